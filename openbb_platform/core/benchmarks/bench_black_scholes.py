@@ -0,0 +1,122 @@
+"""Benchmark the implied volatility and greeks of a chain, contract by contract and at once.
+
+Compares a scalar Black-Scholes, solving the implied volatility of each contract
+with Newton's method and `math.erf`, with the vectorized functions of
+`openbb_core.provider.utils.black_scholes`, for a chain the size of SPX.
+
+Usage: python benchmarks/bench_black_scholes.py [--contracts N]
+"""
+
+import argparse
+import math
+from time import perf_counter
+from typing import Callable, Dict, Tuple
+
+import numpy as np
+from openbb_core.provider.utils.black_scholes import greeks, implied_volatility, price
+
+
+def _make_chain(contracts: int) -> Dict[str, np.ndarray]:
+    """Make a chain, with a rate and dividend yield for each expiration."""
+    rng = np.random.default_rng(0)
+    expirations = rng.uniform(1, 1100, 60)
+    rates = np.linspace(0.045, 0.04, 60)
+    expiration = rng.integers(0, 60, contracts)
+    chain = {
+        "option_type": np.where(rng.random(contracts) < 0.5, "call", "put"),
+        "underlying_price": np.full(contracts, 5800.0),
+        "strike": np.round(rng.uniform(3000, 8000, contracts) / 5) * 5,
+        "time": expirations[expiration] / 365,
+        "rate": rates[expiration],
+        "dividend_yield": np.full(contracts, 0.013),
+    }
+    chain["option_price"] = price(volatility=rng.uniform(0.1, 0.6, contracts), **chain)
+    return chain
+
+
+def _cdf(x: float) -> float:
+    """Get the standard normal cumulative distribution."""
+    return 0.5 * math.erfc(-x / math.sqrt(2))
+
+
+def _scalar(chain: Dict[str, np.ndarray]) -> np.ndarray:
+    """Solve the implied volatility, then the greeks, of each contract in a loop."""
+    results = []
+    for option_type, s, k, t, r, q, p in zip(
+        *(
+            chain[k].tolist()
+            for k in (
+                "option_type",
+                "underlying_price",
+                "strike",
+                "time",
+                "rate",
+                "dividend_yield",
+                "option_price",
+            )
+        )
+    ):
+        sign = 1 if option_type == "call" else -1
+        sigma = 0.3
+        for _ in range(100):
+            d1 = (math.log(s / k) + (r - q + sigma * sigma / 2) * t) / (
+                sigma * math.sqrt(t)
+            )
+            d2 = d1 - sigma * math.sqrt(t)
+            value = sign * (
+                s * math.exp(-q * t) * _cdf(sign * d1)
+                - k * math.exp(-r * t) * _cdf(sign * d2)
+            )
+            vega = s * math.exp(-q * t) * math.exp(-d1 * d1 / 2) * math.sqrt(t)
+            vega /= math.sqrt(2 * math.pi)
+            if abs(value - p) < 1e-8 or vega < 1e-12:
+                break
+            sigma = min(max(sigma - (value - p) / vega, 1e-4), 10.0)
+        delta = sign * math.exp(-q * t) * _cdf(sign * d1)
+        gamma = math.exp(-q * t - d1 * d1 / 2) / (
+            s * sigma * math.sqrt(2 * math.pi * t)
+        )
+        results.append((sigma, delta, gamma, vega / 100))
+    return np.array(results)
+
+
+def _vectorized(chain: Dict[str, np.ndarray]) -> np.ndarray:
+    """Solve the implied volatility, then the greeks, of the chain at once."""
+    inputs = {k: v for k, v in chain.items() if k != "option_price"}
+    iv = implied_volatility(chain["option_price"], **inputs)
+    results = greeks(volatility=iv, **inputs)
+    return np.column_stack([iv, results["delta"], results["gamma"], results["vega"]])
+
+
+def _time(func: Callable[[], np.ndarray]) -> Tuple[float, np.ndarray]:
+    """Time a call."""
+    start = perf_counter()
+    results = func()
+    return perf_counter() - start, results
+
+
+def _run(contracts: int) -> None:
+    """Run the benchmark."""
+    chain = _make_chain(contracts)
+    scalar, expected = _time(lambda: _scalar(chain))
+    vectorized, results = _time(lambda: _vectorized(chain))
+
+    # Deep in the money, the price does not depend on the volatility.
+    solved = expected[:, 3] > 1e-4
+    assert np.allclose(results[solved], expected[solved], atol=1e-6)  # noqa: S101
+
+    print(f"{contracts} contracts, implied volatility and greeks")  # noqa: T201
+    print(f"  scalar loop: {scalar:8.3f}s")  # noqa: T201
+    print(f"  vectorized : {vectorized:8.3f}s")  # noqa: T201
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--contracts", type=int, default=20_000)
+    ns = parser.parse_args()
+    _run(ns.contracts)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+"""Benchmark the validation of fetcher results, row by row and in bulk.
+
+Compares calling `model_validate` on each row, as the fetchers did, with
+`Data.model_validate_list` given the rows, and given the columns of a frame, for
+the historical price models of the FMP, Polygon and FRED providers.
+
+Usage: python benchmarks/bench_bulk_validation.py [--rows N]
+"""
+
+import argparse
+from time import perf_counter
+from typing import Callable, Dict, List, Tuple
+
+import numpy as np
+import pandas as pd
+from openbb_core.provider.abstract.data import Data
+
+
+def _get_models() -> Dict[str, Tuple[type, Callable[[int], pd.DataFrame]]]:
+    """Get the models to validate, with a function making their rows."""
+    # pylint: disable=import-outside-toplevel
+    from openbb_fmp.models.equity_historical import FMPEquityHistoricalData
+    from openbb_fred.models.series import FredSeriesData
+    from openbb_polygon.models.equity_historical import PolygonEquityHistoricalData
+
+    rng = np.random.default_rng(0)
+
+    def prices(rows: int, date: str, volume: str, **columns: str) -> pd.DataFrame:
+        close = 100 * np.exp(np.cumsum(rng.normal(0, 0.001, rows)))
+        dates = pd.date_range("2024-01-02 09:30", periods=rows, freq="min")
+        df = pd.DataFrame(
+            {
+                date: dates.strftime("%Y-%m-%dT%H:%M:%S"),
+                "open": close * 0.999,
+                "high": close * 1.001,
+                "low": close * 0.998,
+                "close": close,
+                volume: rng.integers(100, 10_000, rows).astype(float),
+            }
+        )
+        return df.rename(columns=columns)
+
+    def series(rows: int) -> pd.DataFrame:
+        values = rng.normal(0, 1, (rows, 3))
+        values[::7, 0] = np.nan
+        dates = pd.date_range("1900-01-01", periods=rows, freq="D")
+        return pd.DataFrame(
+            {"date": dates.strftime("%Y-%m-%d"), "GDP": values[:, 0]}
+        ).assign(DGS10=values[:, 1], UNRATE=values[:, 2])
+
+    return {
+        "FMP EquityHistorical": (
+            FMPEquityHistoricalData,
+            lambda rows: prices(rows, "date", "volume"),
+        ),
+        "Polygon EquityHistorical": (
+            PolygonEquityHistoricalData,
+            lambda rows: prices(rows, "t", "v", open="o", high="h", low="l", close="c"),
+        ),
+        "FRED Series": (FredSeriesData, series),
+    }
+
+
+def _time(func: Callable[[], List[Data]]) -> Tuple[float, List[Data]]:
+    """Time a call."""
+    start = perf_counter()
+    results = func()
+    return perf_counter() - start, results
+
+
+def _run(rows: int) -> None:
+    """Run the benchmark."""
+    print(f"{rows} rows, in rows per second")  # noqa: T201
+    for name, (model, make_rows) in _get_models().items():
+        df = make_rows(rows)
+        records = df.replace({np.nan: None}).to_dict("records")
+        columns = {k: df[k].to_numpy() for k in df.columns}
+
+        per_row, expected = _time(
+            lambda: [model.model_validate(r) for r in records]  # noqa: B023
+        )
+        bulk_rows, from_rows = _time(
+            lambda: model.model_validate_list(records)  # noqa: B023
+        )
+        bulk_columns, from_columns = _time(
+            lambda: model.model_validate_list(columns)  # noqa: B023
+        )
+        assert expected == from_rows == from_columns  # noqa: S101
+
+        print(f"  {name}")  # noqa: T201
+        for label, seconds in (
+            ("model_validate per row", per_row),
+            ("model_validate_list rows", bulk_rows),
+            ("model_validate_list columns", bulk_columns),
+        ):
+            print(f"    {label:28}: {rows / seconds:10,.0f}")  # noqa: T201
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=100_000)
+    ns = parser.parse_args()
+    _run(ns.rows)
+
+
+if __name__ == "__main__":
+    main()
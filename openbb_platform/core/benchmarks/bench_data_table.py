@@ -0,0 +1,103 @@
+"""Benchmark passing analytics results between DataFrames and Data rows.
+
+An analytics pipeline converts the rows of one command to a DataFrame, computes
+new columns and converts them back for the next command. This compares the list
+of Data built through a JSON round trip, as `df_to_basemodel` did, with the
+columnar `DataTable`, including the final serialization of the rows.
+
+Usage: python benchmarks/bench_data_table.py [--rows N] [--steps N]
+"""
+
+import argparse
+import json
+from datetime import time
+from time import perf_counter
+
+import numpy as np
+import pandas as pd
+from openbb_core.app.utils import basemodel_to_df, df_to_datatable
+from openbb_core.provider.abstract.data import Data
+
+
+def _legacy_basemodel_to_df(data: list, index: str = "date") -> pd.DataFrame:
+    """Convert the rows to a DataFrame with one model dump and date parse per row."""
+    df = pd.DataFrame(
+        [d.model_dump(exclude_none=True, exclude_unset=True) for d in data]
+    )
+    df["date"] = df["date"].apply(pd.to_datetime)
+    if all(t.time() == time(0, 0) for t in df["date"]):
+        df["date"] = df["date"].apply(lambda x: x.date())
+    return df.set_index(index).sort_index(axis=0)
+
+
+def _legacy_df_to_basemodel(df: pd.DataFrame) -> list:
+    """Convert a DataFrame to rows through a JSON round trip."""
+    df = df.reset_index()
+    df["date"] = df["date"].apply(pd.to_datetime)
+    if all(t.time() == time(0, 0) for t in df["date"]):
+        df["date"] = df["date"].apply(lambda x: x.date().strftime("%Y-%m-%d"))
+    return [
+        Data(**d) for d in json.loads(df.to_json(orient="records", date_format="iso"))
+    ]
+
+
+def _get_prices(rows: int) -> pd.DataFrame:
+    """Get a frame of random daily prices."""
+    rng = np.random.default_rng(0)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, rows)))
+    return pd.DataFrame(
+        {
+            "date": pd.date_range("1900-01-01", periods=rows, freq="D"),
+            "open": close * 0.99,
+            "high": close * 1.01,
+            "low": close * 0.98,
+            "close": close,
+            "volume": rng.integers(1_000, 1_000_000, rows),
+        }
+    ).set_index("date")
+
+
+def _step(df: pd.DataFrame, i: int) -> pd.DataFrame:
+    """Add an indicator column, as an analytics command does."""
+    return df.assign(**{f"sma_{i}": df["close"].rolling(10 + i).mean()})
+
+
+def _run(rows: int, steps: int) -> None:
+    """Run the benchmark."""
+    prices = _get_prices(rows)
+
+    start = perf_counter()
+    data = _legacy_df_to_basemodel(prices)
+    for i in range(steps):
+        data = _legacy_df_to_basemodel(_step(_legacy_basemodel_to_df(data), i))
+    legacy = [d.model_dump() for d in data]
+    legacy_time = perf_counter() - start
+
+    start = perf_counter()
+    table = df_to_datatable(prices, index=True)
+    for i in range(steps):
+        table = df_to_datatable(
+            _step(basemodel_to_df(table, index="date"), i), index=True
+        )
+    columnar = table.to_records()
+    columnar_time = perf_counter() - start
+
+    assert [r["date"] for r in legacy] == [r["date"] for r in columnar]  # noqa: S101
+
+    print(f"{rows} rows, {steps} analytics steps and serialization")  # noqa: T201
+    print(f"  list of Data: {legacy_time:8.3f} s")  # noqa: T201
+    print(f"  DataTable   : {columnar_time:8.3f} s")  # noqa: T201
+    print(f"  speedup     : {legacy_time / columnar_time:8.1f}x")  # noqa: T201
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=20_000)
+    parser.add_argument("--steps", type=int, default=3)
+    ns = parser.parse_args()
+    _run(ns.rows, ns.steps)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+"""Benchmark the per-call overhead of running coroutines from synchronous code.
+
+Compares a new blocking portal per call (`run_async`) with the shared background
+loop used by `CommandRunner.sync_run` (`EventLoopThread`).
+
+Usage: python benchmarks/bench_event_loop.py [--calls N]
+"""
+
+import argparse
+import asyncio
+from time import perf_counter
+
+from openbb_core.provider.utils.helpers import EventLoopThread, run_async
+
+
+async def noop() -> None:
+    """Yield once to the loop."""
+    await asyncio.sleep(0)
+
+
+def _per_call_us(run, n: int) -> float:
+    """Run the no-op coroutine n times and return the microseconds per call."""
+    start = perf_counter()
+    for _ in range(n):
+        run(noop)
+    return (perf_counter() - start) / n * 1e6
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--calls", type=int, default=2000)
+    ns = parser.parse_args()
+
+    portal = _per_call_us(run_async, ns.calls)
+    event_loop = EventLoopThread()
+    event_loop.start()
+    shared = _per_call_us(event_loop.run, ns.calls)
+    event_loop.stop()
+
+    print(f"{ns.calls} synchronous calls of a no-op coroutine")  # noqa: T201
+    print(f"  blocking portal per call: {portal:10.1f} us/call")  # noqa: T201
+    print(f"  shared event loop:        {shared:10.1f} us/call")  # noqa: T201
+    print(f"  speedup:                  {portal / shared:10.2f}x")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+"""Benchmark the time to import `openbb` and run a first command in a new process.
+
+Builds the package into a temporary directory, so its reference matches the
+installed extensions, and compares importing it with the providers and routers
+loaded on first use against the same package without the reference, which loads
+every provider at import. The first command stops at the credential check,
+after the router, the provider interface and the provider are loaded, and before
+any request is made.
+
+Exits with an error when the median import time exceeds `--max-import-seconds`.
+
+Usage: python benchmarks/bench_import_time.py [--runs N] [--max-import-seconds S]
+"""
+
+import argparse
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+from statistics import median
+
+SCRIPT = """
+import json, sys
+from time import perf_counter
+
+start = perf_counter()
+from openbb import obb
+imported = perf_counter() - start
+
+start = perf_counter()
+try:
+    obb._command_runner.sync_run(
+        "/equity/price/historical",
+        provider_choices={"provider": "fmp"},
+        standard_params={"symbol": "AAPL"},
+        extra_params={},
+    )
+except Exception:
+    pass
+called = perf_counter() - start
+
+providers = {m.split(".")[0] for m in sys.modules if m.startswith("openbb_")}
+print(json.dumps({"import": imported, "call": called, "modules": len(providers)}))
+"""
+
+
+def _build(directory: Path) -> None:
+    """Build the package, with its reference, into a directory."""
+    # pylint: disable=import-outside-toplevel
+    from openbb_core.app.static.package_builder import PackageBuilder
+
+    init = Path(__file__).resolve().parents[2] / "openbb" / "__init__.py"
+    directory.mkdir(parents=True)
+    shutil.copy(init, directory / "__init__.py")
+    PackageBuilder(directory, lint=False).build()
+
+
+def _measure(path: Path, runs: int) -> dict:
+    """Measure the import and first command in new processes."""
+    env = {
+        **os.environ,
+        "PYTHONPATH": str(path),
+        "OPENBB_AUTO_BUILD": "false",
+        "FMP_API_KEY": "",
+    }
+    results = []
+    for _ in range(runs):
+        output = subprocess.run(  # noqa: S603
+            [sys.executable, "-c", SCRIPT],
+            capture_output=True,
+            check=True,
+            cwd=path,
+            env=env,
+            text=True,
+        ).stdout
+        results.append(json.loads(output.strip().splitlines()[-1]))
+    return {k: median(r[k] for r in results) for k in results[0]}
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--max-import-seconds", type=float, default=None)
+    ns = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        lazy = Path(tmp) / "lazy"
+        _build(lazy / "openbb")
+        eager = Path(tmp) / "eager"
+        shutil.copytree(lazy, eager)
+        (eager / "openbb" / "assets" / "reference.json").unlink()
+
+        results = {
+            "all at import": _measure(eager, ns.runs),
+            "on first use": _measure(lazy, ns.runs),
+        }
+
+    print(f"median of {ns.runs} new processes")  # noqa: T201
+    for name, r in results.items():
+        print(  # noqa: T201
+            f"  {name:14}: import {r['import']:6.2f} s, "
+            f"first command {r['call']:6.2f} s, {r['modules']:3d} packages loaded"
+        )
+
+    if ns.max_import_seconds is not None:
+        imported = results["on first use"]["import"]
+        if imported > ns.max_import_seconds:
+            sys.exit(
+                f"Import took {imported:.2f} s, over {ns.max_import_seconds:.2f} s."
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+"""Benchmark the queries of an options chain, through frames and through the chains index.
+
+The strategies of a chain look up the nearest strikes, and their premiums, for every
+expiration. This compares filtering the DataFrame of the chain for each lookup, as
+`OptionsChainsProperties` did, with the binary searches of the `OptionsChainsIndex`,
+for a chain the size of SPX, and times all the straddles of the chain.
+
+Usage: python benchmarks/bench_options_chains.py [--expirations N] [--strikes N]
+"""
+
+import argparse
+from datetime import date, timedelta
+from time import perf_counter
+from typing import Callable, List, Tuple
+
+import numpy as np
+import pandas as pd
+from openbb_core.provider.standard_models.options_chains import OptionsChainsData
+
+
+def _make_chains(expirations: int, strikes: int) -> OptionsChainsData:
+    """Make a chain, with a call and a put for every expiration and strike."""
+    rng = np.random.default_rng(0)
+    today = date.today()
+    rows = [
+        (today + timedelta(days=7 * e + 1), 4000.0 + 5 * k, option_type)
+        for e in range(expirations)
+        for k in range(strikes)
+        for option_type in ("call", "put")
+    ]
+    size = len(rows)
+    ask = rng.uniform(0.1, 200, size).round(2)
+    return OptionsChainsData.model_validate(
+        {
+            "underlying_symbol": ["SPX"] * size,
+            "contract_symbol": [f"SPX{i}" for i in range(size)],
+            "expiration": [r[0] for r in rows],
+            "strike": [r[1] for r in rows],
+            "option_type": [r[2] for r in rows],
+            "underlying_price": [4000.0 + 2.5 * strikes] * size,
+            "open_interest": rng.integers(0, 5000, size).tolist(),
+            "bid": (ask - 0.1).tolist(),
+            "ask": ask.tolist(),
+        }
+    )
+
+
+def _legacy_straddles(df: pd.DataFrame, expirations: List[str]) -> List[float]:
+    """Get the premiums of the nearest OTM straddles, filtering the frame for each lookup."""
+    results = []
+    for expiration in expirations:
+        chains = df[df.expiration.astype(str) == expiration]
+        price = chains.underlying_price.iloc[0]
+        strikes = {}
+        for option_type in ("call", "put"):
+            contracts = chains.query("`option_type` == @option_type")
+            contracts = contracts[contracts["ask"].notnull()]
+            nearest = (
+                contracts[contracts.strike >= price]
+                if option_type == "call"
+                else contracts[contracts.strike <= price]
+            )
+            strikes[option_type] = (
+                nearest.strike.min() if option_type == "call" else nearest.strike.max()
+            )
+        call = chains[chains.strike == strikes["call"]].query("option_type == 'call'")
+        put = chains[chains.strike == strikes["put"]].query("option_type == 'put'")
+        results.append(call["ask"].values[0] + put["ask"].values[0])
+    return results
+
+
+def _indexed_straddles(
+    chains: OptionsChainsData, expirations: List[str]
+) -> List[float]:
+    """Get the premiums of the nearest OTM straddles, with the chains index."""
+    index = chains._chains_index  # pylint: disable=protected-access
+    ask = index.columns["ask"]
+    results = []
+    for expiration in expirations:
+        code = index.expiration_code(expiration)
+        call = index.find(code, "call", index.nearest_strike(code, "call", None, "ask"))
+        put = index.find(code, "put", index.nearest_strike(code, "put", None, "ask"))
+        results.append(ask[call] + ask[put])
+    return results
+
+
+def _time(func: Callable[[], List[float]]) -> Tuple[float, List[float]]:
+    """Time a call."""
+    start = perf_counter()
+    results = func()
+    return perf_counter() - start, results
+
+
+def _run(expirations: int, strikes: int) -> None:
+    """Run the benchmark."""
+    chains = _make_chains(expirations, strikes)
+    build, _ = _time(lambda: chains.dataframe)
+    dates = chains.expirations
+
+    legacy, expected = _time(lambda: _legacy_straddles(chains.dataframe, dates))
+    indexed, results = _time(lambda: _indexed_straddles(chains, dates))
+    assert np.allclose(results, expected)  # noqa: S101
+    strategies, _ = _time(lambda: chains.strategies(days=-1))
+
+    print(f"{len(chains.strike)} contracts, {expirations} expirations")  # noqa: T201
+    print(f"  index build          : {build:8.3f}s")  # noqa: T201
+    print(f"  straddles, frames    : {legacy:8.3f}s")  # noqa: T201
+    print(f"  straddles, index     : {indexed:8.3f}s")  # noqa: T201
+    print(f"  strategies(days=-1)  : {strategies:8.3f}s")  # noqa: T201
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--expirations", type=int, default=50)
+    parser.add_argument("--strikes", type=int, default=200)
+    ns = parser.parse_args()
+    _run(ns.expirations, ns.strikes)
+
+
+if __name__ == "__main__":
+    main()
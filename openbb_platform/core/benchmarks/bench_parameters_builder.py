@@ -0,0 +1,100 @@
+"""Benchmark the command runner overhead for a no-op route.
+
+Compares the per-call validation path (signature inspection, deep copies and
+`create_model` on every call) with the cached validation plan.
+
+Usage: python benchmarks/bench_parameters_builder.py [--calls N]
+"""
+
+# pylint: disable=import-outside-toplevel
+
+import argparse
+import asyncio
+from copy import deepcopy
+from time import perf_counter
+from typing import Any, Dict, List, Optional
+
+from openbb_core.app.command_runner import CommandRunner, ParametersBuilder
+from openbb_core.app.model.obbject import OBBject
+from openbb_core.app.model.system_settings import SystemSettings
+from openbb_core.app.model.user_settings import UserSettings
+from openbb_core.app.router import CommandMap, Router
+from openbb_core.provider.abstract.data import Data
+
+router = Router(prefix="")
+
+
+@router.command(methods=["POST"])
+async def noop(
+    data: List[Data],
+    window: int = 21,
+    target: str = "close",
+    index: Optional[str] = None,
+) -> OBBject[List[Data]]:
+    """Do nothing."""
+    return OBBject(results=[])
+
+
+def _legacy_build(func, args, kwargs) -> Dict[str, Any]:
+    """Build parameters the way it was done before validation plans."""
+    func = ParametersBuilder.get_polished_func(func=func)
+    args, kwargs = deepcopy(args), deepcopy(kwargs)
+    merged = {}
+    for index, parameter in enumerate(
+        ParametersBuilder.get_polished_parameter_list(func)
+    ):
+        if index < len(args):
+            merged[parameter.name] = args[index]
+        elif parameter.name in kwargs:
+            merged[parameter.name] = kwargs[parameter.name]
+        elif parameter.default is not parameter.empty:
+            merged[parameter.name] = parameter.default
+        else:
+            merged[parameter.name] = None
+    model = ParametersBuilder.get_validation_model(func)
+    return dict(model(**merged))
+
+
+async def _calls_per_second(runner: CommandRunner, n: int, **kwargs) -> float:
+    """Run the no-op route n times and return the calls per second."""
+    start = perf_counter()
+    for _ in range(n):
+        await runner.run("/noop", None, **kwargs)
+    return n / (perf_counter() - start)
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--calls", type=int, default=2000)
+    parser.add_argument("--rows", type=int, default=500)
+    ns = parser.parse_args()
+
+    runner = CommandRunner(
+        CommandMap(router=router),
+        SystemSettings(logging_suppress=True),
+        UserSettings(),
+    )
+    runner.user_settings.preferences.metadata = False
+    data = [
+        Data(date=f"2024-01-{i % 28 + 1:02d}", close=float(i)) for i in range(ns.rows)
+    ]
+
+    build = ParametersBuilder.build
+    ParametersBuilder.build = classmethod(  # type: ignore
+        lambda cls, args, execution_context, func, kwargs: _legacy_build(
+            func, args, kwargs
+        )
+    )
+    before = asyncio.run(_calls_per_second(runner, ns.calls, data=data))
+    ParametersBuilder.build = build  # type: ignore
+    after = asyncio.run(_calls_per_second(runner, ns.calls, data=data))
+
+    print(f"no-op route, {ns.rows} rows of data, {ns.calls} calls")  # noqa: T201
+    print(f"  per-call validation: {before:10.1f} calls/s")  # noqa: T201
+    print(f"  validation plan:     {after:10.1f} calls/s")  # noqa: T201
+    print(f"  speedup:             {after / before:10.2f}x")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
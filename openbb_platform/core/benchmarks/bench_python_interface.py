@@ -0,0 +1,87 @@
+"""Benchmark the calls per second of a Python interface command.
+
+Compares building the `validate_call` validator of a command on every call, as
+the `validate` decorator did, with building it on the first call and reusing it.
+Each is measured on the whole command, and on the command with the command runner
+replaced by a no-op, which leaves the decorators and the argument validation.
+
+Requires the built `openbb` package to be importable.
+
+Usage: python benchmarks/bench_python_interface.py [--seconds S]
+"""
+
+import argparse
+from copy import copy
+from functools import wraps
+from time import perf_counter
+from typing import Callable
+
+import numpy as np
+import pandas as pd
+from openbb_core.app.static.utils.decorators import exception_handler, validate
+from pydantic import validate_call
+
+
+def validate_per_call(**dec_kwargs) -> Callable:
+    """Build the validator on every call, as the decorator did."""
+
+    def decorated(f: Callable) -> Callable:
+        @wraps(f)
+        def wrapper(*f_args, **f_kwargs):
+            return validate_call(f, **dec_kwargs)(*f_args, **f_kwargs)
+
+        return wrapper
+
+    return decorated
+
+
+def _calls_per_second(func: Callable, seconds: float) -> float:
+    """Call a function repeatedly for some seconds."""
+    calls = 0
+    start = perf_counter()
+    while (elapsed := perf_counter() - start) < seconds:
+        func()
+        calls += 1
+    return calls / elapsed
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--seconds", type=float, default=3.0)
+    ns = parser.parse_args()
+
+    # pylint: disable=import-outside-toplevel
+    from openbb import obb
+
+    dates = pd.date_range("2024-01-01", periods=50)
+    data = pd.DataFrame({"date": dates, "close": np.arange(50.0)}).to_dict("records")
+    kwargs = {"data": data, "target": "close", "length": 5}
+
+    router = obb.technical
+    stub = copy(router)
+    stub._run = lambda *args, **kwargs: None  # pylint: disable=protected-access
+    # The generated method is exception_handler(validate(function)).
+    function = type(router).sma.__wrapped__.__wrapped__
+
+    print("technical.sma, in calls per second")  # noqa: T201
+    for label, decorator in (
+        ("validator per call", validate_per_call),
+        ("cached validator", validate),
+    ):
+        config = {"arbitrary_types_allowed": True}
+        method = exception_handler(decorator(config=config)(function))
+        command = _calls_per_second(
+            lambda: method(router, **kwargs), ns.seconds  # noqa: B023
+        )
+        decorators = _calls_per_second(
+            lambda: method(stub, **kwargs), ns.seconds  # noqa: B023
+        )
+        print(  # noqa: T201
+            f"  {label:18}: command {command:8,.0f}, "
+            f"decorators and validation {decorators:8,.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""Benchmark a burst of requests against a rate limited server.
+
+A local server accepts `--limit` requests per second and answers the others
+with 429 and a Retry-After header. The same burst is sent with an unbounded
+gather, as the multi-symbol fetchers did, and within a provider rate limit.
+
+Usage: python benchmarks/bench_rate_limit.py [--requests N] [--limit N]
+"""
+
+import argparse
+import asyncio
+from time import monotonic, perf_counter
+
+from aiohttp import web
+from openbb_core.provider.utils.helpers import amake_request
+from openbb_core.provider.utils.rate_limit import RateLimit, current_rate_limit
+
+
+async def _start_server(port: int, limit: int) -> web.AppRunner:
+    """Start a local server allowing `limit` requests per one-second window."""
+    window = {"start": monotonic(), "count": 0}
+
+    async def handler(request):
+        now = monotonic()
+        if now - window["start"] >= 1:
+            window["start"], window["count"] = now, 0
+        window["count"] += 1
+        if window["count"] > limit:
+            retry_after = max(1 - (now - window["start"]), 0)
+            return web.Response(
+                status=429, headers={"Retry-After": f"{retry_after:.3f}"}
+            )
+        await asyncio.sleep(0.01)
+        return web.json_response({"ok": True})
+
+    app = web.Application()
+    app.router.add_get("/", handler)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    await web.TCPSite(runner, "127.0.0.1", port).start()
+    return runner
+
+
+async def _burst(url: str, n: int) -> tuple:
+    """Send n requests at once, return the elapsed seconds and the statuses."""
+
+    async def callback(response, _):
+        return response.status
+
+    start = perf_counter()
+    statuses = await asyncio.gather(
+        *[amake_request(url, response_callback=callback) for _ in range(n)]
+    )
+    return perf_counter() - start, statuses
+
+
+async def _run(n: int, limit: int, port: int) -> None:
+    """Run the benchmark."""
+    url = f"http://127.0.0.1:{port}/"
+    runner = await _start_server(port, limit)
+    try:
+        unbounded, unbounded_statuses = await _burst(url, n)
+        await asyncio.sleep(1)
+        token = current_rate_limit.set(
+            RateLimit(requests=limit, period=1, max_concurrent=10)
+        )
+        try:
+            limited, limited_statuses = await _burst(url, n)
+        finally:
+            current_rate_limit.reset(token)
+    finally:
+        await runner.cleanup()
+
+    print(f"{n} requests to a server allowing {limit} requests/s")  # noqa: T201
+    for name, elapsed, statuses in (
+        ("unbounded gather", unbounded, unbounded_statuses),
+        ("rate limited", limited, limited_statuses),
+    ):
+        ok = statuses.count(200)
+        print(  # noqa: T201
+            f"  {name:16}: {ok:5d} ok, {n - ok:5d} rejected, "
+            f"{elapsed:6.2f} s, {ok / elapsed:7.1f} ok/s"
+        )
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--limit", type=int, default=100)
+    parser.add_argument("--port", type=int, default=8788)
+    ns = parser.parse_args()
+    asyncio.run(_run(ns.requests, ns.limit, ns.port))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""Benchmark request latency with and without the shared session pool.
+
+By default the requests go to a local aiohttp server, which only measures the
+saved TCP connection setup. Pass `--url` with an https endpoint to include the
+TLS handshakes saved by keeping the connection alive.
+
+Usage: python benchmarks/bench_session_pool.py [--requests N] [--url URL]
+"""
+
+import argparse
+import asyncio
+from time import perf_counter
+from typing import Optional
+
+from aiohttp import web
+from openbb_core.provider.utils.helpers import (
+    SessionPool,
+    amake_request,
+    get_async_requests_session,
+)
+
+
+async def _start_server(port: int) -> web.AppRunner:
+    """Start a local server answering every request with a small json body."""
+
+    async def handler(request):
+        return web.json_response({"ok": True})
+
+    app = web.Application()
+    app.router.add_get("/", handler)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    await web.TCPSite(runner, "127.0.0.1", port).start()
+    return runner
+
+
+async def _unpooled(url: str, n: int) -> float:
+    """Make n requests with a new session each, as before the pool."""
+    start = perf_counter()
+    for _ in range(n):
+        session = await get_async_requests_session()
+        await amake_request(url, session=session)
+        await session.close()
+    return (perf_counter() - start) / n * 1e3
+
+
+async def _pooled(url: str, n: int) -> float:
+    """Make n requests with the shared session of the event loop."""
+    start = perf_counter()
+    for _ in range(n):
+        await amake_request(url)
+    return (perf_counter() - start) / n * 1e3
+
+
+async def _run(n: int, url: Optional[str], port: int) -> None:
+    """Run the benchmark."""
+    runner = None if url else await _start_server(port)
+    url = url or f"http://127.0.0.1:{port}/"
+    try:
+        unpooled = await _unpooled(url, n)
+        pooled = await _pooled(url, n)
+        stats = (await SessionPool.get_pool()).stats
+    finally:
+        if runner:
+            await runner.cleanup()
+
+    print(f"{n} sequential requests to {url}")  # noqa: T201
+    print(f"  new session per request: {unpooled:8.2f} ms/request")  # noqa: T201
+    print(f"  pooled session:          {pooled:8.2f} ms/request")  # noqa: T201
+    print(  # noqa: T201
+        f"  pool: {stats['connections_created']:.0f} connections created, "
+        f"{stats['connections_reused']:.0f} reused, "
+        f"{stats['connect_time'] * 1e3:.2f} ms connecting"
+    )
+    print(  # noqa: T201
+        f"  handshakes saved: {n - stats['connections_created']:.0f}, "
+        f"about {unpooled - pooled:.2f} ms per request"
+    )
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--url", type=str, default=None)
+    parser.add_argument("--port", type=int, default=8787)
+    ns = parser.parse_args()
+    asyncio.run(_run(ns.requests, ns.url, ns.port))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,18 @@
+"""Jobs dependency."""
+
+from fastapi import Depends
+from openbb_core.api.jobs import JobQueue
+from openbb_core.app.model.user_settings import UserSettings
+from openbb_core.app.service.auth_service import AuthService
+from openbb_core.app.service.system_service import SystemService
+from typing_extensions import Annotated
+
+
+async def get_job_queue(
+    user_settings: Annotated[UserSettings, Depends(AuthService().user_settings_hook)],
+) -> JobQueue:
+    """Get the job queue of the user."""
+    return JobQueue.from_settings(
+        SystemService().system_settings.api_settings.jobs,
+        user_settings.preferences.cache_directory,
+    )
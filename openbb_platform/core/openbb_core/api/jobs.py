@@ -0,0 +1,335 @@
+"""Jobs: run long commands in the background and keep their results."""
+
+import asyncio
+import os
+import sqlite3
+import threading
+from datetime import datetime
+from hashlib import sha256
+from json import dumps, loads
+from pathlib import Path
+from time import time
+from typing import Any, Awaitable, Callable, Dict, Literal, Optional, Set, Tuple
+from uuid import uuid4
+from weakref import WeakKeyDictionary
+
+from fastapi import HTTPException
+from fastapi.encoders import jsonable_encoder
+from openbb_core.app.model.abstract.error import OpenBBError
+from openbb_core.app.model.api_settings import JobSettings
+from openbb_core.app.model.user_settings import UserSettings
+from openbb_core.provider.utils.errors import EmptyDataError, UnauthorizedError
+from pydantic import BaseModel, Field, SecretStr, ValidationError
+
+JobStatus = Literal["pending", "running", "done", "failed"]
+
+COLUMNS = (
+    "id",
+    "route",
+    "status",
+    "created",
+    "started",
+    "finished",
+    "expires",
+    "status_code",
+    "error",
+)
+
+
+class Job(BaseModel):
+    """Status of a command running in the background."""
+
+    id: str = Field(description="Identifier of the job.")
+    route: str = Field(description="Route of the command.")
+    status: JobStatus = Field(
+        description="Status of the job: pending until a worker is free, running,"
+        + " then done or failed."
+    )
+    created: datetime = Field(description="Time the job was submitted.")
+    started: Optional[datetime] = Field(
+        default=None, description="Time the command started running."
+    )
+    finished: Optional[datetime] = Field(
+        default=None, description="Time the command finished."
+    )
+    expires: Optional[datetime] = Field(
+        default=None, description="Time the result of the job is removed."
+    )
+    status_code: Optional[int] = Field(
+        default=None, description="Status code of the response of the command."
+    )
+    error: Optional[Any] = Field(
+        default=None, description="Detail of the error of a failed job."
+    )
+
+
+def get_job_key(route: str, kwargs: Dict[str, Any], user_settings: UserSettings) -> str:
+    """Get the key of a job, from the route, the arguments and the user credentials.
+
+    Jobs with the same key give the same result, so a submission is added to the
+    job with its key that is still running. The credentials are part of the key,
+    so users only share the jobs they could have run themselves.
+    """
+    credentials = {
+        k: v.get_secret_value() if isinstance(v, SecretStr) else v
+        for k, v in user_settings.credentials
+    }
+    try:
+        arguments = jsonable_encoder(kwargs)
+    except (TypeError, ValueError):
+        arguments = uuid4().hex
+    return sha256(
+        dumps([route, arguments, credentials], sort_keys=True, default=str).encode()
+    ).hexdigest()
+
+
+def get_error(error: Exception) -> Tuple[int, Any]:
+    """Get the status code and detail of an error, as the exception handlers do."""
+    if isinstance(error, HTTPException):
+        return error.status_code, error.detail
+    if isinstance(error, EmptyDataError):
+        return 204, str(error)
+    if isinstance(error, UnauthorizedError):
+        return 502, str(error.original)
+    if isinstance(error, OpenBBError):
+        return 400, str(error.original)
+    if isinstance(error, ValidationError):
+        return 422, str(error)
+    return 500, f"Unexpected Error -> {error.__class__.__name__} -> {error}"
+
+
+class JobStore:
+    """SQLite store of the jobs and their results.
+
+    Finished jobs expire `ttl` seconds after they finish, and expired jobs are
+    removed when a job is saved. Each job records the process that runs it, so
+    the workers of a server can share the store: when the store is opened, the
+    jobs left pending or running by a process that has exited are marked as
+    failed.
+    """
+
+    def __init__(self, directory: Optional[str] = None, ttl: int = 3600) -> None:
+        """Initialize the store. Without a directory, the jobs are kept in memory."""
+        self._lock = threading.Lock()
+        self._ttl = ttl
+        database = ":memory:"
+        if directory:
+            path = Path(directory)
+            path.mkdir(parents=True, exist_ok=True)
+            database = str(path / "jobs.sqlite")
+        self._db = sqlite3.connect(database, check_same_thread=False)
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS jobs ("
+            "id TEXT PRIMARY KEY, route TEXT, status TEXT, created REAL,"
+            " started REAL, finished REAL, expires REAL, status_code INTEGER,"
+            " error TEXT, result BLOB, owner INTEGER)"
+        )
+        columns = {r[1] for r in self._db.execute("PRAGMA table_info(jobs)")}
+        if "owner" not in columns:
+            self._db.execute("ALTER TABLE jobs ADD COLUMN owner INTEGER")
+        self._fail_interrupted()
+
+    def _fail_interrupted(self) -> None:
+        """Mark as failed the unfinished jobs of the processes that have exited."""
+        owners = [
+            owner
+            for (owner,) in self._db.execute(
+                "SELECT DISTINCT owner FROM jobs"
+                " WHERE status IN ('pending', 'running')"
+            )
+            if owner is None or not _is_running(owner)
+        ]
+        now = time()
+        self._db.executemany(
+            "UPDATE jobs SET status = 'failed', finished = ?, expires = ?,"
+            " status_code = 500, error = ?"
+            " WHERE status IN ('pending', 'running') AND owner IS ?",
+            [
+                (now, now + self._ttl, dumps("Interrupted before finishing."), owner)
+                for owner in owners
+            ],
+        )
+        self._db.commit()
+
+    def add(self, route: str) -> Job:
+        """Add a pending job."""
+        job = Job(id=uuid4().hex, route=route, status="pending", created=time())
+        with self._lock:
+            self._db.execute("DELETE FROM jobs WHERE expires <= ?", (time(),))
+            self._db.execute(
+                "INSERT INTO jobs (id, route, status, created, owner)"
+                " VALUES (?, ?, ?, ?, ?)",
+                (job.id, route, job.status, job.created.timestamp(), os.getpid()),
+            )
+            self._db.commit()
+        return job
+
+    def start(self, job_id: str) -> None:
+        """Mark a job as running."""
+        with self._lock:
+            self._db.execute(
+                "UPDATE jobs SET status = 'running', started = ? WHERE id = ?",
+                (time(), job_id),
+            )
+            self._db.commit()
+
+    def finish(
+        self,
+        job_id: str,
+        status_code: int,
+        result: Optional[bytes] = None,
+        error: Any = None,
+    ) -> None:
+        """Mark a job as done, with its result, or as failed, with its error."""
+        now = time()
+        status = "failed" if result is None else "done"
+        with self._lock:
+            self._db.execute(
+                "UPDATE jobs SET status = ?, finished = ?, expires = ?,"
+                " status_code = ?, error = ?, result = ? WHERE id = ?",
+                (
+                    status,
+                    now,
+                    now + self._ttl,
+                    status_code,
+                    None if error is None else dumps(jsonable_encoder(error)),
+                    result,
+                    job_id,
+                ),
+            )
+            self._db.commit()
+
+    def get(self, job_id: str) -> Optional[Job]:
+        """Get a job, or None when it does not exist or has expired."""
+        with self._lock:
+            row = self._db.execute(
+                f"SELECT {', '.join(COLUMNS)} FROM jobs"  # noqa: S608  # nosec
+                " WHERE id = ? AND (expires IS NULL OR expires > ?)",
+                (job_id, time()),
+            ).fetchone()
+        if row is None:
+            return None
+        job = dict(zip(COLUMNS, row))
+        if job["error"] is not None:
+            job["error"] = loads(job["error"])
+        return Job.model_validate(job)
+
+    def get_result(self, job_id: str) -> Optional[bytes]:
+        """Get the result of a job that is done."""
+        with self._lock:
+            row = self._db.execute(
+                "SELECT result FROM jobs WHERE id = ? AND status = 'done'"
+                " AND expires > ?",
+                (job_id, time()),
+            ).fetchone()
+        return None if row is None else row[0]
+
+
+def _is_running(pid: int) -> bool:
+    """Check if the process with an id is running."""
+    if pid == os.getpid():
+        return True
+    if os.name == "nt":
+        # pylint: disable=import-outside-toplevel
+        import ctypes
+
+        # os.kill would terminate the process on Windows, so open it instead.
+        kernel32 = ctypes.windll.kernel32  # type: ignore[attr-defined]
+        handle = kernel32.OpenProcess(0x1000, False, pid)
+        if not handle:
+            return False
+        kernel32.CloseHandle(handle)
+        return True
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+class JobQueue:
+    """Queue of jobs that run commands on a bounded pool of workers.
+
+    A job runs once a worker is free, and at most `workers` jobs run at the
+    same time. A submission with the key of a job that has not finished is
+    added to that job instead of running the command again.
+    """
+
+    _instances: Dict[Tuple[str, int, int], "JobQueue"] = {}
+    _instances_lock = threading.Lock()
+
+    def __init__(self, store: JobStore, workers: int = 4) -> None:
+        """Initialize the queue."""
+        self.store = store
+        self.workers = workers
+        self._lock = threading.Lock()
+        self._running: Dict[str, str] = {}
+        self._tasks: Set[asyncio.Task] = set()
+        self._semaphores: WeakKeyDictionary[
+            asyncio.AbstractEventLoop, asyncio.Semaphore
+        ] = WeakKeyDictionary()
+
+    @classmethod
+    def from_settings(
+        cls, settings: JobSettings, directory: Optional[str] = None
+    ) -> "JobQueue":
+        """Get the shared queue for the given settings and directory.
+
+        The directory of the settings, when set, takes precedence.
+        """
+        directory = settings.directory or directory
+        key = (str(directory), settings.workers, settings.ttl)
+        with cls._instances_lock:
+            if key not in cls._instances:
+                cls._instances[key] = cls(
+                    JobStore(directory, settings.ttl), settings.workers
+                )
+            return cls._instances[key]
+
+    def submit(self, key: str, route: str, run: Callable[[], Awaitable[bytes]]) -> Job:
+        """Submit a job, or get the job with the same key that has not finished.
+
+        The `run` coroutine function runs the command and returns its JSON result.
+        """
+        with self._lock:
+            job_id = self._running.get(key)
+            if job_id is not None and (job := self.store.get(job_id)):
+                return job
+            job = self.store.add(route)
+            self._running[key] = job.id
+
+        task = asyncio.get_running_loop().create_task(self._run(key, job.id, run))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return job
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        """Get the semaphore of the running event loop."""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            if loop not in self._semaphores:
+                self._semaphores[loop] = asyncio.Semaphore(self.workers)
+            return self._semaphores[loop]
+
+    async def _run(
+        self, key: str, job_id: str, run: Callable[[], Awaitable[bytes]]
+    ) -> None:
+        """Run a job once a worker is free, and store its result or error."""
+        try:
+            async with self._get_semaphore():
+                self.store.start(job_id)
+                result = await run()
+        except asyncio.CancelledError:
+            self.store.finish(job_id, 500, error="Cancelled before finishing.")
+            raise
+        except Exception as e:  # pylint: disable=broad-except
+            status_code, detail = get_error(e)
+            self.store.finish(job_id, status_code, error=detail)
+        else:
+            self.store.finish(job_id, 200, result=result)
+        finally:
+            with self._lock:
+                if self._running.get(key) == job_id:
+                    del self._running[key]
@@ -0,0 +1,202 @@
+"""Response formats of the command endpoints."""
+
+from io import BytesIO
+from json import dumps
+from typing import Any, Dict, Iterator, List, Literal, Optional
+
+from fastapi import HTTPException
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import Response, StreamingResponse
+from openbb_core.app.model.data_table import DataTable
+from openbb_core.app.model.obbject import OBBject
+from pydantic_core import to_json
+
+ResponseFormat = Literal["json", "ndjson", "arrow", "parquet"]
+
+MEDIA_TYPES: Dict[str, str] = {
+    "json": "application/json",
+    "ndjson": "application/x-ndjson",
+    "arrow": "application/vnd.apache.arrow.stream",
+    "parquet": "application/vnd.apache.parquet",
+}
+
+ACCEPTED_MEDIA_TYPES: Dict[str, str] = {
+    **{media_type: name for name, media_type in MEDIA_TYPES.items()},
+    "application/ndjson": "ndjson",
+    "application/jsonl": "ndjson",
+    "application/x-parquet": "parquet",
+}
+
+# Number of rows serialized together in each chunk of a streamed response.
+CHUNK_SIZE = 1000
+
+# Maximum length of the warnings and extra info headers, in characters.
+EXTRA_HEADER_SIZE = 4096
+
+
+def get_response_format(
+    response_format: Optional[str] = None, accept: Optional[str] = None
+) -> str:
+    """Get the response format from the query flag, or else the Accept header.
+
+    The first media type of the Accept header with a known format is used, and
+    JSON when there is none.
+    """
+    if response_format:
+        return response_format
+    for media_type in (accept or "").split(","):
+        name = ACCEPTED_MEDIA_TYPES.get(media_type.split(";")[0].strip().lower())
+        if name:
+            return name
+    return "json"
+
+
+def get_headers(obbject: OBBject) -> Dict[str, str]:
+    """Get the provider, warnings and extra info of the OBBject as response headers.
+
+    The warnings and extra info are JSON encoded, with non-ASCII characters escaped.
+    Both are bounded, see `get_warnings_header` and `get_extra_header`.
+    """
+    headers = {}
+    if obbject.provider:
+        headers["X-OpenBB-Provider"] = obbject.provider
+    if obbject.warnings:
+        headers["X-OpenBB-Warnings"] = get_warnings_header(obbject.warnings)
+    if obbject.extra:
+        headers["X-OpenBB-Extra"] = get_extra_header(obbject.extra)
+    return headers
+
+
+def get_warnings_header(warnings: List[Any]) -> str:
+    """Get the warnings, bounded to `EXTRA_HEADER_SIZE` characters.
+
+    When the list is too long, it is reduced to the count of the warnings and the
+    first ones that fit. The Arrow and Parquet responses keep the full list in the
+    metadata of their schema.
+    """
+    items = jsonable_encoder(warnings)
+    header = dumps(items)
+    if len(header) <= EXTRA_HEADER_SIZE:
+        return header
+    summary: Dict[str, Any] = {"count": len(items), "warnings": [], "truncated": True}
+    size = len(dumps(summary))
+    for item in items:
+        size += len(dumps(item)) + 2
+        if size > EXTRA_HEADER_SIZE:
+            break
+        summary["warnings"].append(item)
+    return dumps(summary)
+
+
+def get_extra_header(extra: Dict[str, Any]) -> str:
+    """Get a summary of the extra info, bounded to `EXTRA_HEADER_SIZE` characters.
+
+    The spans of the metadata are left out, and an info still too long is reduced
+    to its keys. The Arrow and Parquet responses keep the full info in the
+    metadata of their schema.
+    """
+    info = jsonable_encoder(extra)
+    metadata = info.get("metadata")
+    if isinstance(metadata, dict):
+        info["metadata"] = {k: v for k, v in metadata.items() if k != "spans"}
+    header = dumps(info)
+    if len(header) > EXTRA_HEADER_SIZE:
+        header = dumps({"keys": sorted(info), "truncated": True})
+    return header
+
+
+def check_response_format(response_format: str) -> None:
+    """Check the dependencies of a response format are installed.
+
+    Raises
+    ------
+    HTTPException
+        406 when `pyarrow` is not installed, for the Arrow and Parquet formats.
+    """
+    if response_format in ("arrow", "parquet"):
+        _import_pyarrow()
+
+
+def iter_ndjson(results: Any, chunk_size: int = CHUNK_SIZE) -> Iterator[bytes]:
+    """Serialize the results as JSON lines, a chunk of rows at a time.
+
+    Each row is a line, serialized like the rows of the JSON response. Results that
+    are not a list of rows are a single line.
+    """
+    if results is None:
+        return
+    if isinstance(results, DataTable):
+        for start in range(0, len(results), chunk_size):
+            records = results[start : start + chunk_size].to_records()
+            yield b"".join(_dumps_row(r) for r in records)
+        return
+    rows = results if isinstance(results, list) else [results]
+    for start in range(0, len(rows), chunk_size):
+        yield b"".join(_dumps_row(r) for r in rows[start : start + chunk_size])
+
+
+def _dumps_row(row: Any) -> bytes:
+    """Serialize a row as a JSON line."""
+    return (
+        to_json(row, by_alias=True, inf_nan_mode="null", serialize_unknown=True) + b"\n"
+    )
+
+
+def _import_pyarrow() -> Any:
+    """Import pyarrow, or raise a 406 error when it is not installed."""
+    try:
+        # pylint: disable=import-outside-toplevel
+        import pyarrow as pa  # type: ignore[import-not-found]
+    except ImportError as e:
+        raise HTTPException(
+            status_code=406,
+            detail="Arrow and Parquet responses require pyarrow: `pip install pyarrow`.",
+        ) from e
+    return pa
+
+
+def to_arrow_table(obbject: OBBject) -> Any:
+    """Convert the results to an Arrow table, with the OBBject info in its metadata.
+
+    Raises
+    ------
+    HTTPException
+        406 when `pyarrow` is not installed.
+    """
+    pa = _import_pyarrow()
+    table = pa.Table.from_pandas(obbject.to_dataframe(index=None))
+    info = {
+        "provider": obbject.provider,
+        "warnings": jsonable_encoder(obbject.warnings),
+        "extra": jsonable_encoder(obbject.extra),
+    }
+    return table.replace_schema_metadata(
+        {**(table.schema.metadata or {}), b"openbb": dumps(info).encode()}
+    )
+
+
+def build_response(obbject: OBBject, response_format: str) -> Response:
+    """Build the response of an OBBject in a format other than JSON."""
+    headers = get_headers(obbject)
+    media_type = MEDIA_TYPES[response_format]
+
+    if response_format == "ndjson":
+        return StreamingResponse(
+            iter_ndjson(obbject.results), media_type=media_type, headers=headers
+        )
+
+    table = to_arrow_table(obbject)
+    sink = BytesIO()
+    if response_format == "parquet":
+        # pylint: disable=import-outside-toplevel
+        import pyarrow.parquet as pq  # type: ignore[import-not-found]
+
+        pq.write_table(table, sink)
+    else:
+        # pylint: disable=import-outside-toplevel
+        import pyarrow as pa  # type: ignore[import-not-found]
+
+        with pa.ipc.new_stream(sink, table.schema) as writer:
+            writer.write_table(table)
+
+    return Response(content=sink.getvalue(), media_type=media_type, headers=headers)
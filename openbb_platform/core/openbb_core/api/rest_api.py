@@ -8,6 +8,8 @@ from fastapi.middleware.cors import CORSMiddleware
 from openbb_core.api.app_loader import AppLoader
 from openbb_core.api.router.commands import router as router_commands
 from openbb_core.api.router.coverage import router as router_coverage
+from openbb_core.api.router.jobs import router as router_jobs
+from openbb_core.api.router.metrics import router as router_metrics
 from openbb_core.api.router.system import router as router_system
 from openbb_core.app.service.auth_service import AuthService
 from openbb_core.app.service.system_service import SystemService
@@ -74,10 +76,17 @@ app.add_middleware(
 AppLoader.add_routers(
     app=app,
     routers=(
-        [AuthService().router, router_system, router_coverage, router_commands]
+        [
+            AuthService().router,
+            router_system,
+            router_coverage,
+            router_commands,
+            router_jobs,
+            router_metrics,
+        ]
         if Env().DEV_MODE
         else (
-            [router_commands, router_coverage]
+            [router_commands, router_coverage, router_jobs, router_metrics]
             if hasattr(router_commands, "routes") and router_commands.routes
             else [router_commands]
         )
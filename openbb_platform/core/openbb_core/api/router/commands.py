@@ -1,14 +1,26 @@
 """Commands: generates the command map."""
 
 import inspect
+from copy import copy
 from functools import partial, wraps
 from inspect import Parameter, Signature, signature
-from typing import Any, Callable, Dict, Optional, Tuple, TypeVar
-
-from fastapi import APIRouter, Depends, Header
-from fastapi.routing import APIRoute
+from time import perf_counter_ns
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple, TypeVar
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Query
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from fastapi.routing import APIRoute, serialize_response
+from openbb_core.api.jobs import JobQueue, get_job_key
+from openbb_core.api.response_formats import (
+    ResponseFormat,
+    build_response,
+    check_response_format,
+    get_response_format,
+)
 from openbb_core.app.command_runner import CommandRunner
 from openbb_core.app.model.command_context import CommandContext
+from openbb_core.app.model.metadata import Metadata, Span
 from openbb_core.app.model.obbject import OBBject
 from openbb_core.app.model.user_settings import UserSettings
 from openbb_core.app.router import RouterLoader
@@ -16,6 +28,7 @@ from openbb_core.app.service.auth_service import AuthService
 from openbb_core.app.service.system_service import SystemService
 from openbb_core.app.service.user_service import UserService
 from openbb_core.env import Env
+from openbb_core.provider.utils.tracing import metrics
 from pydantic import BaseModel
 from typing_extensions import Annotated, ParamSpec
 
@@ -117,6 +130,64 @@ def build_new_signature(path: str, func: Callable) -> Signature:
     )
 
 
+def add_api_parameters(sig: Signature) -> Signature:
+    """Add the job and response format query flags and the Accept header to a signature.
+
+    They are only read by the API wrapper, so they are not passed to the command.
+    """
+    parameter_list = list(sig.parameters.values())
+    var_kw_pos = next(
+        (
+            pos
+            for pos, parameter in enumerate(parameter_list)
+            if parameter.kind == Parameter.VAR_KEYWORD
+        ),
+        len(parameter_list),
+    )
+    parameter_list[var_kw_pos:var_kw_pos] = [
+        Parameter(
+            "__job",
+            kind=Parameter.KEYWORD_ONLY,
+            default=None,
+            annotation=Annotated[
+                Optional[bool],
+                Query(
+                    alias="job",
+                    description="Run the command in the background. The response is the"
+                    " job, and its status and JSON result are at /jobs/{job_id} and"
+                    " /jobs/{job_id}/result. Identical jobs that have not finished are"
+                    " run once.",
+                ),
+            ],
+        ),
+        Parameter(
+            "__response_format",
+            kind=Parameter.KEYWORD_ONLY,
+            default=None,
+            annotation=Annotated[
+                Optional[ResponseFormat],
+                Query(
+                    alias="response_format",
+                    description="Format of the response, instead of the Accept header."
+                    " 'ndjson' streams the results as JSON lines, 'arrow' and 'parquet'"
+                    " return them as an Arrow IPC stream or a Parquet file."
+                    " The provider, warnings and extra info are then in the"
+                    " X-OpenBB-Provider, X-OpenBB-Warnings and X-OpenBB-Extra headers.",
+                ),
+            ],
+        ),
+        Parameter(
+            "__accept",
+            kind=Parameter.KEYWORD_ONLY,
+            default=None,
+            annotation=Annotated[
+                Optional[str], Header(alias="accept", include_in_schema=False)
+            ],
+        ),
+    ]
+    return sig.replace(parameters=parameter_list)
+
+
 def validate_output(c_out: OBBject) -> OBBject:
     """
     Validate OBBject object.
@@ -177,6 +248,38 @@ def validate_output(c_out: OBBject) -> OBBject:
     return c_out
 
 
+def add_span(obbject: OBBject, path: str, name: str, duration: int) -> None:
+    """Add a stage that ran after the command to its metadata and metrics.
+
+    The stage starts when the command finished.
+    """
+    metrics.observe_span(path, {"name": name, "duration": duration, "attributes": {}})
+    metadata = obbject.extra.get("metadata")
+    if isinstance(metadata, Metadata):
+        metadata.spans = (metadata.spans or []) + [
+            Span(name=name, start=metadata.duration, duration=duration)
+        ]
+
+
+def submit_job(
+    path: str,
+    key: str,
+    run: Callable[[], Awaitable[bytes]],
+    user_settings: UserSettings,
+) -> JSONResponse:
+    """Submit a command to the job queue and respond with the job."""
+    api_settings = SystemService().system_settings.api_settings
+    queue = JobQueue.from_settings(
+        api_settings.jobs, user_settings.preferences.cache_directory
+    )
+    job = queue.submit(key, path, run)
+    return JSONResponse(
+        status_code=202,
+        content=jsonable_encoder(job),
+        headers={"Location": f"{api_settings.prefix}/jobs/{job.id}"},
+    )
+
+
 def build_api_wrapper(
     command_runner: CommandRunner,
     route: APIRoute,
@@ -206,6 +309,10 @@ def build_api_wrapper(
                 UserService.read_from_file(),
             )
         )
+        response_format = get_response_format(
+            kwargs.pop("__response_format", None), kwargs.pop("__accept", None)
+        )
+        job = kwargs.pop("__job", None)
         p = path.strip("/").replace("/", ".")
         defaults = (
             getattr(user_settings.defaults, "__dict__", {})
@@ -242,23 +349,64 @@ def build_api_wrapper(
             kwargs["extra_params"] = extra_params
 
         execute = partial(command_runner.run, path, user_settings)
+
+        if job:
+            if response_format != "json":
+                raise HTTPException(
+                    status_code=400, detail="Job results are only available as JSON."
+                )
+
+            async def run_job() -> bytes:
+                output = await execute(*args, **kwargs)
+                if isinstance(output, OBBject) and not no_validate:
+                    output = validate_output(output)
+                content = await serialize_response(
+                    field=None if no_validate else route.response_field,
+                    response_content=output,
+                    include=route.response_model_include,
+                    exclude=route.response_model_exclude,
+                    by_alias=route.response_model_by_alias,
+                    exclude_unset=route.response_model_exclude_unset,
+                    exclude_defaults=route.response_model_exclude_defaults,
+                    exclude_none=route.response_model_exclude_none,
+                )
+                return JSONResponse(content=content).body
+
+            return submit_job(
+                path, get_job_key(path, kwargs, user_settings), run_job, user_settings
+            )
+
+        # Fail before running the command when its output cannot be returned.
+        check_response_format(response_format)
         output = await execute(*args, **kwargs)
 
         if isinstance(output, OBBject) and not no_validate:
-            return validate_output(output)
+            start = perf_counter_ns()
+            output = validate_output(output)
+            add_span(output, path, "validate_output", perf_counter_ns() - start)
+
+        if isinstance(output, OBBject) and response_format != "json":
+            return build_response(output, response_format)
 
         return output
 
+    wrapper.__signature__ = add_api_parameters(new_signature)  # type: ignore
+
     return wrapper
 
 
 def add_command_map(command_runner: CommandRunner, api_router: APIRouter) -> None:
     """Add command map to the API router."""
     plugins_router = RouterLoader.from_extensions()
+    # The wrappers go on copies of the routes, so the shared router keeps the
+    # command endpoints that the command runner and the package builder read.
+    wrapped_router = APIRouter()
 
     for route in plugins_router.api_router.routes:
-        route.endpoint = build_api_wrapper(command_runner=command_runner, route=route)  # type: ignore # noqa
-    api_router.include_router(router=plugins_router.api_router)
+        wrapped_route = copy(route)
+        wrapped_route.endpoint = build_api_wrapper(command_runner=command_runner, route=route)  # type: ignore # noqa
+        wrapped_router.routes.append(wrapped_route)
+    api_router.include_router(router=wrapped_router)
 
 
 system_settings = SystemService(logging_sub_app="api").system_settings
@@ -0,0 +1,44 @@
+"""Jobs router."""
+
+from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import JSONResponse, Response
+from openbb_core.api.dependency.jobs import get_job_queue
+from openbb_core.api.jobs import Job, JobQueue
+from typing_extensions import Annotated
+
+router = APIRouter(prefix="/jobs", tags=["Jobs"])
+
+
+def _get_job(queue: JobQueue, job_id: str) -> Job:
+    """Get a job, or raise a 404 error when it does not exist or has expired."""
+    job = queue.store.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Job {job_id} not found.")
+    return job
+
+
+@router.get("/{job_id}", openapi_extra={"widget_config": {"exclude": True}})
+async def get_job(
+    job_id: str, queue: Annotated[JobQueue, Depends(get_job_queue)]
+) -> Job:
+    """Get the status of a job."""
+    return _get_job(queue, job_id)
+
+
+@router.get("/{job_id}/result", openapi_extra={"widget_config": {"exclude": True}})
+async def get_job_result(
+    job_id: str, queue: Annotated[JobQueue, Depends(get_job_queue)]
+) -> Response:
+    """Get the result of a job, or its error when it failed."""
+    job = _get_job(queue, job_id)
+    if job.status == "failed" and job.status_code == 204:
+        # A command without data has no content, as in its exception handler.
+        return Response(status_code=204)
+    if job.status == "failed":
+        return JSONResponse(
+            status_code=job.status_code or 500, content={"detail": job.error}
+        )
+    result = queue.store.get_result(job_id)
+    if result is None:
+        raise HTTPException(status_code=409, detail=f"Job {job_id} is {job.status}.")
+    return Response(content=result, media_type="application/json")
@@ -0,0 +1,23 @@
+"""Metrics router."""
+
+from fastapi import APIRouter, Depends
+from fastapi.responses import PlainTextResponse
+from openbb_core.app.service.auth_service import AuthService
+from openbb_core.provider.utils.tracing import metrics
+from typing_extensions import Annotated
+
+router = APIRouter(prefix="/metrics", tags=["Metrics"])
+
+
+@router.get(
+    "",
+    response_class=PlainTextResponse,
+    openapi_extra={"widget_config": {"exclude": True}},
+)
+async def get_metrics(
+    _: Annotated[None, Depends(AuthService().auth_hook)],
+) -> PlainTextResponse:
+    """Get the metrics of the commands, in the Prometheus text format."""
+    return PlainTextResponse(
+        metrics.render(), media_type="text/plain; version=0.0.4; charset=utf-8"
+    )
@@ -3,23 +3,43 @@
 # pylint: disable=R0903
 
 from copy import deepcopy
-from dataclasses import asdict, is_dataclass
+from dataclasses import asdict, fields, is_dataclass
 from datetime import datetime
 from inspect import Parameter, signature
 from sys import exc_info
-from time import perf_counter_ns
-from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple, Type
+from time import perf_counter_ns, time_ns
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    List,
+    Optional,
+    Tuple,
+    Type,
+)
 from warnings import catch_warnings, showwarning, warn
 
 from openbb_core.app.model.abstract.error import OpenBBError
 from openbb_core.app.model.abstract.warning import OpenBBWarning, cast_warning
-from openbb_core.app.model.metadata import Metadata
+from openbb_core.app.model.data_table import DataTable
+from openbb_core.app.model.metadata import Metadata, Span
 from openbb_core.app.model.obbject import OBBject
 from openbb_core.app.provider_interface import ExtraParams
-from openbb_core.app.static.package_builder import PathHandler
 from openbb_core.env import Env
-from openbb_core.provider.utils.helpers import maybe_coroutine, run_async
-from pydantic import BaseModel, ConfigDict, create_model
+from openbb_core.provider.utils.helpers import (
+    EventLoopThread,
+    maybe_coroutine,
+)
+from openbb_core.provider.utils.response_cache import cache_stats
+from openbb_core.provider.utils.tracing import (
+    current_spans,
+    export_spans,
+    metrics,
+    span,
+)
+from pydantic import BaseModel, ConfigDict, ValidationError, create_model
 
 if TYPE_CHECKING:
     from fastapi.routing import APIRoute
@@ -31,9 +51,6 @@ if TYPE_CHECKING:
 class ExecutionContext:
     """Execution context."""
 
-    # For checking if the command specifies no validation in the API Route
-    _route_map = PathHandler.build_route_map()
-
     def __init__(
         self,
         command_map: "CommandMap",
@@ -50,12 +67,44 @@ class ExecutionContext:
     @property
     def api_route(self) -> "APIRoute":
         """API route."""
-        return self._route_map[self.route]
+        return self.command_map.get_api_route(self.route)  # type: ignore[return-value]
+
+
+class ValidationPlan:
+    """Parameter validation plan, compiled once per command function.
+
+    Holds everything `ParametersBuilder` needs that only depends on the function:
+    the polished signature, the pydantic validation model and the set of valid
+    `ExtraParams` fields.
+    """
+
+    def __init__(self, func: Callable) -> None:
+        """Compile the validation plan for a function."""
+        self.func = ParametersBuilder.get_polished_func(func=func)
+        self.parameters = ParametersBuilder.get_polished_parameter_list(func=self.func)
+        self.model = ParametersBuilder.get_validation_model(func=self.func)
+        # pylint: disable=protected-access
+        self.extra_params_fields = ParametersBuilder._get_extra_params_fields(
+            self.model
+        )
 
 
 class ParametersBuilder:
     """Build parameters for a function."""
 
+    # Validation plans, keyed by the command function they were compiled for.
+    _plans: Dict[Callable, ValidationPlan] = {}
+
+    @classmethod
+    def get_plan(cls, func: Callable) -> ValidationPlan:
+        """Get the validation plan for a function, compiling it on first use."""
+        plan = cls._plans.get(func)
+        if plan is None:
+            plan = ValidationPlan(func)
+            cls._plans[func] = plan
+            cls._plans[plan.func] = plan
+        return plan
+
     @staticmethod
     def get_polished_parameter_list(func: Callable) -> List[Parameter]:
         """Get the signature parameters values as a list."""
@@ -75,7 +124,7 @@ class ParametersBuilder:
             parameter_map.pop("__authenticated_user_settings")
 
         parameter_list = list(parameter_map.values())
-        new_signature = signature(func).replace(parameters=parameter_list)
+        new_signature = sig.replace(parameters=parameter_list)
 
         func.__signature__ = new_signature  # type: ignore
         func.__annotations__ = parameter_map
@@ -89,10 +138,12 @@ class ParametersBuilder:
         args: Tuple[Any, ...],
         kwargs: Dict[str, Any],
     ) -> Dict[str, Any]:
-        """Merge args and kwargs into a single dict."""
-        args = deepcopy(args)
-        kwargs = deepcopy(kwargs)
-        parameter_list = cls.get_polished_parameter_list(func=func)
+        """Merge args and kwargs into a single dict.
+
+        The values are not copied, only the container is new. Commands must not
+        mutate their inputs in place.
+        """
+        parameter_list = cls.get_plan(func).parameters
         parameter_map = {}
 
         for index, parameter in enumerate(parameter_list):
@@ -128,11 +179,8 @@ class ParametersBuilder:
         return kwargs
 
     @staticmethod
-    def _warn_kwargs(
-        extra_params: Dict[str, Any],
-        model: Type[BaseModel],
-    ) -> None:
-        """Warn if kwargs received and ignored by the validation model."""
+    def _get_extra_params_fields(model: Type[BaseModel]) -> Optional[FrozenSet[str]]:
+        """Get the valid extra_params fields of a validation model, if any."""
         # We only check the extra_params annotation because ignored fields
         # will always be there
         annotation = getattr(
@@ -141,15 +189,35 @@ class ParametersBuilder:
         if is_dataclass(annotation) and any(
             t is ExtraParams for t in getattr(annotation, "__bases__", [])
         ):
-            valid = asdict(annotation())  # type: ignore
-            for p in extra_params:
-                if "chart_params" in p:
-                    continue
-                if p not in valid:
-                    warn(
-                        message=f"Parameter '{p}' not found.",
-                        category=OpenBBWarning,
-                    )
+            return frozenset(f.name for f in fields(annotation))
+        return None
+
+    @staticmethod
+    def _warn_extra_params(
+        extra_params: Dict[str, Any],
+        valid: Optional[FrozenSet[str]],
+    ) -> None:
+        """Warn if extra params are not in the set of valid fields."""
+        if valid is None:
+            return
+        for p in extra_params:
+            if "chart_params" in p:
+                continue
+            if p not in valid:
+                warn(
+                    message=f"Parameter '{p}' not found.",
+                    category=OpenBBWarning,
+                )
+
+    @staticmethod
+    def _warn_kwargs(
+        extra_params: Dict[str, Any],
+        model: Type[BaseModel],
+    ) -> None:
+        """Warn if kwargs received and ignored by the validation model."""
+        ParametersBuilder._warn_extra_params(
+            extra_params, ParametersBuilder._get_extra_params_fields(model)
+        )
 
     @staticmethod
     def _as_dict(obj: Any) -> Dict[str, Any]:
@@ -162,13 +230,10 @@ class ParametersBuilder:
             return {}
 
     @staticmethod
-    def validate_kwargs(
-        func: Callable,
-        kwargs: Dict[str, Any],
-    ) -> Dict[str, Any]:
-        """Validate kwargs and if possible coerce to the correct type."""
+    def get_validation_model(func: Callable) -> Type[BaseModel]:
+        """Create the pydantic model used to validate the function parameters."""
         sig = signature(func)
-        fields = {
+        fields_ = {
             n: (
                 Any if p.annotation is Parameter.empty else p.annotation,
                 ... if p.default is Parameter.empty else p.default,
@@ -178,14 +243,32 @@ class ParametersBuilder:
         # We allow extra fields to return with model with 'cc: CommandContext'
         config = ConfigDict(extra="allow", arbitrary_types_allowed=True)
         # pylint: disable=C0103
-        ValidationModel = create_model(func.__name__, __config__=config, **fields)  # type: ignore
+        ValidationModel = create_model(func.__name__, __config__=config, **fields_)  # type: ignore
+        return ValidationModel
+
+    @classmethod
+    def validate_kwargs(
+        cls,
+        func: Callable,
+        kwargs: Dict[str, Any],
+    ) -> Dict[str, Any]:
+        """Validate kwargs and if possible coerce to the correct type."""
+        plan = cls.get_plan(func)
+        # Tables are already lists of Data, validating them would build every row.
+        tables = {k: v for k, v in kwargs.items() if isinstance(v, DataTable)}
         # Validate and coerce
-        model = ValidationModel(**kwargs)
-        ParametersBuilder._warn_kwargs(
-            ParametersBuilder._as_dict(kwargs.get("extra_params", {})),
-            ValidationModel,
+        try:
+            model = plan.model(**{**kwargs, **dict.fromkeys(tables, [])})
+        except ValidationError:
+            if not tables:
+                raise
+            tables = {}
+            model = plan.model(**kwargs)
+        cls._warn_extra_params(
+            cls._as_dict(kwargs.get("extra_params", {})),
+            plan.extra_params_fields,
         )
-        return dict(model)
+        return {**dict(model), **tables}
 
     # pylint: disable=R0913
     @classmethod
@@ -197,7 +280,7 @@ class ParametersBuilder:
         kwargs: Dict[str, Any],
     ) -> Dict[str, Any]:
         """Build the parameters for a function."""
-        func = cls.get_polished_func(func=func)
+        func = cls.get_plan(func).func
         system_settings = execution_context.system_settings
         user_settings = execution_context.user_settings
 
@@ -248,6 +331,12 @@ class StaticCommandRunner:
     ) -> None:
         """Create a chart from the command output."""
         try:
+            if "charting" not in obbject.accessors:
+                # pylint: disable=import-outside-toplevel
+                from openbb_core.app.extension_loader import ExtensionLoader
+
+                # The OBBject extensions register their accessors when loaded.
+                _ = ExtensionLoader().obbject_objects  # type: ignore[attr-defined]
             if "charting" not in obbject.accessors:
                 raise OpenBBError(
                     "Charting is not installed. Please install `openbb-charting`."
@@ -312,12 +401,13 @@ class StaticCommandRunner:
                 # added to the function signature in the router decorator
                 chart = kwargs.pop("chart", False)
 
-                kwargs = ParametersBuilder.build(
-                    args=args,
-                    execution_context=execution_context,
-                    func=func,
-                    kwargs=kwargs,
-                )
+                with span("parameters"):
+                    kwargs = ParametersBuilder.build(
+                        args=args,
+                        execution_context=execution_context,
+                        func=func,
+                        kwargs=kwargs,
+                    )
                 kwargs = kwargs if kwargs is not None else {}
                 # If we're on the api we need to remove "chart" here because the parameter is added on
                 # commands.py and the function signature does not expect "chart"
@@ -347,7 +437,8 @@ class StaticCommandRunner:
                         extra_params
                     )
                     if chart and obbject.results:
-                        cls._chart(obbject, **kwargs)
+                        with span("chart"):
+                            cls._chart(obbject, **kwargs)
 
                 raised_warnings = warning_list if warning_list else []
         finally:
@@ -395,23 +486,35 @@ class StaticCommandRunner:
     ) -> OBBject:
         """Run a command and return the OBBject as output."""
         timestamp = datetime.now()
+        start_time = time_ns()
         start_ns = perf_counter_ns()
 
         command_map = execution_context.command_map
         route = execution_context.route
+        stats_token = cache_stats.set({})
+        spans: List[Dict[str, Any]] = []
+        spans_token = current_spans.set(spans)
+        error = True
 
-        if func := command_map.get_command(route=route):
-            obbject = await cls._execute_func(
-                route=route,
-                args=args,  # type: ignore
-                execution_context=execution_context,
-                func=func,
-                kwargs=kwargs,
-            )
-        else:
-            raise AttributeError(f"Invalid command : route={route}")
-
-        duration = perf_counter_ns() - start_ns
+        try:
+            if func := command_map.get_command(route=route):
+                obbject = await cls._execute_func(
+                    route=route,
+                    args=args,  # type: ignore
+                    execution_context=execution_context,
+                    func=func,
+                    kwargs=kwargs,
+                )
+            else:
+                raise AttributeError(f"Invalid command : route={route}")
+            cache = cache_stats.get()
+            error = False
+        finally:
+            cache_stats.reset(stats_token)
+            current_spans.reset(spans_token)
+            duration = perf_counter_ns() - start_ns
+            metrics.observe(route, duration, spans, error=error)
+            export_spans(route, start_ns, start_time, spans)
 
         if execution_context.user_settings.preferences.metadata and isinstance(
             obbject, OBBject
@@ -422,6 +525,17 @@ class StaticCommandRunner:
                     duration=duration,
                     route=route,
                     timestamp=timestamp,
+                    cache=cache or None,
+                    spans=[
+                        Span(
+                            name=s["name"],
+                            start=s["start"] - start_ns,
+                            duration=s["duration"],
+                            attributes=s["attributes"],
+                        )
+                        for s in sorted(spans, key=lambda s: s["start"])
+                    ]
+                    or None,
                 )
             except Exception as e:
                 if Env().DEBUG_MODE:
@@ -449,6 +563,7 @@ class CommandRunner:
         self._command_map = command_map or CommandMap()
         self._system_settings = system_settings or SystemService().system_settings
         self._user_settings = user_settings or UserService.read_from_file()
+        self._event_loop = EventLoopThread()
 
     def init_logging_service(self) -> None:
         """Initialize the logging service."""
@@ -478,6 +593,15 @@ class CommandRunner:
     def user_settings(self, user_settings: "UserSettings") -> None:
         self._user_settings = user_settings
 
+    @property
+    def event_loop(self) -> EventLoopThread:
+        """Background event loop used by synchronous calls."""
+        return self._event_loop
+
+    def close(self) -> None:
+        """Stop the background event loop used by synchronous calls."""
+        self._event_loop.stop()
+
     # pylint: disable=W1113
     async def run(
         self,
@@ -511,4 +635,4 @@ class CommandRunner:
         **kwargs,
     ) -> OBBject:
         """Run a command and return the OBBject as output."""
-        return run_async(self.run, route, user_settings, *args, **kwargs)
+        return self._event_loop.run(self.run, route, user_settings, *args, **kwargs)
@@ -93,6 +93,32 @@ class ExtensionLoader(metaclass=SingletonMeta):
         """Given an extension name, return the corresponding entry point."""
         return self._get_entry_point(self._provider_entry_points, ext_name)
 
+    @property
+    def extension_map(self) -> Dict[str, List[str]]:
+        """Return the installed extensions by group, as `name@version`."""
+        return {
+            group: [f"{e.name}@{getattr(e.dist, 'version', '')}" for e in eps]
+            for group, eps in zip(OpenBBGroups.groups(), self.entry_points)
+        }
+
+    def get_core_object(self, ext_name: str) -> Optional["Router"]:
+        """Given an extension name, load and return the corresponding router."""
+        if ext_name not in self._core_objects:
+            ep = self.get_core_entry_point(ext_name)
+            if ep is None or (entry := self._load_core(ep)) is None:
+                return None
+            self._core_objects[ext_name] = entry
+        return self._core_objects[ext_name]
+
+    def get_provider_object(self, ext_name: str) -> Optional["Provider"]:
+        """Given an extension name, load and return the corresponding provider."""
+        if ext_name not in self._provider_objects:
+            ep = self.get_provider_entry_point(ext_name)
+            if ep is None or (entry := self._load_provider(ep)) is None:
+                return None
+            self._provider_objects[ext_name] = entry
+        return self._provider_objects[ext_name]
+
     @property
     @lru_cache
     def obbject_objects(self) -> Dict[str, Extension]:
@@ -106,18 +132,22 @@ class ExtensionLoader(metaclass=SingletonMeta):
     @lru_cache
     def core_objects(self) -> Dict[str, "Router"]:
         """Return a dict of core extension objects."""
-        self._core_objects = self._load_entry_points(
-            self._core_entry_points, OpenBBGroups.core
-        )
+        self._core_objects = {
+            ep.name: entry
+            for ep in self._core_entry_points
+            if (entry := self.get_core_object(ep.name)) is not None
+        }
         return self._core_objects
 
     @property
     @lru_cache
     def provider_objects(self) -> Dict[str, "Provider"]:
         """Return a dict of provider extension objects."""
-        self._provider_objects = self._load_entry_points(
-            self._provider_entry_points, OpenBBGroups.provider
-        )
+        self._provider_objects = {
+            ep.name: entry
+            for ep in self._provider_entry_points
+            if (entry := self.get_provider_object(ep.name)) is not None
+        }
         return self._provider_objects
 
     @staticmethod
@@ -125,6 +155,27 @@ class ExtensionLoader(metaclass=SingletonMeta):
         """Return a sorted dictionary of entry points."""
         return sorted(entry_points(group=group))  # type: ignore
 
+    @staticmethod
+    def _load_core(ep: EntryPoint) -> Optional["Router"]:
+        """Load a core entry point, if it is a router."""
+        # pylint: disable=import-outside-toplevel
+        from openbb_core.app.router import Router
+
+        entry = ep.load()
+        return entry if isinstance(entry, Router) else None
+
+    @staticmethod
+    def _load_provider(ep: EntryPoint) -> Optional["Provider"]:
+        """Load a provider entry point, if it is a provider and its dependencies are installed."""
+        # pylint: disable=import-outside-toplevel
+        from openbb_core.provider.abstract.provider import Provider
+
+        try:
+            entry = ep.load()
+        except ModuleNotFoundError:
+            return None
+        return entry if isinstance(entry, Provider) else None
+
     def _load_entry_points(
         self, entry_points_: EntryPoints, group: OpenBBGroups
     ) -> Dict[str, Any]:
@@ -144,11 +195,10 @@ class ExtensionLoader(metaclass=SingletonMeta):
 
         def load_core(eps: EntryPoints) -> Dict[str, "Router"]:
             """Return a dictionary of core objects."""
-            # pylint: disable=import-outside-toplevel
-            from openbb_core.app.router import Router
-
             return {
-                ep.name: entry for ep in eps if isinstance((entry := ep.load()), Router)
+                ep.name: entry
+                for ep in eps
+                if (entry := self._load_core(ep)) is not None
             }
 
         def load_provider(eps: EntryPoints) -> Dict[str, "Provider"]:
@@ -157,17 +207,11 @@ class ExtensionLoader(metaclass=SingletonMeta):
 
             Keys are entry point names and values are instances of the Provider class.
             """
-            # pylint: disable=import-outside-toplevel
-            from openbb_core.provider.abstract.provider import Provider
-
-            entries: dict = {}
-            for ep in eps:
-                try:
-                    if isinstance((entry := ep.load()), Provider):
-                        entries[ep.name] = entry
-                except ModuleNotFoundError:
-                    continue
-            return entries
+            return {
+                ep.name: entry
+                for ep in eps
+                if (entry := self._load_provider(ep)) is not None
+            }
 
         func = {
             OpenBBGroups.obbject: load_obbject,
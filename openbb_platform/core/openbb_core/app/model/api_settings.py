@@ -2,7 +2,7 @@
 
 from typing import Dict, List, Optional
 
-from pydantic import BaseModel, ConfigDict, Field, computed_field
+from pydantic import BaseModel, ConfigDict, Field, PositiveInt, computed_field
 
 
 class Cors(BaseModel):
@@ -24,6 +24,23 @@ class Servers(BaseModel):
     description: str = "Local OpenBB development server"
 
 
+class JobSettings(BaseModel):
+    """Job settings model for FastAPI configuration."""
+
+    model_config = ConfigDict(frozen=True)
+
+    workers: PositiveInt = Field(
+        default=4, description="Number of jobs that run at the same time."
+    )
+    ttl: PositiveInt = Field(
+        default=3600, description="Seconds to keep the result of a finished job."
+    )
+    directory: Optional[str] = Field(
+        default=None,
+        description="Directory of the job results. Defaults to the cache directory of the user.",
+    )
+
+
 class APISettings(BaseModel):
     """Settings model for FastAPI configuration."""
 
@@ -40,6 +57,7 @@ class APISettings(BaseModel):
     license_url: str = "https://github.com/OpenBB-finance/OpenBB/blob/develop/LICENSE"
     servers: List[Servers] = Field(default_factory=lambda: [Servers()])
     cors: Cors = Field(default_factory=Cors)
+    jobs: JobSettings = Field(default_factory=JobSettings)
     custom_headers: Optional[Dict[str, str]] = Field(
         default=None, description="Custom headers and respective default value."
     )
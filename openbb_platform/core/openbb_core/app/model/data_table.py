@@ -0,0 +1,247 @@
+"""Columnar table of Data rows."""
+
+import ast
+from collections.abc import Sequence
+from contextlib import suppress
+from datetime import time
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional, Union, overload
+
+from openbb_core.provider.abstract.data import Data
+from pydantic_core import SchemaSerializer, core_schema
+
+if TYPE_CHECKING:
+    # pylint: disable=import-outside-toplevel
+    from pandas import DataFrame, Series
+
+
+def convert_dates(dates: "Series") -> "Series":
+    """Convert a column to datetimes, or to dates when there are no times."""
+    # pylint: disable=import-outside-toplevel
+    from pandas import to_datetime
+
+    try:
+        converted = to_datetime(dates)
+    except (TypeError, ValueError):
+        # Mixed time zones can only be converted one by one.
+        converted = dates.apply(to_datetime)
+        if all(t.time() == time(0, 0) for t in converted):
+            return converted.apply(lambda x: x.date())
+        return converted
+
+    if hasattr(converted, "dt") and (converted == converted.dt.normalize()).all():
+        return converted.dt.date
+    return converted
+
+
+def _to_iso_strings(column: "Series") -> List[Optional[str]]:
+    """Format a datetime column as the ISO strings of `DataFrame.to_json`."""
+    # pylint: disable=import-outside-toplevel
+    from json import loads
+
+    return [
+        v[0]
+        for v in loads(column.to_frame().to_json(orient="values", date_format="iso"))
+    ]
+
+
+def _get_column_values(name: str, column: "Series") -> List[Any]:
+    """Get the values of a column as they are serialized by `df_to_basemodel`."""
+    # pylint: disable=import-outside-toplevel
+    from pandas import isna
+    from pandas.api.types import is_datetime64_any_dtype
+
+    mask = isna(column).tolist()
+    if name == "date" and len(column) and not is_datetime64_any_dtype(column):
+        with suppress(TypeError, ValueError):
+            column = convert_dates(column)
+
+    if is_datetime64_any_dtype(column):
+        if name == "date" and (column == column.dt.normalize()).all():
+            values = column.dt.strftime("%Y-%m-%d").tolist()
+        else:
+            values = _to_iso_strings(column)
+    elif name == "date":
+        values = [
+            v.strftime("%Y-%m-%d") if hasattr(v, "strftime") else v
+            for v in column.tolist()
+        ]
+    else:
+        values = column.tolist()
+
+    if any(mask):
+        values = [None if m else v for v, m in zip(values, mask)]
+    return values
+
+
+class DataTable(Sequence):
+    """Sequence of Data rows, backed by a DataFrame.
+
+    Analytics commands pass the columns from one step to the next without building
+    a Data model per row or serializing them to JSON. The rows are only built when
+    they are accessed, and serialize exactly like the list of Data that
+    `df_to_basemodel` returns: missing values are None and datetimes are ISO strings.
+
+    The table is a snapshot of its columns. Changes to the rows are not reflected in
+    `to_dataframe`, so build a new table from a modified DataFrame instead.
+    """
+
+    __slots__ = ("_frame", "_rows")
+
+    def __init__(self, frame: "DataFrame") -> None:
+        """Initialize the table from a DataFrame with the fields as columns."""
+        self._frame = frame
+        self._rows: Optional[List[Data]] = None
+
+    @classmethod
+    def from_dataframe(
+        cls, df: Union["DataFrame", "Series"], index: bool = False
+    ) -> "DataTable":
+        """Create a table from a DataFrame, keeping named and multi-level indexes as columns."""
+        # pylint: disable=import-outside-toplevel
+        from pandas import MultiIndex, RangeIndex, Series
+
+        if isinstance(df, Series):
+            df = df.to_frame()
+
+        if isinstance(df.index, MultiIndex):
+            df = df.assign(is_multiindex=True, multiindex_names=str(df.index.names))
+            df = df.reset_index()
+        elif index or df.index.name:
+            df = df.reset_index()
+        elif not isinstance(df.index, RangeIndex) or df.index.start != 0:
+            df = df.reset_index(drop=True)
+
+        return cls(df)
+
+    @classmethod
+    def from_rows(cls, rows: List[Any]) -> "DataTable":
+        """Create a table from a list of Data or dictionaries."""
+        # pylint: disable=import-outside-toplevel
+        from pandas import DataFrame
+
+        table = cls(
+            DataFrame(
+                [r.model_dump() if isinstance(r, Data) else dict(r) for r in rows]
+            )
+        )
+        if rows and all(isinstance(r, Data) for r in rows):
+            table._rows = list(rows)
+        return table
+
+    @property
+    def columns(self) -> List[str]:
+        """Names of the fields."""
+        return [str(c) for c in self._frame.columns]
+
+    def to_dataframe(self, index: Optional[str] = None) -> "DataFrame":
+        """Get the columns as a DataFrame, as `basemodel_to_df` builds it from the rows.
+
+        Columns without values are dropped, multi-level indexes are restored and the
+        "date" column is converted to datetimes, or to dates when there are no times.
+        """
+        df = self._frame.dropna(axis=1, how="all")
+
+        if "is_multiindex" in df.columns:
+            col_names = ast.literal_eval(df.multiindex_names.unique()[0])
+            df = df.set_index(col_names)
+            df = df.drop(["is_multiindex", "multiindex_names"], axis=1)
+
+        if "date" in df.columns:
+            df = df.assign(date=convert_dates(df["date"]))
+
+        if index and index in df.columns:
+            df = df.set_index(index)
+            if index == "date":
+                df = df.sort_index(axis=0)
+
+        return df
+
+    def to_records(self) -> List[Dict[str, Any]]:
+        """Get the rows as dictionaries of JSON compatible values."""
+        names = [str(c) for c in self._frame.columns]
+        columns = [
+            _get_column_values(name, column)
+            for name, (_, column) in zip(names, self._frame.items())
+        ]
+        return [dict(zip(names, row)) for row in zip(*columns)]
+
+    def model_dump(self) -> List[Dict[str, Any]]:
+        """Serialize the rows like a list of Data."""
+        return self.to_records()
+
+    def _get_rows(self) -> List[Data]:
+        """Build the rows on first access."""
+        if self._rows is None:
+            self._rows = [Data.model_construct(**r) for r in self.to_records()]
+        return self._rows
+
+    def __len__(self) -> int:
+        """Get the number of rows."""
+        return len(self._frame)
+
+    @overload
+    def __getitem__(self, item: int) -> Data: ...
+
+    @overload
+    def __getitem__(self, item: slice) -> "DataTable": ...
+
+    def __getitem__(self, item):
+        """Get a row, or a table with a slice of the rows."""
+        if isinstance(item, slice):
+            return DataTable(self._frame.iloc[item].reset_index(drop=True))
+        return self._get_rows()[item]
+
+    def __iter__(self) -> Iterator[Data]:
+        """Iterate over the rows."""
+        return iter(self._get_rows())
+
+    def __eq__(self, other: Any) -> bool:
+        """Compare with another table, or with a list of rows."""
+        if isinstance(other, DataTable):
+            return self._frame.equals(other._frame)
+        if isinstance(other, list):
+            return self._get_rows() == other
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        """Return a short representation of the table."""
+        return f"{self.__class__.__name__}(rows={len(self)}, columns={self.columns})"
+
+    @classmethod
+    def __get_pydantic_core_schema__(cls, source: Any, handler: Any):
+        """Validate tables, DataFrames and lists of rows, and serialize as a list of rows."""
+
+        def validate(value: Any) -> "DataTable":
+            # pylint: disable=import-outside-toplevel
+            from pandas import DataFrame
+
+            if isinstance(value, DataTable):
+                return value
+            if isinstance(value, DataFrame):
+                return cls.from_dataframe(value)
+            return cls.from_rows(list(value))
+
+        return core_schema.json_or_python_schema(
+            json_schema=core_schema.no_info_after_validator_function(
+                cls.from_rows, handler.generate_schema(List[Data])
+            ),
+            python_schema=core_schema.lax_or_strict_schema(
+                lax_schema=core_schema.no_info_plain_validator_function(validate),
+                strict_schema=core_schema.is_instance_schema(cls),
+            ),
+            serialization=core_schema.plain_serializer_function_ser_schema(
+                lambda v: v.to_records()
+            ),
+        )
+
+
+# Serialize the tables held by fields without a type, like the results of an OBBject.
+DataTable.__pydantic_serializer__ = SchemaSerializer(  # type: ignore[attr-defined]
+    core_schema.any_schema(
+        serialization=core_schema.plain_serializer_function_ser_schema(
+            lambda v: v.to_records()
+        )
+    )
+)
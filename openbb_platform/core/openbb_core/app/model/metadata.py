@@ -1,12 +1,31 @@
 """Metadata model."""
 
 from datetime import datetime
-from typing import Any, Dict, Optional, Sequence, Union
+from typing import Any, Dict, List, Optional, Sequence, Union
 
+from openbb_core.app.model.data_table import DataTable
 from openbb_core.provider.abstract.data import Data
 from pydantic import BaseModel, Field, field_validator
 
 
+class Span(BaseModel):
+    """Timing of a stage of a command execution."""
+
+    name: str = Field(
+        description="Stage: parameters, provider, transform_query, extract_data,"
+        + " http, transform_data or chart."
+    )
+    start: int = Field(
+        description="Start of the stage in nano second, from the start of the command."
+    )
+    duration: int = Field(description="Duration of the stage in nano second.")
+    attributes: Dict[str, Any] = Field(
+        default_factory=dict,
+        description="Attributes of the stage, like the URL, status and bytes of a"
+        + " request, the rows of the data, or the memory allocated.",
+    )
+
+
 class Metadata(BaseModel):
     """Metadata of a command execution."""
 
@@ -19,6 +38,14 @@ class Metadata(BaseModel):
     )
     route: str = Field(description="Route of the command.")
     timestamp: datetime = Field(description="Execution starting timestamp.")
+    cache: Optional[Dict[str, int]] = Field(
+        default=None,
+        description="Response cache hits and misses of the command, and its queries"
+        + " coalesced with an identical query that was running.",
+    )
+    spans: Optional[List[Span]] = Field(
+        default=None, description="Timing of the stages of the command."
+    )
 
     def __repr__(self) -> str:
         """Return string representation."""
@@ -72,6 +99,13 @@ class Metadata(BaseModel):
                         "columns": list(set(ld_columns)),
                     }
 
+                # DataTable
+                elif isinstance(arg_val, DataTable):
+                    new_arg_val = {
+                        "type": f"List[{Data.__name__}]",
+                        "columns": arg_val.columns,
+                    }
+
                 # DataFrame
                 elif isinstance(arg_val, DataFrame):
                     df_columns = (
@@ -165,6 +165,7 @@ class OBBject(Tagged, Generic[T]):
         # pylint: disable=import-outside-toplevel
         from pandas import DataFrame, Series, concat  # noqa
         from openbb_core.app.utils import basemodel_to_df  # noqa
+        from openbb_core.app.model.data_table import DataTable  # noqa
 
         def is_list_of_basemodel(items: Union[List[T], T]) -> bool:
             return isinstance(items, list) and all(
@@ -182,8 +183,13 @@ class OBBject(Tagged, Generic[T]):
             df = None
             sort_columns = True
 
+            # DataTable
+            if isinstance(res, DataTable):
+                df = res.to_dataframe(index)
+                sort_columns = False
+
             # BaseModel
-            if isinstance(res, BaseModel):
+            elif isinstance(res, BaseModel):
                 res_dict = res.model_dump(  # pylint: disable=no-member
                     exclude_unset=True, exclude_none=True
                 )
@@ -1,9 +1,32 @@
 """Preferences for the OpenBB platform."""
 
 from pathlib import Path
-from typing import Literal
+from typing import Dict, List, Literal
 
-from pydantic import BaseModel, ConfigDict, Field, PositiveInt
+from pydantic import BaseModel, ConfigDict, Field, NonNegativeInt, PositiveInt
+
+
+class ResponseCacheSettings(BaseModel):
+    """Response cache settings."""
+
+    ttl: Dict[str, NonNegativeInt] = Field(
+        default_factory=dict,
+        description="Seconds to cache the results of each model. Keys are 'provider.Model', 'Model' or '*',"
+        + " the most specific one is used. Models without a time to live are not cached.",
+    )
+    memory_items: NonNegativeInt = Field(
+        default=128, description="Number of results kept in memory."
+    )
+    disk_size: NonNegativeInt = Field(
+        default=256,
+        description="Megabytes of results kept in the cache directory. 0 disables the disk cache.",
+    )
+    incremental: List[str] = Field(
+        default_factory=list,
+        description="Historical models, as 'provider.Model', 'Model' or '*', for which only the dates"
+        + " not fetched before are requested from the provider. Supported models are EquityHistorical,"
+        + " CryptoHistorical, CurrencyHistorical, IndexHistorical and FredSeries.",
+    )
 
 
 class Preferences(BaseModel):
@@ -22,6 +45,10 @@ class Preferences(BaseModel):
         validate_default=True,
     )
     request_timeout: PositiveInt = 60
+    response_cache: ResponseCacheSettings = Field(
+        default_factory=ResponseCacheSettings,
+        description="Cache of provider responses.",
+    )
     show_warnings: bool = False
     table_style: Literal["dark", "light"] = "dark"
     user_styles_directory: str = str(Path.home() / "OpenBBUserData" / "styles" / "user")
@@ -36,6 +36,10 @@ class PythonSettings(BaseModel):
             - auth: str | list - Basic authentication.
             - headers: dict - Request headers.
             - cookies: dict - Dictionary of session cookies.
+            - limit: int - Total number of simultaneous connections.  # aiohttp only
+            - limit_per_host: int - Number of simultaneous connections to the same host.
+            - ttl_dns_cache: int - Seconds to cache DNS lookups.  # aiohttp only
+            - keepalive_timeout: float - Seconds to keep idle connections open.  # aiohttp only
 
         Any additional keys supplied will be ignored unless explicitly implemented via custom code.
 
@@ -48,6 +52,11 @@ class PythonSettings(BaseModel):
         Return a session object with the settings applied by:
             - `openbb_core.provider.utils.helpers.get_requests_session`
             - `openbb_core.provider.utils.helpers.get_async_requests_session`
+
+        Unless a session is passed, the request functions use a shared session per settings,
+        which keeps connections alive between calls:
+            - `openbb_core.provider.utils.helpers.get_pooled_requests_session`
+            - `openbb_core.provider.utils.helpers.get_pooled_session`
         """,
     )
     uvicorn: Optional[dict] = Field(
@@ -95,6 +95,19 @@ class ProviderInterface(metaclass=SingletonMeta):
     -------
     create_executor : QueryExecutor
         Create a query executor
+    get_model_providers : ProviderChoices
+        Provider choices of a model.
+    get_params : Dict[str, Union[StandardParams, ExtraParams]]
+        Params of a model.
+    get_data : Dict[str, Union[StandardData, ExtraData]]
+        Data of a model.
+    get_return_schema : Type[BaseModel]
+        Return data schema of a model.
+    get_return_annotation : Type[OBBject]
+        Return annotation of a model.
+
+    Each of these is generated on first use, and only imports the providers of the
+    model when the registry map can find them without importing every provider.
     """
 
     def __init__(
@@ -106,23 +119,17 @@ class ProviderInterface(metaclass=SingletonMeta):
         self._registry_map = registry_map or RegistryMap()
         self._query_executor = query_executor or QueryExecutor
 
-        self._map = self._registry_map.standard_extra
-        # TODO: Try these 4 methods in a single iteration
-        self._model_providers_map = self._generate_model_providers_dc(self._map)
-        self._params = self._generate_params_dc(self._map)
-        self._data = self._generate_data_dc(self._map)
-        self._return_schema = self._generate_return_schema(self._data)
-        self._return_annotations = self._generate_return_annotations(
-            self._registry_map.original_models
-        )
-
-        self._available_providers = self._registry_map.available_providers
-        self._provider_choices = self._get_provider_choices(self._available_providers)
+        self._model_providers_map: Dict[str, ProviderChoices] = {}
+        self._params: Dict[str, Dict[str, Union[StandardParams, ExtraParams]]] = {}
+        self._data: Dict[str, Dict[str, Union[StandardData, ExtraData]]] = {}
+        self._return_schema: Dict[str, Type[BaseModel]] = {}
+        self._return_annotations: Dict[str, Type[OBBject]] = {}
+        self._provider_choices: Optional[type] = None
 
     @property
     def map(self) -> MapType:
         """Dictionary of provider information."""
-        return self._map
+        return self._registry_map.standard_extra
 
     @property
     def credentials(self) -> Dict[str, List[str]]:
@@ -132,31 +139,35 @@ class ProviderInterface(metaclass=SingletonMeta):
     @property
     def model_providers(self) -> Dict[str, ProviderChoices]:
         """Dictionary of provider choices by model."""
-        return self._model_providers_map
+        return {model: self.get_model_providers(model) for model in self.models}
 
     @property
     def params(self) -> Dict[str, Dict[str, Union[StandardParams, ExtraParams]]]:
         """Dictionary of params by model."""
-        return self._params
+        return {model: self.get_params(model) for model in self.models}
 
     @property
     def data(self) -> Dict[str, Dict[str, Union[StandardData, ExtraData]]]:
         """Dictionary of data by model."""
-        return self._data
+        return {model: self.get_data(model) for model in self.models}
 
     @property
     def return_schema(self) -> Dict[str, Type[BaseModel]]:
         """Dictionary of data by model merged."""
-        return self._return_schema
+        return {model: self.get_return_schema(model) for model in self.models}
 
     @property
     def available_providers(self) -> List[str]:
         """List of available providers."""
-        return self._available_providers
+        return self._registry_map.available_providers
 
     @property
     def provider_choices(self) -> type:
         """Dataclass with literal of provider names."""
+        if self._provider_choices is None:
+            self._provider_choices = self._get_provider_choices(
+                self.available_providers
+            )
         return self._provider_choices
 
     @property
@@ -167,7 +178,49 @@ class ProviderInterface(metaclass=SingletonMeta):
     @property
     def return_annotations(self) -> Dict[str, Type[OBBject]]:
         """Return map."""
-        return self._return_annotations
+        return {model: self.get_return_annotation(model) for model in self.models}
+
+    def get_model_providers(self, model: str) -> ProviderChoices:
+        """Get the provider choices of a model."""
+        if model not in self._model_providers_map:
+            self._model_providers_map.update(
+                self._generate_model_providers_dc(self._get_model_map(model))
+            )
+        return self._model_providers_map[model]
+
+    def get_params(self, model: str) -> Dict[str, Union[StandardParams, ExtraParams]]:
+        """Get the standard and extra params of a model."""
+        if model not in self._params:
+            self._params.update(self._generate_params_dc(self._get_model_map(model)))
+        return self._params[model]
+
+    def get_data(self, model: str) -> Dict[str, Union[StandardData, ExtraData]]:
+        """Get the standard and extra data of a model."""
+        if model not in self._data:
+            self._data.update(self._generate_data_dc(self._get_model_map(model)))
+        return self._data[model]
+
+    def get_return_schema(self, model: str) -> Type[BaseModel]:
+        """Get the return data schema of a model."""
+        if model not in self._return_schema:
+            self._return_schema.update(
+                self._generate_return_schema({model: self.get_data(model)})
+            )
+        return self._return_schema[model]
+
+    def get_return_annotation(self, model: str) -> Type[OBBject]:
+        """Get the return annotation of a model."""
+        if model not in self._return_annotations:
+            self._return_annotations.update(
+                self._generate_return_annotations(
+                    {model: self._registry_map.get_original_models(model)}
+                )
+            )
+        return self._return_annotations[model]
+
+    def _get_model_map(self, model: str) -> MapType:
+        """Get the map with the provider information of a single model."""
+        return {model: self._registry_map.get_standard_extra(model)}
 
     def create_executor(self) -> QueryExecutor:
         """Get query executor."""
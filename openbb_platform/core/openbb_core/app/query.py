@@ -43,7 +43,7 @@ class Query:
         filtered = {}
 
         query = extra_params.__class__.__name__
-        fields = asdict(self.provider_interface.params[query]["extra"]())  # type: ignore
+        fields = asdict(self.provider_interface.get_params(query)["extra"]())  # type: ignore
 
         for k, v in original.items():
             f = fields[k]
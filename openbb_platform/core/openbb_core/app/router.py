@@ -18,6 +18,7 @@ from typing import (
 )
 
 from fastapi import APIRouter, Depends
+from fastapi.routing import APIRoute
 from openbb_core.app.deprecation import DeprecationSummary, OpenBBDeprecationWarning
 from openbb_core.app.extension_loader import ExtensionLoader
 from openbb_core.app.model.abstract.warning import OpenBBWarning
@@ -244,24 +245,24 @@ class SignatureInspector:
             func = cls.inject_dependency(
                 func=func,
                 arg="provider_choices",
-                callable_=provider_interface.model_providers[model],
+                callable_=provider_interface.get_model_providers(model),
             )
 
             func = cls.inject_dependency(
                 func=func,
                 arg="standard_params",
-                callable_=provider_interface.params[model]["standard"],
+                callable_=provider_interface.get_params(model)["standard"],
             )
 
             func = cls.inject_dependency(
                 func=func,
                 arg="extra_params",
-                callable_=provider_interface.params[model]["extra"],
+                callable_=provider_interface.get_params(model)["extra"],
             )
 
             func = cls.inject_return_annotation(
                 func=func,
-                annotation=provider_interface.return_annotations[model],
+                annotation=provider_interface.get_return_annotation(model),
             )
 
         else:
@@ -364,16 +365,26 @@ class CommandMap:
         self, router: Optional[Router] = None, coverage_sep: Optional[str] = None
     ) -> None:
         """Initialize CommandMap."""
-        self._router = router or RouterLoader.from_extensions()
-        self._map = self.get_command_map(router=self._router)
+        self._router = router
+        self._map: Dict[str, Callable] = {}
+        self._routes: Dict[str, Dict[str, APIRoute]] = {}
         self._provider_coverage: Dict[str, List[str]] = {}
         self._command_coverage: Dict[str, List[str]] = {}
         self._commands_model: Dict[str, str] = {}
         self._coverage_sep = coverage_sep
 
+    @property
+    def router(self) -> Router:
+        """Get the router, loading all the extensions on first use."""
+        if self._router is None:
+            self._router = RouterLoader.from_extensions()
+        return self._router
+
     @property
     def map(self) -> Dict[str, Callable]:
         """Get command map."""
+        if not self._map:
+            self._map = self.get_command_map(router=self.router)
         return self._map
 
     @property
@@ -381,7 +392,7 @@ class CommandMap:
         """Get provider coverage."""
         if not self._provider_coverage:
             self._provider_coverage = self.get_provider_coverage(
-                router=self._router, sep=self._coverage_sep
+                router=self.router, sep=self._coverage_sep
             )
         return self._provider_coverage
 
@@ -390,7 +401,7 @@ class CommandMap:
         """Get command coverage."""
         if not self._command_coverage:
             self._command_coverage = self.get_command_coverage(
-                router=self._router, sep=self._coverage_sep
+                router=self.router, sep=self._coverage_sep
             )
         return self._command_coverage
 
@@ -399,7 +410,7 @@ class CommandMap:
         """Get commands model."""
         if not self._commands_model:
             self._commands_model = self.get_commands_model(
-                router=self._router, sep=self._coverage_sep
+                router=self.router, sep=self._coverage_sep
             )
         return self._commands_model
 
@@ -492,7 +503,23 @@ class CommandMap:
 
     def get_command(self, route: str) -> Optional[Callable]:
         """Get command from route."""
-        return self._map.get(route, None)
+        api_route = self.get_api_route(route)
+        return getattr(api_route, "endpoint", None)
+
+    def get_api_route(self, route: str) -> Optional[APIRoute]:
+        """Get the API route, loading only the extension of the route if none is loaded yet."""
+        name = route.strip("/").split("/")[0]
+        if name not in self._routes:
+            router = (
+                self.router
+                if self._router is not None
+                or RouterLoader.from_extensions.cache_info().currsize
+                else RouterLoader.from_extension(name)
+            )
+            self._routes[name] = {
+                r.path: r for r in router.api_router.routes  # type: ignore[misc]
+            }
+        return self._routes[name].get(route)
 
 
 class LoadingError(Exception):
@@ -509,16 +536,42 @@ class RouterLoader:
         router = Router()
 
         for name, entry in ExtensionLoader().core_objects.items():  # type: ignore[attr-defined]
-            try:
-                router.include_router(router=entry, prefix=f"/{name}")
-            except Exception as e:
-                msg = f"Error loading extension: {name}\n"
-                if Env().DEBUG_MODE:
-                    traceback.print_exception(type(e), e, e.__traceback__)
-                    raise LoadingError(msg + f"\033[91m{e}\033[0m") from e
-                warnings.warn(
-                    message=msg,
-                    category=OpenBBWarning,
-                )
+            RouterLoader._include_extension(router, name, entry)
 
         return router
+
+    @staticmethod
+    @lru_cache
+    def from_extension(name: str) -> Router:
+        """Load the routes of a single extension, importing only that extension."""
+        router = Router()
+
+        try:
+            entry = ExtensionLoader().get_core_object(name)
+        except Exception as e:
+            RouterLoader._handle_error(name, e)
+            return router
+        if entry is not None:
+            RouterLoader._include_extension(router, name, entry)
+
+        return router
+
+    @staticmethod
+    def _include_extension(router: Router, name: str, entry: Router) -> None:
+        """Include the router of an extension."""
+        try:
+            router.include_router(router=entry, prefix=f"/{name}")
+        except Exception as e:
+            RouterLoader._handle_error(name, e)
+
+    @staticmethod
+    def _handle_error(name: str, e: Exception) -> None:
+        """Warn about an extension that failed to load, or raise in debug mode."""
+        msg = f"Error loading extension: {name}\n"
+        if Env().DEBUG_MODE:
+            traceback.print_exception(type(e), e, e.__traceback__)
+            raise LoadingError(msg + f"\033[91m{e}\033[0m") from e
+        warnings.warn(
+            message=msg,
+            category=OpenBBWarning,
+        )
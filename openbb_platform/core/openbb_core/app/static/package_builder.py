@@ -42,6 +42,7 @@ from openbb_core.app.static.utils.console import Console
 from openbb_core.app.static.utils.linters import Linters
 from openbb_core.app.version import CORE_VERSION, VERSION
 from openbb_core.env import Env
+from openbb_core.provider.abstract.fetcher import classproperty
 from pydantic.fields import FieldInfo
 from pydantic_core import PydanticUndefined
 from starlette.routing import BaseRoute
@@ -51,6 +52,7 @@ if TYPE_CHECKING:
     # pylint: disable=import-outside-toplevel
     from numpy import ndarray  # noqa
     from pandas import DataFrame, Series  # noqa
+    from openbb_core.app.model.data_table import DataTable  # noqa
     from openbb_core.provider.abstract.data import Data  # noqa
 
 try:
@@ -70,6 +72,7 @@ DataProcessingSupportedTypes = TypeVar(
     list["Series"],
     "ndarray",
     "Data",
+    "DataTable",
 )
 
 TAB = "    "
@@ -91,8 +94,22 @@ class PackageBuilder:
         self.lint = lint
         self.verbose = verbose
         self.console = Console(verbose)
-        self.route_map = PathHandler.build_route_map()
-        self.path_list = PathHandler.build_path_list(route_map=self.route_map)
+        self._route_map: Optional[Dict[str, BaseRoute]] = None
+        self._path_list: Optional[List[str]] = None
+
+    @property
+    def route_map(self) -> Dict[str, BaseRoute]:
+        """Get the route map, loading all the extensions on first use."""
+        if self._route_map is None:
+            self._route_map = PathHandler.build_route_map()
+        return self._route_map
+
+    @property
+    def path_list(self) -> List[str]:
+        """Get the path list."""
+        if self._path_list is None:
+            self._path_list = PathHandler.build_path_list(route_map=self.route_map)
+        return self._path_list
 
     def auto_build(self) -> None:
         """Trigger build if there are differences between built and installed extensions."""
@@ -141,15 +158,7 @@ class PackageBuilder:
 
     def _get_extension_map(self) -> Dict[str, List[str]]:
         """Get map of extensions available at build time."""
-        el = ExtensionLoader()
-        og = OpenBBGroups.groups()
-        ext_map: Dict[str, List[str]] = {}
-
-        for group, entry_point in zip(og, el.entry_points):
-            ext_map[group] = [
-                f"{e.name}@{getattr(e.dist, 'version', '')}" for e in entry_point
-            ]
-        return ext_map
+        return ExtensionLoader().extension_map
 
     def _save_modules(
         self,
@@ -199,6 +208,7 @@ class PackageBuilder:
                 },
                 "paths": ReferenceGenerator.get_paths(self.route_map),
                 "routers": ReferenceGenerator.get_routers(self.route_map),
+                "providers": ReferenceGenerator.get_providers(),
             },
             indent=4,
         )
@@ -394,6 +404,7 @@ class ImportDefinition:
         # TODO: Find a better way to handle this. This is a temporary solution.
         code += "\nimport openbb_core.provider"
         code += "\nfrom openbb_core.provider.abstract.data import Data"
+        code += "\nfrom openbb_core.app.model.data_table import DataTable"
         code += "\nimport pandas"
         code += "\nfrom pandas import DataFrame, Series"
         code += "\nimport numpy"
@@ -1045,7 +1056,11 @@ class MethodDefinition:
         func_params = func_params.replace(
             "openbb_core.provider.abstract.data.Data", "Data"
         )
+        func_params = func_params.replace(
+            "openbb_core.app.model.data_table.DataTable", "DataTable"
+        )
         func_params = func_params.replace("ForwardRef('Data')", "Data")
+        func_params = func_params.replace("ForwardRef('DataTable')", "DataTable")
         func_params = func_params.replace("ForwardRef('DataFrame')", "DataFrame")
         func_params = func_params.replace("ForwardRef('Series')", "Series")
         func_params = func_params.replace("ForwardRef('ndarray')", "ndarray")
@@ -1399,7 +1414,10 @@ class MethodDefinition:
 class DocstringGenerator:
     """Dynamically generate docstrings for the commands."""
 
-    provider_interface = ProviderInterface()
+    @classproperty
+    def provider_interface(cls) -> ProviderInterface:  # pylint: disable=E0213
+        """Get the provider interface."""
+        return ProviderInterface()
 
     @staticmethod
     def get_field_type(
@@ -2230,9 +2248,15 @@ class ReferenceGenerator:
         "data",
     ]
 
-    # pylint: disable=protected-access
-    pi = DocstringGenerator.provider_interface
-    route_map = PathHandler.build_route_map()
+    @classproperty
+    def pi(cls) -> ProviderInterface:  # pylint: disable=E0213
+        """Get the provider interface."""
+        return ProviderInterface()
+
+    @classproperty
+    def route_map(cls) -> Dict[str, BaseRoute]:  # pylint: disable=E0213
+        """Get the route map."""
+        return PathHandler.build_route_map()
 
     @classmethod
     def _get_endpoint_examples(
@@ -3333,3 +3357,26 @@ class ReferenceGenerator:
                 i += 1
                 p = "/".join(path_parts[:i])
         return routers
+
+    @classmethod
+    def get_providers(cls) -> Dict[str, Dict[str, List[str]]]:
+        """Get provider reference data.
+
+        The credentials and models of each provider let the Platform import a
+        provider only when one of its models is used.
+
+        Returns
+        -------
+        Dict[str, Dict[str, List[str]]]
+            Dictionary containing the credentials and models for each provider.
+        """
+        model_map = cls.pi.map
+        return {
+            provider: {
+                "credentials": credentials,
+                "models": [
+                    m for m, providers in model_map.items() if provider in providers
+                ],
+            }
+            for provider, credentials in cls.pi.credentials.items()
+        }
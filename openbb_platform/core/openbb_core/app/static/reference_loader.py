@@ -1,6 +1,8 @@
 """ReferenceLoader class for loading reference data from a file."""
 
 import json
+from contextlib import suppress
+from importlib.util import find_spec
 from pathlib import Path
 from typing import Dict, Optional
 
@@ -21,19 +23,33 @@ class ReferenceLoader(metaclass=SingletonMeta):
         directory : Optional[Path]
             The directory from which to load the assets where the reference file lives.
         """
-        self.directory = directory or directory or self._get_default_directory()
-        self._reference = self._load(self.directory / "assets" / "reference.json")
+        self.directory = directory or self._get_default_directory()
+        self._reference = self.read(self.directory)
 
     @property
     def reference(self) -> Dict[str, Dict]:
         """Get the reference data."""
         return self._reference
 
-    def _get_default_directory(self) -> Path:
-        """Get the default directory for loading references."""
+    @classmethod
+    def read(cls, directory: Optional[Path] = None) -> Dict[str, Dict]:
+        """Read the reference data, without keeping it in the loader."""
+        directory = directory or cls._get_default_directory()
+        return cls._load(directory / "assets" / "reference.json")
+
+    @staticmethod
+    def _get_default_directory() -> Path:
+        """Get the default directory for loading references.
+
+        This is the directory of the `openbb` package, found without importing it.
+        """
+        with suppress(ImportError, ValueError):
+            if (spec := find_spec("openbb")) and spec.origin:
+                return Path(spec.origin).parent
         return Path(__file__).parents[4].resolve() / "openbb"
 
-    def _load(self, file_path: Path):
+    @staticmethod
+    def _load(file_path: Path):
         """Load the reference data from a file."""
         try:
             with open(file_path) as f:
@@ -27,14 +27,22 @@ def validate(
     func: Optional[Callable[P, R]] = None,
     **dec_kwargs,
 ) -> Any:
-    """Validate function calls."""
+    """Validate function calls.
+
+    The validator of each function is built on its first call and reused, so
+    importing the package does not build the validators of every command.
+    """
 
     def decorated(f: Callable[P, R]):
         """Use for decorating functions."""
+        validated: Optional[Callable[P, R]] = None
 
         @wraps(f)
         def wrapper(*f_args, **f_kwargs):
-            return validate_call(f, **dec_kwargs)(*f_args, **f_kwargs)
+            nonlocal validated
+            if validated is None:
+                validated = validate_call(f, **dec_kwargs)
+            return validated(*f_args, **f_kwargs)
 
         return wrapper
 
@@ -2,10 +2,10 @@
 
 import ast
 import json
-from datetime import time
 from typing import TYPE_CHECKING, Dict, List, Optional, Union
 
 from openbb_core.app.model.abstract.error import OpenBBError
+from openbb_core.app.model.data_table import DataTable, convert_dates
 from openbb_core.app.model.preferences import Preferences
 from openbb_core.app.model.system_settings import SystemSettings
 from openbb_core.provider.abstract.data import Data
@@ -18,12 +18,15 @@ if TYPE_CHECKING:
 
 
 def basemodel_to_df(
-    data: Union[List[Data], Data],
+    data: Union[List[Data], Data, DataTable],
     index: Optional[str] = None,
 ) -> "DataFrame":
     """Convert list of BaseModel to a Pandas DataFrame."""
     # pylint: disable=import-outside-toplevel
-    from pandas import DataFrame, to_datetime
+    from pandas import DataFrame
+
+    if isinstance(data, DataTable):
+        return data.to_dataframe(index)
 
     if isinstance(data, list):
         df = DataFrame(
@@ -44,9 +47,7 @@ def basemodel_to_df(
 
     # If the date column contains dates only, convert them to a date to avoid encoding time data.
     if "date" in df.columns:
-        df["date"] = df["date"].apply(to_datetime)
-        if all(t.time() == time(0, 0) for t in df["date"]):
-            df["date"] = df["date"].apply(lambda x: x.date())
+        df["date"] = convert_dates(df["date"])
 
     if index and index in df.columns:
         if index == "date":
@@ -62,31 +63,12 @@ def df_to_basemodel(
     df: Union["DataFrame", "Series"], index: bool = False
 ) -> List[Data]:
     """Convert from a Pandas DataFrame to list of BaseModel."""
-    # pylint: disable=import-outside-toplevel
-    from pandas import MultiIndex, Series, to_datetime
-
-    is_multiindex = isinstance(df.index, MultiIndex)
-
-    if not is_multiindex and (index or df.index.name):
-        df = df.reset_index()
-    if isinstance(df, Series):
-        df = df.to_frame()
+    return list(df_to_datatable(df, index))
 
-    # Check if df has multiindex.  If so, add the index names to the df and a boolean column
-    if isinstance(df.index, MultiIndex):
-        df["is_multiindex"] = True
-        df["multiindex_names"] = str(df.index.names)
-        df = df.reset_index()
 
-    # Converting to JSON will add T00:00:00.000 to all dates with no time element unless we format it as a string first.
-    if "date" in df.columns:
-        df["date"] = df["date"].apply(to_datetime)
-        if all(t.time() == time(0, 0) for t in df["date"]):
-            df["date"] = df["date"].apply(lambda x: x.date().strftime("%Y-%m-%d"))
-
-    return [
-        Data(**d) for d in json.loads(df.to_json(orient="records", date_format="iso"))
-    ]
+def df_to_datatable(df: Union["DataFrame", "Series"], index: bool = False) -> DataTable:
+    """Convert from a Pandas DataFrame to a DataTable, without building the rows."""
+    return DataTable.from_dataframe(df, index)
 
 
 def list_to_basemodel(data_list: List) -> List[Data]:
@@ -133,7 +115,7 @@ def convert_to_basemodel(data) -> Union[Data, List[Data]]:
     from numpy import ndarray
     from pandas import DataFrame, Series
 
-    if isinstance(data, Data) or issubclass(type(data), Data):
+    if isinstance(data, (Data, DataTable)) or issubclass(type(data), Data):
         return data
     if isinstance(data, list):
         return list_to_basemodel(data)
@@ -1,17 +1,22 @@
 """The OpenBB Standardized Data Model."""
 
-from typing import Dict
+from functools import cache
+from typing import Any, Dict, List, Mapping, Sequence, Type, TypeVar, Union
 
 from pydantic import (
     AliasGenerator,
     BaseModel,
     BeforeValidator,
     ConfigDict,
+    TypeAdapter,
+    ValidationInfo,
     alias_generators,
     model_validator,
 )
 from typing_extensions import Annotated
 
+T = TypeVar("T", bound="Data")
+
 
 def check_int(v: int) -> int:
     """Check if the value is an int."""
@@ -70,6 +75,7 @@ class Data(BaseModel):
     """
 
     __alias_dict__: Dict[str, str] = {}
+    __aliases__: Dict[str, str] = {}
 
     def __repr__(self):
         """Return a string representation of the object."""
@@ -85,13 +91,91 @@ class Data(BaseModel):
         ),
     )
 
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs: Any) -> None:
+        """Invert the alias dict once per class, instead of on every validation."""
+        super().__pydantic_init_subclass__(**kwargs)
+        cls.__aliases__ = {orig: alias for alias, orig in cls.__alias_dict__.items()}
+
     @model_validator(mode="before")
     @classmethod
-    def _use_alias(cls, values):
+    def _use_alias(cls, values, info: ValidationInfo):
         """Use alias for error locs."""
-        # set the alias dict values keys
-        aliases = {orig: alias for alias, orig in cls.__alias_dict__.items()}
-        if aliases and isinstance(values, dict):
+        aliases = cls.__aliases__
+        if (
+            aliases
+            and isinstance(values, dict)
+            and not (info.context and info.context.get("aliased") is cls)
+        ):
             return {aliases.get(k, k): v for k, v in values.items()}
 
         return values
+
+    @classmethod
+    def model_validate_list(
+        cls: Type[T], data: Union[Sequence[Mapping], Mapping[str, Sequence]]
+    ) -> List[T]:
+        """Validate a list of rows, or a dictionary of columns, in one call.
+
+        The rows are validated by a `TypeAdapter` of the list, built once per class.
+        The keys are renamed with the alias dict once for each set of keys, or once
+        for each column, instead of on every row. NumPy and pandas numeric columns
+        are converted to Python values in one step, with NaN as None.
+
+        Parameters
+        ----------
+        data : Union[Sequence[Mapping], Mapping[str, Sequence]]
+            The rows, as dictionaries, or the columns, as sequences of values by key.
+
+        Returns
+        -------
+        List[Data]
+            The validated rows.
+        """
+        aliases = cls.__aliases__
+        if isinstance(data, Mapping):
+            keys = [aliases.get(k, k) for k in data]
+            columns = [_to_list(column) for column in data.values()]
+            data = [dict(zip(keys, row)) for row in zip(*columns)]
+        elif aliases:
+            data = _rename_rows(data, aliases)
+        return _get_list_adapter(cls).validate_python(data, context={"aliased": cls})
+
+
+@cache
+def _get_list_adapter(model: Type[T]) -> TypeAdapter:
+    """Get the adapter validating a list of the model."""
+    return TypeAdapter(List[model])  # type: ignore[valid-type]
+
+
+def _rename_rows(rows: Sequence[Any], aliases: Dict[str, str]) -> List[Any]:
+    """Rename the keys of dictionary rows, once for each set of keys."""
+    renamed: Dict[tuple, tuple] = {}
+
+    def rename(row: Any) -> Any:
+        if not isinstance(row, dict):
+            return row
+        keys = tuple(row)
+        if keys not in renamed:
+            renamed[keys] = tuple(aliases.get(k, k) for k in keys)
+        return dict(zip(renamed[keys], row.values()))
+
+    return [rename(row) for row in rows]
+
+
+def _to_list(column: Any) -> list:
+    """Convert a column to a list, with NaN as None for NumPy and pandas floats."""
+    dtype = getattr(column, "dtype", None)
+    if dtype is None:
+        return list(column)
+    if dtype.kind == "f":
+        # pylint: disable=import-outside-toplevel
+        from numpy import asarray, isnan
+
+        values = asarray(column)
+        missing = isnan(values)
+        if missing.any():
+            values = values.astype(object)
+            values[missing] = None
+        return values.tolist()
+    return column.tolist()
@@ -18,6 +18,7 @@ from openbb_core.provider.abstract.annotated_result import AnnotatedResult
 from openbb_core.provider.abstract.data import Data
 from openbb_core.provider.abstract.query_params import QueryParams
 from openbb_core.provider.utils.helpers import maybe_coroutine, run_async
+from openbb_core.provider.utils.tracing import count_rows, span
 
 Q = TypeVar("Q", bound=QueryParams)
 D = TypeVar("D", bound=Data)
@@ -81,11 +82,16 @@ class Fetcher(Generic[Q, R]):
         **kwargs,
     ) -> Union[R, AnnotatedResult[R]]:
         """Fetch data from a provider."""
-        query = cls.transform_query(params=params)
-        data = await maybe_coroutine(
-            cls.extract_data, query=query, credentials=credentials, **kwargs
-        )
-        return cls.transform_data(query=query, data=data, **kwargs)
+        with span("transform_query"):
+            query = cls.transform_query(params=params)
+        with span("extract_data"):
+            data = await maybe_coroutine(
+                cls.extract_data, query=query, credentials=credentials, **kwargs
+            )
+        with span("transform_data") as attributes:
+            result = cls.transform_data(query=query, data=data, **kwargs)
+            attributes["rows"] = count_rows(result)
+        return result
 
     @classproperty
     def query_params_type(self) -> Q:
@@ -3,6 +3,7 @@
 from typing import Dict, List, Optional, Type
 
 from openbb_core.provider.abstract.fetcher import Fetcher
+from openbb_core.provider.utils.rate_limit import RateLimit
 
 
 class Provider:
@@ -19,6 +20,7 @@ class Provider:
         repr_name: Optional[str] = None,
         deprecated_credentials: Optional[Dict[str, Optional[str]]] = None,
         instructions: Optional[str] = None,
+        rate_limit: Optional[RateLimit] = None,
     ) -> None:
         """Initialize the provider.
 
@@ -40,6 +42,8 @@ class Provider:
             Map of deprecated credentials to its current name, by default None.
         instructions: Optional[str]
             Instructions on how to setup the provider. For example, how to get an API key.
+        rate_limit: Optional[RateLimit]
+            Rate limit, concurrency and retries of the requests to the provider, by default None.
         """
         self.name = name
         self.description = description
@@ -54,3 +58,4 @@ class Provider:
         self.repr_name = repr_name
         self.deprecated_credentials = deprecated_credentials
         self.instructions = instructions
+        self.rate_limit = rate_limit
@@ -1,17 +1,39 @@
 """Query executor module."""
 
-from typing import Any, Dict, Optional, Type
+from datetime import date
+from hashlib import sha256
+from json import dumps
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, Optional, Type
 
 from openbb_core.app.model.abstract.error import OpenBBError
 from openbb_core.provider.abstract.fetcher import Fetcher
 from openbb_core.provider.abstract.provider import Provider
 from openbb_core.provider.registry import Registry, RegistryLoader
+from openbb_core.provider.utils.rate_limit import current_rate_limit
+from openbb_core.provider.utils.response_cache import (
+    ResponseCache,
+    get_cache_key,
+    get_cache_ttl,
+    record_cache_event,
+)
+from openbb_core.provider.utils.single_flight import SingleFlight
+from openbb_core.provider.utils.timeseries_cache import (
+    REFRESH_DAYS,
+    TimeSeriesCache,
+    fetch_incremental,
+    is_incremental,
+)
+from openbb_core.provider.utils.tracing import span
 from pydantic import SecretStr
 
 
 class QueryExecutor:
     """Class to execute queries from providers."""
 
+    # Identical queries that run at the same time share a single fetch.
+    single_flight = SingleFlight()
+
     def __init__(self, registry: Optional[Registry] = None) -> None:
         """Initialize the query executor."""
         self.registry = registry or RegistryLoader.from_extensions()
@@ -19,12 +41,13 @@ class QueryExecutor:
     def get_provider(self, provider_name: str) -> Provider:
         """Get a provider from the registry."""
         name = provider_name.lower()
-        if name not in self.registry.providers:
+        provider = self.registry.get_provider(name)
+        if provider is None:
             raise OpenBBError(
                 f"Provider '{name}' not found in the registry."
-                f"Available providers: {list(self.registry.providers.keys())}"
+                f"Available providers: {self.registry.provider_names}"
             )
-        return self.registry.providers[name]
+        return provider
 
     def get_fetcher(self, provider: Provider, model_name: str) -> Type[Fetcher]:
         """Get a fetcher from a provider."""
@@ -84,15 +107,99 @@ class QueryExecutor:
         credentials : Optional[Dict[str, SecretStr]], optional
             Credentials for the provider, by default None
             For example, {"fmp_api_key": SecretStr("1234")}.
+            They are not part of the response cache key, but only queries with the
+            same credentials share a fetch that is running.
 
         Returns
         -------
         Any
             Query result.
         """
-        provider = self.get_provider(provider_name)
-        fetcher = self.get_fetcher(provider, model_name)
-        filtered_credentials = self.filter_credentials(
-            credentials, provider, fetcher.require_credentials
+        name = provider_name.lower()
+        with span("provider", provider=name, model=model_name):
+            provider = self.get_provider(provider_name)
+            fetcher = self.get_fetcher(provider, model_name)
+            filtered_credentials = self.filter_credentials(
+                credentials, provider, fetcher.require_credentials
+            )
+        preferences = kwargs.get("preferences") or {}
+        cache_settings = preferences.get("response_cache") or {}
+        cache_directory = preferences.get("cache_directory")
+        ttl = get_cache_ttl(cache_settings, name, model_name)
+
+        async def fetch(query: Dict[str, Any]) -> Any:
+            if is_incremental(cache_settings, name, model_name):
+                return await self._fetch_incremental(
+                    name, model_name, query, cache_directory, fetch_data
+                )
+            return await fetch_data(query)
+
+        async def fetch_data(query: Dict[str, Any]) -> Any:
+            token = current_rate_limit.set(provider.rate_limit)
+            try:
+                return await fetcher.fetch_data(query, filtered_credentials, **kwargs)
+            finally:
+                current_rate_limit.reset(token)
+
+        key = get_cache_key(name, model_name, params)
+        flight_key = (
+            key
+            + sha256(dumps(filtered_credentials, sort_keys=True).encode()).hexdigest()
+        )
+
+        if not ttl:
+            return await self.single_flight.run(flight_key, lambda: fetch(params))
+
+        cache = ResponseCache.from_settings(
+            cache_settings,
+            str(Path(cache_directory, "responses")) if cache_directory else None,
+        )
+        hit, result = cache.get(key)
+        if hit:
+            record_cache_event("hits")
+            return result
+
+        record_cache_event("misses")
+
+        async def fetch_and_cache() -> Any:
+            result = await fetch(params)
+            cache.set(key, result, ttl)
+            return result
+
+        return await self.single_flight.run(flight_key, fetch_and_cache)
+
+    @staticmethod
+    async def _fetch_incremental(
+        provider_name: str,
+        model_name: str,
+        params: Dict[str, Any],
+        cache_directory: Optional[str],
+        fetch_data: Callable[[Dict[str, Any]], Awaitable[Any]],
+    ) -> Any:
+        """Fetch a single time series, only requesting the dates that are not cached."""
+        start = params.get("start_date")
+        symbol = str(params.get("symbol") or "")
+        if not start or not symbol or "," in symbol:
+            return await fetch_data(params)
+
+        start = date.fromisoformat(str(start)[:10])
+        end = params.get("end_date")
+        end = date.fromisoformat(str(end)[:10]) if end else date.today()
+
+        cache = TimeSeriesCache.from_directory(
+            str(Path(cache_directory, "timeseries")) if cache_directory else None
+        )
+
+        async def fetch(gap_start: date, gap_end: date) -> Any:
+            return await fetch_data(
+                {**params, "start_date": gap_start, "end_date": gap_end}
+            )
+
+        return await fetch_incremental(
+            cache,
+            TimeSeriesCache.get_series_key(provider_name, model_name, params),
+            start,
+            end,
+            fetch,
+            REFRESH_DAYS.get(model_name, 1),
         )
-        return await fetcher.fetch_data(params, filtered_credentials, **kwargs)
@@ -2,8 +2,8 @@
 
 import traceback
 import warnings
-from functools import lru_cache
-from typing import Dict
+from functools import lru_cache, partial
+from typing import Callable, Dict, List, Optional
 
 from openbb_core.app.extension_loader import ExtensionLoader
 from openbb_core.app.model.abstract.warning import OpenBBWarning
@@ -17,15 +17,56 @@ class Registry:
     def __init__(self) -> None:
         """Initialize the registry."""
         self._providers: Dict[str, Provider] = {}
+        self._loaders: Dict[str, Callable[[], Optional[Provider]]] = {}
+        self._names: List[str] = []
 
     @property
     def providers(self):
-        """Return a dictionary of providers."""
+        """Return a dictionary of providers, loading the ones not loaded yet."""
+        if self._loaders:
+            for name in list(self._loaders):
+                self.get_provider(name)
+            self._providers = {
+                name: self._providers[name]
+                for name in self._names
+                if name in self._providers
+            }
         return self._providers
 
+    @property
+    def provider_names(self) -> List[str]:
+        """Return the names of the providers, without loading them."""
+        return [
+            name
+            for name in self._names
+            if name in self._providers or name in self._loaders
+        ]
+
     def include_provider(self, provider: Provider) -> None:
         """Include a provider in the registry."""
-        self._providers[provider.name.lower()] = provider
+        name = provider.name.lower()
+        if name not in self._names:
+            self._names.append(name)
+        self._providers[name] = provider
+
+    def include_loader(
+        self, name: str, loader: Callable[[], Optional[Provider]]
+    ) -> None:
+        """Include a provider in the registry, to be loaded on first use."""
+        name = name.lower()
+        if name not in self._names:
+            self._names.append(name)
+        self._loaders[name] = loader
+
+    def get_provider(self, name: str) -> Optional[Provider]:
+        """Return a provider by name, loading it if needed."""
+        name = name.lower()
+        if (loader := self._loaders.pop(name, None)) and (provider := loader()):
+            self.include_provider(provider)
+        if name not in self._providers and self._loaders:
+            # The provider may be named differently from its entry point.
+            return self.providers.get(name)
+        return self._providers.get(name)
 
 
 class LoadingError(Exception):
@@ -38,19 +79,30 @@ class RegistryLoader:
     @staticmethod
     @lru_cache
     def from_extensions() -> Registry:
-        """Load providers from entry points."""
+        """Load providers from entry points.
+
+        The providers are imported on first use, one at a time.
+        """
         registry = Registry()
 
-        for name, entry in ExtensionLoader().provider_objects.items():  # type: ignore[attr-defined]
-            try:
-                registry.include_provider(provider=entry)
-            except Exception as e:
-                msg = f"Error loading extension: {name}\n"
-                if Env().DEBUG_MODE:
-                    traceback.print_exception(type(e), e, e.__traceback__)
-                    raise LoadingError(msg + f"\033[91m{e}\033[0m") from e
-                warnings.warn(
-                    message=msg,
-                    category=OpenBBWarning,
-                )
+        for ep in ExtensionLoader().provider_entry_points:
+            registry.include_loader(
+                ep.name, partial(RegistryLoader._load_provider, ep.name)
+            )
         return registry
+
+    @staticmethod
+    def _load_provider(name: str) -> Optional[Provider]:
+        """Load a provider from its entry point."""
+        try:
+            return ExtensionLoader().get_provider_object(name)
+        except Exception as e:
+            msg = f"Error loading extension: {name}\n"
+            if Env().DEBUG_MODE:
+                traceback.print_exception(type(e), e, e.__traceback__)
+                raise LoadingError(msg + f"\033[91m{e}\033[0m") from e
+            warnings.warn(
+                message=msg,
+                category=OpenBBWarning,
+            )
+        return None
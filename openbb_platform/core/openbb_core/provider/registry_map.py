@@ -3,8 +3,9 @@
 from copy import deepcopy
 from inspect import getfile, isclass
 from pathlib import Path
-from typing import Any, Dict, List, Literal, Optional, Tuple, get_origin
+from typing import Any, Dict, List, Literal, Optional, get_origin
 
+from openbb_core.app.extension_loader import ExtensionLoader
 from openbb_core.provider.abstract.data import Data
 from openbb_core.provider.abstract.fetcher import Fetcher
 from openbb_core.provider.abstract.query_params import QueryParams
@@ -18,15 +19,20 @@ SKIP = {"object", "Representation", "BaseModel", "QueryParams", "Data"}
 
 
 class RegistryMap:
-    """Class to store information about providers in the registry."""
+    """Class to store information about providers in the registry.
+
+    When the reference of the built package matches the installed extensions, the
+    credentials and models of each provider are read from it, and a provider is only
+    imported when the map of one of its models is needed.
+    """
 
     def __init__(self, registry: Optional[Registry] = None) -> None:
         """Initialize Registry Map."""
         self._registry = registry or RegistryLoader.from_extensions()
-        self._credentials = self._get_credentials(self._registry)
-        self._available_providers = self._get_available_providers(self._registry)
-        self._standard_extra, self._original_models = self._get_maps(self._registry)
-        self._models = self._get_models(self._standard_extra)
+        self._reference = None if registry else self._get_reference_providers()
+        self._standard_extra: MapType = {}
+        self._original_models: Dict[str, Dict] = {}
+        self._complete = False
 
     @property
     def registry(self) -> Registry:
@@ -36,27 +42,67 @@ class RegistryMap:
     @property
     def available_providers(self) -> List[str]:
         """Get list of available providers."""
-        return self._available_providers
+        if self._reference is not None:
+            return sorted(self._reference)
+        return self._get_available_providers(self._registry)
 
     @property
     def credentials(self) -> Dict[str, List[str]]:
         """Get map of providers to credentials."""
-        return self._credentials
+        if self._reference is not None:
+            return {name: info["credentials"] for name, info in self._reference.items()}
+        return self._get_credentials(self._registry)
 
     @property
     def standard_extra(self) -> MapType:
         """Get standard extra map."""
+        self._load_maps()
         return self._standard_extra
 
     @property
     def original_models(self) -> MapType:
         """Get original models."""
+        self._load_maps()
         return self._original_models
 
     @property
     def models(self) -> List[str]:
         """Get available models."""
-        return self._models
+        if self._reference is not None and not self._complete:
+            return list(
+                dict.fromkeys(
+                    model
+                    for info in self._reference.values()
+                    for model in info["models"]
+                )
+            )
+        return self._get_models(self.standard_extra)
+
+    def get_standard_extra(self, model: str) -> Dict[str, Dict[str, Any]]:
+        """Get the standard extra map of a model, importing only its providers."""
+        self._load_model(model)
+        return self._standard_extra[model]
+
+    def get_original_models(self, model: str) -> Dict[str, Dict[str, Any]]:
+        """Get the original models of a model, importing only its providers."""
+        self._load_model(model)
+        return self._original_models[model]
+
+    @staticmethod
+    def _get_reference_providers() -> Optional[Dict[str, Dict[str, List[str]]]]:
+        """Get the providers in the reference, if it was built with the installed extensions."""
+        # pylint: disable=import-outside-toplevel
+        from openbb_core.app.static.reference_loader import ReferenceLoader
+
+        reference = ReferenceLoader.read()
+        built = reference.get("info", {}).get("extensions", {})
+        installed = ExtensionLoader().extension_map
+        if "providers" not in reference or any(
+            set(built.get(group, [])) != set(extensions)
+            for group, extensions in installed.items()
+        ):
+            return None
+        return reference["providers"]
 
     def _get_credentials(self, registry: Registry) -> Dict[str, List[str]]:
         """Get map of providers to credentials."""
@@ -68,42 +114,63 @@ class RegistryMap:
         """Get list of available providers."""
         return sorted(list(registry.providers.keys()))
 
-    def _get_maps(self, registry: Registry) -> Tuple[MapType, Dict[str, Dict]]:
-        """Generate map for the provider package."""
-        standard_extra: MapType = {}
-        original_models: Dict[str, Dict] = {}
-
+    def _load_model(self, model: str) -> None:
+        """Add the providers of a model to the maps."""
+        if model in self._standard_extra or self._complete:
+            return
+        if self._reference is None:
+            self._load_maps()
+            return
+        for p in self._registry.provider_names:
+            if model in self._reference.get(p, {}).get("models", []):
+                provider = self._registry.get_provider(p)
+                if provider is not None and model in provider.fetcher_dict:
+                    self._add_fetcher(model, p, provider.fetcher_dict[model])
+
+    def _load_maps(self) -> None:
+        """Add all the models of all the providers to the maps."""
+        if self._complete:
+            return
+        registry = self._registry
+        order: Dict[str, None] = {}
         for p in registry.providers:
             for model_name, fetcher in registry.providers[p].fetcher_dict.items():
-                standard_query, extra_query = self._extract_info(
-                    fetcher, "query_params"
-                )
-                standard_data, extra_data = self._extract_info(fetcher, "data")
-                if model_name not in standard_extra:
-                    standard_extra[model_name] = {}
-                    # The deepcopy avoids modifications from one model to affect another
-                    standard_extra[model_name]["openbb"] = {
-                        "QueryParams": deepcopy(standard_query),
-                        "Data": deepcopy(standard_data),
-                    }
-                standard_extra[model_name][p] = {
-                    "QueryParams": extra_query,
-                    "Data": extra_data,
-                }
-
-                original_models.setdefault(model_name, {}).update(
-                    {
-                        p: {
-                            "query": self._get_model(fetcher, "query_params"),
-                            "data": self._get_model(fetcher, "data"),
-                            "results_type": self._get_results_type(fetcher),
-                        }
-                    }
-                )
+                order[model_name] = None
+                if p not in self._standard_extra.get(model_name, {}):
+                    self._add_fetcher(model_name, p, fetcher)
+
+        self._standard_extra = {m: self._standard_extra[m] for m in order}
+        self._original_models = {m: self._original_models[m] for m in order}
+        self._complete = True
+
+    def _add_fetcher(self, model_name: str, p: str, fetcher: Fetcher) -> None:
+        """Add the fetcher of a provider to the maps of a model."""
+        standard_extra = self._standard_extra
+        standard_query, extra_query = self._extract_info(fetcher, "query_params")
+        standard_data, extra_data = self._extract_info(fetcher, "data")
+        if model_name not in standard_extra:
+            standard_extra[model_name] = {}
+            # The deepcopy avoids modifications from one model to affect another
+            standard_extra[model_name]["openbb"] = {
+                "QueryParams": deepcopy(standard_query),
+                "Data": deepcopy(standard_data),
+            }
+        standard_extra[model_name][p] = {
+            "QueryParams": extra_query,
+            "Data": extra_data,
+        }
 
-                self._update_json_schema_extra(p, fetcher, standard_extra[model_name])
+        self._original_models.setdefault(model_name, {}).update(
+            {
+                p: {
+                    "query": self._get_model(fetcher, "query_params"),
+                    "data": self._get_model(fetcher, "data"),
+                    "results_type": self._get_results_type(fetcher),
+                }
+            }
+        )
 
-        return standard_extra, original_models
+        self._update_json_schema_extra(p, fetcher, standard_extra[model_name])
 
     def _update_json_schema_extra(
         self,
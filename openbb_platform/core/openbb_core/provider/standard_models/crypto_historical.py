@@ -1,5 +1,6 @@
 """Crypto Historical Price Standard Model."""
 
+from contextlib import suppress
 from datetime import (
     date as dateType,
     datetime,
@@ -62,6 +63,11 @@ class CryptoHistoricalData(Data):
     @classmethod
     def date_validate(cls, v):  # pylint: disable=E0213
         """Return formatted datetime."""
+        if isinstance(v, str):
+            with suppress(ValueError):
+                return (
+                    datetime.fromisoformat(v) if ":" in v else dateType.fromisoformat(v)
+                )
         if ":" in str(v):
             return parser.isoparse(str(v))
         return parser.parse(str(v)).date()
@@ -1,5 +1,6 @@
 """Equity Historical Price Standard Model."""
 
+from contextlib import suppress
 from datetime import (
     date as dateType,
     datetime,
@@ -56,6 +57,12 @@ class EquityHistoricalData(Data):
     @classmethod
     def date_validate(cls, v):
         """Return formatted datetime."""
+        if isinstance(v, str):
+            with suppress(ValueError):
+                return (
+                    datetime.fromisoformat(v) if ":" in v else dateType.fromisoformat(v)
+                )
+
         # pylint: disable=import-outside-toplevel
         from dateutil import parser
 
@@ -1,5 +1,6 @@
 """ETF Historical Price Standard Model."""
 
+from contextlib import suppress
 from datetime import (
     date as dateType,
     datetime,
@@ -53,6 +54,11 @@ class EtfHistoricalData(Data):
     @field_validator("date", mode="before", check_fields=False)
     def date_validate(cls, v):  # pylint: disable=E0213
         """Return formatted datetime."""
+        if isinstance(v, str):
+            with suppress(ValueError):
+                return (
+                    datetime.fromisoformat(v) if ":" in v else dateType.fromisoformat(v)
+                )
         if ":" in str(v):
             return parser.isoparse(str(v))
         return parser.parse(str(v)).date()
@@ -1,5 +1,6 @@
 """Index Historical Standard Model."""
 
+from contextlib import suppress
 from datetime import (
     date as dateType,
     datetime,
@@ -60,6 +61,11 @@ class IndexHistoricalData(Data):
     @classmethod
     def date_validate(cls, v):
         """Return formatted datetime."""
+        if isinstance(v, str):
+            with suppress(ValueError):
+                return (
+                    datetime.fromisoformat(v) if ":" in v else dateType.fromisoformat(v)
+                )
         if ":" in str(v):
             return parser.isoparse(str(v))
         return parser.parse(str(v)).date()
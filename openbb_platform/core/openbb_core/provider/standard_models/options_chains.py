@@ -120,6 +120,14 @@ class OptionsChainsData(OptionsChainsProperties):
     ) -> DataFrame:
         Method for combining multiple strategies and parameters in a single DataFrame.
         To get all expirations, set days to -1.
+    fill_greeks(
+        risk_free_rate: Union[float, Dict[str, float]] = 0.0,
+        dividend_yield: Union[float, Dict[str, float]] = 0.0,
+        underlying_price: Optional[float] = None,
+        overwrite: bool = False,
+    ) -> None:
+        Fill the implied volatility and greeks missing from the data, with the Black-Scholes model.
+        Rates and dividend yields can be supplied per expiration, as a dictionary.
 
     Raises
     ------
@@ -0,0 +1,266 @@
+"""Black-Scholes: price options, and solve their implied volatility and greeks.
+
+Every function takes arrays, or scalars, and computes a whole chain at once.
+The arguments are broadcast, so the rates and dividend yields can be one value,
+or one per contract, like the rate of the expiration of each contract.
+
+Time to expiration, `time`, is in years. Rates, dividend yields and volatilities
+are decimals, continuously compounded. Theta is per calendar day, and vega and
+rho are per one point of volatility or rate. Invalid inputs give NaN.
+"""
+
+from typing import Dict, Sequence, Union
+
+import numpy as np
+
+ArrayLike = Union[float, Sequence, np.ndarray]
+
+SQRT_2PI = 2.5066282746310002
+
+
+def norm_pdf(x: ArrayLike) -> np.ndarray:
+    """Get the standard normal probability density."""
+    x = np.asarray(x, dtype=float)
+    return np.exp(-0.5 * x * x) / SQRT_2PI
+
+
+def norm_cdf(x: ArrayLike) -> np.ndarray:
+    """Get the standard normal cumulative distribution, with double precision.
+
+    Uses the algorithm 5666 of Hart (1968), as described by West (2005),
+    "Better approximations to cumulative normal functions".
+    """
+    x = np.asarray(x, dtype=float)
+    a = np.abs(x)
+    e = np.exp(-0.5 * a * a)
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        numerator = np.polyval(
+            [
+                3.52624965998911e-02,
+                0.700383064443688,
+                6.37396220353165,
+                33.912866078383,
+                112.079291497871,
+                221.213596169931,
+                220.206867912376,
+            ],
+            a,
+        )
+        denominator = np.polyval(
+            [
+                8.83883476483184e-02,
+                1.75566716318264,
+                16.064177579207,
+                86.7807322029461,
+                296.564248779674,
+                637.333633378831,
+                793.826512519948,
+                440.413735824752,
+            ],
+            a,
+        )
+        fraction = a + 0.65
+        for k in (4, 3, 2, 1):
+            fraction = a + k / fraction
+        tail = np.where(
+            a < 7.07106781186547,
+            e * numerator / denominator,
+            e / fraction / SQRT_2PI,
+        )
+    tail = np.where(a > 37, 0.0, tail)
+    return np.where(x > 0, 1 - tail, tail)
+
+
+def _is_call(option_type: ArrayLike) -> np.ndarray:
+    """Get a mask of the calls, from the option types, "call" or "put"."""
+    return np.char.lower(np.asarray(option_type, dtype=str)) == "call"
+
+
+def _d1_d2(
+    underlying_price: ArrayLike,
+    strike: ArrayLike,
+    time: ArrayLike,
+    rate: ArrayLike,
+    dividend_yield: ArrayLike,
+    volatility: ArrayLike,
+) -> tuple:
+    """Get d1 and d2, NaN where the inputs are not positive."""
+    s, k, t, r, q, v = np.broadcast_arrays(
+        *(
+            np.asarray(x, dtype=float)
+            for x in (
+                underlying_price,
+                strike,
+                time,
+                rate,
+                dividend_yield,
+                volatility,
+            )
+        )
+    )
+    valid = (s > 0) & (k > 0) & (t > 0) & (v > 0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        vol_sqrt_t = np.where(valid, v * np.sqrt(t), np.nan)
+        d1 = (np.log(s / k) + (r - q + 0.5 * v * v) * t) / vol_sqrt_t
+    return d1, d1 - vol_sqrt_t, s, k, t, r, q, v
+
+
+def price(
+    option_type: ArrayLike,
+    underlying_price: ArrayLike,
+    strike: ArrayLike,
+    time: ArrayLike,
+    volatility: ArrayLike,
+    rate: ArrayLike = 0.0,
+    dividend_yield: ArrayLike = 0.0,
+) -> np.ndarray:
+    """Get the Black-Scholes price of European options."""
+    d1, d2, s, k, t, r, q, _ = _d1_d2(
+        underlying_price, strike, time, rate, dividend_yield, volatility
+    )
+    sign = np.where(_is_call(option_type), 1.0, -1.0)
+    return sign * (
+        s * np.exp(-q * t) * norm_cdf(sign * d1)
+        - k * np.exp(-r * t) * norm_cdf(sign * d2)
+    )
+
+
+def greeks(
+    option_type: ArrayLike,
+    underlying_price: ArrayLike,
+    strike: ArrayLike,
+    time: ArrayLike,
+    volatility: ArrayLike,
+    rate: ArrayLike = 0.0,
+    dividend_yield: ArrayLike = 0.0,
+) -> Dict[str, np.ndarray]:
+    """Get the delta, gamma, theta, vega and rho of European options."""
+    d1, d2, s, k, t, r, q, v = _d1_d2(
+        underlying_price, strike, time, rate, dividend_yield, volatility
+    )
+    sign = np.where(_is_call(option_type), 1.0, -1.0)
+    spot = s * np.exp(-q * t)
+    discounted_strike = k * np.exp(-r * t)
+    pdf = norm_pdf(d1)
+    cdf_d1 = norm_cdf(sign * d1)
+    cdf_d2 = norm_cdf(sign * d2)
+    sqrt_t = np.sqrt(t)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        gamma = spot * pdf / (s * s * v * sqrt_t)
+        theta = (
+            -spot * pdf * v / (2 * sqrt_t)
+            - sign * r * discounted_strike * cdf_d2
+            + sign * q * spot * cdf_d1
+        )
+    return {
+        "delta": sign * np.exp(-q * t) * cdf_d1,
+        "gamma": gamma,
+        "theta": theta / 365,
+        "vega": spot * pdf * sqrt_t / 100,
+        "rho": sign * t * discounted_strike * cdf_d2 / 100,
+    }
+
+
+def _discounted_price(
+    sign: np.ndarray,
+    spot: np.ndarray,
+    discounted_strike: np.ndarray,
+    log_moneyness: np.ndarray,
+    vol_sqrt_t: np.ndarray,
+) -> tuple:
+    """Get the price and d1, from the discounted underlying price and strike."""
+    d1 = log_moneyness / vol_sqrt_t + 0.5 * vol_sqrt_t
+    value = sign * (
+        spot * norm_cdf(sign * d1)
+        - discounted_strike * norm_cdf(sign * (d1 - vol_sqrt_t))
+    )
+    return value, d1
+
+
+def implied_volatility(
+    option_price: ArrayLike,
+    option_type: ArrayLike,
+    underlying_price: ArrayLike,
+    strike: ArrayLike,
+    time: ArrayLike,
+    rate: ArrayLike = 0.0,
+    dividend_yield: ArrayLike = 0.0,
+    tol: float = 1e-8,
+    max_iter: int = 100,
+    max_volatility: float = 10.0,
+) -> np.ndarray:
+    """Solve the implied volatility of European options.
+
+    Newton's method, started from the volatility of the highest vega (Manaster
+    and Koehler, 1982), and kept within a bracket of the solution. A step that
+    leaves the bracket, or has no vega to follow, bisects it instead, so every
+    contract converges. Prices outside of the no-arbitrage bounds, or needing a
+    volatility above `max_volatility`, give NaN.
+    """
+    p, s, k, t, r, q = np.broadcast_arrays(
+        *(
+            np.asarray(x, dtype=float)
+            for x in (
+                option_price,
+                underlying_price,
+                strike,
+                time,
+                rate,
+                dividend_yield,
+            )
+        )
+    )
+    is_call = np.broadcast_to(_is_call(option_type), p.shape)
+    result = np.full(p.shape, np.nan)
+    valid = np.flatnonzero((s > 0) & (k > 0) & (t > 0) & ~np.isnan(p))
+    if valid.size == 0:
+        return result
+
+    # Only the valid contracts are solved, from the terms constant in the loop.
+    p, s, k, t, r, q = (x.ravel()[valid] for x in (p, s, k, t, r, q))
+    sign = np.where(is_call.ravel()[valid], 1.0, -1.0)
+    spot = s * np.exp(-q * t)
+    discounted_strike = k * np.exp(-r * t)
+    log_moneyness = np.log(spot / discounted_strike)
+    sqrt_t = np.sqrt(t)
+
+    lower = np.maximum(sign * (spot - discounted_strike), 0)
+    upper = np.where(sign > 0, spot, discounted_strike)
+    highest, _ = _discounted_price(
+        sign, spot, discounted_strike, log_moneyness, max_volatility * sqrt_t
+    )
+    solvable = (p > lower) & (p < np.minimum(upper, highest))
+
+    low = np.zeros(valid.size)
+    high = np.full(valid.size, max_volatility)
+    sigma = np.clip(np.sqrt(2 * np.abs(log_moneyness) / t), 0.05, max_volatility / 2)
+    active = np.flatnonzero(solvable)
+
+    for _ in range(max_iter):
+        if active.size == 0:
+            break
+        _sigma, _spot, _sqrt_t = sigma[active], spot[active], sqrt_t[active]
+        value, d1 = _discounted_price(
+            sign[active],
+            _spot,
+            discounted_strike[active],
+            log_moneyness[active],
+            _sigma * _sqrt_t,
+        )
+        diff = value - p[active]
+        vega = _spot * norm_pdf(d1) * _sqrt_t
+
+        _low = np.where(diff < 0, _sigma, low[active])
+        _high = np.where(diff > 0, _sigma, high[active])
+        with np.errstate(divide="ignore", invalid="ignore"):
+            step = _sigma - diff / vega
+        bisect = ~np.isfinite(step) | (step <= _low) | (step >= _high)
+        step = np.where(bisect, 0.5 * (_low + _high), step)
+
+        done = (np.abs(diff) < tol) | (_high - _low < tol)
+        low[active], high[active] = _low, _high
+        sigma[active] = np.where(done, _sigma, step)
+        active = active[~done]
+
+    result.ravel()[valid] = np.where(solvable, sigma, np.nan)
+    return result
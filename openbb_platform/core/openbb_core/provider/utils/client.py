@@ -8,6 +8,9 @@ from typing import Any, Dict, Type, Union
 
 import aiohttp
 from multidict import CIMultiDict, CIMultiDictProxy, MultiDict
+from openbb_core.provider.utils.rate_limit import current_rate_limit
+from openbb_core.provider.utils.tracing import span
+from yarl import URL
 
 FILTER_QUERY_REGEX = r".*key.*|.*token.*|.*auth.*|(c$)"
 
@@ -23,6 +26,12 @@ def obfuscate(params: Union[CIMultiDict[str], MultiDict[str]]) -> Dict[str, Any]
     }
 
 
+def redact_url(url: Union[str, URL]) -> str:
+    """Get a URL with the sensitive query parameters obfuscated."""
+    url = URL(str(url))
+    return str(url.with_query(obfuscate(url.query)))
+
+
 def get_user_agent() -> str:
     """Get a not very random user agent."""
     user_agent_strings = [
@@ -110,10 +119,16 @@ class ClientSession(aiohttp.ClientSession):
     async def request(  # type: ignore
         self, *args, raise_for_status: bool = False, **kwargs
     ) -> ClientResponse:
-        """Send request."""
+        """Send request.
+
+        Requests are sent within the `rate_limit` keyword argument, or the rate limit
+        of the provider being queried, when there is one.
+        """
         # pylint: disable=import-outside-toplevel
         import zlib
 
+        rate_limit = kwargs.pop("rate_limit", None) or current_rate_limit.get()
+
         kwargs["headers"] = kwargs.get(
             "headers",
             # Default headers, makes sure we accept gzip
@@ -127,15 +142,27 @@ class ClientSession(aiohttp.ClientSession):
         if kwargs["headers"].get("User-Agent", None) is None:
             kwargs["headers"]["User-Agent"] = get_user_agent()
 
-        response = await super().request(*args, **kwargs)
-
-        if raise_for_status:
-            response.raise_for_status()
-
-        encoding = response.headers.get("Content-Encoding", "")
-        if encoding in ("gzip", "deflate") and not self.auto_decompress:
-            response_body = await response.read()
-            wbits = 16 + zlib.MAX_WBITS if encoding == "gzip" else -zlib.MAX_WBITS
-            response._body = zlib.decompress(response_body, wbits)
+        method = args[0] if args else kwargs.get("method")
+        url = args[1] if len(args) > 1 else kwargs.get("url", "")
+        with span("http", method=method, url=redact_url(url)) as attributes:
+            if rate_limit is None:
+                response = await super().request(*args, **kwargs)
+            else:
+                response = await rate_limit.call(
+                    lambda: super(ClientSession, self).request(*args, **kwargs)
+                )
+            attributes["url"] = redact_url(response.request_info.url)
+            attributes["status"] = response.status
+            attributes["bytes"] = response.content_length
+
+            if raise_for_status:
+                response.raise_for_status()
+
+            encoding = response.headers.get("Content-Encoding", "")
+            if encoding in ("gzip", "deflate") and not self.auto_decompress:
+                response_body = await response.read()
+                attributes["bytes"] = len(response_body)
+                wbits = 16 + zlib.MAX_WBITS if encoding == "gzip" else -zlib.MAX_WBITS
+                response._body = zlib.decompress(response_body, wbits)
 
         return response  # type: ignore
@@ -2,14 +2,17 @@
 
 import asyncio
 import os
+import threading
 from datetime import date, datetime, timedelta, timezone
 from difflib import SequenceMatcher
 from functools import partial
 from inspect import iscoroutinefunction
 from typing import (
     TYPE_CHECKING,
+    AsyncGenerator,
     Awaitable,
     Callable,
+    Dict,
     List,
     Literal,
     Optional,
@@ -17,6 +20,7 @@ from typing import (
     Union,
     cast,
 )
+from weakref import WeakKeyDictionary
 
 from anyio.from_thread import start_blocking_portal
 from openbb_core.provider.abstract.data import Data
@@ -24,7 +28,9 @@ from openbb_core.provider.utils.client import (
     ClientResponse,
     ClientSession,
     get_user_agent,
+    redact_url,
 )
+from openbb_core.provider.utils.tracing import is_tracing, span
 from typing_extensions import ParamSpec
 
 if TYPE_CHECKING:
@@ -118,6 +124,10 @@ def get_python_request_settings() -> dict:
     - auth: Basic authentication.
     - headers: Request headers.
     - cookies: Dictionary of session cookies.
+    - limit: Total number of simultaneous connections.  # aiohttp only
+    - limit_per_host: Number of simultaneous connections to the same host.
+    - ttl_dns_cache: Seconds to cache DNS lookups, None to cache forever.  # aiohttp only
+    - keepalive_timeout: Seconds to keep idle connections open.  # aiohttp only
 
     Any additional keys supplied will be ignored.
     """
@@ -140,6 +150,10 @@ def get_python_request_settings() -> dict:
         "auth",
         "headers",
         "cookies",
+        "limit",
+        "limit_per_host",
+        "ttl_dns_cache",
+        "keepalive_timeout",
     ]
 
     return {
@@ -222,6 +236,11 @@ def get_requests_session(**kwargs) -> "Session":
             except AttributeError:
                 continue
 
+    if limit_per_host := python_settings.get("limit_per_host"):
+        adapter = requests.adapters.HTTPAdapter(pool_maxsize=limit_per_host)
+        _session.mount("http://", adapter)
+        _session.mount("https://", adapter)
+
     _session.trust_env = False
 
     return _session
@@ -284,6 +303,12 @@ async def get_async_requests_session(**kwargs) -> ClientSession:
         for k, v in python_settings.items()
         if k in ["ssl", "verify_ssl", "fingerprint"] and v is not None
     }
+    # Connection pool settings also go to the TCPConnector.
+    connector_kwargs = {
+        k: python_settings.pop(k)
+        for k in ["limit", "limit_per_host", "ttl_dns_cache", "keepalive_timeout"]
+        if k in python_settings
+    }
 
     # Merge the updated python_settings dict with the kwargs.
     if python_settings:
@@ -293,11 +318,16 @@ async def get_async_requests_session(**kwargs) -> ClientSession:
 
     # SSL settings get passed to the TCPConnector used by the session.
     connector = kwargs.pop("connector", None) or (
-        aiohttp.TCPConnector(ttl_dns_cache=300, **ssl_kwargs) if ssl_kwargs else None
+        aiohttp.TCPConnector(**{"ttl_dns_cache": 300, **connector_kwargs, **ssl_kwargs})
+        if ssl_kwargs or connector_kwargs
+        else None
     )
 
     conn_kwargs = {"connector": connector} if connector else {}
 
+    if trace_configs := kwargs.pop("trace_configs", None):
+        conn_kwargs["trace_configs"] = trace_configs
+
     # Add basic auth for proxies, if provided.
     p_auth = kwargs.pop("proxy_auth", [])
     if p_auth:
@@ -317,6 +347,8 @@ async def get_async_requests_session(**kwargs) -> ClientSession:
             conn_kwargs["cookies"] = _cookies
         elif isinstance(_cookies, aiohttp.CookieJar):
             conn_kwargs["cookie_jar"] = _cookies
+    if (cookie_jar := kwargs.pop("cookie_jar", None)) is not None:
+        conn_kwargs["cookie_jar"] = cookie_jar
 
     # Pass any remaining kwargs to the session
     for k, v in kwargs.items():
@@ -331,6 +363,17 @@ async def get_async_requests_session(**kwargs) -> ClientSession:
         elif k not in ("ssl", "verify_ssl", "fingerprint") and k in python_settings:
             conn_kwargs[k] = v
 
+    # A jar that does not store cookies also drops those of the session, so they are
+    # sent as a header.
+    if isinstance(conn_kwargs.get("cookie_jar"), aiohttp.DummyCookieJar) and isinstance(
+        conn_kwargs.get("cookies"), dict
+    ):
+        cookies = conn_kwargs.pop("cookies")
+        conn_kwargs["headers"] = {
+            **conn_kwargs.get("headers", {}),
+            "Cookie": "; ".join(f"{k}={v}" for k, v in cookies.items()),
+        }
+
     _session: ClientSession = ClientSession(**conn_kwargs)
 
     def at_exit(session):
@@ -344,6 +387,190 @@ async def get_async_requests_session(**kwargs) -> ClientSession:
     return _session
 
 
+def _get_session_key(python_settings: dict) -> str:
+    """Get a key identifying the session settings, including the relevant environment variables."""
+    # pylint: disable=import-outside-toplevel
+    from json import dumps
+
+    env = {
+        k: os.environ.get(k)
+        for k in ["HTTP_PROXY", "HTTPS_PROXY", "REQUESTS_CA_BUNDLE"]
+        if os.environ.get(k)
+    }
+    return dumps([python_settings, env], sort_keys=True, default=str)
+
+
+class SessionPool:
+    """Shared aiohttp sessions for one event loop, keyed by the request settings.
+
+    Pooled sessions keep their connections alive between calls, so the TCP and TLS
+    handshakes to a provider's host are paid once instead of on every request.
+    They do not store cookies, which would otherwise be shared by all their users.
+    Requests that need the cookies of a response should use their own session.
+    Connection limits and DNS caching are set with the `limit`, `limit_per_host`,
+    `ttl_dns_cache` and `keepalive_timeout` HTTP settings.
+
+    The pool is closed when its event loop shuts down asynchronous generators, which
+    `asyncio.run`, anyio and `EventLoopThread` all do before closing the loop.
+    """
+
+    _pools: "WeakKeyDictionary[asyncio.AbstractEventLoop, SessionPool]" = (
+        WeakKeyDictionary()
+    )
+
+    def __init__(self) -> None:
+        """Initialize the session pool."""
+        self._sessions: Dict[str, ClientSession] = {}
+        self._lifetime: Optional[AsyncGenerator] = None
+        self.stats: Dict[str, float] = {
+            "requests": 0,
+            "connections_created": 0,
+            "connections_reused": 0,
+            "connect_time": 0.0,
+        }
+
+    @classmethod
+    async def get_pool(cls) -> "SessionPool":
+        """Get the session pool of the running event loop."""
+        loop = asyncio.get_running_loop()
+        pool = cls._pools.get(loop)
+        if pool is None:
+            pool = cls()
+            cls._pools[loop] = pool
+            await pool._bind()
+        return pool
+
+    async def _bind(self) -> None:
+        """Close the pool when the loop finalizes its asynchronous generators."""
+
+        async def _lifetime() -> AsyncGenerator[None, None]:
+            try:
+                yield
+            finally:
+                await self.close()
+
+        self._lifetime = _lifetime()
+        await self._lifetime.__anext__()
+
+    def _get_trace_config(self):
+        """Get a trace config that records connection reuse and connect time."""
+        # pylint: disable=import-outside-toplevel
+        from time import perf_counter
+
+        import aiohttp
+
+        async def on_request_start(session, ctx, params):
+            self.stats["requests"] += 1
+
+        async def on_connection_create_start(session, ctx, params):
+            ctx.connect_start = perf_counter()
+
+        async def on_connection_create_end(session, ctx, params):
+            self.stats["connections_created"] += 1
+            self.stats["connect_time"] += perf_counter() - ctx.connect_start
+
+        async def on_connection_reuseconn(session, ctx, params):
+            self.stats["connections_reused"] += 1
+
+        trace_config = aiohttp.TraceConfig()
+        trace_config.on_request_start.append(on_request_start)
+        trace_config.on_connection_create_start.append(on_connection_create_start)
+        trace_config.on_connection_create_end.append(on_connection_create_end)
+        trace_config.on_connection_reuseconn.append(on_connection_reuseconn)
+        return trace_config
+
+    async def get_session(self) -> ClientSession:
+        """Get the pooled session for the current request settings."""
+        # pylint: disable=import-outside-toplevel
+        import aiohttp
+
+        key = _get_session_key(get_python_request_settings())
+        session = self._sessions.get(key)
+        if session is None or session.closed:
+            session = await get_async_requests_session(
+                cookie_jar=aiohttp.DummyCookieJar(),
+                trace_configs=[self._get_trace_config()],
+            )
+            self._sessions[key] = session
+        return session
+
+    @classmethod
+    def is_pooled(cls, session: ClientSession) -> bool:
+        """Check if a session belongs to the pool of the running event loop."""
+        pool = cls._pools.get(asyncio.get_running_loop())
+        return pool is not None and any(
+            session is s
+            for s in pool._sessions.values()  # pylint: disable=protected-access
+        )
+
+    async def close(self) -> None:
+        """Close all the sessions in the pool."""
+        sessions = list(self._sessions.values())
+        self._sessions.clear()
+        for session in sessions:
+            if not session.closed:
+                await session.close()
+        for loop, pool in list(self._pools.items()):
+            if pool is self:
+                self._pools.pop(loop, None)
+
+
+async def get_pooled_session() -> ClientSession:
+    """Get a shared aiohttp session for the running event loop.
+
+    The session must not be closed by the caller, it is closed with its event loop.
+    """
+    pool = await SessionPool.get_pool()
+    return await pool.get_session()
+
+
+async def close_session_pool() -> None:
+    """Close the shared aiohttp sessions of the running event loop."""
+    pool = SessionPool._pools.get(
+        asyncio.get_running_loop()
+    )  # pylint: disable=protected-access
+    if pool is not None:
+        await pool.close()
+
+
+_requests_sessions: Dict[str, "Session"] = {}
+_requests_sessions_lock = threading.Lock()
+
+
+def get_pooled_requests_session() -> "Session":
+    """Get a shared requests session for the current request settings.
+
+    The session must not be closed by the caller, it is closed at exit.
+    It does not store the cookies of the responses, so they are not shared
+    between its users. Requests that need them should use their own session.
+    """
+    key = _get_session_key(get_python_request_settings())
+    with _requests_sessions_lock:
+        session = _requests_sessions.get(key)
+        if session is None:
+            if not _requests_sessions:
+                # pylint: disable=import-outside-toplevel
+                import atexit
+
+                atexit.register(close_requests_session_pool)
+            # pylint: disable=import-outside-toplevel
+            from http.cookiejar import DefaultCookiePolicy
+
+            session = get_requests_session()
+            session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+            _requests_sessions[key] = session
+    return session
+
+
+def close_requests_session_pool() -> None:
+    """Close the shared requests sessions."""
+    with _requests_sessions_lock:
+        sessions = list(_requests_sessions.values())
+        _requests_sessions.clear()
+    for session in sessions:
+        session.close()
+
+
 async def amake_request(
     url: str,
     method: Literal["GET", "POST"] = "GET",
@@ -367,7 +594,7 @@ async def amake_request(
     response_callback : Callable[[ClientResponse, ClientSession], Awaitable[Union[dict, List[dict]]]], optional
         Async callback with response and session as arguments that returns the json, by default None
     session : ClientSession, optional
-        Custom session to use for requests, by default None
+        Custom session to use for requests, by default the shared session of the running event loop
 
 
     Returns
@@ -385,13 +612,13 @@ async def amake_request(
     )
 
     with_session = kwargs.pop("with_session", "session" in kwargs)
-    session = kwargs.pop("session", await get_async_requests_session(**kwargs))
+    session = kwargs.pop("session", None) or await get_pooled_session()
 
     try:
         response = await session.request(method, url, **kwargs)
         return await response_callback(response, session)
     finally:
-        if not with_session:
+        if not with_session and not SessionPool.is_pooled(session):
             await session.close()
 
 
@@ -415,14 +642,14 @@ async def amake_requests(
     response_callback : Callable[[ClientResponse, ClientSession], Awaitable[Union[dict, List[dict]]]], optional
         Async callback with response and session as arguments that returns the json, by default None
     session : ClientSession, optional
-        Custom session to use for requests, by default None
+        Custom session to use for requests, by default the shared session of the running event loop
 
     Returns
     -------
     Union[dict, List[dict]]
         Response json
     """
-    session = kwargs.pop("session", await get_async_requests_session(**kwargs))
+    session = kwargs.pop("session", None) or await get_pooled_session()
     kwargs["response_callback"] = response_callback
     urls = urls if isinstance(urls, list) else [urls]
 
@@ -448,7 +675,8 @@ async def amake_requests(
         return results
 
     finally:
-        await session.close()
+        if not SessionPool.is_pooled(session):
+            await session.close()
 
 
 def combine_certificates(cert: str, bundle: Optional[str] = None) -> str:
@@ -536,23 +764,26 @@ def make_request(
         headers["User-Agent"] = get_user_agent()
 
     # Allow a custom session for caching, if desired
-    _session = kwargs.pop("session", get_requests_session(**kwargs))
-
-    if method.upper() == "GET":
-        return _session.get(
-            url,
-            headers=headers,
-            timeout=timeout,
-            **kwargs,
-        )
-    if method.upper() == "POST":
-        return _session.post(
-            url,
-            headers=headers,
-            timeout=timeout,
-            **kwargs,
+    _session = kwargs.pop("session", None) or get_pooled_requests_session()
+
+    if method.upper() not in ("GET", "POST"):
+        raise ValueError("Method must be GET or POST")
+
+    send = _session.get if method.upper() == "GET" else _session.post
+
+    if not is_tracing():
+        return send(url, headers=headers, timeout=timeout, **kwargs)
+
+    with span("http", method=method.upper(), url=redact_url(url)) as attributes:
+        response = send(url, headers=headers, timeout=timeout, **kwargs)
+        attributes["url"] = redact_url(response.url)
+        attributes["status"] = response.status_code
+        attributes["bytes"] = (
+            int(response.headers.get("Content-Length") or 0)
+            if kwargs.get("stream")
+            else len(response.content)
         )
-    raise ValueError("Method must be GET or POST")
+    return response
 
 
 def to_snake_case(string: str) -> str:
@@ -592,6 +823,121 @@ def run_async(
             portal.call(portal.stop)
 
 
+class EventLoopThread:
+    """Long-lived event loop running in a background daemon thread.
+
+    Coroutines submitted from synchronous code run on the same loop, so the thread
+    and loop startup cost is paid once, and resources bound to the loop, like
+    connection pools, survive between calls.
+
+    The loop runs one call at a time. If a call is submitted while another one is
+    still running, or from the loop thread itself, it falls back to `run_async`
+    so that threaded callers keep running in parallel and nothing deadlocks.
+    """
+
+    def __init__(self, name: str = "openbb-event-loop") -> None:
+        """Initialize the event loop thread. The loop is started on first use."""
+        self._name = name
+        self._lock = threading.Lock()
+        self._busy = threading.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._atexit_registered = False
+
+    @property
+    def loop(self) -> Optional[asyncio.AbstractEventLoop]:
+        """The running event loop, if started."""
+        return self._loop
+
+    @property
+    def is_running(self) -> bool:
+        """Whether the background thread is alive."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> asyncio.AbstractEventLoop:
+        """Start the background loop if it is not running and return it."""
+        with self._lock:
+            if self._loop is None or not self.is_running:
+                loop = asyncio.new_event_loop()
+                ready = threading.Event()
+
+                def _run_forever() -> None:
+                    asyncio.set_event_loop(loop)
+                    loop.call_soon(ready.set)
+                    loop.run_forever()
+
+                thread = threading.Thread(
+                    target=_run_forever, name=self._name, daemon=True
+                )
+                thread.start()
+                ready.wait()
+                self._loop, self._thread = loop, thread
+
+                if not self._atexit_registered:
+                    # pylint: disable=import-outside-toplevel
+                    import atexit
+
+                    atexit.register(self.stop)
+                    self._atexit_registered = True
+
+            return self._loop
+
+    def run(
+        self, func: Callable[P, Awaitable[T]], /, *args: P.args, **kwargs: P.kwargs
+    ) -> T:
+        """Run a coroutine function on the background loop and block until it is done."""
+        if not iscoroutinefunction(func):
+            return cast(T, func(*args, **kwargs))
+
+        if threading.current_thread() is self._thread or not self._busy.acquire(
+            blocking=False
+        ):
+            return run_async(func, *args, **kwargs)
+
+        try:
+            loop = self.start()
+            future = asyncio.run_coroutine_threadsafe(func(*args, **kwargs), loop)
+            try:
+                return future.result()
+            except BaseException:
+                future.cancel()
+                raise
+        finally:
+            self._busy.release()
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """Cancel pending tasks, stop the loop and join the thread."""
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            self._loop, self._thread = None, None
+
+        if loop is None or loop.is_closed():
+            return
+
+        if thread is threading.current_thread():
+            loop.call_soon(loop.stop)
+            return
+
+        async def _shutdown() -> None:
+            tasks = [t for t in asyncio.all_tasks() if t is not asyncio.current_task()]
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            await loop.shutdown_asyncgens()
+
+        if thread is not None and thread.is_alive():
+            # pylint: disable=import-outside-toplevel
+            from contextlib import suppress
+
+            with suppress(Exception):
+                asyncio.run_coroutine_threadsafe(_shutdown(), loop).result(timeout)
+            loop.call_soon_threadsafe(loop.stop)
+            thread.join(timeout)
+
+        if not loop.is_running():
+            loop.close()
+
+
 def filter_by_dates(
     data: List[D], start_date: Optional[date] = None, end_date: Optional[date] = None
 ) -> List[D]:
@@ -0,0 +1,301 @@
+"""Options Chains Index."""
+
+from datetime import (
+    date as dateType,
+    datetime,
+)
+from typing import Any, Dict, List, Literal, Optional, Tuple, Union
+
+import numpy as np
+from openbb_core.app.model.abstract.error import OpenBBError
+from pandas import DataFrame, Timestamp, to_datetime
+
+PRICE_FIELDS: Dict[str, List[str]] = {
+    "bid": [
+        "bid",
+        "last_trade_price",
+        "close",
+        "close_bid",
+        "prev_close",
+        "mark",
+        "settlement_price",
+    ],
+    "ask": [
+        "ask",
+        "last_trade_price",
+        "close",
+        "close_ask",
+        "prev_close",
+        "mark",
+        "settlement_price",
+    ],
+}
+
+
+class OptionsChainsIndex:
+    """Columnar index of an options chain, built once from the fields of the chain.
+
+    The contracts are sorted by expiration, strike and option type, with the computed
+    columns of `OptionsChainsProperties.dataframe`, and stored as arrays in `columns`.
+    Each expiration is an integer code into `expirations`. The contracts of an
+    expiration and option type are a slice of `order`, sorted by strike, so strikes
+    are looked up with a binary search instead of filtering the whole chain.
+    """
+
+    def __init__(self, fields: Dict[str, List], last_price: Optional[float] = None):
+        """Initialize the index from the fields of the chain."""
+        frame, expiration = self._build_frame(fields, last_price)
+        self.frame = frame
+        self.columns: Dict[str, np.ndarray] = {
+            c: frame[c].to_numpy() for c in frame.columns
+        }
+        self.size = len(frame)
+
+        self.expirations, self.codes = np.unique(
+            expiration.astype("datetime64[D]"), return_inverse=True
+        )
+        self.expiration_strings: List[str] = np.datetime_as_string(
+            self.expirations, unit="D"
+        ).tolist()
+        self._expiration_codes = {d: i for i, d in enumerate(self.expiration_strings)}
+        self._expiration_starts = np.searchsorted(
+            self.codes, np.arange(len(self.expirations) + 1)
+        )
+        # All the expirations of the chain, including the ones filtered out.
+        self.all_expirations = np.unique(
+            np.array(list(set(fields["expiration"])), dtype="datetime64[D]")
+        ).astype("datetime64[ns]")
+
+        self.option_type = self.columns["option_type"]
+        is_put = (self.option_type == "put").astype(int)
+        self.order = np.lexsort((self.columns["strike"], is_put, self.codes))
+        keys = (self.codes * 2 + is_put)[self.order]
+        self._starts = np.searchsorted(keys, np.arange(len(self.expirations) * 2 + 1))
+
+        # The distinct days to expiration of each expiration, in order of expiration.
+        self._dte_codes = np.array([], dtype=int)
+        self._dte_values = np.array([], dtype=float)
+        if "dte" in self.columns:
+            dte = self.columns["dte"].astype(float)
+            valid = dte >= 0
+            pairs = np.unique(
+                np.column_stack([self.codes[valid], dte[valid]]), axis=0
+            ).reshape(-1, 2)
+            self._dte_codes = pairs[:, 0].astype(int)
+            self._dte_values = pairs[:, 1]
+
+    @staticmethod
+    def _build_frame(
+        fields: Dict[str, List], last_price: Optional[float]
+    ) -> Tuple[DataFrame, np.ndarray]:
+        """Build the rows of the chain, sorted, with the days to expiration and the computed columns.
+
+        Returns the rows, and their expiration dates as an array.
+        """
+        frame = DataFrame(fields)
+
+        if "underlying_price" not in frame.columns and not last_price:
+            raise OpenBBError(
+                "'underlying_price' was not returned in the provider data."
+                + "\n\n Please set the 'last_price' property and try again."
+                + "\n\n Note: This error does not impact the standard OBBject `to_df()` method."
+            )
+
+        # Add the underlying price to the DataFrame, or override the existing price.
+        if last_price:
+            frame.loc[:, "underlying_price"] = last_price
+
+        if frame.empty:
+            raise OpenBBError("Error: No validated data was found.")
+
+        expiration = to_datetime(frame.expiration).to_numpy()
+        day = np.timedelta64(1, "D")
+        if "dte" not in frame.columns and "eod_date" in frame.columns:
+            eod_date = to_datetime(frame.eod_date).to_numpy()
+            frame.loc[:, "dte"] = (expiration - eod_date) // day
+
+        if "dte" in frame.columns:
+            unexpired = (frame.dte >= 0).to_numpy()
+            frame = frame[unexpired]
+            expiration = expiration[unexpired]
+
+        if "dte" not in frame.columns and "eod_date" not in frame.columns:
+            today = np.datetime64(datetime.today().date(), "ns")
+            frame.loc[:, "dte"] = (expiration - today) // day
+
+        option_type = frame.option_type.to_numpy()
+        order = np.lexsort(
+            (
+                option_type == "put",
+                frame.strike.to_numpy(),
+                expiration.astype("datetime64[D]"),
+            )
+        )
+
+        # Add the breakeven price for each option, and the DEX and GEX for each option, if available.
+        computed = OptionsChainsIndex._computed_columns(frame, option_type)
+        if computed:
+            frame = frame.assign(**computed)
+            order = order[np.isin(option_type[order], ["call", "put"])]
+
+        first = ["expiration", "strike", "option_type"]
+        columns = first + [c for c in frame.columns if c not in first]
+        return frame.take(order)[columns].reset_index(drop=True), expiration[order]
+
+    @staticmethod
+    def _computed_columns(frame: DataFrame, option_type: np.ndarray) -> Dict[str, Any]:
+        """Compute the breakeven price, DEX and GEX, or nothing if the chain is missing a field."""
+        try:
+            sign = np.where(option_type == "call", 1, -1)
+            ask = get_price_col(frame.columns, "ask")
+            computed: Dict[str, Any] = {"Breakeven": frame.strike + sign * frame[ask]}
+            size = frame.contract_size if "contract_size" in frame.columns else 100
+            if "delta" in frame.columns:
+                computed["DEX"] = (
+                    (frame.delta * size * frame.open_interest * frame.underlying_price)
+                    .replace({np.nan: 0})
+                    .astype("int64")
+                )
+            if "gamma" in frame.columns:
+                computed["GEX"] = (
+                    (
+                        frame.gamma
+                        * size
+                        * frame.open_interest
+                        * (frame.underlying_price * frame.underlying_price)
+                        * 0.01
+                        * sign
+                    )
+                    .replace({np.nan: 0})
+                    .astype("int64")
+                )
+        except Exception:  # pylint: disable=broad-exception-caught
+            return {}
+
+        return computed
+
+    def price_col(self, bid_ask: Literal["bid", "ask"]) -> str:
+        """Get the name of the bid or ask price column, which may vary by provider."""
+        return get_price_col(self.columns, bid_ask)
+
+    def expiration_code(self, expiration: str) -> Optional[int]:
+        """Get the code of an expiration date, as a string, or None if it is not in the chain."""
+        return self._expiration_codes.get(expiration)
+
+    def expiration_rows(self, code: Optional[int]) -> np.ndarray:
+        """Get the rows of an expiration, in order of strike and option type."""
+        if code is None:
+            return np.array([], dtype=int)
+        return np.arange(
+            self._expiration_starts[code], self._expiration_starts[code + 1]
+        )
+
+    def rows(self, code: Optional[int], option_type: str) -> np.ndarray:
+        """Get the rows of an expiration and option type, in order of strike."""
+        if code is None or option_type not in ["call", "put"]:
+            return np.array([], dtype=int)
+        block = code * 2 + (option_type == "put")
+        return self.order[self._starts[block] : self._starts[block + 1]]
+
+    def find(self, code: Optional[int], option_type: str, strike: Any) -> Optional[int]:
+        """Get the first row of a contract, by expiration, option type and strike."""
+        rows = self.rows(code, option_type)
+        if strike is None or rows.size == 0:
+            return None
+        strikes = self.columns["strike"][rows]
+        i = np.searchsorted(strikes, strike)
+        if i < rows.size and strikes[i] == strike:
+            return int(rows[i])
+        return None
+
+    def nearest_expiration(
+        self,
+        date: Optional[Union[str, int, dateType]] = None,
+    ) -> str:
+        """Get the nearest expiration date to a date, or a number of days until expiry."""
+        if isinstance(date, int) and not isinstance(date, bool):
+            days = -1 if date == 0 else date
+            if self._dte_values.size == 0:
+                raise OpenBBError("Error: No contracts with days to expiration found.")
+            nearest = np.abs(self._dte_values - days).argmin()
+            return self.expiration_strings[self._dte_codes[nearest]]
+
+        if date is None:
+            target = to_datetime(
+                self.columns["eod_date"][0]
+                if "eod_date" in self.columns
+                else datetime.today().strftime("%Y-%m-%d")
+            )
+        else:
+            target = to_datetime(date)
+        target = Timestamp(target).to_datetime64()
+        nearest = np.abs(
+            (self.all_expirations - target).astype("int64")  # type: ignore
+        ).argmin()
+        return str(self.all_expirations[nearest].astype("datetime64[D]"))
+
+    def nearest_strike(
+        self,
+        code: Optional[int],
+        option_type: Literal["call", "put"],
+        strike: Optional[float] = None,
+        price_col: Optional[str] = None,
+        force_otm: bool = True,
+    ) -> Optional[float]:
+        """Get the strike nearest to a target, by binary search over the strikes of an expiration.
+
+        Only the contracts with a price in `price_col` are considered. With `force_otm`,
+        the nearest strike is the one at, or out of the money from, the target.
+        """
+        rows = self.rows(code, option_type)
+        if rows.size == 0:
+            return None
+        if strike is None:
+            strike = self.columns["underlying_price"][rows[0]]
+        if price_col is not None:
+            rows = rows[~isnull(self.columns[price_col][rows])]
+        if rows.size == 0:
+            return None
+
+        strikes = self.columns["strike"][rows]
+        i = np.searchsorted(strikes, strike)
+        if force_otm is False:
+            if i == 0:
+                return strikes[0]
+            if i == strikes.size:
+                return strikes[-1]
+            lower, upper = strikes[i - 1], strikes[i]
+            return lower if abs(lower - strike) <= abs(upper - strike) else upper
+
+        if option_type == "put":
+            i = np.searchsorted(strikes, strike, side="right")
+            return strikes[i - 1] if i > 0 else None
+        return strikes[i] if i < strikes.size else None
+
+
+def get_price_col(columns: Any, bid_ask: Literal["bid", "ask"]) -> str:
+    """Get the first price column found, from the ones of the bid or ask side."""
+    for field in PRICE_FIELDS[bid_ask]:
+        if field in columns:
+            return field
+    return ""
+
+
+def isnull(values: np.ndarray) -> np.ndarray:
+    """Get a mask of the missing values of an array."""
+    # pylint: disable=import-outside-toplevel
+    from pandas import isna
+
+    return np.asarray(isna(values))
+
+
+def group_sum(values: np.ndarray, groups: np.ndarray, size: int) -> np.ndarray:
+    """Sum the values by group code, with NaN for the groups without any value."""
+    dtype = values.dtype if values.dtype.kind in "iuf" else float
+    sums = np.zeros(size, dtype=dtype)
+    np.add.at(sums, groups, values.astype(dtype))
+    empty = np.bincount(groups, minlength=size) == 0
+    if empty.any():
+        sums = sums.astype(float)
+        sums[empty] = np.nan
+    return sums
@@ -10,6 +10,7 @@ from openbb_core.app.model.abstract.error import OpenBBError
 from openbb_core.provider.abstract.data import Data
 
 if TYPE_CHECKING:
+    from openbb_core.provider.utils.options_chains_index import OptionsChainsIndex
     from pandas import DataFrame
 
 
@@ -35,137 +36,46 @@ class OptionsChainsProperties(Data):
         Deleting the property will revert to the provider's underlying price.
         """
         self._last_price = price
+        self._clear_index()
 
     @last_price.deleter
     def last_price(self):
         """Delete the last price property."""
         if hasattr(self, "_last_price"):
             del self._last_price
+        self._clear_index()
+
+    def _clear_index(self) -> None:
+        """Clear the chains index and the dataframe, so they are built again from the fields."""
+        self.__dict__.pop("_chains_index", None)
+        self.__dict__.pop("dataframe", None)
 
     @cached_property
-    def dataframe(self) -> "DataFrame":
-        """Return all data as a Pandas DataFrame,
-        with additional computed columns (Breakeven, GEX, DEX) if available.
+    def _chains_index(self) -> "OptionsChainsIndex":
+        """The columnar index of the chains, built once from the fields.
+        This property is not intended to be used directly.
         """
         # pylint: disable=import-outside-toplevel
-        from numpy import nan
-        from pandas import DataFrame, DatetimeIndex, Timedelta, concat, to_datetime
-
-        chains_data = DataFrame(
-            self.model_dump(
-                exclude_unset=True,
-                exclude_none=True,
-            )
-        )
-
-        if "underlying_price" not in chains_data.columns and not self.last_price:
-            raise OpenBBError(
-                "'underlying_price' was not returned in the provider data."
-                + "\n\n Please set the 'last_price' property and try again."
-                + "\n\n Note: This error does not impact the standard OBBject `to_df()` method."
-            )
-
-        # Add the underlying price to the DataFrame, or override the existing price.
-        if self.last_price:
-            chains_data.loc[:, "underlying_price"] = self.last_price
-
-        if chains_data.empty:
-            raise OpenBBError("Error: No validated data was found.")
-
-        if "dte" not in chains_data.columns and "eod_date" in chains_data.columns:
-            _date = to_datetime(chains_data.eod_date)
-            temp = DatetimeIndex(chains_data.expiration)
-            temp_ = temp - _date  # type: ignore
-            chains_data.loc[:, "dte"] = [Timedelta(_temp_).days for _temp_ in temp_]
-
-        if "dte" in chains_data.columns:
-            chains_data = DataFrame(chains_data[chains_data.dte >= 0])
-
-        if "dte" not in chains_data.columns and "eod_date" not in chains_data.columns:
-            today = datetime.today().date()
-            chains_data.loc[:, "dte"] = chains_data.expiration - today
-
-        # Add the breakeven price for each option, and the DEX and GEX for each option, if available.
-        try:
-            _calls = DataFrame(chains_data[chains_data.option_type == "call"])
-            _puts = DataFrame(chains_data[chains_data.option_type == "put"])
-            _ask = self._identify_price_col(  # pylint: disable=W0212
-                chains_data, "call", "ask"
-            )
-            _calls.loc[:, ("Breakeven")] = _calls.strike + _calls.loc[:, (_ask)]
-            _puts.loc[:, ("Breakeven")] = _puts.strike - _puts.loc[:, (_ask)]
-            if "delta" in _calls.columns:
-                _calls.loc[:, ("DEX")] = (
-                    (
-                        _calls.delta
-                        * (
-                            _calls.contract_size
-                            if hasattr(_calls, "contract_size")
-                            else 100
-                        )
-                        * _calls.open_interest
-                        * _calls.underlying_price
-                    )
-                    .replace({nan: 0})
-                    .astype("int64")
-                )
-                _puts.loc[:, ("DEX")] = (
-                    (
-                        _puts.delta
-                        * (
-                            _puts.contract_size
-                            if hasattr(_puts, "contract_size")
-                            else 100
-                        )
-                        * _puts.open_interest
-                        * _puts.underlying_price
-                    )
-                    .replace({nan: 0})
-                    .astype("int64")
-                )
-
-            if "gamma" in _calls.columns:
-                _calls.loc[:, ("GEX")] = (
-                    (
-                        _calls.gamma
-                        * (
-                            _calls.contract_size
-                            if hasattr(_calls, "contract_size")
-                            else 100
-                        )
-                        * _calls.open_interest
-                        * (_calls.underlying_price * _calls.underlying_price)
-                        * 0.01
-                    )
-                    .replace({nan: 0})
-                    .astype("int64")
-                )
-                _puts.loc[:, ("GEX")] = (
-                    (
-                        _puts.gamma
-                        * (
-                            _puts.contract_size
-                            if hasattr(_puts, "contract_size")
-                            else 100
-                        )
-                        * _puts.open_interest
-                        * (_puts.underlying_price * _puts.underlying_price)
-                        * 0.01
-                        * (-1)
-                    )
-                    .replace({nan: 0})
-                    .astype("int64")
+        from openbb_core.provider.utils.options_chains_index import OptionsChainsIndex
+
+        fields: Dict = {}
+        for field in type(self).model_fields:
+            value = getattr(self, field)
+            if isinstance(value, list) and value:
+                fields[field] = (
+                    [str(v) if v else None for v in value]
+                    if isinstance(value[0], datetime)
+                    else value
                 )
 
-            _calls.set_index(keys=["expiration", "strike", "option_type"], inplace=True)
-            _puts.set_index(keys=["expiration", "strike", "option_type"], inplace=True)
-            df = concat([_puts, _calls])
-            df = df.sort_index().reset_index()
-
-            return df
+        return OptionsChainsIndex(fields, self.last_price)
 
-        except Exception:  # pylint: disable=broad-exception-caught
-            return chains_data
+    @cached_property
+    def dataframe(self) -> "DataFrame":
+        """Return all data as a Pandas DataFrame,
+        with additional computed columns (Breakeven, GEX, DEX) if available.
+        """
+        return self._chains_index.frame
 
     @property
     def expirations(self) -> List[str]:
@@ -251,34 +161,10 @@ class OptionsChainsProperties(Data):
         str
             Name of the price column to use.
         """
-        price_col = ""
-        bid_fields = [
-            "bid",
-            "last_trade_price",
-            "close",
-            "close_bid",
-            "prev_close",
-            "mark",
-            "settlement_price",
-        ]
-        ask_fields = [
-            "ask",
-            "last_trade_price",
-            "close",
-            "close_ask",
-            "prev_close",
-            "mark",
-            "settlement_price",
-        ]
-        fields = bid_fields if bid_ask == "bid" else ask_fields
-        new_df = df[df["option_type"] == option_type].copy()
-
-        for field in fields:
-            if field in new_df.columns:
-                price_col = field
-                break
-
-        return price_col
+        # pylint: disable=import-outside-toplevel
+        from openbb_core.provider.utils.options_chains_index import get_price_col
+
+        return get_price_col(df.columns, bid_ask)
 
     def filter_data(
         self,
@@ -321,8 +207,15 @@ class OptionsChainsProperties(Data):
             This is ignored if `stat` is None.
         """
         # pylint: disable=import-outside-toplevel
-        from numpy import nan
-        from pandas import DataFrame, concat
+        from numpy import (
+            abs as np_abs,
+            arange,
+            concatenate,
+            flatnonzero,
+            nan,
+        )
+        from openbb_core.provider.utils.options_chains_index import isnull
+        from pandas import DataFrame
 
         stats = ["open_interest", "volume", "dex", "gex"]
         _stat = stat.upper() if stat in ["dex", "gex"] else stat
@@ -345,41 +238,46 @@ class OptionsChainsProperties(Data):
             df = DataFrame(self._get_stat(_stat, moneyness=moneyness, date=date)[by])  # type: ignore
             return df.replace({nan: None})
 
-        df = self.dataframe
+        # The filters select the rows of the index, and the frame is taken once at the end.
+        index = self._chains_index
+        columns = index.columns
+        rows = arange(index.size)
 
         if moneyness is not None:
-            df_calls = DataFrame(
-                df[df.strike >= df.underlying_price].query("option_type == 'call'")
-            )
-            df_puts = DataFrame(
-                df[df.strike <= df.underlying_price].query("option_type == 'put'")
+            strike = columns["strike"]
+            price = columns["underlying_price"]
+            rows = concatenate(
+                [
+                    flatnonzero((index.option_type == "call") & (strike >= price)),
+                    flatnonzero((index.option_type == "put") & (strike <= price)),
+                ]
             )
-            df = concat([df_calls, df_puts])
 
         if date is not None:
-            date = self._get_nearest_expiration(date)
-            df = DataFrame(df[df.expiration.astype(str) == date])
+            code = index.expiration_code(self._get_nearest_expiration(date))
+            rows = rows[index.codes[rows] == code]
 
         if option_type is not None:
-            df = DataFrame(df[df.option_type == option_type])
+            rows = rows[index.option_type[rows] == option_type]
 
+        sort = False
         if column is not None:
-            if column not in df.columns:
+            if column not in columns:
                 raise OpenBBError(f"Error: column '{column}' not found in data")
-            df = DataFrame(df[df[column].notnull()])
+            rows = rows[~isnull(columns[column][rows])]
             if value_min is not None and value_max is not None:
-                df = DataFrame(
-                    df[
-                        (df[column].abs() >= value_min)
-                        & (df[column].abs() <= value_max)
-                    ]
-                )
+                values = np_abs(columns[column][rows])
+                rows = rows[(values >= value_min) & (values <= value_max)]
             elif value_min is not None:
-                df = DataFrame(df[df[column].abs() >= value_min])
+                rows = rows[np_abs(columns[column][rows]) >= value_min]
             elif value_max is not None:
-                df = DataFrame(df[df[column].abs() <= value_max])
+                rows = rows[np_abs(columns[column][rows]) <= value_max]
             else:
-                df = DataFrame(df.sort_values(by=column, ascending=False))
+                sort = True
+
+        df = self.dataframe.take(rows)
+        if sort:
+            df = df.sort_values(by=column, ascending=False)  # type: ignore
 
         return df.reset_index(drop=True)
 
@@ -393,18 +291,30 @@ class OptionsChainsProperties(Data):
         This method is not intended to be called directly.
         """
         # pylint: disable=import-outside-toplevel
-        from numpy import inf, nan
-        from pandas import DataFrame, concat
+        from numpy import (
+            abs as np_abs,
+            concatenate,
+            flatnonzero,
+            inf,
+            nan,
+            nansum,
+            unique,
+        )
+        from openbb_core.provider.utils.options_chains_index import group_sum, isnull
+        from pandas import DataFrame
 
-        df = self.dataframe
+        if metric in ["DEX", "GEX"] and not self.has_greeks:
+            raise OpenBBError("Greeks were not found within the data.")
 
+        index = self._chains_index
+        values = index.columns[metric]
         if metric in ["DEX", "GEX"]:
-            if not self.has_greeks:
-                raise OpenBBError("Greeks were not found within the data.")
-            df[metric] = abs(df[metric])
+            values = np_abs(values)
 
-        total_calls = df[df.option_type == "call"][metric].sum()
-        total_puts = df[df.option_type == "put"][metric].sum()
+        is_call = index.option_type == "call"
+        is_put = index.option_type == "put"
+        total_calls = nansum(values[is_call])
+        total_puts = nansum(values[is_put])
         total_metric = total_calls + total_puts
         total_metric_dict = {
             "Calls": total_calls,
@@ -413,59 +323,60 @@ class OptionsChainsProperties(Data):
             "PCR": round(total_puts / total_calls, 4) if total_calls != 0 else 0,
         }
 
-        df = DataFrame(df[df[metric].notnull()])  # type: ignore
-        df["expiration"] = df.expiration.astype(str)
+        valid = ~isnull(values)
+        rows = flatnonzero(valid)
 
         if moneyness is not None:
-            df_calls = DataFrame(
-                df[df.strike >= df.underlying_price].query("option_type == 'call'")
-                if moneyness == "otm"
-                else df[df.strike <= df.underlying_price].query("option_type == 'call'")
-            )
-            df_puts = DataFrame(
-                df[df.strike <= df.underlying_price].query("option_type == 'put'")
-                if moneyness == "otm"
-                else df[df.strike >= df.underlying_price].query("option_type == 'put'")
+            strike = index.columns["strike"]
+            price = index.columns["underlying_price"]
+            above, below = strike >= price, strike <= price
+            rows = concatenate(
+                [
+                    flatnonzero(
+                        valid & is_call & (above if moneyness == "otm" else below)
+                    ),
+                    flatnonzero(
+                        valid & is_put & (below if moneyness == "otm" else above)
+                    ),
+                ]
             )
-            df = concat([df_calls, df_puts])
 
         if date is not None:
-            date = self._get_nearest_expiration(date)
-            df = DataFrame(df[df["expiration"].astype(str) == date])
-
-        by_expiration = df.groupby("expiration")[[metric]].sum()[[metric]].copy()
-        by_expiration = by_expiration.rename(columns={metric: "Total"})  # type: ignore
-        by_expiration["Calls"] = df[df.option_type == "call"].groupby("expiration")[metric].sum().copy()  # type: ignore
-        by_expiration["Puts"] = df[df.option_type == "put"].groupby("expiration")[metric].sum().copy()  # type: ignore
-        by_expiration["PCR"] = round(by_expiration["Puts"] / by_expiration["Calls"], 4)
-        by_expiration["Net Percent"] = round(
-            (by_expiration["Total"] / total_metric) * 100, 4
-        )
-        by_expiration = (
-            by_expiration[["Calls", "Puts", "Total", "Net Percent", "PCR"]]
-            .replace({0: None, inf: None, nan: None})
-            .dropna(how="all", axis=0)
-        )
-        by_expiration.index.name = "Expiration"
-        by_expiration_dict = by_expiration.reset_index().to_dict(orient="records")
-        by_strike = df.groupby("strike")[[metric]].sum()[[metric]].copy()
-        by_strike = by_strike.rename(columns={metric: "Total"})  # type: ignore
-        by_strike["Calls"] = df[df.option_type == "call"].groupby("strike")[metric].sum().copy()  # type: ignore
-        by_strike["Puts"] = df[df.option_type == "put"].groupby("strike")[metric].sum().copy()  # type: ignore
-        by_strike["PCR"] = round(by_strike["Puts"] / by_strike["Calls"], 4)
-        by_strike["Net Percent"] = round((by_strike["Total"] / total_metric) * 100, 4)
-        by_strike = (
-            by_strike[["Calls", "Puts", "Total", "Net Percent", "PCR"]]
-            .replace({0: None, inf: None, nan: None})
-            .dropna(how="all", axis=0)
-        )
-        by_strike.index.name = "Strike"
-        by_strike_dict = by_strike.reset_index().to_dict(orient="records")
+            code = index.expiration_code(self._get_nearest_expiration(date))
+            rows = rows[index.codes[rows] == code]
+
+        values, is_call, is_put = values[rows], is_call[rows], is_put[rows]
+
+        def group_by(keys, labels, name: str) -> List[Dict]:
+            """Sum the metric by the keys, for the calls, the puts and in total."""
+            groups, inverse = unique(keys, return_inverse=True)
+            size = len(groups)
+            data = DataFrame(
+                {
+                    "Total": group_sum(values, inverse, size),
+                    "Calls": group_sum(values[is_call], inverse[is_call], size),
+                    "Puts": group_sum(values[is_put], inverse[is_put], size),
+                },
+                index=labels(groups),
+            )
+            data["PCR"] = round(data["Puts"] / data["Calls"], 4)
+            data["Net Percent"] = round((data["Total"] / total_metric) * 100, 4)
+            data = (
+                data[["Calls", "Puts", "Total", "Net Percent", "PCR"]]
+                .replace({0: None, inf: None, nan: None})
+                .dropna(how="all", axis=0)
+            )
+            data.index.name = name
+            return data.reset_index().to_dict(orient="records")
 
         return {
             "total": total_metric_dict,
-            "expiration": by_expiration_dict,
-            "strike": by_strike_dict,
+            "expiration": group_by(
+                index.codes[rows],
+                lambda codes: [index.expiration_strings[c] for c in codes],
+                "Expiration",
+            ),
+            "strike": group_by(index.columns["strike"][rows], list, "Strike"),
         }
 
     def _get_nearest_expiration(
@@ -478,6 +389,8 @@ class OptionsChainsProperties(Data):
         ----------
         date: Optional[Union[str, int]]
             The expiration date, or days until expiry, to use.
+        df: Optional[DataFrame]
+            A subset of the chains to search, instead of the whole chain.
 
         Returns
         -------
@@ -488,7 +401,9 @@ class OptionsChainsProperties(Data):
         from datetime import timedelta  # noqa
         from pandas import DataFrame, Series, to_datetime
 
-        df = df if df is not None else self.dataframe
+        if df is None:
+            return self._chains_index.nearest_expiration(date)
+
         if isinstance(date, int):
             if not hasattr(df, "dte"):
                 date = (datetime.today() + timedelta(days=date)).strftime("%Y-%m-%d")
@@ -537,7 +452,7 @@ class OptionsChainsProperties(Data):
             Dictionary of the upper (call) and lower (put) strike prices.
         """
         # pylint: disable=import-outside-toplevel
-        from pandas import Series
+        from numpy import array
 
         if moneyness is None:
             moneyness = 0.25
@@ -550,32 +465,32 @@ class OptionsChainsProperties(Data):
                 "Error: Moneyness must be expressed as a percentage between 0 and 100"
             )
 
-        df = self.dataframe
+        index = self._chains_index
 
-        if underlying_price is None and not hasattr(df, "underlying_price"):
+        if underlying_price is None and "underlying_price" not in index.columns:
             raise OpenBBError(
                 "Error: underlying_price must be provided if underlying_price is not available"
             )
 
+        rows = index.expiration_rows(0)
         if date is not None:
-            date = self._get_nearest_expiration(date)
-            df = df[df.expiration.astype(str) == date]
-            strikes = Series(df.strike.unique().tolist())
+            rows = index.expiration_rows(
+                index.expiration_code(self._get_nearest_expiration(date))
+            )
 
         last_price = (
             underlying_price
             if underlying_price is not None
-            else df.underlying_price.iloc[0]
+            else index.columns["underlying_price"][rows[0]]
         )
-        strikes = Series(self.strikes)
+        strikes = array(self.strikes)
 
         upper = last_price * (1 + moneyness)  # type: ignore
         lower = last_price * (1 - moneyness)  # type: ignore
-        nearest_call = (upper - strikes).abs().idxmin()
-        call = strikes[nearest_call]
-        nearest_put = (lower - strikes).abs().idxmin()
-        put = strikes[nearest_put]
-        otm_strikes = {"call": call, "put": put}
+        otm_strikes = {
+            "call": strikes[abs(upper - strikes).argmin()],
+            "put": strikes[abs(lower - strikes).argmin()],
+        }
 
         return otm_strikes
 
@@ -609,52 +524,33 @@ class OptionsChainsProperties(Data):
         float
             The closest strike price to the target price and number of days until expiry.
         """
-        # pylint: disable=import-outside-toplevel
-        from pandas import Series
-
         if option_type not in ["call", "put"]:
             raise OpenBBError("Error: option_type must be either 'call' or 'put'")
 
-        chains = self.dataframe
         days = -1 if days == 0 else days
 
         if days is None:
             days = 30
 
-        dte_estimate = self._get_nearest_expiration(days)
-        df = (
-            chains[chains.expiration.astype(str) == dte_estimate]
-            .query("`option_type` == @option_type")
-            .copy()
-        )
-        if strike is None:
-            strike = df.underlying_price.iloc[0]
-
-        if price_col is not None:
-            df = df[df[price_col].notnull()]  # type: ignore
-
-        if df.empty or len(df) == 0:
-            return None
+        index = self._chains_index
+        code = index.expiration_code(self._get_nearest_expiration(days))
 
-        if force_otm is False:
-            strikes = Series(df.strike.unique().tolist())
-            nearest = (strikes - strike).abs().idxmin()
-            return strikes.iloc[nearest]
+        return index.nearest_strike(code, option_type, strike, price_col, force_otm)
 
-        nearest = (
-            df[df.strike <= strike] if option_type == "put" else df[df.strike >= strike]
-        )
-
-        if nearest.empty or len(nearest) == 0:  # type: ignore
-            return None
-
-        nearest = (
-            nearest.query("strike.idxmax()")  # type: ignore
-            if option_type == "put"
-            else nearest.query("strike.idxmin()")  # type: ignore
-        )
+    def _get_premium(
+        self,
+        code: Optional[int],
+        option_type: Literal["call", "put"],
+        strike: Optional[float],
+        price_col: str,
+    ) -> Optional[float]:
+        """Return the premium of a contract, by expiration code, option type and strike.
+        This method is not intended to be called directly.
+        """
+        index = self._chains_index
+        row = index.find(code, option_type, strike)
 
-        return nearest.strike
+        return None if row is None else index.columns[price_col][row]
 
     def straddle(
         self,
@@ -688,7 +584,8 @@ class OptionsChainsProperties(Data):
 
         short: bool = False
 
-        chains = self.dataframe
+        index = self._chains_index
+        columns = index.columns
 
         if days is None:
             days = 30
@@ -697,22 +594,22 @@ class OptionsChainsProperties(Data):
             days = -1
 
         dte_estimate = self._get_nearest_expiration(days)
+        code = index.expiration_code(dte_estimate)
+        first = index.expiration_rows(code)[0]
 
-        chains = chains[chains.expiration.astype(str) == dte_estimate]
-
-        if not hasattr(chains, "underlying_price") and underlying_price is None:
+        if "underlying_price" not in columns and underlying_price is None:
             raise OpenBBError(
                 "Error: underlying_price must be provided if underlying_price is not available"
             )
         underlying_price = (
             underlying_price
             if underlying_price is not None
-            else chains.underlying_price.iloc[0]
+            else columns["underlying_price"][first]
         )
 
         force_otm = True
 
-        if strike is None and not hasattr(chains, "underlying_price"):
+        if strike is None and "underlying_price" not in columns:
             raise OpenBBError(
                 "Error: strike must be provided if underlying_price is not available"
             )
@@ -728,43 +625,33 @@ class OptionsChainsProperties(Data):
 
         strike_price = abs(strike)  # type: ignore
         bid_ask = "bid" if short else "ask"
-        call_price_col = self._identify_price_col(chains, "call", bid_ask)  # type: ignore
-        put_price_col = self._identify_price_col(chains, "put", bid_ask)  # type: ignore
-        call_strike_estimate = self._get_nearest_strike("call", days, strike_price, call_price_col, force_otm)  # type: ignore
+        call_price_col = index.price_col(bid_ask)  # type: ignore
+        put_price_col = index.price_col(bid_ask)  # type: ignore
+        call_strike_estimate = index.nearest_strike(code, "call", strike_price, call_price_col, force_otm)  # type: ignore
         # If a strike price is supplied, the put strike is the same as the call strike.
         # Otherwise, the put strike is the nearest OTM put strike to the last price.
 
-        put_strike_estimate = self._get_nearest_strike(
-            "put", days, strike_price, put_price_col, force_otm
+        put_strike_estimate = index.nearest_strike(
+            code, "put", strike_price, put_price_col, force_otm
         )  # type: ignore
-        call_premium = chains[chains.strike == call_strike_estimate].query(  # type: ignore
-            "`option_type` == 'call'"
-        )[
-            call_price_col
-        ]
-        put_premium = chains[chains.strike == put_strike_estimate].query(  # type: ignore
-            "`option_type` == 'put'"
-        )[
-            put_price_col
-        ]
-        if call_premium.empty or put_premium.empty:
+        call_premium = self._get_premium(code, "call", call_strike_estimate, call_price_col)  # type: ignore
+        put_premium = self._get_premium(code, "put", put_strike_estimate, put_price_col)  # type: ignore
+        if call_premium is None or put_premium is None:
             raise OpenBBError(
                 "Error: No premium data found for the selected strikes."
                 f" Call: {call_strike_estimate}, Put: {put_strike_estimate}"
             )
-        put_premium = put_premium.values[0]
-        call_premium = call_premium.values[0]
-        dte = chains[chains.expiration.astype(str) == dte_estimate]["dte"].unique()[0]  # type: ignore
+        dte = columns["dte"][first]
         straddle_cost = call_premium + put_premium  # type: ignore
         straddle_dict: Dict = {}
 
         # Includes the as-of date if it is historical EOD data.
-        if hasattr(chains, "eod_date"):
-            straddle_dict.update({"Date": chains.eod_date.iloc[0]})
+        if "eod_date" in columns:
+            straddle_dict.update({"Date": columns["eod_date"][first]})
 
         straddle_dict.update(
             {
-                "Symbol": chains.underlying_symbol.unique()[0],
+                "Symbol": columns["underlying_symbol"][first],
                 "Underlying Price": underlying_price,
                 "Expiration": dte_estimate,
                 "DTE": dte,
@@ -846,13 +733,15 @@ class OptionsChainsProperties(Data):
 
         bid_ask = "bid" if short else "ask"
 
-        chains = self.dataframe
+        index = self._chains_index
+        columns = index.columns
         dte_estimate = self._get_nearest_expiration(days)
-        chains = chains[chains["expiration"].astype(str) == dte_estimate]
-        call_price_col = self._identify_price_col(chains, "call", bid_ask)  # type: ignore
-        put_price_col = self._identify_price_col(chains, "put", bid_ask)  # type: ignore
+        code = index.expiration_code(dte_estimate)
+        first = index.expiration_rows(code)[0]
+        call_price_col = index.price_col(bid_ask)  # type: ignore
+        put_price_col = index.price_col(bid_ask)  # type: ignore
 
-        if underlying_price is None and not hasattr(chains, "underlying_price"):
+        if underlying_price is None and "underlying_price" not in columns:
             raise OpenBBError(
                 "Error: underlying_price must be provided if underlying_price is not available"
             )
@@ -860,52 +749,37 @@ class OptionsChainsProperties(Data):
         underlying_price = (
             underlying_price
             if underlying_price is not None
-            else chains.underlying_price.iloc[0]
+            else columns["underlying_price"][first]
         )
 
         strikes = self._get_nearest_otm_strikes(
             dte_estimate, underlying_price, moneyness
         )
-        call_strike_estimate = self._get_nearest_strike(
-            "call", days, strikes.get("call"), call_price_col, force_otm=False
+        call_strike_estimate = index.nearest_strike(
+            code, "call", strikes.get("call"), call_price_col, force_otm=False
         )
-        put_strike_estimate = self._get_nearest_strike(
-            "put", days, strikes.get("put"), put_price_col, force_otm=False
+        put_strike_estimate = index.nearest_strike(
+            code, "put", strikes.get("put"), put_price_col, force_otm=False
         )
-        call_premium = chains[chains.strike == call_strike_estimate].query(  # type: ignore
-            "`option_type` == 'call'"
-        )[
-            call_price_col
-        ]
-        put_premium = chains[chains.strike == put_strike_estimate].query(  # type: ignore
-            "`option_type` == 'put'"
-        )[
-            put_price_col
-        ]
-
-        if call_premium.empty or put_premium.empty:
+        call_premium = self._get_premium(code, "call", call_strike_estimate, call_price_col)  # type: ignore
+        put_premium = self._get_premium(code, "put", put_strike_estimate, put_price_col)  # type: ignore
+
+        if call_premium is None or put_premium is None:
             raise OpenBBError(
                 "Error: No premium data found for the selected strikes."
                 f" Call: {call_strike_estimate}, Put: {put_strike_estimate}"
             )
-        put_premium = put_premium.values[0]
-        call_premium = call_premium.values[0]
 
-        dte = chains[chains.expiration.astype(str) == dte_estimate]["dte"].unique()[0]  # type: ignore
+        dte = columns["dte"][first]
         strangle_cost = call_premium + put_premium
-        underlying_price = (
-            underlying_price
-            if underlying_price is not None
-            else chains.underlying_price.iloc[0]
-        )
         strangle_dict: Dict = {}
         # Includes the as-of date if it is historical EOD data.
-        if hasattr(chains, "eod_date"):
-            strangle_dict.update({"Date": chains.eod_date.iloc[0]})
+        if "eod_date" in columns:
+            strangle_dict.update({"Date": columns["eod_date"][first]})
 
         strangle_dict.update(
             {
-                "Symbol": chains.underlying_symbol.unique()[0],
+                "Symbol": columns["underlying_symbol"][first],
                 "Underlying Price": underlying_price,
                 "Expiration": dte_estimate,
                 "DTE": dte,
@@ -982,9 +856,10 @@ class OptionsChainsProperties(Data):
         from numpy import nan
         from pandas import DataFrame, Series
 
-        chains = self.dataframe
+        index = self._chains_index
+        columns = index.columns
 
-        if not hasattr(chains, "underlying_price") and underlying_price is None:
+        if "underlying_price" not in columns and underlying_price is None:
             raise OpenBBError(
                 "Error: underlying_price must be provided if underlying_price is not available"
             )
@@ -996,15 +871,13 @@ class OptionsChainsProperties(Data):
             days = -1
 
         dte_estimate = self._get_nearest_expiration(days)
-
-        chains = chains[chains["expiration"].astype(str) == dte_estimate].query(
-            "`option_type` == 'call'"
-        )
+        code = index.expiration_code(dte_estimate)
+        first = index.rows(code, "call")[0]
 
         last_price = (
             underlying_price
             if underlying_price is not None
-            else chains.underlying_price.iloc[0]
+            else columns["underlying_price"][first]
         )
 
         if bought is None:
@@ -1013,26 +886,34 @@ class OptionsChainsProperties(Data):
         if sold is None:
             sold = last_price * 1.0750
 
-        bid = self._identify_price_col(chains, "call", "bid")
-        ask = self._identify_price_col(chains, "call", "ask")
-        sold = self._get_nearest_strike("call", days, sold, bid, False)
-        bought = self._get_nearest_strike("call", days, bought, ask, False)
+        bid = index.price_col("bid")
+        ask = index.price_col("ask")
+        sold = index.nearest_strike(code, "call", sold, bid, False)
+        bought = index.nearest_strike(code, "call", bought, ask, False)
 
-        sold_premium = chains[chains.strike == sold][bid].iloc[0] * (-1)  # type: ignore
-        bought_premium = chains[chains.strike == bought][ask].iloc[0]  # type: ignore
-        dte = chains[chains.expiration.astype(str) == dte_estimate]["dte"].unique()[0]  # type: ignore
+        sold_premium = self._get_premium(code, "call", sold, bid)  # type: ignore
+        bought_premium = self._get_premium(code, "call", bought, ask)  # type: ignore
+
+        if sold_premium is None or bought_premium is None:
+            raise OpenBBError(
+                "Error: No premium data found for the selected strikes."
+                f" Sold: {sold}, Bought: {bought}"
+            )
+
+        sold_premium = sold_premium * (-1)
+        dte = columns["dte"][first]
         spread_cost = bought_premium + sold_premium
         breakeven_price = bought + spread_cost
         max_profit = sold - bought - spread_cost  # type: ignore
         call_spread_: Dict = {}
         if sold != bought and spread_cost != 0:
             # Includes the as-of date if it is historical EOD data.
-            if hasattr(chains, "eod_date"):
-                call_spread_.update({"Date": chains.eod_date.iloc[0]})
+            if "eod_date" in columns:
+                call_spread_.update({"Date": columns["eod_date"][first]})
 
             call_spread_.update(
                 {
-                    "Symbol": chains.underlying_symbol.unique()[0],
+                    "Symbol": columns["underlying_symbol"][first],
                     "Underlying Price": last_price,
                     "Expiration": dte_estimate,
                     "DTE": dte,
@@ -1118,9 +999,10 @@ class OptionsChainsProperties(Data):
         from numpy import nan
         from pandas import DataFrame, Series
 
-        chains = self.dataframe
+        index = self._chains_index
+        columns = index.columns
 
-        if not hasattr(chains, "underlying_price") and underlying_price is None:
+        if "underlying_price" not in columns and underlying_price is None:
             raise OpenBBError(
                 "Error: underlying_price must be provided if underlying_price is not available"
             )
@@ -1132,15 +1014,13 @@ class OptionsChainsProperties(Data):
             days = -1
 
         dte_estimate = self._get_nearest_expiration(days)
-
-        chains = chains[chains["expiration"].astype(str) == dte_estimate].query(
-            "`option_type` == 'put'"
-        )
+        code = index.expiration_code(dte_estimate)
+        first = index.rows(code, "put")[0]
 
         last_price = (
             underlying_price
             if underlying_price is not None
-            else chains.underlying_price.iloc[0]
+            else columns["underlying_price"][first]
         )
 
         if bought is None:
@@ -1149,14 +1029,22 @@ class OptionsChainsProperties(Data):
         if sold is None:
             sold = last_price * 0.9250
 
-        bid = self._identify_price_col(chains, "put", "bid")
-        ask = self._identify_price_col(chains, "put", "ask")
-        sold = self._get_nearest_strike("put", days, sold, bid, False)
-        bought = self._get_nearest_strike("put", days, bought, ask, False)
+        bid = index.price_col("bid")
+        ask = index.price_col("ask")
+        sold = index.nearest_strike(code, "put", sold, bid, False)
+        bought = index.nearest_strike(code, "put", bought, ask, False)
+
+        sold_premium = self._get_premium(code, "put", sold, bid)  # type: ignore
+        bought_premium = self._get_premium(code, "put", bought, ask)  # type: ignore
+
+        if sold_premium is None or bought_premium is None:
+            raise OpenBBError(
+                "Error: No premium data found for the selected strikes."
+                f" Sold: {sold}, Bought: {bought}"
+            )
 
-        sold_premium = chains[chains.strike == sold][bid].iloc[0] * (-1)  # type: ignore
-        bought_premium = chains[chains.strike == bought][ask].iloc[0]  # type: ignore
-        dte = chains[chains.expiration.astype(str) == dte_estimate]["dte"].unique()[0]  # type: ignore
+        sold_premium = sold_premium * (-1)
+        dte = columns["dte"][first]
         spread_cost = bought_premium + sold_premium
         max_profit = abs(spread_cost)
         breakeven_price = sold - max_profit
@@ -1164,12 +1052,12 @@ class OptionsChainsProperties(Data):
         put_spread_: Dict = {}
         if sold != bought and max_loss != 0:
             # Includes the as-of date if it is historical EOD data.
-            if hasattr(chains, "eod_date"):
-                put_spread_.update({"Date": chains.eod_date.iloc[0]})
+            if "eod_date" in columns:
+                put_spread_.update({"Date": columns["eod_date"][first]})
 
             put_spread_.update(
                 {
-                    "Symbol": chains.underlying_symbol.unique()[0],
+                    "Symbol": columns["underlying_symbol"][first],
                     "Underlying Price": last_price,
                     "Expiration": dte_estimate,
                     "DTE": dte,
@@ -1242,9 +1130,10 @@ class OptionsChainsProperties(Data):
         from numpy import inf, nan
         from pandas import DataFrame
 
-        chains = self.dataframe
+        index = self._chains_index
+        columns = index.columns
 
-        if not hasattr(chains, "underlying_price") and underlying_price is None:
+        if "underlying_price" not in columns and underlying_price is None:
             raise OpenBBError(
                 "Error: underlying_price must be provided if underlying_price is not available"
             )
@@ -1256,39 +1145,39 @@ class OptionsChainsProperties(Data):
             days = -1
 
         dte_estimate = self._get_nearest_expiration(days)
-        chains = DataFrame(chains[chains["expiration"].astype(str) == dte_estimate])
+        code = index.expiration_code(dte_estimate)
+        first = index.expiration_rows(code)[0]
         last_price = (
             underlying_price
             if underlying_price is not None
-            else chains.underlying_price.iloc[0]
+            else columns["underlying_price"][first]
         )
-        bid = self._identify_price_col(chains, "put", "bid")
-        ask = self._identify_price_col(chains, "call", "ask")
+        bid = index.price_col("bid")
+        ask = index.price_col("ask")
         strike_price = last_price if strike == 0 else strike
-        sold = self._get_nearest_strike("put", days, strike_price, bid, False)
-        bought = self._get_nearest_strike("call", days, strike_price, ask, False)
-        put_premium = chains[chains.strike == sold].query("`option_type` == 'put'")[bid]  # type: ignore
-        call_premium = chains[chains.strike == bought].query("`option_type` == 'call'")[ask]  # type: ignore
+        sold = index.nearest_strike(code, "put", strike_price, bid, False)
+        bought = index.nearest_strike(code, "call", strike_price, ask, False)
+        put_premium = self._get_premium(code, "put", sold, bid)  # type: ignore
+        call_premium = self._get_premium(code, "call", bought, ask)  # type: ignore
 
-        if call_premium.empty or put_premium.empty:
+        if call_premium is None or put_premium is None:
             raise OpenBBError(
                 "Error: No premium data found for the selected strikes."
                 f" Call: {bought}, Put: {sold}"
             )
 
-        put_premium = put_premium.values[0] * (-1)
-        call_premium = call_premium.values[0]
-        dte = chains[chains.expiration.astype(str) == dte_estimate]["dte"].unique()[0]  # type: ignore
+        put_premium = put_premium * (-1)
+        dte = columns["dte"][first]
         position_cost = call_premium + put_premium
         breakeven = ((sold + bought) / 2) + position_cost  # type: ignore
         synthetic_long_dict: Dict = {}
         # Includes the as-of date if it is historical EOD data.
-        if hasattr(chains, "eod_date"):
-            synthetic_long_dict.update({"Date": chains.eod_date.iloc[0]})
+        if "eod_date" in columns:
+            synthetic_long_dict.update({"Date": columns["eod_date"][first]})
 
         synthetic_long_dict.update(
             {
-                "Symbol": chains.underlying_symbol.unique()[0],
+                "Symbol": columns["underlying_symbol"][first],
                 "Underlying Price": last_price,
                 "Expiration": dte_estimate,
                 "DTE": dte,
@@ -1345,9 +1234,10 @@ class OptionsChainsProperties(Data):
         from numpy import inf, nan
         from pandas import DataFrame
 
-        chains = self.dataframe
+        index = self._chains_index
+        columns = index.columns
 
-        if not hasattr(chains, "underlying_price") and underlying_price is None:
+        if "underlying_price" not in columns and underlying_price is None:
             raise OpenBBError(
                 "Error: underlying_price must be provided if underlying_price is not available"
             )
@@ -1359,39 +1249,39 @@ class OptionsChainsProperties(Data):
             days = -1
 
         dte_estimate = self._get_nearest_expiration(days)
-        chains = DataFrame(chains[chains["expiration"].astype(str) == dte_estimate])
+        code = index.expiration_code(dte_estimate)
+        first = index.expiration_rows(code)[0]
         last_price = (
             underlying_price
             if underlying_price is not None
-            else chains.underlying_price.iloc[0]
+            else columns["underlying_price"][first]
         )
-        bid = self._identify_price_col(chains, "call", "bid")
-        ask = self._identify_price_col(chains, "put", "ask")
+        bid = index.price_col("bid")
+        ask = index.price_col("ask")
         strike_price = last_price if strike == 0 else strike
-        sold = self._get_nearest_strike("call", days, strike_price, bid, False)
-        bought = self._get_nearest_strike("put", days, strike_price, ask, False)
-        put_premium = chains[chains.strike == bought].query("`option_type` == 'put'")[ask]  # type: ignore
-        call_premium = chains[chains.strike == sold].query("`option_type` == 'call'")[bid]  # type: ignore
+        sold = index.nearest_strike(code, "call", strike_price, bid, False)
+        bought = index.nearest_strike(code, "put", strike_price, ask, False)
+        put_premium = self._get_premium(code, "put", bought, ask)  # type: ignore
+        call_premium = self._get_premium(code, "call", sold, bid)  # type: ignore
 
-        if call_premium.empty or put_premium.empty:
+        if call_premium is None or put_premium is None:
             raise OpenBBError(
                 "Error: No premium data found for the selected strikes."
                 f" Call: {bought}, Put: {sold}"
             )
 
-        put_premium = put_premium.values[0]
-        call_premium = call_premium.values[0] * (-1)
-        dte = chains[chains.expiration.astype(str) == dte_estimate]["dte"].unique()[0]  # type: ignore
+        call_premium = call_premium * (-1)
+        dte = columns["dte"][first]
         position_cost = call_premium + put_premium
         breakeven = ((sold + bought) / 2) + position_cost  # type: ignore
         synthetic_short_dict: Dict = {}
         # Includes the as-of date if it is historical EOD data.
-        if hasattr(chains, "eod_date"):
-            synthetic_short_dict.update({"Date": chains.eod_date.iloc[0]})
+        if "eod_date" in columns:
+            synthetic_short_dict.update({"Date": columns["eod_date"][first]})
 
         synthetic_short_dict.update(
             {
-                "Symbol": chains.underlying_symbol.unique()[0],
+                "Symbol": columns["underlying_symbol"][first],
                 "Underlying Price": last_price,
                 "Expiration": dte_estimate,
                 "DTE": dte,
@@ -1476,7 +1366,8 @@ class OptionsChainsProperties(Data):
             Pandas DataFrame with the results.
         """
         # pylint: disable=import-outside-toplevel
-        from pandas import DataFrame, concat
+        from openbb_core.provider.utils.options_chains_index import isnull
+        from pandas import DataFrame, concat, unique
 
         def to_clean_list(x):
             if x is None:
@@ -1507,11 +1398,11 @@ class OptionsChainsProperties(Data):
         ):
             straddle_strike = 0
 
-        chains = self.dataframe
-        bid = self._identify_price_col(chains, "call", "bid")
-        chains = chains[chains[bid].notnull()].query("`dte` >= 0")
+        index = self._chains_index
+        dte = index.columns["dte"]
+        valid = ~isnull(index.columns[index.price_col("bid")]) & (dte >= 0)
         days = (
-            chains.dte.unique().tolist()
+            unique(dte[valid]).tolist()
             if days == -1
             else days if days else [20, 40, 60, 90, 180, 360]
         )
@@ -1853,3 +1744,109 @@ class OptionsChainsProperties(Data):
         skew_df["Expiration"] = skew_df["Expiration"].astype(str)
 
         return skew_df
+
+    def fill_greeks(
+        self,
+        risk_free_rate: Union[float, Dict[str, float]] = 0.0,
+        dividend_yield: Union[float, Dict[str, float]] = 0.0,
+        underlying_price: Optional[float] = None,
+        overwrite: bool = False,
+    ) -> None:
+        """Fill the implied volatility and greeks missing from the data, with the Black-Scholes model.
+
+        The implied volatility is solved from the mark, the bid-ask midpoint or the last price,
+        whichever is available for each contract, and the greeks are computed from the implied volatility.
+        Values returned by the provider are kept, unless `overwrite` is True.
+        Contracts expiring on the day are valued with one day until expiry.
+
+        Parameters
+        ----------
+        risk_free_rate: Union[float, Dict[str, float]]
+            The risk-free rate, as a continuously compounded decimal.
+            Enter a dictionary of expiration dates, as strings, to rates to use a rate for each expiration.
+        dividend_yield: Union[float, Dict[str, float]]
+            The dividend yield of the underlying asset, as a continuously compounded decimal.
+            Enter a dictionary of expiration dates, as strings, to yields to use a yield for each expiration.
+        underlying_price: Optional[float]
+            Only supply this is if the underlying price is not a returned field.
+        overwrite: bool
+            Replace the values returned by the provider. Default is False.
+        """
+        # pylint: disable=import-outside-toplevel
+        from numpy import array, full, isnan, maximum, nan, where
+        from openbb_core.provider.utils.black_scholes import greeks, implied_volatility
+
+        size = len(self.expiration)  # type: ignore
+
+        def get_column(field: str):
+            """Get a field as a float array, with NaN for the missing values."""
+            values = getattr(self, field, None) or []
+            if len(values) != size:
+                return full(size, nan)
+            return array([nan if v is None else v for v in values], dtype=float)
+
+        def by_expiration(value: Union[float, Dict[str, float]], name: str):
+            """Get the value of each contract, from a value per expiration."""
+            if not isinstance(value, dict):
+                return float(value)
+            missing = sorted(set(self.expirations) - set(value))
+            if missing:
+                raise OpenBBError(f"Error: No {name} for: {', '.join(missing)}")
+            return array([value[d.strftime("%Y-%m-%d")] for d in self.expiration])  # type: ignore
+
+        price = underlying_price or self.last_price
+        spot = full(size, float(price)) if price else get_column("underlying_price")
+        if isnan(spot).all():
+            raise OpenBBError(
+                "Error: underlying_price must be provided if underlying_price is not available"
+            )
+
+        option_price = get_column("mark")
+        bid, ask = get_column("bid"), get_column("ask")
+        option_price = where(
+            isnan(option_price) & (bid > 0) & (ask > 0), (bid + ask) / 2, option_price
+        )
+        for field in ("last_trade_price", "close", "prev_close"):
+            option_price = where(isnan(option_price), get_column(field), option_price)
+
+        days = get_column("dte")
+        if isnan(days).any():
+            eod_date = getattr(self, "eod_date", None) or []
+            dates = (
+                eod_date if len(eod_date) == size else [datetime.today().date()] * size
+            )
+            days = where(
+                isnan(days),
+                [
+                    (e - (d.date() if isinstance(d, datetime) else d)).days
+                    for e, d in zip(self.expiration, dates)  # type: ignore
+                ],
+                days,
+            )
+        time = where(days < 0, nan, maximum(days, 1) / 365)
+        rate = by_expiration(risk_free_rate, "risk-free rate")
+        yield_ = by_expiration(dividend_yield, "dividend yield")
+        strike = get_column("strike")
+        option_type = self.option_type  # type: ignore
+
+        iv = get_column("implied_volatility")
+        solve = full(size, True) if overwrite else isnan(iv) | (iv <= 0)
+        if solve.any():
+            iv = where(
+                solve,
+                implied_volatility(
+                    option_price, option_type, spot, strike, time, rate, yield_
+                ),
+                iv,
+            )
+
+        results = {"implied_volatility": iv}
+        results.update(greeks(option_type, spot, strike, time, iv, rate, yield_))
+
+        for field, values in results.items():
+            existing = get_column(field)
+            filled = values if overwrite else where(isnan(existing), values, existing)
+            setattr(self, field, [None if isnan(v) else float(v) for v in filled])
+
+        # The chains are indexed again, with the DEX and GEX of the new greeks.
+        self._clear_index()
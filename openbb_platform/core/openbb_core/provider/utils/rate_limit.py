@@ -0,0 +1,170 @@
+"""Rate limits and concurrency of provider requests."""
+
+import asyncio
+import threading
+from contextvars import ContextVar
+from email.utils import parsedate_to_datetime
+from time import monotonic, time
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+from weakref import WeakKeyDictionary
+
+import aiohttp
+
+# Rate limit of the provider being queried, set by the query executor.
+current_rate_limit: ContextVar[Optional["RateLimit"]] = ContextVar(
+    "current_rate_limit", default=None
+)
+
+
+class RateLimit:
+    """Rate limit and concurrency policy of a provider.
+
+    Requests are started at most `requests` times per `period` seconds, with
+    bursts of up to `burst` requests, and at most `max_concurrent` wait for a
+    response at the same time. Failed connections and responses with one of the
+    `retry_statuses` are retried up to `max_retries` times, after the delay in
+    the Retry-After header or an exponential backoff. A 429 response pauses all
+    the requests of the provider for that delay.
+
+    A limit of 0 disables the corresponding check.
+    """
+
+    # pylint: disable=too-many-arguments,too-many-instance-attributes
+    def __init__(
+        self,
+        requests: float = 0,
+        period: float = 1,
+        burst: Optional[int] = None,
+        max_concurrent: int = 0,
+        max_retries: int = 3,
+        backoff: float = 0.5,
+        max_backoff: float = 60,
+        retry_statuses: Tuple[int, ...] = (429, 502, 503, 504),
+    ) -> None:
+        """Initialize the rate limit.
+
+        Parameters
+        ----------
+        requests : float
+            Number of requests allowed per period, by default 0 (unlimited).
+        period : float
+            Length of the period in seconds, by default 1.
+        burst : Optional[int]
+            Number of requests that can be started at once, by default `requests`.
+        max_concurrent : int
+            Number of requests in flight at the same time, by default 0 (unlimited).
+        max_retries : int
+            Number of retries of a failed request, by default 3.
+        backoff : float
+            Delay before the first retry in seconds, doubled on each retry, by default 0.5.
+        max_backoff : float
+            Maximum delay before a retry in seconds, by default 60.
+        retry_statuses : Tuple[int, ...]
+            Response statuses that are retried, by default (429, 502, 503, 504).
+        """
+        self.requests = requests
+        self.period = period
+        self.burst = burst or max(int(requests), 1)
+        self.max_concurrent = max_concurrent
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.retry_statuses = retry_statuses
+
+        self._lock = threading.Lock()
+        self._tokens = float(self.burst)
+        self._updated = monotonic()
+        self._paused_until = 0.0
+        self._semaphores: WeakKeyDictionary[
+            asyncio.AbstractEventLoop, asyncio.Semaphore
+        ] = WeakKeyDictionary()
+
+    def __repr__(self) -> str:
+        """Return the representation of the rate limit."""
+        return (
+            f"{self.__class__.__name__}(requests={self.requests}, period={self.period}, "
+            f"burst={self.burst}, max_concurrent={self.max_concurrent})"
+        )
+
+    def reserve(self) -> float:
+        """Take a token from the bucket. Return the seconds to wait before using it."""
+        with self._lock:
+            now = monotonic()
+            wait = max(self._paused_until - now, 0)
+            if not self.requests:
+                return wait
+            rate = self.requests / self.period
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * rate)
+            self._updated = now
+            self._tokens -= 1
+            if self._tokens < 0:
+                wait = max(wait, -self._tokens / rate)
+            return wait
+
+    def pause(self, seconds: float) -> None:
+        """Hold all the requests for a number of seconds."""
+        with self._lock:
+            self._paused_until = max(self._paused_until, monotonic() + seconds)
+
+    def get_retry_delay(
+        self, attempt: int, headers: Optional[Dict[str, Any]] = None
+    ) -> float:
+        """Get the seconds to wait before a retry, from the Retry-After header or the backoff."""
+        retry_after = (headers or {}).get("Retry-After")
+        if retry_after:
+            try:
+                return min(max(float(retry_after), 0), self.max_backoff)
+            except ValueError:
+                try:
+                    delay = parsedate_to_datetime(retry_after).timestamp() - time()
+                    return min(max(delay, 0), self.max_backoff)
+                except (TypeError, ValueError):
+                    pass
+        return min(self.backoff * 2**attempt, self.max_backoff)
+
+    def _get_semaphore(self) -> Optional[asyncio.Semaphore]:
+        """Get the semaphore of the running event loop."""
+        if not self.max_concurrent:
+            return None
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            if loop not in self._semaphores:
+                self._semaphores[loop] = asyncio.Semaphore(self.max_concurrent)
+            return self._semaphores[loop]
+
+    async def _send(
+        self, send: Callable[[], Awaitable[aiohttp.ClientResponse]]
+    ) -> aiohttp.ClientResponse:
+        """Send a request once a slot and a token are available."""
+        semaphore = self._get_semaphore()
+        if semaphore is None:
+            await asyncio.sleep(self.reserve())
+            return await send()
+        async with semaphore:
+            await asyncio.sleep(self.reserve())
+            return await send()
+
+    async def call(
+        self, send: Callable[[], Awaitable[aiohttp.ClientResponse]]
+    ) -> aiohttp.ClientResponse:
+        """Send a request within the limits, retrying it when it fails."""
+        attempt = 0
+        while True:
+            try:
+                response = await self._send(send)
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError):
+                if attempt >= self.max_retries:
+                    raise
+                delay = self.get_retry_delay(attempt)
+            else:
+                if (
+                    response.status not in self.retry_statuses
+                    or attempt >= self.max_retries
+                ):
+                    return response
+                delay = self.get_retry_delay(attempt, response.headers)  # type: ignore
+                response.release()
+                if response.status == 429:
+                    self.pause(delay)
+            await asyncio.sleep(delay)
+            attempt += 1
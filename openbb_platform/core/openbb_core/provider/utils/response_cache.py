@@ -0,0 +1,182 @@
+"""Response cache for fetcher results."""
+
+import pickle  # noqa: S403  # nosec
+import sqlite3
+import threading
+from collections import OrderedDict
+from contextvars import ContextVar
+from hashlib import sha256
+from json import dumps
+from pathlib import Path
+from time import time
+from typing import Any, Dict, Optional, Tuple
+
+# Hits and misses of the command being executed, read by the command runner.
+cache_stats: ContextVar[Optional[Dict[str, int]]] = ContextVar(
+    "cache_stats", default=None
+)
+
+
+def record_cache_event(event: str) -> None:
+    """Count a cache hit or miss for the command being executed."""
+    stats = cache_stats.get()
+    if stats is not None:
+        stats[event] = stats.get(event, 0) + 1
+
+
+def get_cache_ttl(settings: Dict[str, Any], provider: str, model: str) -> int:
+    """Get the time to live, in seconds, of a provider model.
+
+    The most specific entry wins: "provider.Model", then "Model", then "*".
+    A time to live of 0 disables the cache.
+    """
+    ttl = settings.get("ttl") or {}
+    for key in (f"{provider}.{model}", model, "*"):
+        if key in ttl:
+            return int(ttl[key] or 0)
+    return 0
+
+
+def get_cache_key(provider: str, model: str, params: Dict[str, Any]) -> str:
+    """Get the cache key of a query, from the provider, model and normalized params."""
+    normalized = {k: v for k, v in params.items() if v is not None}
+    return sha256(
+        dumps([provider, model, normalized], sort_keys=True, default=str).encode()
+    ).hexdigest()
+
+
+class ResponseCache:
+    """Two-tier cache of fetcher results.
+
+    Results are pickled and kept in an in-memory LRU of `memory_items` entries,
+    backed by an SQLite file that is trimmed to `disk_size` megabytes, least
+    recently used first. Expired entries are dropped when they are read.
+    """
+
+    _instances: Dict[Tuple[str, int, int], "ResponseCache"] = {}
+    _instances_lock = threading.Lock()
+
+    def __init__(
+        self,
+        directory: Optional[str] = None,
+        memory_items: int = 128,
+        disk_size: int = 256,
+    ) -> None:
+        """Initialize the cache. Without a directory, or a disk_size of 0, only memory is used."""
+        self._lock = threading.Lock()
+        self._memory: OrderedDict[str, Tuple[float, bytes]] = OrderedDict()
+        self._memory_items = memory_items
+        self._disk_size = disk_size * 1024 * 1024
+        self._db: Optional[sqlite3.Connection] = None
+
+        if directory and disk_size:
+            path = Path(directory)
+            path.mkdir(parents=True, exist_ok=True)
+            self._db = sqlite3.connect(
+                path / "responses.sqlite", check_same_thread=False
+            )
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, expires REAL, accessed REAL, size INTEGER, value BLOB)"
+            )
+            self._db.commit()
+
+    @classmethod
+    def from_settings(
+        cls, settings: Dict[str, Any], directory: Optional[str] = None
+    ) -> "ResponseCache":
+        """Get the shared cache for the given settings and directory."""
+        memory_items = settings.get("memory_items", 128)
+        disk_size = settings.get("disk_size", 256)
+        key = (str(directory), memory_items, disk_size)
+        with cls._instances_lock:
+            if key not in cls._instances:
+                cls._instances[key] = cls(directory, memory_items, disk_size)
+            return cls._instances[key]
+
+    def get(self, key: str) -> Tuple[bool, Any]:
+        """Get a cached value. Return a (hit, value) tuple."""
+        now = time()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                if entry[0] > now:
+                    self._memory.move_to_end(key)
+                    return True, pickle.loads(entry[1])  # noqa: S301  # nosec
+                del self._memory[key]
+
+            if self._db is None:
+                return False, None
+
+            row = self._db.execute(
+                "SELECT expires, value FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return False, None
+            if row[0] <= now:
+                self._db.execute("DELETE FROM responses WHERE key = ?", (key,))
+                self._db.commit()
+                return False, None
+
+            self._db.execute(
+                "UPDATE responses SET accessed = ? WHERE key = ?", (now, key)
+            )
+            self._db.commit()
+            self._set_memory(key, row[0], row[1])
+            return True, pickle.loads(row[1])  # noqa: S301  # nosec
+
+    def set(self, key: str, value: Any, ttl: int) -> None:
+        """Cache a value for ttl seconds."""
+        now = time()
+        expires = now + ttl
+        try:
+            blob = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        except (pickle.PicklingError, TypeError, AttributeError):
+            return
+        with self._lock:
+            self._set_memory(key, expires, blob)
+            if self._db is None or len(blob) > self._disk_size:
+                return
+            self._db.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?)",
+                (key, expires, now, len(blob), blob),
+            )
+            self._evict()
+            self._db.commit()
+
+    def clear(self) -> None:
+        """Remove all the cached values."""
+        with self._lock:
+            self._memory.clear()
+            if self._db is not None:
+                self._db.execute("DELETE FROM responses")
+                self._db.commit()
+
+    def _set_memory(self, key: str, expires: float, blob: bytes) -> None:
+        """Add an entry to the in-memory LRU."""
+        if not self._memory_items:
+            return
+        self._memory[key] = (expires, blob)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self._memory_items:
+            self._memory.popitem(last=False)
+
+    def _evict(self) -> None:
+        """Drop expired entries, then the least recently used until under the size limit."""
+        db = self._db
+        if db is None:
+            return
+        db.execute("DELETE FROM responses WHERE expires <= ?", (time(),))
+        total = db.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        if total <= self._disk_size:
+            return
+        rows = db.execute(
+            "SELECT key, size FROM responses ORDER BY accessed ASC"
+        ).fetchall()
+        evicted = []
+        for key, size in rows:
+            if total <= self._disk_size:
+                break
+            evicted.append((key,))
+            total -= size
+        db.executemany("DELETE FROM responses WHERE key = ?", evicted)
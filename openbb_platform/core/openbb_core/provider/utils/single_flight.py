@@ -0,0 +1,89 @@
+"""Single flight: run identical concurrent queries once."""
+
+import asyncio
+import threading
+from copy import deepcopy
+from functools import partial
+from typing import Any, Awaitable, Callable, Dict, List, Tuple
+from warnings import WarningMessage, catch_warnings, warn_explicit
+from weakref import WeakKeyDictionary
+
+from openbb_core.provider.utils.response_cache import record_cache_event
+
+
+class SingleFlight:
+    """Share the result of a call with the identical calls made while it runs.
+
+    The first call with a key runs, and the calls with the same key made before
+    it finishes wait for it instead of running. Every caller gets the warnings
+    raised by the call, and its result or error. The waiters get a copy of the
+    result, so callers can modify theirs, and count as "coalesced" in the cache
+    stats of their command.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the single flight."""
+        self._lock = threading.Lock()
+        self._calls: WeakKeyDictionary[
+            asyncio.AbstractEventLoop,
+            Dict[str, asyncio.Task[Tuple[List[WarningMessage], Any]]],
+        ] = WeakKeyDictionary()
+
+    def __len__(self) -> int:
+        """Get the number of calls running."""
+        with self._lock:
+            return sum(len(calls) for calls in self._calls.values())
+
+    async def run(self, key: str, func: Callable[[], Awaitable[Any]]) -> Any:
+        """Run a call, or wait for the running call with the same key."""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            calls = self._calls.setdefault(loop, {})
+            task = calls.get(key)
+            leader = task is None
+            if task is None:
+                # The call runs in its own task, so cancelling the caller that
+                # started it does not cancel it for the others.
+                task = calls[key] = loop.create_task(_call(func))
+                task.add_done_callback(partial(self._done, calls, key))
+
+        if not leader:
+            record_cache_event("coalesced")
+        caught, result = await asyncio.shield(task)
+        _warn(caught)
+        return result if leader else _copy(result)
+
+    def _done(
+        self,
+        calls: Dict[str, asyncio.Task[Tuple[List[WarningMessage], Any]]],
+        key: str,
+        task: asyncio.Task[Tuple[List[WarningMessage], Any]],
+    ) -> None:
+        """Remove a finished call."""
+        with self._lock:
+            if calls.get(key) is task:
+                calls.pop(key)
+        # Retrieve the exception, in case no call is waiting for it.
+        if not task.cancelled():
+            task.exception()
+
+
+async def _call(func: Callable[[], Awaitable[Any]]) -> Tuple[List[WarningMessage], Any]:
+    """Run a call, with the warnings it raises."""
+    with catch_warnings(record=True) as caught:
+        result = await func()
+    return caught, result
+
+
+def _warn(caught: List[WarningMessage]) -> None:
+    """Raise the warnings of a call again."""
+    for w in caught:
+        warn_explicit(w.message, w.category, w.filename, w.lineno, source=w.source)
+
+
+def _copy(result: Any) -> Any:
+    """Copy a result, or return it when it cannot be copied."""
+    try:
+        return deepcopy(result)
+    except Exception:  # pylint: disable=broad-except
+        return result
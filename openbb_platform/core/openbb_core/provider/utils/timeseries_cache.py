@@ -0,0 +1,253 @@
+"""Incremental cache for historical time series."""
+
+import pickle  # noqa: S403  # nosec
+import sqlite3
+import threading
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from openbb_core.provider.abstract.annotated_result import AnnotatedResult
+from openbb_core.provider.utils.errors import EmptyDataError
+from openbb_core.provider.utils.response_cache import get_cache_key
+
+# Models whose results are rows keyed by date, for one symbol per request.
+INCREMENTAL_MODELS = {
+    "EquityHistorical",
+    "CryptoHistorical",
+    "CurrencyHistorical",
+    "IndexHistorical",
+    "FredSeries",
+}
+
+# Trailing days that are always fetched again, because the values can still change.
+# Economic series are published with a lag and revised, bars only change until the close.
+REFRESH_DAYS = {"FredSeries": 180}
+
+Fetch = Callable[[date, date], Awaitable[Any]]
+
+
+def is_incremental(settings: Dict[str, Any], provider: str, model: str) -> bool:
+    """Check if the incremental cache is enabled for a provider model."""
+    enabled = settings.get("incremental") or []
+    return model in INCREMENTAL_MODELS and (
+        f"{provider}.{model}" in enabled or model in enabled or "*" in enabled
+    )
+
+
+def _to_date(value: Any) -> Optional[date]:
+    """Convert a date, datetime or iso string to a date."""
+    if value is None:
+        return None
+    return date.fromisoformat(str(value)[:10])
+
+
+def _get_gaps(
+    coverage: List[Tuple[date, date]], start: date, end: date
+) -> List[Tuple[date, date]]:
+    """Get the date ranges between start and end that are not covered."""
+    gaps = []
+    cursor = start
+    for covered_start, covered_end in coverage:
+        if covered_end < cursor:
+            continue
+        if covered_start > end:
+            break
+        if covered_start > cursor:
+            gaps.append((cursor, covered_start - timedelta(days=1)))
+        cursor = max(cursor, covered_end + timedelta(days=1))
+    if cursor <= end:
+        gaps.append((cursor, end))
+    return gaps
+
+
+def _merge(ranges: List[Tuple[date, date]]) -> List[Tuple[date, date]]:
+    """Merge overlapping and adjacent date ranges."""
+    merged: List[Tuple[date, date]] = []
+    for start, end in sorted(ranges):
+        if merged and start <= merged[-1][1] + timedelta(days=1):
+            merged[-1] = (merged[-1][0], max(end, merged[-1][1]))
+        else:
+            merged.append((start, end))
+    return merged
+
+
+class TimeSeriesCache:
+    """Store of fetched rows and the date ranges they cover, per series.
+
+    A series is identified by the provider, the model and every query parameter
+    except the dates, so the symbol, the interval and options like the adjustment
+    are all part of it.
+    """
+
+    _instances: Dict[str, "TimeSeriesCache"] = {}
+    _instances_lock = threading.Lock()
+
+    def __init__(self, directory: Optional[str] = None) -> None:
+        """Initialize the store. Without a directory, it is kept in memory."""
+        self._lock = threading.Lock()
+        database = ":memory:"
+        if directory:
+            Path(directory).mkdir(parents=True, exist_ok=True)
+            database = str(Path(directory, "timeseries.sqlite"))
+        self._db = sqlite3.connect(database, check_same_thread=False)
+        self._db.executescript(
+            "CREATE TABLE IF NOT EXISTS rows ("
+            "series TEXT, date TEXT, value BLOB, PRIMARY KEY (series, date));"
+            "CREATE TABLE IF NOT EXISTS coverage (series TEXT, start TEXT, end TEXT);"
+            "CREATE INDEX IF NOT EXISTS coverage_series ON coverage (series);"
+            "CREATE TABLE IF NOT EXISTS metadata (series TEXT PRIMARY KEY, value BLOB);"
+        )
+
+    @classmethod
+    def from_directory(cls, directory: Optional[str] = None) -> "TimeSeriesCache":
+        """Get the shared store of a directory."""
+        with cls._instances_lock:
+            if str(directory) not in cls._instances:
+                cls._instances[str(directory)] = cls(directory)
+            return cls._instances[str(directory)]
+
+    @staticmethod
+    def get_series_key(provider: str, model: str, params: Dict[str, Any]) -> str:
+        """Get the key of a series, from the query params without the dates."""
+        return get_cache_key(
+            provider,
+            model,
+            {k: v for k, v in params.items() if k not in ("start_date", "end_date")},
+        )
+
+    def get_coverage(self, series: str) -> List[Tuple[date, date]]:
+        """Get the merged date ranges already fetched for a series."""
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT start, end FROM coverage WHERE series = ?", (series,)
+            ).fetchall()
+        return _merge([(date.fromisoformat(s), date.fromisoformat(e)) for s, e in rows])
+
+    def get_rows(self, series: str, start: date, end: date) -> List[Any]:
+        """Get the rows of a series between two dates, sorted by date."""
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT value FROM rows WHERE series = ? AND date >= ? AND date < ?"
+                " ORDER BY date",
+                (series, start.isoformat(), (end + timedelta(days=1)).isoformat()),
+            ).fetchall()
+        return [pickle.loads(r[0]) for r in rows]  # noqa: S301  # nosec
+
+    def get_metadata(self, series: str) -> Any:
+        """Get the results metadata of a series."""
+        with self._lock:
+            row = self._db.execute(
+                "SELECT value FROM metadata WHERE series = ?", (series,)
+            ).fetchone()
+        return pickle.loads(row[0]) if row else None  # noqa: S301  # nosec
+
+    def put(
+        self,
+        series: str,
+        rows: List[Any],
+        covered: Optional[Tuple[date, date]],
+        metadata: Any = None,
+    ) -> None:
+        """Store rows, replacing those with the same date, and the range they cover."""
+        values = [(series, str(r.date), pickle.dumps(r)) for r in rows]
+        with self._lock, self._db:
+            self._db.executemany("INSERT OR REPLACE INTO rows VALUES (?, ?, ?)", values)
+            if covered and covered[0] <= covered[1]:
+                merged = _merge(
+                    [
+                        (date.fromisoformat(s), date.fromisoformat(e))
+                        for s, e in self._db.execute(
+                            "SELECT start, end FROM coverage WHERE series = ?",
+                            (series,),
+                        ).fetchall()
+                    ]
+                    + [covered]
+                )
+                self._db.execute("DELETE FROM coverage WHERE series = ?", (series,))
+                self._db.executemany(
+                    "INSERT INTO coverage VALUES (?, ?, ?)",
+                    [(series, s.isoformat(), e.isoformat()) for s, e in merged],
+                )
+            if metadata is not None:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO metadata VALUES (?, ?)",
+                    (series, pickle.dumps(metadata)),
+                )
+
+    def drop(self, series: str) -> None:
+        """Remove a series."""
+        with self._lock, self._db:
+            self._db.execute("DELETE FROM rows WHERE series = ?", (series,))
+            self._db.execute("DELETE FROM coverage WHERE series = ?", (series,))
+            self._db.execute("DELETE FROM metadata WHERE series = ?", (series,))
+
+
+def _split_result(result: Any) -> Tuple[List[Any], Any]:
+    """Split a fetcher result into its rows and metadata."""
+    if isinstance(result, AnnotatedResult):
+        return list(result.result or []), result.metadata
+    return list(result or []), None
+
+
+def _same_row(a: Any, b: Any) -> bool:
+    """Check if two rows have the same values."""
+    dump = getattr(a, "model_dump", None)
+    return dump() == b.model_dump() if dump else a == b
+
+
+async def fetch_incremental(
+    cache: TimeSeriesCache,
+    series: str,
+    start: date,
+    end: date,
+    fetch: Fetch,
+    refresh_days: int = 1,
+    today: Optional[date] = None,
+) -> Any:
+    """Fetch only the date ranges of a series that are not cached yet.
+
+    The fetched rows are merged with the cached ones and the full range is
+    returned. The trailing `refresh_days` are never marked as covered, so they
+    are fetched again on the next call. Each gap that follows cached data is
+    fetched from the last cached row, and if that row changed, for example after
+    a split or dividend adjustment, the series is dropped and fetched again.
+    """
+    today = today or date.today()
+    final = today - timedelta(days=refresh_days)
+
+    async def _fetch(gap_start: date, gap_end: date) -> Tuple[List[Any], Any]:
+        try:
+            return _split_result(await fetch(gap_start, gap_end))
+        except EmptyDataError:
+            return [], None
+
+    metadata = None
+    for gap_start, gap_end in _get_gaps(cache.get_coverage(series), start, end):
+        anchor = None
+        if gap_start > start:
+            previous = cache.get_rows(series, start, gap_start - timedelta(days=1))
+            anchor = previous[-1] if previous else None
+
+        fetch_start = _to_date(getattr(anchor, "date", None)) or gap_start
+        rows, meta = await _fetch(fetch_start, gap_end)
+        metadata = meta if meta is not None else metadata
+
+        if anchor is not None:
+            fetched = [r for r in rows if str(r.date) == str(anchor.date)]
+            if fetched and not _same_row(fetched[0], anchor):
+                cache.drop(series)
+                rows, metadata = _split_result(await fetch(start, end))
+                cache.put(series, rows, (start, min(end, final)), metadata)
+                break
+
+        cache.put(series, rows, (gap_start, min(gap_end, final)), metadata)
+
+    rows = cache.get_rows(series, start, end)
+    if not rows:
+        raise EmptyDataError()
+
+    metadata = metadata if metadata is not None else cache.get_metadata(series)
+    if metadata is not None:
+        return AnnotatedResult(result=rows, metadata=metadata)
+    return rows
@@ -0,0 +1,206 @@
+"""Tracing: time the stages of a command, and aggregate them as metrics."""
+
+import threading
+import tracemalloc
+from contextlib import contextmanager
+from contextvars import ContextVar
+from time import perf_counter_ns
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+# Spans of the command being executed, read by the command runner.
+current_spans: ContextVar[Optional[List[Dict[str, Any]]]] = ContextVar(
+    "current_spans", default=None
+)
+
+
+def is_tracing() -> bool:
+    """Check if the stages of a command are being recorded."""
+    return current_spans.get() is not None
+
+
+@contextmanager
+def span(name: str, **attributes: Any) -> Iterator[Dict[str, Any]]:
+    """Time a stage of the command being executed.
+
+    Yields the attributes of the span, so the stage can add its results, like a
+    row count or a status. When tracemalloc is tracing, the memory allocated
+    during the stage is added as `memory`, in bytes. Outside of a command, the
+    stage is not recorded.
+    """
+    spans = current_spans.get()
+    if spans is None:
+        yield attributes
+        return
+
+    memory = tracemalloc.get_traced_memory()[0] if tracemalloc.is_tracing() else None
+    start = perf_counter_ns()
+    try:
+        yield attributes
+    finally:
+        duration = perf_counter_ns() - start
+        if memory is not None:
+            attributes["memory"] = tracemalloc.get_traced_memory()[0] - memory
+        spans.append(
+            {
+                "name": name,
+                "start": start,
+                "duration": duration,
+                "attributes": attributes,
+            }
+        )
+
+
+def count_rows(result: Any) -> int:
+    """Count the rows of a fetcher result."""
+    result = getattr(result, "result", result)
+    if result is None:
+        return 0
+    return len(result) if isinstance(result, (list, tuple)) else 1
+
+
+def export_spans(
+    route: str, start: int, start_time: int, spans: List[Dict[str, Any]]
+) -> None:
+    """Export the spans of a command to OpenTelemetry, when it is installed.
+
+    The command is the parent span, and its stages are the children. `start` is
+    the `perf_counter_ns` of the spans at `start_time`, in nanoseconds since the
+    epoch. Without a tracer provider configured, the spans are not recorded.
+    """
+    try:
+        # pylint: disable=import-outside-toplevel
+        from opentelemetry import trace  # type: ignore[import-not-found]
+    except ImportError:
+        return
+
+    tracer = trace.get_tracer("openbb")
+    end = max([start] + [s["start"] + s["duration"] for s in spans])
+    parent = tracer.start_span(route, start_time=start_time)
+    context = trace.set_span_in_context(parent)
+    for s in spans:
+        child = tracer.start_span(
+            s["name"],
+            context=context,
+            start_time=start_time + s["start"] - start,
+            attributes={
+                k: v
+                for k, v in s["attributes"].items()
+                if isinstance(v, (str, bool, int, float))
+            },
+        )
+        child.end(end_time=start_time + s["start"] - start + s["duration"])
+    parent.end(end_time=start_time + end - start)
+
+
+def _escape(value: str) -> str:
+    """Escape a Prometheus label value."""
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+class Metrics:
+    """Counters of the commands executed, in the Prometheus text format.
+
+    For each route, the number of commands, errors and their duration; for each
+    stage, the number of spans and their duration; and for the HTTP requests,
+    their number by status and the bytes received.
+    """
+
+    METRICS: Dict[str, Tuple[str, str]] = {
+        "openbb_command_duration_seconds": ("summary", "Duration of the commands."),
+        "openbb_command_errors_total": ("counter", "Commands that raised an error."),
+        "openbb_stage_duration_seconds": (
+            "summary",
+            "Duration of the stages of the commands.",
+        ),
+        "openbb_http_requests_total": ("counter", "HTTP requests to the providers."),
+        "openbb_http_response_bytes_total": (
+            "counter",
+            "Bytes received from the providers.",
+        ),
+    }
+
+    def __init__(self) -> None:
+        """Initialize the metrics."""
+        self._lock = threading.Lock()
+        self._values: Dict[Tuple[str, Tuple[Tuple[str, str], ...]], float] = {}
+
+    def _add(self, name: str, value: float, **labels: str) -> None:
+        """Add to a value, with the lock held."""
+        key = (name, tuple(sorted(labels.items())))
+        self._values[key] = self._values.get(key, 0) + value
+
+    def observe(
+        self,
+        route: str,
+        duration: int,
+        spans: List[Dict[str, Any]],
+        error: bool = False,
+    ) -> None:
+        """Add a command, with its duration and spans in nanoseconds."""
+        with self._lock:
+            self._add("openbb_command_duration_seconds_count", 1, route=route)
+            self._add(
+                "openbb_command_duration_seconds_sum", duration / 1e9, route=route
+            )
+            if error:
+                self._add("openbb_command_errors_total", 1, route=route)
+            for s in spans:
+                self._add_span(route, s)
+
+    def observe_span(self, route: str, span_: Dict[str, Any]) -> None:
+        """Add a stage that ran after its command, like the validation of the output."""
+        with self._lock:
+            self._add_span(route, span_)
+
+    def _add_span(self, route: str, span_: Dict[str, Any]) -> None:
+        """Add a stage, with the lock held."""
+        stage = span_["name"]
+        self._add("openbb_stage_duration_seconds_count", 1, route=route, stage=stage)
+        self._add(
+            "openbb_stage_duration_seconds_sum",
+            span_["duration"] / 1e9,
+            route=route,
+            stage=stage,
+        )
+        if stage == "http":
+            attributes = span_["attributes"]
+            self._add(
+                "openbb_http_requests_total",
+                1,
+                route=route,
+                status=str(attributes.get("status")),
+            )
+            self._add(
+                "openbb_http_response_bytes_total",
+                attributes.get("bytes") or 0,
+                route=route,
+            )
+
+    def clear(self) -> None:
+        """Reset all the metrics."""
+        with self._lock:
+            self._values.clear()
+
+    def render(self) -> str:
+        """Render the metrics in the Prometheus text format."""
+        with self._lock:
+            values = sorted(self._values.items())
+
+        lines = []
+        for metric, (kind, description) in self.METRICS.items():
+            samples = [
+                (name, labels, value)
+                for (name, labels), value in values
+                if name == metric or name.rsplit("_", 1)[0] == metric
+            ]
+            if not samples:
+                continue
+            lines.append(f"# HELP {metric} {description}")
+            lines.append(f"# TYPE {metric} {kind}")
+            for name, labels, value in samples:
+                label = ",".join(f'{k}="{_escape(v)}"' for k, v in labels)
+                lines.append(f"{name}{{{label}}} {float(value)}")
+        return "\n".join(lines) + "\n"
+
+
+metrics = Metrics()
@@ -0,0 +1,192 @@
+"""Test the job queue and store."""
+
+import asyncio
+from unittest.mock import patch
+
+import pytest
+from fastapi import HTTPException
+from openbb_core.api.jobs import JobQueue, JobStore, get_error, get_job_key
+from openbb_core.app.model.abstract.error import OpenBBError
+from openbb_core.app.model.api_settings import JobSettings
+from openbb_core.app.model.user_settings import UserSettings
+from openbb_core.provider.utils.errors import EmptyDataError
+
+
+def test_get_job_key():
+    """Test the key depends on the route, the arguments and the credentials."""
+    user_settings = UserSettings()
+    other_user = UserSettings()
+    other_user.credentials.fmp_api_key = "key"  # type: ignore[attr-defined]
+    kwargs = {"standard_params": {"symbol": "AAPL"}}
+
+    key = get_job_key("/equity/price/historical", kwargs, user_settings)
+
+    assert key == get_job_key("/equity/price/historical", kwargs, UserSettings())
+    assert key != get_job_key("/equity/price/quote", kwargs, user_settings)
+    assert key != get_job_key(
+        "/equity/price/historical", {"standard_params": {"symbol": "MSFT"}}, other_user
+    )
+    assert key != get_job_key("/equity/price/historical", kwargs, other_user)
+
+
+@pytest.mark.parametrize(
+    "error, expected",
+    [
+        (HTTPException(status_code=404, detail="missing"), (404, "missing")),
+        (EmptyDataError("empty"), (204, "empty")),
+        (OpenBBError("bad"), (400, "bad")),
+        (ValueError("oops"), (500, "Unexpected Error -> ValueError -> oops")),
+    ],
+)
+def test_get_error(error, expected):
+    """Test the errors get the status code of their exception handler."""
+    assert get_error(error) == expected
+
+
+def test_job_store(tmp_path):
+    """Test a job is stored with its status and result."""
+    store = JobStore(str(tmp_path))
+
+    job = store.add("/test")
+    assert store.get(job.id).status == "pending"  # type: ignore[union-attr]
+
+    store.start(job.id)
+    assert store.get(job.id).status == "running"  # type: ignore[union-attr]
+    assert store.get_result(job.id) is None
+
+    store.finish(job.id, 200, result=b'{"results": []}')
+    finished = store.get(job.id)
+    assert finished.status == "done"  # type: ignore[union-attr]
+    assert finished.status_code == 200  # type: ignore[union-attr]
+    assert store.get_result(job.id) == b'{"results": []}'
+    assert store.get("unknown") is None
+
+
+def test_job_store_failed(tmp_path):
+    """Test a failed job keeps its error."""
+    store = JobStore(str(tmp_path))
+    job = store.add("/test")
+
+    store.finish(job.id, 422, error=[{"loc": ["query", "symbol"]}])
+
+    failed = store.get(job.id)
+    assert failed.status == "failed"  # type: ignore[union-attr]
+    assert failed.status_code == 422  # type: ignore[union-attr]
+    assert failed.error == [{"loc": ["query", "symbol"]}]  # type: ignore[union-attr]
+    assert store.get_result(job.id) is None
+
+
+def test_job_store_expired(tmp_path):
+    """Test a job expires after the time to live of its result."""
+    store = JobStore(str(tmp_path), ttl=60)
+    job = store.add("/test")
+    store.finish(job.id, 200, result=b"{}")
+
+    with patch(
+        "openbb_core.api.jobs.time", return_value=job.created.timestamp() + 3600
+    ):
+        assert store.get(job.id) is None
+        assert store.get_result(job.id) is None
+
+
+def test_job_store_interrupted(tmp_path):
+    """Test the unfinished jobs of a process that has exited are marked as failed."""
+    job = JobStore(str(tmp_path)).add("/test")
+
+    with patch("openbb_core.api.jobs._is_running", return_value=False):
+        interrupted = JobStore(str(tmp_path)).get(job.id)
+
+    assert interrupted.status == "failed"  # type: ignore[union-attr]
+    assert interrupted.error == "Interrupted before finishing."  # type: ignore[union-attr]
+
+
+def test_job_store_shared(tmp_path):
+    """Test the unfinished jobs of a process still running are kept by another store."""
+    job = JobStore(str(tmp_path)).add("/test")
+
+    with patch("openbb_core.api.jobs.os.getpid", return_value=-1):
+        shared = JobStore(str(tmp_path)).get(job.id)
+
+    assert shared.status == "pending"  # type: ignore[union-attr]
+
+
+def test_job_queue_deduplicates():
+    """Test identical submissions run once, until the job finishes."""
+    queue = JobQueue(JobStore())
+    calls = []
+
+    async def run() -> bytes:
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return b"{}"
+
+    async def main():
+        first = queue.submit("key", "/test", run)
+        second = queue.submit("key", "/test", run)
+        other = queue.submit("other", "/test", run)
+        await asyncio.gather(*queue._tasks)  # pylint: disable=protected-access
+        third = queue.submit("key", "/test", run)
+        await asyncio.gather(*queue._tasks)  # pylint: disable=protected-access
+        return first, second, other, third
+
+    first, second, other, third = asyncio.run(main())
+
+    assert first.id == second.id
+    assert other.id != first.id
+    assert third.id != first.id
+    assert len(calls) == 3
+    assert queue.store.get(first.id).status == "done"  # type: ignore[union-attr]
+
+
+def test_job_queue_workers():
+    """Test no more jobs than workers run at the same time."""
+    queue = JobQueue(JobStore(), workers=2)
+    running = []
+    peak = []
+
+    async def run() -> bytes:
+        running.append(1)
+        peak.append(len(running))
+        await asyncio.sleep(0.01)
+        running.pop()
+        return b"{}"
+
+    async def main():
+        for i in range(6):
+            queue.submit(str(i), "/test", run)
+        await asyncio.gather(*queue._tasks)  # pylint: disable=protected-access
+
+    asyncio.run(main())
+
+    assert max(peak) == 2
+
+
+def test_job_queue_failed():
+    """Test a command error fails the job with its status code."""
+    queue = JobQueue(JobStore())
+
+    async def run() -> bytes:
+        raise OpenBBError("No results found.")
+
+    async def main():
+        job = queue.submit("key", "/test", run)
+        await asyncio.gather(*queue._tasks)  # pylint: disable=protected-access
+        return job
+
+    job = queue.store.get(asyncio.run(main()).id)
+
+    assert job.status == "failed"  # type: ignore[union-attr]
+    assert job.status_code == 400  # type: ignore[union-attr]
+    assert job.error == "No results found."  # type: ignore[union-attr]
+
+
+def test_job_queue_from_settings(tmp_path):
+    """Test the queue is shared by the same settings and directory."""
+    settings = JobSettings(workers=3)
+
+    queue = JobQueue.from_settings(settings, str(tmp_path))
+
+    assert queue is JobQueue.from_settings(settings, str(tmp_path))
+    assert queue is not JobQueue.from_settings(JobSettings(), str(tmp_path))
+    assert queue.workers == 3
+    assert (tmp_path / "jobs.sqlite").exists()
@@ -0,0 +1,217 @@
+"""Test the response formats of the command endpoints."""
+
+import asyncio
+import json
+import sys
+from inspect import signature
+from unittest.mock import AsyncMock, Mock, patch
+
+import pandas as pd
+import pytest
+from fastapi import HTTPException
+from fastapi.routing import APIRoute
+from openbb_core.api.response_formats import (
+    EXTRA_HEADER_SIZE,
+    build_response,
+    check_response_format,
+    get_extra_header,
+    get_headers,
+    get_response_format,
+    get_warnings_header,
+    iter_ndjson,
+    to_arrow_table,
+)
+from openbb_core.api.router.commands import add_api_parameters, build_api_wrapper
+from openbb_core.app.model.abstract.warning import Warning_
+from openbb_core.app.model.data_table import DataTable
+from openbb_core.app.model.obbject import OBBject
+from openbb_core.provider.abstract.data import Data
+
+
+@pytest.fixture
+def obbject():
+    """Get an OBBject with rows, warnings and extra info."""
+    return OBBject(
+        results=[Data(date="2024-01-0" + str(i), close=float(i)) for i in range(1, 4)],
+        provider="test",
+        warnings=[Warning_(category="OpenBBWarning", message="Ünïcode warning")],
+        extra={"metadata": {"route": "/test"}},
+    )
+
+
+@pytest.mark.parametrize(
+    "response_format, accept, expected",
+    [
+        (None, None, "json"),
+        (None, "application/json", "json"),
+        (None, "application/x-ndjson", "ndjson"),
+        (None, "text/html, application/vnd.apache.arrow.stream;q=0.9", "arrow"),
+        (None, "application/x-parquet", "parquet"),
+        ("ndjson", "application/vnd.apache.parquet", "ndjson"),
+        (None, "*/*", "json"),
+    ],
+)
+def test_get_response_format(response_format, accept, expected):
+    """Test the query flag takes precedence over the Accept header."""
+    assert get_response_format(response_format, accept) == expected
+
+
+def test_get_headers(obbject):
+    """Test the OBBject info is kept in ASCII headers."""
+    headers = get_headers(obbject)
+
+    assert headers["X-OpenBB-Provider"] == "test"
+    assert json.loads(headers["X-OpenBB-Warnings"]) == [
+        {"category": "OpenBBWarning", "message": "Ünïcode warning"}
+    ]
+    assert json.loads(headers["X-OpenBB-Extra"]) == obbject.extra
+    assert all(v.isascii() for v in headers.values())
+
+
+def test_get_extra_header():
+    """Test the spans of the metadata are left out of the extra info header."""
+    extra = {"metadata": {"route": "/test", "spans": [{"name": "provider"}]}}
+
+    assert json.loads(get_extra_header(extra)) == {"metadata": {"route": "/test"}}
+
+
+def test_get_extra_header_truncated():
+    """Test an extra info too long for a header is reduced to its keys."""
+    extra = {"metadata": {"route": "/test"}, "results": ["x" * EXTRA_HEADER_SIZE]}
+
+    header = get_extra_header(extra)
+
+    assert len(header) <= EXTRA_HEADER_SIZE
+    assert json.loads(header) == {"keys": ["metadata", "results"], "truncated": True}
+
+
+def test_get_warnings_header_truncated():
+    """Test a list of warnings too long for a header keeps its count and first warnings."""
+    warnings = [
+        {"category": "OpenBBWarning", "message": f"Warning {i} " + "x" * 100}
+        for i in range(100)
+    ]
+
+    header = get_warnings_header(warnings)
+    summary = json.loads(header)
+
+    assert len(header) <= EXTRA_HEADER_SIZE
+    assert summary["count"] == 100
+    assert summary["truncated"] is True
+    assert 0 < len(summary["warnings"]) < 100
+    assert summary["warnings"] == warnings[: len(summary["warnings"])]
+
+
+def test_iter_ndjson(obbject):
+    """Test the rows are streamed as JSON lines, in chunks."""
+    chunks = list(iter_ndjson(obbject.results, chunk_size=2))
+    lines = b"".join(chunks).decode().splitlines()
+
+    assert len(chunks) == 2
+    assert [json.loads(line) for line in lines] == [
+        r.model_dump(mode="json") for r in obbject.results
+    ]
+
+
+def test_iter_ndjson_table():
+    """Test the rows of a table are serialized from its columns."""
+    df = pd.DataFrame(
+        {"date": pd.date_range("2024-01-01", periods=3), "x": [1.0, None, 3.0]}
+    )
+    table = DataTable.from_dataframe(df)
+    lines = b"".join(iter_ndjson(table, chunk_size=2)).decode().splitlines()
+
+    assert [json.loads(line) for line in lines] == table.to_records()
+
+
+def test_iter_ndjson_single():
+    """Test results that are not rows are a single line."""
+    assert list(iter_ndjson({"a": float("nan")})) == [b'{"a":null}\n']
+    assert not list(iter_ndjson(None))
+
+
+def test_build_response_ndjson(obbject):
+    """Test the NDJSON response."""
+    response = build_response(obbject, "ndjson")
+
+    async def read():
+        return b"".join([chunk async for chunk in response.body_iterator])
+
+    assert response.media_type == "application/x-ndjson"
+    assert response.headers["x-openbb-provider"] == "test"
+    assert len(asyncio.run(read()).splitlines()) == 3
+
+
+def test_to_arrow_table_missing_pyarrow(obbject):
+    """Test the error when pyarrow is not installed."""
+    with patch.dict(sys.modules, {"pyarrow": None}), pytest.raises(
+        HTTPException
+    ) as exc_info:
+        to_arrow_table(obbject)
+
+    assert exc_info.value.status_code == 406
+
+
+@pytest.mark.parametrize("response_format", ["arrow", "parquet"])
+def test_check_response_format_missing_pyarrow(response_format):
+    """Test the Arrow and Parquet formats are refused when pyarrow is not installed."""
+    check_response_format("json")
+    check_response_format("ndjson")
+
+    with patch.dict(sys.modules, {"pyarrow": None}), pytest.raises(
+        HTTPException
+    ) as exc_info:
+        check_response_format(response_format)
+
+    assert exc_info.value.status_code == 406
+
+
+def test_api_wrapper_missing_pyarrow():
+    """Test the command does not run when its Arrow response cannot be built."""
+
+    async def command(a: int = 1):
+        """Command."""
+
+    command_runner = Mock(run=AsyncMock())
+    wrapper = build_api_wrapper(command_runner, APIRoute("/test", endpoint=command))
+
+    with patch.dict(sys.modules, {"pyarrow": None}), pytest.raises(
+        HTTPException
+    ) as exc_info:
+        asyncio.run(
+            wrapper(a=1, __authenticated_user_settings={}, __response_format="arrow")
+        )
+
+    assert exc_info.value.status_code == 406
+    command_runner.run.assert_not_called()
+
+
+@pytest.mark.parametrize("response_format", ["arrow", "parquet"])
+def test_build_response_arrow(obbject, response_format):
+    """Test the Arrow and Parquet responses."""
+    pa = pytest.importorskip("pyarrow")
+    pq = pytest.importorskip("pyarrow.parquet")
+
+    response = build_response(obbject, response_format)
+    reader = pa.BufferReader(response.body)
+    table = (
+        pq.read_table(reader)
+        if response_format == "parquet"
+        else pa.ipc.open_stream(reader).read_all()
+    )
+
+    assert table.column("close").to_pylist() == [1.0, 2.0, 3.0]
+    info = json.loads(table.schema.metadata[b"openbb"])
+    assert info["provider"] == "test"
+    assert info["extra"] == obbject.extra
+
+
+def test_add_api_parameters():
+    """Test the parameters are added before the keyword arguments."""
+
+    def command(a: int, b: str = "b", **kwargs):
+        """Command."""
+
+    parameters = list(add_api_parameters(signature(command)).parameters)
+
+    assert parameters == ["a", "b", "__job", "__response_format", "__accept", "kwargs"]
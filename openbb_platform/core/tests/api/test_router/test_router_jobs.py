@@ -0,0 +1,72 @@
+"""Test the router jobs module."""
+
+import asyncio
+import json
+
+import pytest
+from fastapi import HTTPException
+from openbb_core.api.jobs import JobQueue, JobStore
+from openbb_core.api.router.jobs import get_job, get_job_result
+
+
+@pytest.fixture
+def queue():
+    """Get a queue with a job of each status."""
+    return JobQueue(JobStore())
+
+
+@pytest.fixture
+def jobs(queue):
+    """Add a running, a done, a failed and an empty job to the queue."""
+    store = queue.store
+    jobs = {
+        status: store.add("/test").id
+        for status in ("running", "done", "failed", "empty")
+    }
+    store.finish(jobs["done"], 200, result=b'{"results":[]}')
+    store.finish(jobs["failed"], 502, error="Unauthorized")
+    store.finish(jobs["empty"], 204, error="No results found.")
+    return jobs
+
+
+def test_get_job(queue, jobs):
+    """Test get job."""
+    job = asyncio.run(get_job(jobs["done"], queue))
+
+    assert job.status == "done"
+
+    with pytest.raises(HTTPException) as exc:
+        asyncio.run(get_job("unknown", queue))
+    assert exc.value.status_code == 404
+
+
+def test_get_job_result(queue, jobs):
+    """Test get job result."""
+    response = asyncio.run(get_job_result(jobs["done"], queue))
+
+    assert response.status_code == 200
+    assert json.loads(response.body) == {"results": []}
+
+
+def test_get_job_result_failed(queue, jobs):
+    """Test the result of a failed job is its error."""
+    response = asyncio.run(get_job_result(jobs["failed"], queue))
+
+    assert response.status_code == 502
+    assert json.loads(response.body) == {"detail": "Unauthorized"}
+
+
+def test_get_job_result_empty(queue, jobs):
+    """Test the result of a job without data has no content."""
+    response = asyncio.run(get_job_result(jobs["empty"], queue))
+
+    assert response.status_code == 204
+    assert response.body == b""
+
+
+def test_get_job_result_running(queue, jobs):
+    """Test the result of a job that has not finished is a conflict."""
+    with pytest.raises(HTTPException) as exc:
+        asyncio.run(get_job_result(jobs["running"], queue))
+
+    assert exc.value.status_code == 409
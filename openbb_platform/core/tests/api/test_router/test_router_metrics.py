@@ -0,0 +1,18 @@
+"""Test the router metrics module."""
+
+import asyncio
+
+from openbb_core.api.router.metrics import get_metrics
+from openbb_core.provider.utils.tracing import metrics
+
+
+def test_get_metrics():
+    """Test get metrics."""
+    metrics.clear()
+    metrics.observe("/test", 1_000_000_000, [])
+
+    response = asyncio.run(get_metrics(None))
+
+    assert response.media_type == "text/plain; version=0.0.4; charset=utf-8"
+    assert b'openbb_command_duration_seconds_count{route="/test"} 1.0' in response.body
+    metrics.clear()
@@ -0,0 +1,156 @@
+"""Tests for the DataTable class."""
+
+import json
+from datetime import date
+from typing import List, Union
+
+import pandas as pd
+import pytest
+from openbb_core.app.model.data_table import DataTable, convert_dates
+from openbb_core.app.model.obbject import OBBject
+from openbb_core.app.utils import basemodel_to_df, df_to_datatable
+from openbb_core.provider.abstract.data import Data
+from pandas.testing import assert_frame_equal
+from pydantic import BaseModel
+
+
+@pytest.fixture(name="frame")
+def frame_fixture():
+    """Get a daily price frame."""
+    return pd.DataFrame(
+        {
+            "date": pd.date_range("2024-01-01", periods=3),
+            "close": [1.5, None, 3.25],
+            "volume": [10, 20, 30],
+        }
+    )
+
+
+def test_from_dataframe_to_dataframe(frame):
+    """Test that the columns round trip without changes."""
+    table = DataTable.from_dataframe(frame)
+
+    assert len(table) == 3
+    assert table.columns == ["date", "close", "volume"]
+    assert_frame_equal(
+        table.to_dataframe(index="date"),
+        frame.assign(date=frame.date.dt.date).set_index("date"),
+    )
+
+
+def test_to_records(frame):
+    """Test that the records serialize like a list of Data."""
+    records = DataTable.from_dataframe(frame).to_records()
+
+    assert records[0] == {"date": "2024-01-01", "close": 1.5, "volume": 10}
+    assert records[1]["close"] is None
+    assert isinstance(records[2]["volume"], int)
+
+
+def test_to_records_intraday():
+    """Test that datetimes keep their time."""
+    df = pd.DataFrame(
+        {"date": pd.to_datetime(["2024-01-01 09:30", "2024-01-01 09:31"]), "x": [1, 2]}
+    )
+    records = DataTable.from_dataframe(df).to_records()
+
+    assert records[0]["date"] == "2024-01-01T09:30:00.000"
+
+
+def test_rows_are_lazy(frame):
+    """Test that the rows are only built when accessed."""
+    table = DataTable.from_dataframe(frame)
+    assert table._rows is None  # pylint: disable=protected-access
+
+    row = table[0]
+
+    assert isinstance(row, Data)
+    assert row.close == 1.5
+    assert [r.volume for r in table] == [10, 20, 30]
+
+
+def test_slice(frame):
+    """Test that a slice is a table."""
+    table = DataTable.from_dataframe(frame)[1:]
+
+    assert isinstance(table, DataTable)
+    assert len(table) == 2
+    assert table[0].volume == 20
+
+
+def test_from_dataframe_index():
+    """Test that named and multi-level indexes are kept as columns."""
+    df = pd.DataFrame(
+        {"value": [1.0, 2.0]},
+        index=pd.MultiIndex.from_tuples([("a", 1), ("b", 2)], names=["s", "n"]),
+    )
+    table = DataTable.from_dataframe(df)
+
+    assert "s" in table.columns
+    assert_frame_equal(table.to_dataframe(), df)
+
+
+def test_from_rows():
+    """Test that a table keeps the Data rows it is built from."""
+    rows = [Data(x=1), Data(x=2)]
+    table = DataTable.from_rows(rows)
+
+    assert table[1] is rows[1]
+    assert table.to_dataframe().x.tolist() == [1, 2]
+    assert table == DataTable.from_rows([{"x": 1}, {"x": 2}])
+
+
+def test_equals_list(frame):
+    """Test the comparison with a list of rows."""
+    table = DataTable.from_dataframe(frame)
+    assert table == list(table)
+
+
+def test_pydantic_validation(frame):
+    """Test the validation and serialization of a DataTable field."""
+
+    class Model(BaseModel):
+        """Model with a table."""
+
+        data: DataTable
+
+    model = Model(data=frame)
+    assert isinstance(model.data, DataTable)
+    assert Model(data=[{"x": 1}]).data[0].x == 1
+    assert Model(data=model.data).data is model.data
+
+    dumped = json.loads(model.model_dump_json())
+    assert dumped["data"][0]["date"] == "2024-01-01"
+    assert Model.model_validate_json(model.model_dump_json()).data[2].volume == 30
+    assert Model.model_json_schema()["properties"]["data"]["type"] == "array"
+
+
+def test_union_validation():
+    """Test that a list in a union with DataTable is not converted."""
+
+    class Model(BaseModel):
+        """Model with a table or a list."""
+
+        data: Union[List[Data], DataTable]
+
+    assert isinstance(Model(data=[Data(x=1)]).data, list)
+    assert isinstance(Model(data=DataTable.from_rows([{"x": 1}])).data, DataTable)
+
+
+def test_obbject(frame):
+    """Test an OBBject with a table as results."""
+    obbject = OBBject(results=df_to_datatable(frame))
+
+    assert_frame_equal(
+        obbject.to_dataframe(), basemodel_to_df(obbject.results, index="date")
+    )
+    assert json.loads(obbject.model_dump_json())["results"][1]["close"] is None
+
+
+def test_convert_dates():
+    """Test the conversion of a date column."""
+    assert convert_dates(pd.Series(["2024-01-01", "2024-01-02"])).tolist() == [
+        date(2024, 1, 1),
+        date(2024, 1, 2),
+    ]
+    assert convert_dates(pd.Series(["2024-01-01 10:00"])).dtype.kind == "M"
@@ -20,6 +20,7 @@ from openbb_core.app.static.package_builder import (
     PackageBuilder,
     Parameter,
     PathHandler,
+    ReferenceGenerator,
 )
 from openbb_core.env import Env
 from pydantic import Field
@@ -741,3 +742,11 @@ def test_auto_build(package_builder, add, remove, openbb_auto_build):
     else:
         mock_assets_diff.assert_not_called()
         mock_build.assert_not_called()
+
+
+def test_reference_generator_get_providers():
+    """Test the provider reference data."""
+    providers = ReferenceGenerator.get_providers()
+
+    assert providers["fmp"]["credentials"] == ["fmp_api_key"]
+    assert "EquityHistorical" in providers["fmp"]["models"]
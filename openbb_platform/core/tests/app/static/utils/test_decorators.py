@@ -0,0 +1,57 @@
+"""Test the decorators of the static assets."""
+
+from unittest.mock import patch
+
+import pytest
+from openbb_core.app.model.abstract.error import OpenBBError
+from openbb_core.app.static.utils import decorators
+from openbb_core.app.static.utils.decorators import exception_handler, validate
+
+
+def test_validate_builds_validator_once():
+    """Test that the validator is built on the first call and reused."""
+
+    @validate
+    def add(a: int, b: int = 1) -> int:
+        return a + b
+
+    with patch.object(
+        decorators, "validate_call", wraps=decorators.validate_call
+    ) as validate_call:
+        assert add(1) == 2
+        assert add("2", b="3") == 5
+        assert add(a=3) == 4
+
+    validate_call.assert_called_once()
+
+
+def test_validate_config():
+    """Test that the decorator arguments are passed to the validator."""
+
+    class Custom:
+        """Type unknown to pydantic."""
+
+    @validate(config=dict(arbitrary_types_allowed=True))
+    def identity(value: Custom) -> Custom:
+        return value
+
+    custom = Custom()
+    assert identity(custom) is custom
+
+
+def test_exception_handler_validation_error():
+    """Test the message of a validation error."""
+
+    @exception_handler
+    @validate
+    def add(a: int, b: int = 1) -> int:
+        return a + b
+
+    for _ in range(2):
+        with pytest.raises(OpenBBError) as exc_info:
+            add(a="x")
+
+        assert str(exc_info.value) == (
+            "\n[Error] -> 1 validations error(s)\n[Arg] a -> input: x -> "
+            "Input should be a valid integer, unable to parse string as an integer"
+        )
@@ -1,9 +1,10 @@
 """Test command runner."""
 
+import asyncio
 from dataclasses import dataclass
 from inspect import Parameter
 from typing import Dict, List
-from unittest.mock import Mock, patch
+from unittest.mock import Mock, PropertyMock, patch
 
 import pytest
 from fastapi import Query
@@ -21,6 +22,7 @@ from openbb_core.app.model.system_settings import SystemSettings
 from openbb_core.app.model.user_settings import UserSettings
 from openbb_core.app.provider_interface import ExtraParams
 from openbb_core.app.router import CommandMap
+from openbb_core.provider.utils.tracing import metrics, span
 from pydantic import BaseModel, ConfigDict
 
 # pylint: disable=W0613, W0621, W0102, W0212
@@ -216,6 +218,25 @@ def test_parameters_builder_validate_kwargs(mock_func):
     assert result == {"a": 1, "b": 2, "c": 3.0, "d": 4, "provider_choices": {}}
 
 
+def test_parameters_builder_get_plan(mock_func):
+    """Test the validation plan is compiled once and reused."""
+    plan = ParametersBuilder.get_plan(mock_func)
+
+    assert ParametersBuilder.get_plan(mock_func) is plan
+    assert ParametersBuilder.get_plan(plan.func) is plan
+    assert [p.name for p in plan.parameters] == ["a", "b", "c", "d", "provider_choices"]
+    assert set(plan.model.model_fields) == {"a", "b", "c", "d", "provider_choices"}
+    assert plan.extra_params_fields is None
+
+
+def test_parameters_builder_merge_args_and_kwargs_no_copy(mock_func):
+    """Test merge_args_and_kwargs does not copy the values."""
+    data = [{"x": 1}]
+    result = ParametersBuilder.merge_args_and_kwargs(mock_func, (data, 2), {})
+
+    assert result["a"] is data
+
+
 @pytest.mark.parametrize(
     "extra_params, base, expect",
     [
@@ -297,6 +318,7 @@ def test_command_runner_properties():
     assert runner.system_settings == sys
     assert runner.user_settings == user
     assert runner.command_map == cmd_map
+    assert not runner.event_loop.is_running
 
 
 @patch("openbb_core.app.command_runner.CommandRunner")
@@ -311,6 +333,27 @@ def test_command_runner_run(_):
         assert runner.run("mock/route")
 
 
+def test_command_runner_sync_run():
+    """Test sync_run reuses the background event loop."""
+    runner = CommandRunner()
+    loops = []
+
+    async def mock_run(*args, **kwargs):
+        loops.append(asyncio.get_running_loop())
+        return "mock_obbject"
+
+    with patch(
+        "openbb_core.app.command_runner.StaticCommandRunner.run",
+        side_effect=mock_run,
+    ):
+        assert runner.sync_run("mock/route") == "mock_obbject"
+        assert runner.sync_run("mock/route") == "mock_obbject"
+
+    assert loops[0] is loops[1] is runner.event_loop.loop
+    runner.close()
+    assert not runner.event_loop.is_running
+
+
 @pytest.mark.asyncio
 @patch("openbb_core.app.router.CommandMap.get_command")
 @patch("openbb_core.app.command_runner.StaticCommandRunner._execute_func")
@@ -343,6 +386,35 @@ async def test_static_command_runner_run(
     assert result.extra.get("metadata") is not None
 
 
+@pytest.mark.asyncio
+@patch("openbb_core.app.router.CommandMap.get_command")
+@patch("openbb_core.app.command_runner.StaticCommandRunner._execute_func")
+async def test_static_command_runner_run_spans(
+    mock_execute_func, mock_get_command, execution_context
+):
+    """Test the spans of a command are added to its metadata and metrics."""
+
+    async def execute_func(*args, **kwargs):
+        """Mock executing the command in a stage."""
+        with span("extract_data"):
+            return OBBject(results=[1, 2, 3, 4])
+
+    mock_get_command.return_value = lambda: None
+    mock_execute_func.side_effect = execute_func
+    metrics.clear()
+
+    result = await StaticCommandRunner.run(execution_context)
+
+    spans = result.extra["metadata"].spans
+    assert [s.name for s in spans] == ["extract_data"]
+    assert 0 <= spans[0].start <= result.extra["metadata"].duration
+    assert (
+        'openbb_stage_duration_seconds_count{route="mock/route",stage="extract_data"} 1.0'
+        in (metrics.render())
+    )
+    metrics.clear()
+
+
 @pytest.mark.asyncio
 @patch("openbb_core.app.logs.logging_service.LoggingService")
 @patch("openbb_core.app.command_runner.ParametersBuilder.build")
@@ -397,13 +469,31 @@ def test_static_command_runner_chart():
             {"date": "1992", "value": 300},
         ],
         provider="mock_provider",
-        accessors={"charting": Mock()},
     )
-    mock_obbject.charting.show = Mock()
+    mock_charting = Mock()
+
+    with patch.object(OBBject, "accessors", {"charting"}), patch.object(
+        OBBject, "charting", mock_charting, create=True
+    ):
+        StaticCommandRunner._chart(mock_obbject)  # pylint: disable=protected-access
+
+    mock_charting.show.assert_called_once()
 
-    StaticCommandRunner._chart(mock_obbject)  # pylint: disable=protected-access
 
-    mock_obbject.charting.show.assert_called_once()
+@patch("openbb_core.app.extension_loader.ExtensionLoader")
+def test_static_command_runner_chart_loads_extensions(mock_extension_loader):
+    """Test _chart method loads the OBBject extensions when charting is not registered."""
+
+    mock_obbject = OBBject(results=[{"date": "1990", "value": 100}])
+    mock_obbject_objects = PropertyMock(return_value={})
+    type(mock_extension_loader.return_value).obbject_objects = mock_obbject_objects
+
+    with patch.object(OBBject, "accessors", set()), pytest.warns(
+        OpenBBWarning, match="Charting is not installed"
+    ):
+        StaticCommandRunner._chart(mock_obbject)  # pylint: disable=protected-access
+
+    mock_obbject_objects.assert_called_once()
 
 
 @pytest.mark.asyncio
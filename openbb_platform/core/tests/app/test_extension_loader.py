@@ -180,3 +180,28 @@ def test_provider_objects():
     for key, value in el.provider_objects.items():
         assert isinstance(key, str)
         assert isinstance(value, Provider)
+
+
+def test_extension_map():
+    """Test the extension map property."""
+    el = ExtensionLoader()
+    extension_map = el.extension_map
+
+    assert set(extension_map) == {
+        "openbb_core_extension",
+        "openbb_provider_extension",
+        "openbb_obbject_extension",
+    }
+    for ep in el.core_entry_points:
+        assert f"{ep.name}@{ep.dist.version}" in extension_map["openbb_core_extension"]
+
+
+def test_get_core_object():
+    """Test loading a single core extension."""
+    el = ExtensionLoader()
+    names = [ep.name for ep in el.core_entry_points]
+    if not names:
+        pytest.skip("No core extensions installed.")
+
+    assert el.get_core_object(names[0]) is not None
+    assert el.get_core_object("not_an_extension") is None
@@ -72,6 +72,15 @@ def test_from_extensions(router_loader):
     assert router_loader.from_extensions()
 
 
+def test_from_extension(router_loader):
+    """Test from_extension."""
+    router = router_loader.from_extension("equity")
+    paths = [route.path for route in router.api_router.routes]
+
+    assert paths
+    assert all(path.startswith("/equity") for path in paths)
+
+
 @pytest.fixture(scope="module")
 def signature_inspector():
     """Set up signature_inspector."""
@@ -213,3 +222,10 @@ def test_get_command(command_map):
     """Test get_command."""
     command = command_map.get_command("stocks/load")
     assert command is None
+
+
+def test_get_api_route(command_map):
+    """Test get_api_route."""
+    route = command_map.get_api_route("/equity/price/historical")
+    assert route.path == "/equity/price/historical"
+    assert command_map.get_api_route("/not_an_extension/command") is None
@@ -2,8 +2,13 @@
 
 # pylint: disable=C2801
 
+from typing import Optional
+
+import numpy as np
+import pandas as pd
 import pytest
 from openbb_core.provider.abstract.data import Data, check_int
+from pydantic import ValidationError
 
 
 def test_check_int_valid():
@@ -41,3 +46,38 @@ def test_data_model_alias():
     assert some_data.__repr__() == "SomeData(test_alias=Hello)"
     assert some_data.model_dump() == {"test_alias": "Hello"}
     assert some_data.test_alias == "Hello"  # type: ignore[attr-defined]
+
+
+class PriceData(Data):
+    """Price data."""
+
+    __alias_dict__ = {"close": "c"}
+
+    symbol: str
+    close: Optional[float] = None
+
+
+def test_model_validate_list_rows():
+    """Test the validation of a list of rows."""
+    rows = [{"symbol": "A", "c": 1.5}, {"symbol": "B", "c": None, "extra": 1}]
+    results = PriceData.model_validate_list(rows)
+
+    assert results == [PriceData.model_validate(r) for r in rows]
+    assert results[0].close == 1.5
+    assert results[1].extra == 1  # type: ignore[attr-defined]
+
+
+def test_model_validate_list_columns():
+    """Test the validation of a dictionary of columns."""
+    columns = {"symbol": np.array(["A", "B"]), "c": pd.Series([1.5, np.nan])}
+    results = PriceData.model_validate_list(columns)
+
+    assert [r.symbol for r in results] == ["A", "B"]
+    assert results[0].close == 1.5
+    assert results[1].close is None
+
+
+def test_model_validate_list_invalid():
+    """Test that an invalid row raises a validation error."""
+    with pytest.raises(ValidationError):
+        PriceData.model_validate_list([{"symbol": "A", "c": "not_a_number"}])
@@ -4,6 +4,7 @@ from typing import Any, Dict, List, Optional
 
 import pytest
 from openbb_core.provider.abstract.fetcher import Data, Fetcher, QueryParams
+from openbb_core.provider.utils.tracing import current_spans
 
 # Step 1: Create a dummy subclass of Fetcher
 
@@ -49,6 +50,24 @@ async def test_fetcher_methods():
     assert fetched_data[0].model_dump() == {"mock_key": "mock_value"}
 
 
+@pytest.mark.asyncio
+async def test_fetcher_spans():
+    """Test the stages of the fetcher are recorded as spans."""
+    spans: list = []
+    token = current_spans.set(spans)
+    try:
+        await MockFetcher.fetch_data(params={})
+    finally:
+        current_spans.reset(token)
+
+    assert [s["name"] for s in spans] == [
+        "transform_query",
+        "extract_data",
+        "transform_data",
+    ]
+    assert spans[-1]["attributes"] == {"rows": 1}
+
+
 def test_fetcher_query_params_type():
     """Test the query_params_type classproperty."""
     assert MockFetcher.query_params_type == MockQueryParams
@@ -2,27 +2,31 @@
 
 # pylint: disable=W0621
 
-from unittest.mock import MagicMock, patch
+import asyncio
+from unittest.mock import patch
 
 import pytest
 from openbb_core.app.model.abstract.error import OpenBBError
 from openbb_core.provider.abstract.fetcher import Fetcher
 from openbb_core.provider.abstract.provider import Provider
 from openbb_core.provider.query_executor import QueryExecutor
+from openbb_core.provider.registry import Registry
+from openbb_core.provider.utils.response_cache import cache_stats
 from pydantic import SecretStr
 
 
 @pytest.fixture
 def mock_query_executor():
     """Mock the query executor."""
-    registry = MagicMock()
-    registry.providers = {
-        "test_provider": Provider(
-            name="Test",
+    registry = Registry()
+    registry.include_loader(
+        "test_provider",
+        lambda: Provider(
+            name="Test_Provider",
             description="Test provider",
             fetcher_dict={"test_fetcher": Fetcher},
         ),
-    }
+    )
     executor = QueryExecutor(registry=registry)
     return executor
 
@@ -30,7 +34,7 @@ def mock_query_executor():
 def test_get_provider_success(mock_query_executor):
     """Test if the method can retrieve a provider successfully."""
     provider = mock_query_executor.get_provider("test_provider")
-    assert provider.name == "Test"
+    assert provider.name == "Test_Provider"
 
 
 def test_get_provider_failure(mock_query_executor):
@@ -120,3 +124,64 @@ async def test_execute_success(mock_query_executor: QueryExecutor):
 
         assert result == mock_result
         mock_fetch.assert_called_once_with(params, {}, **{})
+
+
+@pytest.mark.asyncio
+async def test_execute_cached(mock_query_executor: QueryExecutor):
+    """Test results are served from the response cache within the time to live."""
+    params = {"param1": "value1"}
+    preferences = {
+        "response_cache": {"ttl": {"test_provider.test_fetcher": 60}, "disk_size": 0}
+    }
+    stats: dict = {}
+    token = cache_stats.set(stats)
+
+    with patch.object(Fetcher, "fetch_data", return_value=[1, 2]) as mock_fetch:
+        first = await mock_query_executor.execute(
+            "test_provider", "test_fetcher", params, preferences=preferences
+        )
+        second = await mock_query_executor.execute(
+            "test_provider", "test_fetcher", params, preferences=preferences
+        )
+        other = await mock_query_executor.execute(
+            "test_provider", "test_fetcher", {"param1": "x"}, preferences=preferences
+        )
+
+    cache_stats.reset(token)
+    assert first == second == other == [1, 2]
+    assert mock_fetch.call_count == 2
+    assert stats == {"misses": 2, "hits": 1}
+
+
+@pytest.mark.asyncio
+async def test_execute_coalesced(mock_query_executor: QueryExecutor):
+    """Test identical concurrent queries share one fetch, with their own results."""
+    params = {"param1": "value1"}
+    credentials = {"api_key": SecretStr("12345")}
+    calls = []
+
+    async def fetch_data(*args, **kwargs):
+        calls.append(args)
+        await asyncio.sleep(0.01)
+        return [{"value": 1}]
+
+    stats: dict = {}
+    token = cache_stats.set(stats)
+    with patch.object(Fetcher, "fetch_data", side_effect=fetch_data):
+        results = await asyncio.gather(
+            *(
+                mock_query_executor.execute(
+                    "test_provider", "test_fetcher", params, credentials
+                )
+                for _ in range(3)
+            ),
+            mock_query_executor.execute(
+                "test_provider", "test_fetcher", {"param1": "x"}
+            ),
+        )
+    cache_stats.reset(token)
+
+    assert len(calls) == 2
+    assert results[0] == results[1] == results[2] == [{"value": 1}]
+    assert results[0] is not results[1]
+    assert stats == {"coalesced": 2}
@@ -28,3 +28,25 @@ def test_registry_loader_integration():
 
     for provider in registry.providers.values():
         assert isinstance(provider, Provider)
+
+
+def test_registry_lazy_loaders():
+    """Test that the providers are loaded on first use."""
+    registry = Registry()
+    calls = []
+
+    def loader(name):
+        calls.append(name)
+        return Provider(name=name, description="Just a test provider.")
+
+    registry.include_loader("first", lambda: loader("first"))
+    registry.include_loader("second", lambda: loader("second"))
+
+    assert registry.provider_names == ["first", "second"]
+    assert not calls
+
+    assert registry.get_provider("second").name == "second"
+    assert calls == ["second"]
+
+    assert list(registry.providers) == ["first", "second"]
+    assert calls == ["second", "first"]
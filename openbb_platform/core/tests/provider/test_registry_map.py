@@ -2,7 +2,10 @@
 
 # pylint: disable=W0621
 
+from unittest.mock import patch
+
 import pytest
+from openbb_core.provider.registry import RegistryLoader
 from openbb_core.provider.registry_map import RegistryMap
 
 
@@ -39,3 +42,32 @@ def test_map_and_models(load_registry_map):
     assert "EquityHistorical" in standard_extra
     assert "EquityHistorical" in original_models
     assert "EquityHistorical" in models
+
+
+def test_registry_map_lazy(load_registry_map):
+    """Test that a model loads only the providers implementing it."""
+    eager = load_registry_map
+    reference = {
+        p: {
+            "credentials": eager.credentials.get(p, []),
+            "models": [m for m in eager.models if p in eager.standard_extra[m]],
+        }
+        for p in eager.available_providers
+    }
+    registry = RegistryLoader.from_extensions.__wrapped__()
+
+    with patch.object(
+        RegistryMap, "_get_reference_providers", return_value=reference
+    ), patch(
+        "openbb_core.provider.registry_map.RegistryLoader.from_extensions",
+        return_value=registry,
+    ):
+        lazy = RegistryMap()
+        assert lazy.available_providers == eager.available_providers
+        assert lazy.credentials == eager.credentials
+        assert not registry._providers  # pylint: disable=protected-access
+
+        standard_extra = lazy.get_standard_extra("EquityHistorical")
+
+    assert standard_extra.keys() == eager.standard_extra["EquityHistorical"].keys()
+    assert "fred" in registry._loaders  # pylint: disable=protected-access
@@ -0,0 +1,95 @@
+"""Test the Black-Scholes utils."""
+
+import math
+
+import numpy as np
+import pytest
+from openbb_core.provider.utils.black_scholes import (
+    greeks,
+    implied_volatility,
+    norm_cdf,
+    price,
+)
+
+
+@pytest.fixture
+def chain():
+    """Get random contracts, with their volatility."""
+    rng = np.random.default_rng(0)
+    size = 2000
+    return {
+        "option_type": np.where(rng.random(size) < 0.5, "call", "put"),
+        "underlying_price": 100.0,
+        "strike": rng.uniform(50, 150, size),
+        "time": rng.uniform(1, 730, size) / 365,
+        "rate": 0.04,
+        "dividend_yield": 0.01,
+        "volatility": rng.uniform(0.1, 1.0, size),
+    }
+
+
+def test_norm_cdf():
+    """Test the normal distribution has double precision."""
+    x = np.linspace(-30, 30, 10001)
+    expected = [0.5 * math.erfc(-v / math.sqrt(2)) for v in x]
+
+    assert np.allclose(norm_cdf(x), expected, rtol=1e-7, atol=1e-16)
+
+
+def test_price():
+    """Test the price of a call and a put, and their parity."""
+    call = price("call", 100, 100, 1, 0.2, 0.05)
+    put = price("put", 100, 100, 1, 0.2, 0.05)
+
+    assert call == pytest.approx(10.450583572185565)
+    assert put == pytest.approx(5.573526022256971)
+    assert call - put == pytest.approx(100 - 100 * math.exp(-0.05))
+
+
+def test_greeks(chain):
+    """Test the greeks are the derivatives of the price."""
+    results = greeks(**chain)
+
+    def bump(name, h):
+        """Get the central difference of the price."""
+        up = price(**{**chain, name: chain[name] + h})
+        down = price(**{**chain, name: chain[name] - h})
+        return (up - down) / (2 * h)
+
+    assert np.allclose(results["delta"], bump("underlying_price", 1e-4), atol=1e-6)
+    assert np.allclose(results["vega"], bump("volatility", 1e-5) / 100, atol=1e-6)
+    assert np.allclose(results["rho"], bump("rate", 1e-5) / 100, atol=1e-6)
+    assert np.allclose(results["theta"], -bump("time", 1e-6) / 365, atol=1e-6)
+    up = results["delta"]
+    down = greeks(**{**chain, "underlying_price": 100 - 1e-3})["delta"]
+    assert np.allclose(results["gamma"], (up - down) / 1e-3, atol=1e-4)
+
+
+def test_implied_volatility(chain):
+    """Test the implied volatility is the volatility of the price."""
+    volatility = chain.pop("volatility")
+    option_price = price(volatility=volatility, **chain)
+
+    result = implied_volatility(option_price, **chain)
+
+    # Deep in the money, the price does not depend on the volatility.
+    vega = greeks(volatility=volatility, **chain)["vega"]
+    solved = ~np.isnan(result)
+    assert (vega[~solved] < 1e-4).all()
+    assert np.allclose(result[vega > 1e-4], volatility[vega > 1e-4], atol=1e-6)
+    assert np.allclose(
+        price(volatility=result, **chain)[solved], option_price[solved], atol=1e-7
+    )
+
+
+@pytest.mark.parametrize(
+    "option_price, option_type, time",
+    [
+        (30.0, "call", 1.0),  # Above the underlying price.
+        (0.5, "put", 1.0),  # Below the intrinsic value.
+        (5.0, "call", 0.0),  # Expired.
+    ],
+)
+def test_implied_volatility_invalid(option_price, option_type, time):
+    """Test the prices outside of the no-arbitrage bounds have no volatility."""
+    assert np.isnan(implied_volatility(option_price, option_type, 25, 30, time))
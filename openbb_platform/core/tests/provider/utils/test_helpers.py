@@ -1,15 +1,24 @@
 """Test the provider helpers."""
 
+import asyncio
+import threading
+
 import pytest
 from openbb_core.provider.utils.client import ClientSession
 from openbb_core.provider.utils.helpers import (
+    EventLoopThread,
+    SessionPool,
     amake_request,
     amake_requests,
+    close_session_pool,
+    get_pooled_requests_session,
+    get_pooled_session,
     get_querystring,
     get_requests_session,
     make_request,
     to_snake_case,
 )
+from openbb_core.provider.utils.tracing import current_spans
 
 # pylint: disable=unused-argument
 
@@ -92,6 +101,27 @@ def test_make_request(monkeypatch):
         make_request("http://mock.url", method="PUT")
 
 
+def test_make_request_span(monkeypatch):
+    """Test the request is recorded as a span, with a redacted URL."""
+    response = MockResponse()
+    response.url = "http://mock.url/?apikey=secret"
+    response.content = b"1234"
+    client_session = get_requests_session()
+    monkeypatch.setattr(client_session, "get", lambda *args, **kwargs: response)
+
+    spans: list = []
+    token = current_spans.set(spans)
+    try:
+        make_request("http://mock.url/?apikey=secret", session=client_session)
+    finally:
+        current_spans.reset(token)
+
+    assert spans[0]["name"] == "http"
+    assert "secret" not in spans[0]["attributes"]["url"]
+    assert spans[0]["attributes"]["status"] == 200
+    assert spans[0]["attributes"]["bytes"] == 4
+
+
 def test_to_snake_case():
     """Test the to_snake_case helper."""
     assert to_snake_case("SomeRandomString") == "some_random_string"
@@ -141,3 +171,139 @@ async def test_amake_requests(monkeypatch):
         await amake_requests(
             ["http://mock.url", "http://mock.url"], method="PUT", raise_for_status=True
         )
+
+
+def test_event_loop_thread_reuses_loop():
+    """Test the event loop thread runs every call on the same loop."""
+
+    async def get_loop():
+        return asyncio.get_running_loop(), threading.current_thread()
+
+    event_loop = EventLoopThread()
+    first = event_loop.run(get_loop)
+    second = event_loop.run(get_loop)
+
+    assert first == second
+    assert first[0] is event_loop.loop
+    assert first[1] is not threading.current_thread()
+
+    event_loop.stop()
+    assert not event_loop.is_running
+    assert first[0].is_closed()
+
+
+def test_event_loop_thread_nested_call():
+    """Test a blocking call from the loop thread does not deadlock."""
+    event_loop = EventLoopThread()
+
+    async def inner():
+        return threading.current_thread()
+
+    async def outer():
+        return event_loop.run(inner), threading.current_thread()
+
+    inner_thread, outer_thread = event_loop.run(outer)
+
+    assert inner_thread is not outer_thread
+    event_loop.stop()
+
+
+def test_event_loop_thread_raises():
+    """Test exceptions are propagated to the caller."""
+    event_loop = EventLoopThread()
+
+    async def fail():
+        raise ValueError("Test")
+
+    with pytest.raises(ValueError, match="Test"):
+        event_loop.run(fail)
+
+    assert event_loop.is_running
+    event_loop.stop()
+
+
+@pytest.mark.asyncio
+async def test_get_pooled_session():
+    """Test the pooled session is shared within the event loop."""
+    session = await get_pooled_session()
+
+    assert session is await get_pooled_session()
+    assert SessionPool.is_pooled(session)
+
+    await close_session_pool()
+    assert session.closed
+    assert not SessionPool.is_pooled(session)
+    assert await get_pooled_session() is not session
+    await close_session_pool()
+
+
+@pytest.mark.asyncio
+async def test_get_pooled_session_no_cookies():
+    """Test the pooled session does not store the cookies of the responses."""
+    # pylint: disable=import-outside-toplevel
+    from http.cookies import SimpleCookie
+
+    from yarl import URL
+
+    session = await get_pooled_session()
+    session.cookie_jar.update_cookies(
+        SimpleCookie("session_id=user1"), URL("http://mock.url")
+    )
+
+    assert len(session.cookie_jar) == 0
+    await close_session_pool()
+
+
+@pytest.mark.asyncio
+async def test_get_pooled_session_settings_cookies(monkeypatch):
+    """Test the pooled session sends the cookies of the settings."""
+    monkeypatch.setattr(
+        "openbb_core.provider.utils.helpers.get_python_request_settings",
+        lambda: {"cookies": {"consent": "yes", "region": "us"}},
+    )
+
+    session = await get_pooled_session()
+
+    assert session.headers["Cookie"] == "consent=yes; region=us"
+    assert len(session.cookie_jar) == 0
+    await close_session_pool()
+
+
+@pytest.mark.asyncio
+async def test_amake_request_keeps_pooled_session(monkeypatch):
+    """Test amake_request does not close the pooled session."""
+    client_session = MockSession()
+    monkeypatch.setattr(ClientSession, "request", client_session.request)
+
+    await amake_request("http://mock.url", response_callback=MockSession.mock_callback)
+    await amake_requests(
+        ["http://mock.url"], response_callback=MockSession.mock_callback
+    )
+    session = await get_pooled_session()
+
+    assert not session.closed
+    await close_session_pool()
+
+
+def test_get_pooled_requests_session():
+    """Test the pooled requests session is shared."""
+    assert get_pooled_requests_session() is get_pooled_requests_session()
+
+
+def test_get_pooled_requests_session_no_cookies():
+    """Test the pooled requests session does not store the cookies of the responses."""
+    # pylint: disable=import-outside-toplevel
+    from unittest.mock import MagicMock
+
+    from requests.cookies import extract_cookies_to_jar
+    from requests.models import PreparedRequest
+
+    session = get_pooled_requests_session()
+    request = PreparedRequest()
+    request.prepare(method="GET", url="http://mock.url/")
+    response = MagicMock()
+    response._original_response.msg.get_all.return_value = ["session_id=user1"]
+
+    extract_cookies_to_jar(session.cookies, request, response)
+
+    assert not session.cookies
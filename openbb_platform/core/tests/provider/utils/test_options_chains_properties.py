@@ -0,0 +1,136 @@
+"""Test the options chains properties."""
+
+from datetime import date
+
+import pytest
+from openbb_core.app.model.abstract.error import OpenBBError
+from openbb_core.provider.standard_models.options_chains import OptionsChainsData
+from openbb_core.provider.utils.black_scholes import price
+
+
+@pytest.fixture
+def chains():
+    """Get a chain priced at 20% volatility, with the delta of a single contract."""
+    strikes = [90.0, 100.0, 110.0]
+    marks = [
+        float(price(option_type, 100, strike, 30 / 365, 0.2, 0.05))
+        for option_type in ("call", "put")
+        for strike in strikes
+    ]
+    return OptionsChainsData.model_validate(
+        {
+            "contract_symbol": [f"TEST{i}" for i in range(6)],
+            "expiration": [date(2024, 12, 20)] * 6,
+            "dte": [30] * 6,
+            "strike": strikes * 2,
+            "option_type": ["call"] * 3 + ["put"] * 3,
+            "underlying_price": [100.0] * 6,
+            "open_interest": [10] * 6,
+            "mark": marks,
+            "delta": [0.9, None, None, None, None, None],
+        }
+    )
+
+
+def test_fill_greeks(chains):
+    """Test the missing implied volatility and greeks are filled."""
+    chains.fill_greeks(risk_free_rate={"2024-12-20": 0.05})
+
+    assert chains.implied_volatility == pytest.approx([0.2] * 6)
+    assert chains.delta[0] == 0.9
+    assert chains.delta[1] == pytest.approx(0.5400, abs=1e-4)
+    assert chains.delta[4] == pytest.approx(0.5400 - 1, abs=1e-4)
+    assert all(v > 0 for v in chains.gamma + chains.vega)
+    assert "GEX" in chains.dataframe.columns
+
+    chains.fill_greeks(risk_free_rate=0.05, overwrite=True)
+    assert chains.delta[0] == pytest.approx(0.9737, abs=1e-4)
+
+
+def test_fill_greeks_missing_rate(chains):
+    """Test a rate is required for each expiration."""
+    with pytest.raises(OpenBBError):
+        chains.fill_greeks(risk_free_rate={"2025-01-17": 0.05})
+
+
+@pytest.fixture
+def eod_chains():
+    """Get an unsorted end-of-day chain, with two expirations and an expired one."""
+    expirations = [date(2024, 12, 20), date(2025, 1, 17), date(2024, 11, 15)]
+    rows = [
+        (expiration, strike, option_type)
+        for expiration in expirations
+        for strike in (110.0, 90.0, 100.0)
+        for option_type in ("put", "call")
+    ]
+    return OptionsChainsData.model_validate(
+        {
+            "underlying_symbol": ["TEST"] * len(rows),
+            "contract_symbol": [f"TEST{i}" for i in range(len(rows))],
+            "eod_date": [date(2024, 11, 20)] * len(rows),
+            "expiration": [r[0] for r in rows],
+            "strike": [r[1] for r in rows],
+            "option_type": [r[2] for r in rows],
+            "underlying_price": [101.0] * len(rows),
+            "open_interest": [10] * len(rows),
+            "bid": [1.0 + i / 10 for i in range(len(rows))],
+            "ask": [1.2 + i / 10 for i in range(len(rows))],
+            "delta": [0.5 if r[2] == "call" else -0.5 for r in rows],
+        }
+    )
+
+
+def test_dataframe(eod_chains):
+    """Test the chains are sorted, without the expired contracts."""
+    df = eod_chains.dataframe
+
+    assert len(df) == 12
+    assert df.dte.tolist() == [30] * 6 + [58] * 6
+    assert df.strike.tolist()[:6] == [90.0, 90.0, 100.0, 100.0, 110.0, 110.0]
+    assert df.option_type.tolist()[:2] == ["call", "put"]
+    assert (
+        df.Breakeven == df.strike + df.ask.where(df.option_type == "call", -df.ask)
+    ).all()
+
+
+def test_filter_data(eod_chains):
+    """Test the filters select the contracts of the nearest expiration."""
+    df = eod_chains.filter_data(date=25, moneyness="otm")
+
+    assert df.expiration.astype(str).unique().tolist() == ["2024-12-20"]
+    assert df.strike.tolist() == [110.0, 90.0, 100.0]
+    assert df.option_type.tolist() == ["call", "put", "put"]
+
+    df = eod_chains.filter_data(option_type="put", column="bid", value_min=2)
+    assert df.bid.min() >= 2
+    assert (df.option_type == "put").all()
+
+
+def test_total_dex(eod_chains):
+    """Test the DEX stats are absolute, without changing the chains."""
+    total = eod_chains.total_dex["total"]
+
+    assert total["Calls"] == total["Puts"] == 6 * 50500
+    assert (eod_chains.dataframe.DEX < 0).sum() == 6
+
+
+def test_straddle(eod_chains):
+    """Test the straddle is priced from the nearest out of the money strikes."""
+    straddle = eod_chains.straddle(days=30)["Long Straddle"]
+
+    assert straddle["Expiration"] == "2024-12-20"
+    assert straddle["DTE"] == 30
+    assert straddle["Strike 1"] == 110.0
+    assert straddle["Strike 2"] == 100.0
+    assert straddle["Cost"] == pytest.approx(1.3 + 1.6)
+
+
+def test_last_price(eod_chains):
+    """Test setting the last price indexes the chains again."""
+    assert eod_chains.filter_data(date=30, moneyness="otm").strike.tolist()[0] == 110.0
+
+    eod_chains.last_price = 95.0
+
+    df = eod_chains.filter_data(date=30, moneyness="otm")
+    assert (eod_chains.dataframe.underlying_price == 95.0).all()
+    assert df.strike.tolist() == [100.0, 110.0, 90.0]
@@ -0,0 +1,155 @@
+"""Test the rate limit."""
+
+import asyncio
+from email.utils import formatdate
+from time import time
+
+import pytest
+from aiohttp import web
+from openbb_core.provider.utils.client import ClientSession
+from openbb_core.provider.utils.rate_limit import RateLimit, current_rate_limit
+
+# pylint: disable=protected-access
+
+
+class MockResponse:
+    """Mock response."""
+
+    def __init__(self, status: int, headers: dict = None):
+        """Initialize the mock response."""
+        self.status = status
+        self.headers = headers or {}
+        self.released = False
+
+    def release(self):
+        """Release the response."""
+        self.released = True
+
+
+def test_reserve():
+    """Test the bucket allows a burst, then waits."""
+    limit = RateLimit(requests=2, period=1)
+
+    assert limit.reserve() == 0
+    assert limit.reserve() == 0
+    assert limit.reserve() == pytest.approx(0.5, abs=0.05)
+    assert limit.reserve() == pytest.approx(1, abs=0.05)
+
+
+def test_reserve_unlimited():
+    """Test no wait without a request limit."""
+    limit = RateLimit(max_concurrent=2)
+
+    assert all(limit.reserve() == 0 for _ in range(100))
+
+
+def test_pause():
+    """Test a pause holds the requests."""
+    limit = RateLimit()
+    limit.pause(2)
+
+    assert limit.reserve() == pytest.approx(2, abs=0.05)
+
+
+@pytest.mark.parametrize(
+    "headers, attempt, expected",
+    [
+        ({"Retry-After": "3"}, 0, 3),
+        ({"Retry-After": "1000"}, 0, 60),
+        ({"Retry-After": formatdate(time() + 3600, usegmt=True)}, 0, 60),
+        ({"Retry-After": formatdate(time() - 3600, usegmt=True)}, 0, 0),
+        ({"Retry-After": "soon"}, 1, 1),
+        ({}, 0, 0.5),
+        ({}, 2, 2),
+        (None, 10, 60),
+    ],
+)
+def test_get_retry_delay(headers, attempt, expected):
+    """Test the delay before a retry."""
+    delay = RateLimit().get_retry_delay(attempt, headers)
+
+    assert delay == pytest.approx(expected, abs=1)
+
+
+@pytest.mark.asyncio
+async def test_call_retries():
+    """Test responses with a retry status are retried."""
+    limit = RateLimit(backoff=0)
+    responses = [
+        MockResponse(429, {"Retry-After": "0"}),
+        MockResponse(503),
+        MockResponse(200),
+    ]
+    sent = iter(responses)
+
+    async def send():
+        return next(sent)
+
+    response = await limit.call(send)
+
+    assert response.status == 200
+    assert responses[0].released and responses[1].released
+
+
+@pytest.mark.asyncio
+async def test_call_max_retries():
+    """Test the last response is returned when the retries are exhausted."""
+    limit = RateLimit(max_retries=2, backoff=0)
+    calls = []
+
+    async def send():
+        calls.append(1)
+        return MockResponse(429)
+
+    response = await limit.call(send)
+
+    assert response.status == 429
+    assert len(calls) == 3
+
+
+@pytest.mark.asyncio
+async def test_call_max_concurrent():
+    """Test the number of requests in flight is bounded."""
+    limit = RateLimit(max_concurrent=3)
+    in_flight = []
+    peak = []
+
+    async def send():
+        in_flight.append(1)
+        peak.append(len(in_flight))
+        await asyncio.sleep(0.01)
+        in_flight.pop()
+        return MockResponse(200)
+
+    await asyncio.gather(*[limit.call(send) for _ in range(20)])
+
+    assert max(peak) == 3
+
+
+@pytest.mark.asyncio
+async def test_client_session_rate_limit(unused_tcp_port):
+    """Test the client session sends requests within the current rate limit."""
+    calls = []
+
+    async def handler(_):
+        calls.append(1)
+        if len(calls) == 1:
+            return web.Response(status=429, headers={"Retry-After": "0"})
+        return web.json_response({"ok": True})
+
+    app = web.Application()
+    app.router.add_get("/", handler)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    await web.TCPSite(runner, "127.0.0.1", unused_tcp_port).start()
+
+    token = current_rate_limit.set(RateLimit(max_concurrent=1))
+    try:
+        async with ClientSession() as session:
+            data = await session.get_json(f"http://127.0.0.1:{unused_tcp_port}/")
+    finally:
+        current_rate_limit.reset(token)
+        await runner.cleanup()
+
+    assert data == {"ok": True}
+    assert len(calls) == 2
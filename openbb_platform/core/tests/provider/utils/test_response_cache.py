@@ -0,0 +1,80 @@
+"""Test the response cache."""
+
+from unittest.mock import patch
+
+from openbb_core.provider.utils.response_cache import (
+    ResponseCache,
+    cache_stats,
+    get_cache_key,
+    get_cache_ttl,
+    record_cache_event,
+)
+
+
+def test_get_cache_ttl():
+    """Test the most specific time to live is used."""
+    settings = {"ttl": {"fmp.EquityHistorical": 10, "EquityHistorical": 20, "*": 30}}
+
+    assert get_cache_ttl(settings, "fmp", "EquityHistorical") == 10
+    assert get_cache_ttl(settings, "polygon", "EquityHistorical") == 20
+    assert get_cache_ttl(settings, "fmp", "EquityQuote") == 30
+    assert get_cache_ttl({}, "fmp", "EquityQuote") == 0
+
+
+def test_get_cache_key():
+    """Test the cache key ignores ordering and None values."""
+    key = get_cache_key("fmp", "EquityHistorical", {"symbol": "AAPL", "limit": None})
+
+    assert key == get_cache_key("fmp", "EquityHistorical", {"symbol": "AAPL"})
+    assert key != get_cache_key("fmp", "EquityHistorical", {"symbol": "MSFT"})
+    assert key != get_cache_key("yfinance", "EquityHistorical", {"symbol": "AAPL"})
+
+
+def test_record_cache_event():
+    """Test cache events are only counted inside a command."""
+    record_cache_event("hits")
+    stats: dict = {}
+    token = cache_stats.set(stats)
+    record_cache_event("hits")
+    record_cache_event("misses")
+    cache_stats.reset(token)
+
+    assert stats == {"hits": 1, "misses": 1}
+
+
+def test_response_cache_memory():
+    """Test the in-memory tier and its LRU eviction."""
+    cache = ResponseCache(memory_items=2)
+    cache.set("a", [1], 60)
+    cache.set("b", [2], 60)
+    cache.get("a")
+    cache.set("c", [3], 60)
+
+    assert cache.get("a") == (True, [1])
+    assert cache.get("b") == (False, None)
+    assert cache.get("c") == (True, [3])
+
+
+def test_response_cache_expired():
+    """Test expired entries are not returned."""
+    cache = ResponseCache()
+
+    with patch("openbb_core.provider.utils.response_cache.time", return_value=0):
+        cache.set("a", [1], 60)
+
+    with patch("openbb_core.provider.utils.response_cache.time", return_value=61):
+        assert cache.get("a") == (False, None)
+
+
+def test_response_cache_disk(tmp_path):
+    """Test the disk tier persists between instances and is trimmed by size."""
+    cache = ResponseCache(str(tmp_path), memory_items=0, disk_size=1)
+    cache.set("a", b"x" * 400_000, 60)
+    cache.set("b", b"y" * 400_000, 60)
+
+    assert ResponseCache(str(tmp_path)).get("b")[0]
+
+    cache.set("c", b"z" * 400_000, 60)
+
+    assert cache.get("a") == (False, None)
+    assert cache.get("c")[0]
@@ -0,0 +1,134 @@
+"""Test the single flight."""
+
+import asyncio
+import warnings
+
+import pytest
+from openbb_core.provider.utils.response_cache import cache_stats
+from openbb_core.provider.utils.single_flight import SingleFlight
+
+
+def test_single_flight():
+    """Test concurrent calls with the same key run once, and get a copy of the result."""
+    single_flight = SingleFlight()
+    calls = []
+
+    async def func():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return {"results": [1, 2]}
+
+    async def main():
+        stats: dict = {}
+        token = cache_stats.set(stats)
+        results = await asyncio.gather(
+            single_flight.run("a", func),
+            single_flight.run("a", func),
+            single_flight.run("b", func),
+        )
+        cache_stats.reset(token)
+        return results, stats
+
+    (first, second, other), stats = asyncio.run(main())
+
+    assert len(calls) == 2
+    assert first == second == other == {"results": [1, 2]}
+    assert first is not second
+    assert stats == {"coalesced": 1}
+    assert not single_flight
+
+
+def test_single_flight_sequential():
+    """Test a call made after the previous one finished runs again."""
+    single_flight = SingleFlight()
+    calls = []
+
+    async def func():
+        calls.append(1)
+        return 1
+
+    async def main():
+        await single_flight.run("a", func)
+        await single_flight.run("a", func)
+
+    asyncio.run(main())
+
+    assert len(calls) == 2
+
+
+def test_single_flight_error():
+    """Test every waiting call gets the error."""
+    single_flight = SingleFlight()
+
+    async def func():
+        await asyncio.sleep(0.01)
+        raise ValueError("Failed.")
+
+    async def main():
+        return await asyncio.gather(
+            single_flight.run("a", func),
+            single_flight.run("a", func),
+            return_exceptions=True,
+        )
+
+    results = asyncio.run(main())
+
+    assert all(isinstance(r, ValueError) for r in results)
+    assert not single_flight
+
+
+def test_single_flight_warnings():
+    """Test every waiting call gets the warnings."""
+    single_flight = SingleFlight()
+
+    async def func():
+        await asyncio.sleep(0.01)
+        warnings.warn("Partial results.", UserWarning)
+        return 1
+
+    async def main():
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always")
+            await asyncio.gather(
+                single_flight.run("a", func), single_flight.run("a", func)
+            )
+        return [str(w.message) for w in caught]
+
+    assert asyncio.run(main()) == ["Partial results.", "Partial results."]
+
+
+@pytest.mark.parametrize("result", [None, [1], {"a": 1}])
+def test_single_flight_result(result):
+    """Test the result is returned as is to the call that ran."""
+    single_flight = SingleFlight()
+
+    async def func():
+        return result
+
+    assert asyncio.run(single_flight.run("a", func)) is result
+
+
+def test_single_flight_cancelled():
+    """Test cancelling the first call does not cancel the call for the others."""
+    single_flight = SingleFlight()
+    calls = []
+
+    async def func():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return 1
+
+    async def main():
+        first = asyncio.ensure_future(single_flight.run("a", func))
+        await asyncio.sleep(0)
+        second = asyncio.ensure_future(single_flight.run("a", func))
+        await asyncio.sleep(0.01)
+        first.cancel()
+        return await asyncio.gather(first, second, return_exceptions=True)
+
+    first, second = asyncio.run(main())
+
+    assert isinstance(first, asyncio.CancelledError)
+    assert second == 1
+    assert len(calls) == 1
+    assert not single_flight
@@ -0,0 +1,179 @@
+"""Test the incremental time series cache."""
+
+from datetime import date, timedelta
+
+import pytest
+from openbb_core.provider.abstract.annotated_result import AnnotatedResult
+from openbb_core.provider.abstract.data import Data
+from openbb_core.provider.utils.errors import EmptyDataError
+from openbb_core.provider.utils.timeseries_cache import (
+    TimeSeriesCache,
+    _get_gaps,
+    _merge,
+    fetch_incremental,
+    is_incremental,
+)
+
+# pylint: disable=protected-access
+
+TODAY = date(2024, 1, 31)
+
+
+class MockProvider:
+    """Mock provider with one bar per day."""
+
+    def __init__(self, adjustment: float = 1.0):
+        """Initialize the mock provider."""
+        self.calls: list = []
+        self.adjustment = adjustment
+
+    async def fetch(self, start: date, end: date):
+        """Return one row per day between start and end."""
+        self.calls.append((start, end))
+        days = (end - start).days + 1
+        rows = [
+            Data(
+                date=start + timedelta(days=i), close=(start.day + i) * self.adjustment
+            )
+            for i in range(days)
+        ]
+        if not rows:
+            raise EmptyDataError()
+        return rows
+
+
+def test_is_incremental():
+    """Test the incremental cache is only enabled for supported models."""
+    settings = {"incremental": ["fmp.EquityHistorical", "FredSeries"]}
+
+    assert is_incremental(settings, "fmp", "EquityHistorical")
+    assert not is_incremental(settings, "yfinance", "EquityHistorical")
+    assert is_incremental(settings, "fred", "FredSeries")
+    assert not is_incremental({"incremental": ["*"]}, "fmp", "EquityQuote")
+
+
+def test_get_gaps():
+    """Test the missing ranges are found."""
+    coverage = _merge(
+        [(date(2024, 1, 5), date(2024, 1, 10)), (date(2024, 1, 11), date(2024, 1, 15))]
+    )
+
+    assert coverage == [(date(2024, 1, 5), date(2024, 1, 15))]
+    assert _get_gaps(coverage, date(2024, 1, 1), date(2024, 1, 20)) == [
+        (date(2024, 1, 1), date(2024, 1, 4)),
+        (date(2024, 1, 16), date(2024, 1, 20)),
+    ]
+    assert not _get_gaps(coverage, date(2024, 1, 6), date(2024, 1, 9))
+
+
+@pytest.mark.asyncio
+async def test_fetch_incremental_only_fetches_gaps():
+    """Test a moving window only fetches the new days and the refresh window."""
+    cache = TimeSeriesCache()
+    provider = MockProvider()
+
+    rows = await fetch_incremental(
+        cache, "s", date(2024, 1, 1), date(2024, 1, 20), provider.fetch, today=TODAY
+    )
+    assert len(rows) == 20
+
+    rows = await fetch_incremental(
+        cache, "s", date(2024, 1, 2), date(2024, 1, 21), provider.fetch, today=TODAY
+    )
+    assert len(rows) == 20
+    assert rows[0].date == date(2024, 1, 2)
+    assert provider.calls == [
+        (date(2024, 1, 1), date(2024, 1, 20)),
+        (date(2024, 1, 20), date(2024, 1, 21)),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_fetch_incremental_refreshes_recent_days():
+    """Test the days within the refresh window are fetched again."""
+    cache = TimeSeriesCache()
+    provider = MockProvider()
+
+    await fetch_incremental(
+        cache, "s", date(2024, 1, 25), TODAY, provider.fetch, today=TODAY
+    )
+    await fetch_incremental(
+        cache, "s", date(2024, 1, 25), TODAY, provider.fetch, today=TODAY
+    )
+
+    assert provider.calls[-1] == (date(2024, 1, 30), TODAY)
+
+
+@pytest.mark.asyncio
+async def test_fetch_incremental_adjustment_change():
+    """Test the series is fetched again when a cached row changed."""
+    cache = TimeSeriesCache()
+
+    await fetch_incremental(
+        cache,
+        "s",
+        date(2024, 1, 1),
+        date(2024, 1, 10),
+        MockProvider().fetch,
+        today=TODAY,
+    )
+    adjusted = MockProvider(adjustment=0.5)
+    rows = await fetch_incremental(
+        cache, "s", date(2024, 1, 1), date(2024, 1, 12), adjusted.fetch, today=TODAY
+    )
+
+    assert adjusted.calls == [
+        (date(2024, 1, 10), date(2024, 1, 12)),
+        (date(2024, 1, 1), date(2024, 1, 12)),
+    ]
+    assert [r.close for r in rows] == [i * 0.5 for i in range(1, 13)]
+
+
+@pytest.mark.asyncio
+async def test_fetch_incremental_annotated_result():
+    """Test the metadata of annotated results is kept."""
+    cache = TimeSeriesCache()
+
+    async def fetch(start, end):
+        return AnnotatedResult(
+            result=await MockProvider().fetch(start, end), metadata={"title": "Test"}
+        )
+
+    await fetch_incremental(
+        cache, "s", date(2024, 1, 1), date(2024, 1, 5), fetch, today=TODAY
+    )
+    result = await fetch_incremental(
+        cache, "s", date(2024, 1, 1), date(2024, 1, 5), fetch, today=TODAY
+    )
+
+    assert isinstance(result, AnnotatedResult)
+    assert result.metadata == {"title": "Test"}
+    assert len(result.result) == 5
+
+
+@pytest.mark.asyncio
+async def test_fetch_incremental_empty():
+    """Test empty results raise EmptyDataError."""
+
+    async def fetch(start, end):
+        raise EmptyDataError()
+
+    with pytest.raises(EmptyDataError):
+        await fetch_incremental(
+            TimeSeriesCache(), "s", date(2024, 1, 1), date(2024, 1, 5), fetch
+        )
+
+
+def test_time_series_cache_persists(tmp_path):
+    """Test the store persists between instances."""
+    TimeSeriesCache(str(tmp_path)).put(
+        "s",
+        [Data(date=date(2024, 1, 2), close=1.0)],
+        (date(2024, 1, 1), date(2024, 1, 3)),
+    )
+    cache = TimeSeriesCache(str(tmp_path))
+
+    assert cache.get_coverage("s") == [(date(2024, 1, 1), date(2024, 1, 3))]
+    assert cache.get_rows("s", date(2024, 1, 1), date(2024, 1, 3))[0].close == 1.0
+    cache.drop("s")
+    assert not cache.get_coverage("s")
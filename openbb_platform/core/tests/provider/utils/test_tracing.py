@@ -0,0 +1,127 @@
+"""Test the tracing utilities."""
+
+import sys
+import tracemalloc
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+from openbb_core.provider.abstract.annotated_result import AnnotatedResult
+from openbb_core.provider.utils.tracing import (
+    Metrics,
+    count_rows,
+    current_spans,
+    export_spans,
+    is_tracing,
+    span,
+)
+
+
+def test_span():
+    """Test a span is recorded with its attributes, only in a command."""
+    with span("outside") as attributes:
+        attributes["rows"] = 1
+
+    spans: list = []
+    token = current_spans.set(spans)
+    try:
+        assert is_tracing()
+        with span("stage", provider="fmp") as attributes:
+            attributes["rows"] = 2
+    finally:
+        current_spans.reset(token)
+
+    assert not is_tracing()
+    assert len(spans) == 1
+    assert spans[0]["name"] == "stage"
+    assert spans[0]["duration"] >= 0
+    assert spans[0]["attributes"] == {"provider": "fmp", "rows": 2}
+
+
+def test_span_memory():
+    """Test the memory allocated by a stage is recorded when tracemalloc is tracing."""
+    spans: list = []
+    token = current_spans.set(spans)
+    tracemalloc.start()
+    try:
+        with span("stage"):
+            data = [0] * 100_000
+    finally:
+        tracemalloc.stop()
+        current_spans.reset(token)
+
+    assert data
+    assert spans[0]["attributes"]["memory"] >= 800_000
+
+
+def test_count_rows():
+    """Test the rows of a fetcher result are counted."""
+    assert count_rows([1, 2, 3]) == 3
+    assert count_rows({"a": 1}) == 1
+    assert count_rows(None) == 0
+    assert count_rows(AnnotatedResult(result=[1, 2], metadata={})) == 2
+
+
+def test_metrics():
+    """Test the metrics are rendered in the Prometheus text format."""
+    metrics = Metrics()
+    spans = [
+        {"name": "extract_data", "start": 0, "duration": 500_000_000},
+        {
+            "name": "http",
+            "start": 0,
+            "duration": 250_000_000,
+            "attributes": {"status": 200, "bytes": 1024},
+        },
+    ]
+
+    metrics.observe("/equity/price/quote", 1_000_000_000, spans)
+    metrics.observe('/a"b', 2_000_000_000, [], error=True)
+    text = metrics.render()
+
+    assert "# TYPE openbb_command_duration_seconds summary" in text
+    assert (
+        'openbb_command_duration_seconds_count{route="/equity/price/quote"} 1.0' in text
+    )
+    assert (
+        'openbb_command_duration_seconds_sum{route="/equity/price/quote"} 1.0' in text
+    )
+    assert 'openbb_command_errors_total{route="/a\\"b"} 1.0' in text
+    assert (
+        'openbb_stage_duration_seconds_sum{route="/equity/price/quote",stage="extract_data"} 0.5'
+        in text
+    )
+    assert (
+        'openbb_http_requests_total{route="/equity/price/quote",status="200"} 1.0'
+        in text
+    )
+    assert (
+        'openbb_http_response_bytes_total{route="/equity/price/quote"} 1024.0' in text
+    )
+
+    metrics.clear()
+    assert metrics.render() == "\n"
+
+
+def test_export_spans():
+    """Test the spans are exported as children of the command span."""
+    tracer = MagicMock()
+    trace = SimpleNamespace(
+        get_tracer=lambda name: tracer, set_span_in_context=lambda span: "context"
+    )
+    spans = [
+        {"name": "http", "start": 110, "duration": 30, "attributes": {"status": 200}}
+    ]
+
+    with patch.dict(sys.modules, {"opentelemetry": SimpleNamespace(trace=trace)}):
+        export_spans("/route", 100, 1_000, spans)
+
+    parent_call, child_call = tracer.start_span.call_args_list
+    assert parent_call.args == ("/route",)
+    assert parent_call.kwargs == {"start_time": 1_000}
+    assert child_call.args == ("http",)
+    assert child_call.kwargs == {
+        "context": "context",
+        "start_time": 1_010,
+        "attributes": {"status": 200},
+    }
+    tracer.start_span.return_value.end.assert_any_call(end_time=1_040)
@@ -961,7 +961,7 @@ def variance_inflation_factor(
     # pylint: disable=import-outside-toplevel
     from openbb_core.app.utils import (
         basemodel_to_df,
-        df_to_basemodel,
+        df_to_datatable,
     )
     from pandas import DataFrame
     from statsmodels.stats.outliers_influence import variance_inflation_factor as vif
@@ -981,5 +981,5 @@ def variance_inflation_factor(
     for i in range(len(df.columns))[1:]:
         vif_values[f"{df.columns[i]}"] = vif(df.values, i)
 
-    results = df_to_basemodel(DataFrame(vif_values, index=[0]))
+    results = df_to_datatable(DataFrame(vif_values, index=[0]))
     return OBBject(results=results)
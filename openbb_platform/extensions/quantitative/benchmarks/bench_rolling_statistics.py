@@ -0,0 +1,61 @@
+"""Benchmark the rolling statistics against a function applied to each window.
+
+Compares `rolling(window).apply` with the statistics functions, as the rolling
+commands computed them, with the running power sums of `rolling_moments` and
+the skip list of `rolling_quantiles`.
+
+Usage: python benchmarks/bench_rolling_statistics.py [--rows N] [--windows N ...]
+"""
+
+import argparse
+from time import perf_counter
+
+import numpy as np
+import pandas as pd
+from openbb_quantitative.rolling_statistics import rolling_moments, rolling_quantiles
+from openbb_quantitative.statistics import kurtosis_, mean_, skew_, std_dev_, var_
+
+FUNCTIONS = {
+    "mean": mean_,
+    "variance": var_,
+    "stdev": std_dev_,
+    "skew": skew_,
+    "kurtosis": kurtosis_,
+}
+
+
+def _run(rows: int, windows: list) -> None:
+    """Run the benchmark."""
+    values = np.random.default_rng(0).normal(0, 0.01, rows)
+    series = pd.Series(values)
+
+    print(f"{rows} rows")  # noqa: T201
+    for window in windows:
+        start = perf_counter()
+        for func in FUNCTIONS.values():
+            series.rolling(window).apply(func)
+        series.rolling(window).quantile(0.25)
+        per_window = perf_counter() - start
+
+        start = perf_counter()
+        rolling_moments(values, window)
+        rolling_quantiles(values, window, [0.25])
+        streaming = perf_counter() - start
+
+        print(  # noqa: T201
+            f"  window {window:5d}: apply {per_window:8.3f} s, "
+            f"streaming {streaming:7.4f} s, {per_window / streaming:8.1f}x"
+        )
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=5_000)
+    parser.add_argument("--windows", type=int, nargs="+", default=[21, 252, 1260])
+    ns = parser.parse_args()
+    _run(ns.rows, ns.windows)
+
+
+if __name__ == "__main__":
+    main()
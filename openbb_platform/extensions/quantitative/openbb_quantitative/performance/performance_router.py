@@ -159,7 +159,7 @@ def sharpe_ratio(
     from numpy import sqrt
     from openbb_core.app.utils import (
         basemodel_to_df,
-        df_to_basemodel,
+        df_to_datatable,
         get_target_column,
     )
     from openbb_quantitative.helpers import validate_window
@@ -172,7 +172,7 @@ def sharpe_ratio(
     std = series_target.rolling(window).std() / sqrt(window)
     results = ((returns - rfr) / std).dropna().reset_index(drop=False)
 
-    results = df_to_basemodel(results)
+    results = df_to_datatable(results)
 
     return OBBject(results=results)
 
@@ -246,7 +246,7 @@ def sortino_ratio(
     from numpy import sqrt
     from openbb_core.app.utils import (
         basemodel_to_df,
-        df_to_basemodel,
+        df_to_datatable,
         get_target_column,
     )
     from openbb_quantitative.helpers import validate_window
@@ -266,6 +266,6 @@ def sortino_ratio(
 
     if adjusted:
         results = results.applymap(lambda x: x / sqrt(2) if isinstance(x, float) else x)
-    results_ = df_to_basemodel(results)
+    results_ = df_to_datatable(results)
 
     return OBBject(results=results_)
@@ -63,20 +63,19 @@ def skew(
     # pylint: disable=import-outside-toplevel
     from openbb_core.app.utils import (
         basemodel_to_df,
-        df_to_basemodel,
+        df_to_datatable,
         get_target_column,
     )
     from openbb_quantitative.helpers import validate_window
-    from openbb_quantitative.statistics import skew_
+    from openbb_quantitative.rolling_statistics import get_rolling_results
 
     df = basemodel_to_df(data, index=index)
     series_target = get_target_column(df, target)
-    series_target.name = f"rolling_skew_{window}"
     validate_window(series_target, window)
-    results = (
-        series_target.rolling(window).apply(skew_).dropna().reset_index(drop=False)
+    results = get_rolling_results(
+        df, target, window, {f"rolling_skew_{window}": "skew"}
     )
-    results = df_to_basemodel(results)
+    results = df_to_datatable(results)
 
     return OBBject(results=results)
 
@@ -132,18 +131,19 @@ def variance(
     # pylint: disable=import-outside-toplevel
     from openbb_core.app.utils import (
         basemodel_to_df,
-        df_to_basemodel,
+        df_to_datatable,
         get_target_column,
     )
     from openbb_quantitative.helpers import validate_window
-    from openbb_quantitative.statistics import var_
+    from openbb_quantitative.rolling_statistics import get_rolling_results
 
     df = basemodel_to_df(data, index=index)
     series_target = get_target_column(df, target)
-    series_target.name = f"rolling_var_{window}"
     validate_window(series_target, window)
-    results = series_target.rolling(window).apply(var_).dropna().reset_index(drop=False)
-    results = df_to_basemodel(results)
+    results = get_rolling_results(
+        df, target, window, {f"rolling_var_{window}": "variance"}
+    )
+    results = df_to_datatable(results)
 
     return OBBject(results=results)
 
@@ -200,20 +200,19 @@ def stdev(
     # pylint: disable=import-outside-toplevel
     from openbb_core.app.utils import (
         basemodel_to_df,
-        df_to_basemodel,
+        df_to_datatable,
         get_target_column,
     )
     from openbb_quantitative.helpers import validate_window
-    from openbb_quantitative.statistics import std_dev_
+    from openbb_quantitative.rolling_statistics import get_rolling_results
 
     df = basemodel_to_df(data, index=index)
     series_target = get_target_column(df, target)
-    series_target.name = f"rolling_stdev_{window}"
     validate_window(series_target, window)
-    results = (
-        series_target.rolling(window).apply(std_dev_).dropna().reset_index(drop=False)
+    results = get_rolling_results(
+        df, target, window, {f"rolling_stdev_{window}": "stdev"}
     )
-    results = df_to_basemodel(results)
+    results = df_to_datatable(results)
 
     return OBBject(results=results)
 
@@ -272,20 +271,19 @@ def kurtosis(
     # pylint: disable=import-outside-toplevel
     from openbb_core.app.utils import (
         basemodel_to_df,
-        df_to_basemodel,
+        df_to_datatable,
         get_target_column,
     )
     from openbb_quantitative.helpers import validate_window
-    from openbb_quantitative.statistics import kurtosis_
+    from openbb_quantitative.rolling_statistics import get_rolling_results
 
     df = basemodel_to_df(data, index=index)
     series_target = get_target_column(df, target)
-    series_target.name = f"rolling_kurtosis_{window}"
     validate_window(series_target, window)
-    results = (
-        series_target.rolling(window).apply(kurtosis_).dropna().reset_index(drop=False)
+    results = get_rolling_results(
+        df, target, window, {f"rolling_kurtosis_{window}": "kurtosis"}
     )
-    results = df_to_basemodel(results)
+    results = df_to_datatable(results)
 
     return OBBject(results=results)
 
@@ -349,32 +347,25 @@ def quantile(
     # pylint: disable=import-outside-toplevel
     from openbb_core.app.utils import (
         basemodel_to_df,
-        df_to_basemodel,
+        df_to_datatable,
         get_target_column,
     )
     from openbb_quantitative.helpers import validate_window
-    from pandas import concat
+    from openbb_quantitative.rolling_statistics import get_rolling_results
 
     df = basemodel_to_df(data, index=index)
     series_target = get_target_column(df, target)
     validate_window(series_target, window)
-    roll = series_target.rolling(window)
-    df_median = roll.median()
-    df_quantile = roll.quantile(quantile_pct)
-    results = (
-        concat(
-            [df_median, df_quantile],
-            axis=1,
-            keys=[
-                f"rolling_median_{window}",
-                f"rolling_quantile_{quantile_pct}_{window}",
-            ],
-        )
-        .dropna()
-        .reset_index(drop=False)
+    results = get_rolling_results(
+        df,
+        target,
+        window,
+        {
+            f"rolling_median_{window}": "quantile_0.5",
+            f"rolling_quantile_{quantile_pct}_{window}": f"quantile_{quantile_pct}",
+        },
     )
-
-    results = df_to_basemodel(results)
+    results = df_to_datatable(results)
 
     return OBBject(results=results)
 
@@ -430,19 +421,18 @@ def mean(
     # pylint: disable=import-outside-toplevel
     from openbb_core.app.utils import (
         basemodel_to_df,
-        df_to_basemodel,
+        df_to_datatable,
         get_target_column,
     )
     from openbb_quantitative.helpers import validate_window
-    from openbb_quantitative.statistics import mean_
+    from openbb_quantitative.rolling_statistics import get_rolling_results
 
     df = basemodel_to_df(data, index=index)
     series_target = get_target_column(df, target)
-    series_target.name = f"rolling_mean_{window}"
     validate_window(series_target, window)
-    results = (
-        series_target.rolling(window).apply(mean_).dropna().reset_index(drop=False)
+    results = get_rolling_results(
+        df, target, window, {f"rolling_mean_{window}": "mean"}
     )
-    results = df_to_basemodel(results)
+    results = df_to_datatable(results)
 
     return OBBject(results=results)
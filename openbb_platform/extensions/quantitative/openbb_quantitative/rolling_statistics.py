@@ -0,0 +1,244 @@
+"""Rolling Statistics Functions."""
+
+from typing import TYPE_CHECKING, Dict, Iterable, Optional
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from pandas import DataFrame
+
+MOMENTS = ("mean", "variance", "stdev", "skew", "kurtosis")
+
+# Relative resolution below which the variance of a window is treated as zero, as in scipy.stats.
+_RESOLUTION = np.finfo(np.float64).resolution * 10
+
+
+def _get_window_sums(values: np.ndarray, window: int) -> tuple:
+    """Get the power sums, up to the fourth, of every window ending at each row.
+
+    The rows are split in blocks of `window` rows, so a window spans the end of the
+    previous block and the start of its own. The sums are accumulated around the mean
+    of the block the window ends in, and never over more than a block, which keeps
+    them accurate for series that drift far from zero.
+
+    Returns
+    -------
+    tuple
+        The shift of each window, and the sums of the 1st to 4th powers of the rows
+        minus the shift, each an array with the shape of `values`.
+    """
+    n, m = values.shape
+    blocks = -(-n // window)
+    padded = np.full((blocks * window, m), np.nan)
+    padded[:n] = values
+    padded = padded.reshape(blocks, window, m)
+    valid = ~np.isnan(padded)
+
+    count = valid.sum(axis=1)
+    shift = np.where(valid, padded, 0).sum(axis=1) / np.maximum(count, 1)
+
+    own = np.where(valid, padded - shift[:, None, :], 0)
+    previous = np.zeros_like(own)
+    previous[1:] = np.where(valid[:-1], padded[:-1] - shift[1:, None, :], 0)
+
+    own_power = np.ones_like(own)
+    previous_power = np.ones_like(previous)
+    sums = []
+    for _ in range(4):
+        own_power = own_power * own
+        previous_power = previous_power * previous
+        # Rows after each position in the previous block.
+        tail = np.cumsum(previous_power[:, ::-1], axis=1)[:, ::-1]
+        tail = np.concatenate([tail[:, 1:], np.zeros_like(tail[:, :1])], axis=1)
+        sums.append((np.cumsum(own_power, axis=1) + tail).reshape(-1, m)[:n])
+
+    shift = np.repeat(shift, window, axis=0)[:n]
+    return (shift, *sums)
+
+
+def get_valid_windows(
+    values: np.ndarray, window: int, groups: Optional[np.ndarray] = None
+) -> np.ndarray:
+    """Get the mask of the full windows without missing values and within a single group.
+
+    Parameters
+    ----------
+    values : np.ndarray
+        The rows by columns array of values.
+    window : int
+        The number of rows in a window.
+    groups : Optional[np.ndarray]
+        The group code of each row, with the rows of each group contiguous.
+
+    Returns
+    -------
+    np.ndarray
+        The mask of the windows ending at each row, with the shape of `values`.
+    """
+    n = values.shape[0]
+    missing = np.cumsum(np.isnan(values), axis=0)
+    missing = np.vstack([np.zeros((1, values.shape[1])), missing])
+    valid = np.zeros(values.shape, dtype=bool)
+    if n < window:
+        return valid
+    valid[window - 1 :] = (missing[window:] - missing[: n - window + 1]) == 0
+    if groups is not None:
+        same_group = np.zeros(n, dtype=bool)
+        same_group[window - 1 :] = groups[window - 1 :] == groups[: n - window + 1]
+        valid &= same_group[:, None]
+    return valid
+
+
+def rolling_moments(
+    values: np.ndarray,
+    window: int,
+    groups: Optional[np.ndarray] = None,
+) -> Dict[str, np.ndarray]:
+    """Get the rolling mean, variance, standard deviation, skew and kurtosis of each column.
+
+    The moments of every window come from running power sums, in O(n) for each
+    column. They match `numpy.mean`, `numpy.var`, `numpy.std`, `scipy.stats.skew`
+    and `scipy.stats.kurtosis` applied to each window.
+
+    Parameters
+    ----------
+    values : np.ndarray
+        The rows by columns array of values.
+    window : int
+        The number of rows in a window.
+    groups : Optional[np.ndarray]
+        The group code of each row, with the rows of each group contiguous.
+        Windows spanning more than one group are missing.
+
+    Returns
+    -------
+    Dict[str, np.ndarray]
+        The statistics by name, with NaN where a window is incomplete.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    if values.ndim == 1:
+        values = values[:, None]
+
+    shift, s1, s2, s3, s4 = _get_window_sums(values, window)
+    m1 = s1 / window
+    m2 = np.maximum(s2 / window - m1**2, 0)
+    m3 = s3 / window - 3 * m1 * s2 / window + 2 * m1**3
+    m4 = s4 / window - 4 * m1 * s3 / window + 6 * m1**2 * s2 / window - 3 * m1**4
+
+    mean = shift + m1
+    valid = get_valid_windows(values, window, groups)
+    constant = m2 <= (_RESOLUTION * mean) ** 2
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        skew = np.where(constant, np.nan, m3 / m2**1.5)
+        kurtosis = np.where(constant, np.nan, m4 / m2**2 - 3)
+
+    results = {
+        "mean": mean,
+        "variance": m2,
+        "stdev": np.sqrt(m2),
+        "skew": skew,
+        "kurtosis": kurtosis,
+    }
+    return {k: np.where(valid, v, np.nan) for k, v in results.items()}
+
+
+def rolling_quantiles(
+    values: np.ndarray,
+    window: int,
+    quantiles: Iterable[float],
+    groups: Optional[np.ndarray] = None,
+) -> Dict[float, np.ndarray]:
+    """Get rolling quantiles of each column, with linear interpolation.
+
+    The windows are kept in the sorted skip list of the pandas rolling quantile, so
+    each row is inserted and removed in O(log window), for all columns in one call.
+
+    Parameters
+    ----------
+    values : np.ndarray
+        The rows by columns array of values.
+    window : int
+        The number of rows in a window.
+    quantiles : Iterable[float]
+        The quantiles to compute, between 0 and 1.
+    groups : Optional[np.ndarray]
+        The group code of each row, with the rows of each group contiguous.
+
+    Returns
+    -------
+    Dict[float, np.ndarray]
+        The rolling values by quantile, with NaN where a window is incomplete.
+    """
+    # pylint: disable=import-outside-toplevel
+    from pandas import DataFrame
+
+    values = np.asarray(values, dtype=np.float64)
+    if values.ndim == 1:
+        values = values[:, None]
+
+    valid = get_valid_windows(values, window, groups)
+    rolling = DataFrame(values).rolling(window)
+    return {
+        q: np.where(valid, rolling.quantile(q).to_numpy(), np.nan) for q in quantiles
+    }
+
+
+def get_rolling_results(
+    df: "DataFrame",
+    target: str,
+    window: int,
+    statistics: Dict[str, str],
+    group: str = "symbol",
+) -> "DataFrame":
+    """Get rolling statistics of a target column, by symbol when the data has several.
+
+    Parameters
+    ----------
+    df : DataFrame
+        The time series data.
+    target : str
+        The name of the target column.
+    window : int
+        The number of observations in a window.
+    statistics : Dict[str, str]
+        The statistic of each result column: one of the moments, or "quantile_<pct>".
+    group : str, optional
+        The column with the symbol of each row, by default "symbol".
+
+    Returns
+    -------
+    DataFrame
+        The index, the symbol when there are several, and the statistics of the full windows.
+    """
+    # pylint: disable=import-outside-toplevel
+    from pandas import DataFrame, factorize
+
+    groups = None
+    if group in df.columns and df[group].nunique() > 1:
+        codes = factorize(df[group])[0]
+        order = np.argsort(codes, kind="stable")
+        df = df.iloc[order]
+        groups = codes[order]
+
+    values = df[target].to_numpy(dtype=np.float64, na_value=np.nan)
+    pcts = {float(s.split("_")[1]) for s in statistics.values() if s not in MOMENTS}
+    moments = (
+        rolling_moments(values, window, groups)
+        if len(pcts) < len(set(statistics.values()))
+        else {}
+    )
+    quantiles = rolling_quantiles(values, window, pcts, groups) if pcts else {}
+
+    results = DataFrame(index=df.index)
+    if groups is not None:
+        results[group] = df[group].to_numpy()
+    for name, statistic in statistics.items():
+        column = (
+            moments[statistic]
+            if statistic in MOMENTS
+            else quantiles[float(statistic.split("_")[1])]
+        )
+        results[name] = column[:, 0]
+
+    return results.dropna().reset_index(drop=False)
@@ -58,7 +58,7 @@ def skew(
     # pylint: disable=import-outside-toplevel
     from openbb_core.app.utils import (
         basemodel_to_df,
-        df_to_basemodel,
+        df_to_datatable,
         get_target_column,
     )
     from openbb_quantitative.statistics import skew_
@@ -67,7 +67,7 @@ def skew(
     df = basemodel_to_df(data)
     series_target = get_target_column(df, target)
     results = DataFrame([skew_(series_target)], columns=["skew"])
-    results = df_to_basemodel(results)
+    results = df_to_datatable(results)
 
     return OBBject(results=results)
 
@@ -115,7 +115,7 @@ def variance(data: list[Data], target: str) -> OBBject[list[Data]]:
     # pylint: disable=import-outside-toplevel
     from openbb_core.app.utils import (
         basemodel_to_df,
-        df_to_basemodel,
+        df_to_datatable,
         get_target_column,
     )
     from openbb_quantitative.statistics import var_
@@ -124,7 +124,7 @@ def variance(data: list[Data], target: str) -> OBBject[list[Data]]:
     df = basemodel_to_df(data)
     series_target = get_target_column(df, target)
     results = DataFrame([var_(series_target)], columns=["variance"])
-    results = df_to_basemodel(results)
+    results = df_to_datatable(results)
 
     return OBBject(results=results)
 
@@ -173,7 +173,7 @@ def stdev(data: list[Data], target: str) -> OBBject[list[Data]]:
     # pylint: disable=import-outside-toplevel
     from openbb_core.app.utils import (
         basemodel_to_df,
-        df_to_basemodel,
+        df_to_datatable,
         get_target_column,
     )
     from openbb_quantitative.statistics import std_dev_
@@ -182,7 +182,7 @@ def stdev(data: list[Data], target: str) -> OBBject[list[Data]]:
     df = basemodel_to_df(data)
     series_target = get_target_column(df, target)
     results = DataFrame([std_dev_(series_target)], columns=["stdev"])
-    results = df_to_basemodel(results)
+    results = df_to_datatable(results)
 
     return OBBject(results=results)
 
@@ -232,7 +232,7 @@ def kurtosis(data: list[Data], target: str) -> OBBject[list[Data]]:
     # pylint: disable=import-outside-toplevel
     from openbb_core.app.utils import (
         basemodel_to_df,
-        df_to_basemodel,
+        df_to_datatable,
         get_target_column,
     )
     from openbb_quantitative.statistics import kurtosis_
@@ -241,7 +241,7 @@ def kurtosis(data: list[Data], target: str) -> OBBject[list[Data]]:
     df = basemodel_to_df(data)
     series_target = get_target_column(df, target)
     results = DataFrame([kurtosis_(series_target)], columns=["kurtosis"])
-    results = df_to_basemodel(results)
+    results = df_to_datatable(results)
 
     return OBBject(results=results)
 
@@ -295,7 +295,7 @@ def quantile(
     # pylint: disable=import-outside-toplevel
     from openbb_core.app.utils import (
         basemodel_to_df,
-        df_to_basemodel,
+        df_to_datatable,
         get_target_column,
     )
     from pandas import DataFrame
@@ -307,7 +307,7 @@ def quantile(
     results = DataFrame(
         [series_target.quantile(quantile_pct)], columns=[f"{quantile_pct}_quantile"]
     )
-    results = df_to_basemodel(results)
+    results = df_to_datatable(results)
     return OBBject(results=results)
 
 
@@ -358,7 +358,7 @@ def mean(
     # pylint: disable=import-outside-toplevel
     from openbb_core.app.utils import (
         basemodel_to_df,
-        df_to_basemodel,
+        df_to_datatable,
         get_target_column,
     )
     from openbb_quantitative.statistics import mean_
@@ -367,6 +367,6 @@ def mean(
     df = basemodel_to_df(data)
     series_target = get_target_column(df, target)
     results = DataFrame([mean_(series_target)], columns=["mean"])
-    results = df_to_basemodel(results)
+    results = df_to_datatable(results)
 
     return OBBject(results=results)
@@ -0,0 +1,114 @@
+"""Tests for the rolling statistics module."""
+
+import numpy as np
+import pandas as pd
+import pytest
+from openbb_quantitative.rolling_statistics import (
+    get_rolling_results,
+    get_valid_windows,
+    rolling_moments,
+    rolling_quantiles,
+)
+from openbb_quantitative.statistics import kurtosis_, mean_, skew_, std_dev_, var_
+
+rng = np.random.default_rng(42)
+returns = rng.normal(0, 0.01, 600)
+prices = 1_000 * np.exp(np.cumsum(returns))
+
+
+@pytest.mark.parametrize("values", [returns, prices])
+@pytest.mark.parametrize("window", [1, 5, 21, 252])
+def test_rolling_moments(values, window):
+    """Test the rolling moments against the statistics of each window."""
+    results = rolling_moments(values, window)
+    rolling = pd.Series(values).rolling(window)
+
+    for name, func in (
+        ("mean", mean_),
+        ("variance", var_),
+        ("stdev", std_dev_),
+        ("skew", skew_),
+        ("kurtosis", kurtosis_),
+    ):
+        expected = rolling.apply(func, raw=True).to_numpy()
+        np.testing.assert_allclose(
+            results[name][:, 0], expected, rtol=1e-6, atol=1e-12, err_msg=name
+        )
+
+
+def test_rolling_moments_columns():
+    """Test that each column is computed on its own."""
+    values = np.column_stack([returns, prices])
+    results = rolling_moments(values, 21)
+
+    np.testing.assert_allclose(
+        results["stdev"][:, 1], rolling_moments(prices, 21)["stdev"][:, 0]
+    )
+
+
+def test_rolling_moments_missing():
+    """Test that the windows with missing values are missing."""
+    values = returns.copy()
+    values[30] = np.nan
+    mean = rolling_moments(values, 10)["mean"][:, 0]
+
+    assert np.isnan(mean[:9]).all()
+    assert np.isnan(mean[30:40]).all()
+    assert not np.isnan(mean[40:]).any()
+    assert mean[40] == pytest.approx(values[31:41].mean())
+
+
+def test_rolling_moments_constant():
+    """Test that the skew and kurtosis of a constant window are missing."""
+    results = rolling_moments(np.full(30, 5.0), 10)
+
+    assert np.isnan(results["skew"][9:]).all()
+    assert np.isnan(results["kurtosis"][9:]).all()
+    assert (results["variance"][9:] == 0).all()
+
+
+def test_get_valid_windows_groups():
+    """Test that the windows spanning two groups are not valid."""
+    groups = np.array([0, 0, 0, 1, 1, 1])
+    valid = get_valid_windows(np.zeros((6, 1)), 2, groups)[:, 0]
+
+    assert valid.tolist() == [False, True, True, False, True, True]
+
+
+def test_rolling_quantiles():
+    """Test the rolling quantiles against pandas."""
+    results = rolling_quantiles(returns, 21, [0.25, 0.5])
+
+    np.testing.assert_allclose(
+        results[0.25][:, 0], pd.Series(returns).rolling(21).quantile(0.25)
+    )
+    np.testing.assert_allclose(
+        results[0.5][:, 0], pd.Series(returns).rolling(21).median()
+    )
+
+
+def test_get_rolling_results():
+    """Test the rolling statistics of several symbols."""
+    dates = pd.date_range("2024-01-01", periods=50, name="date")
+    df = pd.concat(
+        [
+            pd.DataFrame({"symbol": "A", "close": returns[:50]}, index=dates),
+            pd.DataFrame({"symbol": "B", "close": returns[50:100]}, index=dates),
+        ]
+    ).sort_index()
+
+    results = get_rolling_results(
+        df, "close", 10, {"rolling_mean_10": "mean", "rolling_q_10": "quantile_0.5"}
+    )
+
+    assert results.columns.tolist() == [
+        "date",
+        "symbol",
+        "rolling_mean_10",
+        "rolling_q_10",
+    ]
+    assert results.groupby("symbol").size().tolist() == [41, 41]
+    first = results[results.symbol == "B"].iloc[0]
+    assert first.date == dates[9]
+    assert first.rolling_mean_10 == pytest.approx(returns[50:60].mean())
+    assert first.rolling_q_10 == pytest.approx(np.median(returns[50:60]))
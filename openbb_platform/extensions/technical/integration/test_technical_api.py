@@ -962,6 +962,42 @@ def test_technical_ema(params, data_type):
     assert result.status_code == 200
 
 
+@pytest.mark.parametrize(
+    "params, data_type",
+    [
+        (
+            {
+                "data": "",
+                "indicators": ["rsi", {"name": "sma", "length": 20}, "macd"],
+                "index": "date",
+            },
+            "equity",
+        ),
+        (
+            {
+                "data": "",
+                "indicators": [{"name": "bbands", "target": "high"}, "atr"],
+                "index": "",
+            },
+            "crypto",
+        ),
+    ],
+)
+@pytest.mark.integration
+def test_technical_batch(params, data_type):
+    """Test ta batch."""
+    params = {p: v for p, v in params.items() if v}
+    body = json.dumps(
+        {"data": get_data(data_type), "indicators": params.pop("indicators")}
+    )
+
+    query_str = get_querystring(params, ["data"])
+    url = f"http://0.0.0.0:8000/api/v1/technical/batch?{query_str}"
+    result = requests.post(url, headers=get_headers(), timeout=10, data=body)
+    assert isinstance(result, requests.Response)
+    assert result.status_code == 200
+
+
 @pytest.mark.parametrize(
     "params",
     [
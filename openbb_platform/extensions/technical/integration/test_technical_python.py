@@ -927,6 +927,39 @@ def test_technical_ema(params, data_type, obb):
     assert len(result.results) > 0
 
 
+@pytest.mark.parametrize(
+    "params, data_type",
+    [
+        (
+            {
+                "data": "",
+                "indicators": ["rsi", {"name": "sma", "length": 20}, "macd"],
+                "index": "date",
+            },
+            "stocks",
+        ),
+        (
+            {
+                "data": "",
+                "indicators": [{"name": "bbands", "target": "high"}, "atr"],
+                "index": "",
+            },
+            "crypto",
+        ),
+    ],
+)
+@pytest.mark.integration
+def test_technical_batch(params, data_type, obb):
+    """Test batch."""
+    params = {p: v for p, v in params.items() if v}
+    params["data"] = get_data(data_type)
+
+    result = obb.technical.batch(**params)
+    assert result
+    assert isinstance(result, OBBject)
+    assert len(result.results) > 0
+
+
 @pytest.mark.parametrize(
     "params",
     [
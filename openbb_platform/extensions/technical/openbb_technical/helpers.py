@@ -2,7 +2,7 @@
 
 # pylint: disable=too-many-arguments,too-many-locals,too-many-positional-arguments
 
-from typing import TYPE_CHECKING, Any, List, Literal, Optional, Tuple, Union
+from typing import TYPE_CHECKING, Any, Dict, List, Literal, Optional, Tuple, Union
 from warnings import warn
 
 if TYPE_CHECKING:
@@ -617,3 +617,115 @@ def calculate_fib_levels(
     df["Price"] = levels
 
     return df, min_date, max_date, min_pr, max_pr, lvl_text
+
+
+# Columns used by each indicator of a batch, or None when it is computed on a target column.
+BATCH_INDICATORS: Dict[str, Optional[List[str]]] = {
+    "ad": ["high", "low", "close", "volume"],
+    "adosc": ["open", "high", "low", "close", "volume"],
+    "adx": ["close", "high", "low"],
+    "aroon": ["high", "low", "close"],
+    "atr": ["high", "low", "close"],
+    "bbands": None,
+    "cci": ["close", "high", "low"],
+    "cg": ["high", "low", "close"],
+    "donchian": ["high", "low"],
+    "ema": None,
+    "fisher": ["high", "low"],
+    "hma": None,
+    "kc": ["high", "low", "close"],
+    "macd": None,
+    "obv": ["close", "volume"],
+    "rsi": None,
+    "sma": None,
+    "stoch": ["close", "high", "low"],
+    "vwap": ["high", "low", "close", "volume"],
+    "wma": None,
+    "zlma": None,
+}
+
+# Indicators whose commands keep the rows where only some of the columns have values.
+_KEEP_PARTIAL_ROWS = ("adosc", "atr", "bbands", "fisher", "obv")
+
+# Parameters that set a number of periods, which can not exceed the length of the data.
+_PERIOD_PARAMS = (
+    "length",
+    "lower_length",
+    "upper_length",
+    "fast",
+    "slow",
+    "signal",
+    "fast_k_period",
+    "slow_d_period",
+    "slow_k_period",
+)
+
+
+def _calculate_indicator(
+    df: "DataFrame", name: str, params: Dict[str, Any]
+) -> "DataFrame":
+    """Calculate one indicator of a batch, with the parameters of its command."""
+    # pylint: disable=import-outside-toplevel
+    import pandas_ta as ta  # noqa
+    from openbb_core.app.utils import get_target_column, get_target_columns
+    from pandas import DataFrame, to_datetime
+
+    params = dict(params)
+    validate_data(df, [v for k, v in params.items() if k in _PERIOD_PARAMS])
+    columns = BATCH_INDICATORS[name]
+
+    if columns is None:
+        target = params.pop("target", "close")
+        df_target = get_target_column(df, target).to_frame()
+        params.update(close=target, prefix=target)
+    else:
+        df_target = get_target_columns(df, columns)
+
+    if name == "vwap":
+        df_target.index = to_datetime(df_target.index)
+
+    result = DataFrame(getattr(df_target.ta, name)(**params))
+    result.index = df.index
+    return result if name in _KEEP_PARTIAL_ROWS else result.dropna()
+
+
+def calculate_indicators(
+    df: "DataFrame",
+    indicators: List[Tuple[str, Dict[str, Any]]],
+    group: str = "symbol",
+) -> "DataFrame":
+    """Calculate several indicators over the same data.
+
+    Each indicator is computed on the columns of the shared DataFrame and added to it,
+    separately for each symbol when the data has several.
+
+    Parameters
+    ----------
+    df : DataFrame
+        Dataframe of prices, indexed by date.
+    indicators : List[Tuple[str, Dict[str, Any]]]
+        The name and the parameters of each indicator, as in its command.
+    group : str
+        Column with the symbol of each row.
+
+    Returns
+    -------
+    DataFrame
+        The data, with the columns of every indicator.
+    """
+    # pylint: disable=import-outside-toplevel
+    from pandas import concat
+
+    if group in df.columns and df[group].nunique() > 1:
+        return concat(
+            [
+                calculate_indicators(group_df, indicators, group)
+                for _, group_df in df.groupby(group, sort=False)
+            ]
+        )
+
+    output = concat(
+        [df] + [_calculate_indicator(df, name, params) for name, params in indicators],
+        axis=1,
+    )
+    return output.loc[:, ~output.columns.duplicated()]
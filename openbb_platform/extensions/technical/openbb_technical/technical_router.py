@@ -2,23 +2,35 @@
 
 # pylint: disable=too-many-lines,unused-import,too-many-arguments,too-many-positional-arguments
 
-from typing import Any, Literal, Optional
+import inspect
+from functools import cache
+from typing import Any, Literal, Optional, Union
 
 from openbb_core.app.model.example import APIEx, PythonEx
 from openbb_core.app.model.obbject import OBBject
 from openbb_core.app.router import Router
 from openbb_core.app.utils import (
     basemodel_to_df,
-    df_to_basemodel,
+    df_to_datatable,
     get_target_column,
     get_target_columns,
 )
 from openbb_core.provider.abstract.data import Data
-from pydantic import NonNegativeFloat, NonNegativeInt, PositiveFloat, PositiveInt
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    NonNegativeFloat,
+    NonNegativeInt,
+    PositiveFloat,
+    PositiveInt,
+    create_model,
+)
 
 from openbb_technical.helpers import (
+    BATCH_INDICATORS,
     calculate_cones,
     calculate_fib_levels,
+    calculate_indicators,
     clenow_momentum,
     validate_data,
 )
@@ -226,7 +238,7 @@ def atr(
     )
 
     output = pd.concat([df, df_atr], axis=1)
-    results = df_to_basemodel(output.reset_index())
+    results = df_to_datatable(output.reset_index())
 
     return OBBject(results=results)
 
@@ -297,7 +309,7 @@ def fib(
     df_fib["max_pr"] = max_pr
     df_fib["lvl_text"] = lvl_text
 
-    results = df_to_basemodel(df_fib)
+    results = df_to_datatable(df_fib)
 
     return OBBject(results=results)
 
@@ -354,7 +366,7 @@ def obv(
     df_obv = pd.DataFrame(df_target.ta.obv(offset=offset))
 
     output = pd.concat([df, df_obv], axis=1)
-    results = df_to_basemodel(output.reset_index())
+    results = df_to_datatable(output.reset_index())
 
     return OBBject(results=results)
 
@@ -412,7 +424,7 @@ def fisher(
     df_fisher = pd.DataFrame(df_target.ta.fisher(length=length, signal=signal))
 
     output = pd.concat([df, df_fisher], axis=1)
-    results = df_to_basemodel(output.reset_index())
+    results = df_to_datatable(output.reset_index())
 
     return OBBject(results=results)
 
@@ -474,7 +486,7 @@ def adosc(
     df_adosc = pd.DataFrame(df_target.ta.adosc(fast=fast, slow=slow, offset=offset))
 
     output = pd.concat([df, df_adosc], axis=1)
-    results = df_to_basemodel(output.reset_index())
+    results = df_to_datatable(output.reset_index())
 
     return OBBject(results=results)
 
@@ -557,7 +569,7 @@ def bbands(
     )
 
     output = pd.concat([df, bbands_df], axis=1)
-    results = df_to_basemodel(output.reset_index())
+    results = df_to_datatable(output.reset_index())
 
     return OBBject(results=results)
 
@@ -626,7 +638,7 @@ def zlma(
     ).dropna()
 
     output = pd.concat([df, zlma_df], axis=1)
-    results = df_to_basemodel(output.reset_index())
+    results = df_to_datatable(output.reset_index())
 
     return OBBject(results=results)
 
@@ -690,7 +702,7 @@ def aroon(
     df_aroon = pd.DataFrame(df_target.ta.aroon(length=length, scalar=scalar)).dropna()
 
     output = pd.concat([df, df_aroon], axis=1)
-    results = df_to_basemodel(output.reset_index())
+    results = df_to_datatable(output.reset_index())
 
     return OBBject(results=results)
 
@@ -760,7 +772,7 @@ def sma(
     )
 
     output = pd.concat([df, sma_df], axis=1)
-    results = df_to_basemodel(output.reset_index())
+    results = df_to_datatable(output.reset_index())
 
     return OBBject(results=results)
 
@@ -823,7 +835,7 @@ def demark(
     _demark = ta.exhc(df_target[target], asint=asint, show_all=show_all, offset=offset)
     demark_df = concat([df[[target]], _demark], axis=1).reset_index()
     demark_df = demark_df.rename(columns={"EXHC_DNa": "down", "EXHC_UPa": "up"})
-    results = df_to_basemodel(demark_df)
+    results = df_to_datatable(demark_df)
 
     return OBBject(results=results)
 
@@ -883,7 +895,7 @@ def vwap(
     df_vwap = pd.DataFrame(df_target.ta.vwap(anchor=anchor, offset=offset).dropna())
 
     output = pd.concat([df, df_vwap], axis=1)
-    results = df_to_basemodel(output.reset_index())
+    results = df_to_datatable(output.reset_index())
 
     return OBBject(results=results)
 
@@ -965,7 +977,7 @@ def macd(
         ).dropna()
     )
     output = pd.concat([df, macd_df], axis=1)
-    results = df_to_basemodel(output.reset_index())
+    results = df_to_datatable(output.reset_index())
 
     return OBBject(results=results)
 
@@ -1031,7 +1043,7 @@ def hma(
     )
 
     output = pd.concat([df, hma_df], axis=1)
-    results = df_to_basemodel(output.reset_index())
+    results = df_to_datatable(output.reset_index())
 
     return OBBject(results=results)
 
@@ -1102,7 +1114,7 @@ def donchian(
     )
 
     output = pd.concat([df, donchian_df], axis=1)
-    results = df_to_basemodel(output.reset_index())
+    results = df_to_datatable(output.reset_index())
 
     return OBBject(results=results)
 
@@ -1172,7 +1184,7 @@ def ichimoku(
     df_result = df.join(df_span.add_prefix("span_"), how="left")
     df_result = df_result.join(df_ichimoku, how="left")
 
-    results = df_to_basemodel(df_result.reset_index())
+    results = df_to_datatable(df_result.reset_index())
 
     return OBBject(results=results)
 
@@ -1238,7 +1250,7 @@ def clenow(
     ).transpose()
 
     output = pd.concat([df, df_clenow], axis=1)
-    results = df_to_basemodel(output.reset_index())
+    results = df_to_datatable(output.reset_index())
 
     return OBBject(results=results)
 
@@ -1295,7 +1307,7 @@ def ad(data: list[Data], index: str = "date", offset: int = 0) -> OBBject[list[D
     ad_df = pd.DataFrame(df_target.ta.ad(offset=offset).dropna())
 
     output = pd.concat([df, ad_df], axis=1)
-    results = df_to_basemodel(output.reset_index())
+    results = df_to_datatable(output.reset_index())
 
     return OBBject(results=results)
 
@@ -1356,7 +1368,7 @@ def adx(
     )
 
     output = pd.concat([df, df_adx], axis=1)
-    results = df_to_basemodel(output.reset_index())
+    results = df_to_datatable(output.reset_index())
 
     return OBBject(results=results)
 
@@ -1423,7 +1435,7 @@ def wma(
     )
 
     output = pd.concat([df, df_wma], axis=1)
-    results = df_to_basemodel(output.reset_index())
+    results = df_to_datatable(output.reset_index())
 
     return OBBject(results=results)
 
@@ -1481,7 +1493,7 @@ def cci(
     cci_df = pd.DataFrame(df_target.ta.cci(length=length, scalar=scalar).dropna())
 
     output = pd.concat([df, cci_df], axis=1)
-    results = df_to_basemodel(output.reset_index())
+    results = df_to_datatable(output.reset_index())
 
     return OBBject(results=results)
 
@@ -1553,7 +1565,7 @@ def rsi(
     )
 
     output = pd.concat([df, rsi_df], axis=1)
-    results = df_to_basemodel(output.reset_index())
+    results = df_to_datatable(output.reset_index())
 
     return OBBject(results=results)
 
@@ -1620,7 +1632,7 @@ def stoch(
     )
 
     output = pd.concat([df, stoch_df], axis=1)
-    results = df_to_basemodel(output.reset_index())
+    results = df_to_datatable(output.reset_index())
 
     return OBBject(results=results)
 
@@ -1690,7 +1702,7 @@ def kc(
         ).dropna()
     )
     output = pd.concat([df, kc_df], axis=1)
-    results = df_to_basemodel(output.reset_index())
+    results = df_to_datatable(output.reset_index())
 
     return OBBject(results=results)
 
@@ -1743,7 +1755,7 @@ def cg(
     cg_df = pd.DataFrame(df_target.ta.cg(length=length).dropna())
 
     output = pd.concat([df, cg_df], axis=1)
-    results = df_to_basemodel(output.reset_index())
+    results = df_to_datatable(output.reset_index())
 
     return OBBject(results=results)
 
@@ -1847,7 +1859,7 @@ def cones(
         is_crypto=is_crypto,
         trading_periods=trading_periods,
     )
-    results = df_to_basemodel(df_cones)
+    results = df_to_datatable(df_cones)
 
     return OBBject(results=results)
 
@@ -1911,6 +1923,88 @@ def ema(
     )
 
     output = pd.concat([df, ema_df], axis=1)
-    results = df_to_basemodel(output.reset_index())
+    results = df_to_datatable(output.reset_index())
+
+    return OBBject(results=results)
+
+
+@cache
+def _get_indicator_params_model(name: str) -> type[BaseModel]:
+    """Get the model of the parameters of an indicator command, without the data and the index."""
+    parameters = inspect.signature(globals()[name]).parameters.values()
+    return create_model(  # type: ignore[call-overload]
+        f"{name.title()}BatchParams",
+        __config__=ConfigDict(extra="forbid", validate_default=True),
+        **{
+            p.name: (p.annotation, p.default)
+            for p in parameters
+            if p.name not in ("data", "index")
+        },
+    )
+
+
+@router.command(
+    methods=["POST"],
+    examples=[
+        PythonEx(
+            description="Calculate several indicators over the same data.",
+            code=[
+                "stock_data = obb.equity.price.historical(symbol='AAPL,MSFT', start_date='2023-01-01', provider='fmp')",
+                "batch_data = obb.technical.batch(data=stock_data.results, indicators=["
+                + "{'name': 'sma', 'length': 20}, {'name': 'sma', 'length': 50}, 'rsi', "
+                + "{'name': 'macd', 'fast': 12, 'slow': 26}, 'bbands', 'atr'])",
+            ],
+        ),
+        APIEx(
+            parameters={
+                "indicators": [{"name": "sma", "length": 2}, {"name": "rsi"}],
+                "data": APIEx.mock_data("timeseries"),
+            }
+        ),
+    ],
+)
+def batch(
+    data: list[Data],
+    indicators: list[Union[str, dict[str, Any]]],
+    index: str = "date",
+) -> OBBject[list[Data]]:
+    """Calculate several technical indicators in one pass.
+
+    The data is converted once and every indicator is added to the same table,
+    instead of converting the data again for each indicator command.
+    When the data has several symbols, the indicators are calculated for each symbol.
+
+    Parameters
+    ----------
+    data : list[Data]
+        The data to use for the calculation.
+    indicators : list[Union[str, dict[str, Any]]]
+        The indicators to calculate, by name, or as a dictionary with the name
+        and the parameters of the indicator command, e.g. {"name": "sma", "length": 20}.
+        Choose from: ad, adosc, adx, aroon, atr, bbands, cci, cg, donchian, ema, fisher,
+        hma, kc, macd, obv, rsi, sma, stoch, vwap, wma, zlma.
+    index : str, optional
+        Index column name to use with `data`, by default "date".
+
+    Returns
+    -------
+    OBBject[list[Data]]
+        The data with the columns of every indicator.
+    """
+    specs = []
+    for indicator in indicators:
+        params = {"name": indicator} if isinstance(indicator, str) else dict(indicator)
+        name = params.pop("name", None)
+        if name not in BATCH_INDICATORS:
+            raise ValueError(
+                f"Indicator '{name}' can not be calculated in a batch."
+                f" Choose from: {', '.join(BATCH_INDICATORS)}"
+            )
+        model = _get_indicator_params_model(name)
+        specs.append((name, model.model_validate(params).model_dump()))
+
+    df = basemodel_to_df(data, index=index)
+    output = calculate_indicators(df, specs)
+    results = df_to_datatable(output.reset_index())
 
     return OBBject(results=results)
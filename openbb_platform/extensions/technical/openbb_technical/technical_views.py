@@ -416,6 +416,7 @@ def _ta_ma(**kwargs):
     # pylint: disable=import-outside-toplevel
     from openbb_charting.core.chart_style import ChartStyle
     from openbb_charting.core.openbb_figure import OpenBBFigure
+    from openbb_core.app.model.data_table import DataTable
     from openbb_core.app.utils import basemodel_to_df
     from pandas import DataFrame
 
@@ -438,7 +439,7 @@ def _ta_ma(**kwargs):
     if data is None:
         data = basemodel_to_df(kwargs["obbject_item"], index=index)
 
-    if isinstance(data, list):
+    if isinstance(data, (list, DataTable)):
         data = basemodel_to_df(data, index=index)
 
     window = (
@@ -6,6 +6,7 @@ import pytest
 from extensions.technical.openbb_technical.helpers import (
     calculate_cones,
     calculate_fib_levels,
+    calculate_indicators,
     clenow_momentum,
     garman_klass,
     hodges_tompkins,
@@ -99,3 +100,29 @@ def test_validate_data_with_mock_data(mock_data):
         validate_data(mock_data["close"].tolist(), 20)
     except ValueError:
         pytest.fail("validate_data raised ValueError unexpectedly!")
+
+
+def test_calculate_indicators_with_mock_data(mock_data):
+    """Test calculate_indicators with several indicators."""
+    result = calculate_indicators(
+        mock_data,
+        [
+            ("sma", {"target": "close", "length": 10, "offset": 0}),
+            ("sma", {"target": "close", "length": 20, "offset": 0}),
+            ("atr", {"length": 14, "mamode": "rma", "drift": 1, "offset": 0}),
+        ],
+    )
+    assert len(result) == len(mock_data)
+    assert {"close_SMA_10", "close_SMA_20", "ATRr_14"} <= set(result.columns)
+    assert result["close_SMA_10"].iloc[-1] == pytest.approx(94.5)
+
+
+def test_calculate_indicators_by_symbol(mock_data):
+    """Test calculate_indicators with several symbols."""
+    data = pd.concat(
+        [mock_data.assign(symbol="A"), mock_data.assign(symbol="B")]
+    ).sort_index()
+    result = calculate_indicators(
+        data, [("sma", {"target": "close", "length": 10, "offset": 0})]
+    )
+    assert result.groupby("symbol")["close_SMA_10"].count().tolist() == [90, 90]
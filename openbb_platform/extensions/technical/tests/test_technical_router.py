@@ -0,0 +1,38 @@
+"""Test the technical router."""
+
+from inspect import signature
+
+import numpy as np
+import pandas as pd
+import pytest
+from openbb_core.app.command_runner import ParametersBuilder
+from openbb_core.provider.abstract.data import Data
+from openbb_technical import technical_router
+from openbb_technical.helpers import BATCH_INDICATORS
+
+# pylint: disable=redefined-outer-name
+
+
+@pytest.fixture(scope="module")
+def data():
+    """Get a random walk of prices."""
+    rng = np.random.default_rng(0)
+    close = 100 + rng.standard_normal(300).cumsum()
+    dates = pd.date_range("2023-01-01", periods=300).date
+    return [
+        Data(date=d, open=c, high=c + 1, low=c - 1, close=c, volume=1000 + i)
+        for i, (d, c) in enumerate(zip(dates, close))
+    ]
+
+
+@pytest.mark.parametrize("name", list(BATCH_INDICATORS))
+def test_batch_columns(data, name):
+    """Test an indicator of a batch has the columns of its command."""
+    func = getattr(technical_router, name)
+    params = {p.name: p.default for p in signature(func).parameters.values()}
+    # The command runner validates the parameters, with their defaults, before the call.
+    single = func(**ParametersBuilder.validate_kwargs(func, {**params, "data": data}))
+
+    batch = technical_router.batch(data=data, indicators=[name])
+
+    assert list(batch.to_df().columns) == list(single.to_df().columns)
@@ -157,4 +157,4 @@ class AVHistoricalEpsFetcher(
         """Transform the raw data into the standard model."""
         if not data:
             raise EmptyDataError("No data found.")
-        return [AlphaVantageHistoricalEpsData.model_validate(d) for d in data]
+        return AlphaVantageHistoricalEpsData.model_validate_list(data)
@@ -202,4 +202,4 @@ class BenzingaCompanyNewsFetcher(
         **kwargs: Any,
     ) -> List[BenzingaCompanyNewsData]:
         """Transform data."""
-        return [BenzingaCompanyNewsData.model_validate(item) for item in data]
+        return BenzingaCompanyNewsData.model_validate_list(data)
@@ -194,4 +194,4 @@ class BenzingaWorldNewsFetcher(
         **kwargs: Any,
     ) -> List[BenzingaWorldNewsData]:
         """Transform the data."""
-        return [BenzingaWorldNewsData.model_validate(item) for item in data]
+        return BenzingaWorldNewsData.model_validate_list(data)
@@ -111,4 +111,4 @@ class CboeAvailableIndicesFetcher(
         query: CboeAvailableIndicesQueryParams, data: List[Dict], **kwargs: Any
     ) -> List[CboeAvailableIndicesData]:
         """Transform the data to the standard format."""
-        return [CboeAvailableIndicesData.model_validate(d) for d in data]
+        return CboeAvailableIndicesData.model_validate_list(data)
@@ -98,4 +98,4 @@ class CboeFuturesCurveFetcher(
         **kwargs: Any,
     ) -> List[CboeFuturesCurveData]:
         """Transform data."""
-        return [CboeFuturesCurveData.model_validate(d) for d in data]
+        return CboeFuturesCurveData.model_validate_list(data)
@@ -111,4 +111,4 @@ class CboeIndexSearchFetcher(
         query: CboeIndexSearchQueryParams, data: List[Dict], **kwargs: Any
     ) -> List[CboeIndexSearchData]:
         """Transform the data to the standard format."""
-        return [CboeIndexSearchData.model_validate(d) for d in data]
+        return CboeIndexSearchData.model_validate_list(data)
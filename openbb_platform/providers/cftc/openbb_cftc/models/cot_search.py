@@ -87,4 +87,4 @@ class CftcCotSearchFetcher(Fetcher[CftcCotSearchQueryParams, List[CftcCotSearchD
         **kwargs: Any,
     ) -> List[CftcCotSearchData]:
         """Transform the data."""
-        return [CftcCotSearchData.model_validate(d) for d in data]
+        return CftcCotSearchData.model_validate_list(data)
@@ -151,5 +151,5 @@ class DeribitFuturesHistoricalFetcher(
             for d in data:
                 _ = d.pop("symbol", None)
                 results.append(DeribitFuturesHistoricalData.model_validate(d))
-            return [DeribitFuturesHistoricalData.model_validate(d) for d in data]
-        return [DeribitFuturesHistoricalData.model_validate(d) for d in data]
+            return DeribitFuturesHistoricalData.model_validate_list(data)
+        return DeribitFuturesHistoricalData.model_validate_list(data)
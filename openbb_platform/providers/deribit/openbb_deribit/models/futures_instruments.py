@@ -130,4 +130,4 @@ class DeribitFuturesInstrumentsFetcher(
         **kwargs: Any,
     ) -> list[DeribitFuturesInstrumentData]:
         """Transform the data."""
-        return [DeribitFuturesInstrumentData.model_validate(d) for d in data]
+        return DeribitFuturesInstrumentData.model_validate_list(data)
@@ -0,0 +1,275 @@
+"""Deribit WebSocket Client Module."""
+
+import asyncio
+import json
+import threading
+from itertools import count
+from time import monotonic
+from typing import Any, Optional
+
+from openbb_core.app.model.abstract.error import OpenBBError
+
+WEBSOCKET_URL = "wss://www.deribit.com/ws/api/v2"
+TICKER_INTERVAL = "100ms"
+# Channels subscribed to per request, to keep each message small.
+MAX_CHANNELS = 500
+# Seconds an instrument stays subscribed after the last call requesting it.
+IDLE_TTL = 60.0
+# Instruments subscribed at the same time, across all the calls.
+MAX_INSTRUMENTS = 2000
+
+
+class DeribitWebSocket:
+    """One connection to the Deribit WebSocket API, shared by the calls of an event loop.
+
+    Calls are JSON-RPC requests, matched to their response by id, so any number of
+    them can be in flight over the connection. Ticker subscriptions are kept, and
+    the last message of each instrument is stored in `tickers`, a live snapshot of
+    the instruments, so repeated calls for the same instruments are answered from
+    it without waiting. When the connection closes, the calls waiting fail, the
+    snapshot is cleared, and the next call reconnects.
+
+    An instrument not requested for `idle_ttl` seconds is unsubscribed, and the
+    connection is closed once it has no subscription left. At most
+    `max_instruments` are subscribed: the least recently requested instruments
+    are unsubscribed to make room for new ones, unless a single call needs more.
+    """
+
+    def __init__(
+        self,
+        url: str = WEBSOCKET_URL,
+        timeout: float = 10.0,
+        idle_ttl: float = IDLE_TTL,
+        max_instruments: int = MAX_INSTRUMENTS,
+    ) -> None:
+        """Initialize the client."""
+        self.url = url
+        self.timeout = timeout
+        self.idle_ttl = idle_ttl
+        self.max_instruments = max_instruments
+        self.tickers: dict[str, dict] = {}
+        self._ids = count(1)
+        self._pending: dict[int, asyncio.Future] = {}
+        self._waiters: list[tuple[set[str], asyncio.Future]] = []
+        self._subscribed: set[str] = set()
+        # Last time each subscribed instrument was requested, oldest first.
+        self._last_used: dict[str, float] = {}
+        self._connection: Any = None
+        self._reader: Optional[asyncio.Task] = None
+        self._expiry: Optional[asyncio.Task] = None
+        self._lock = asyncio.Lock()
+
+    @property
+    def connected(self) -> bool:
+        """Check if the connection is open."""
+        return self._reader is not None and not self._reader.done()
+
+    async def connect(self) -> None:
+        """Open the connection, if it is not open already."""
+        # pylint: disable=import-outside-toplevel
+        from websockets.asyncio.client import connect
+
+        async with self._lock:
+            if self.connected:
+                return
+            try:
+                self._connection = await connect(self.url)
+            except Exception as e:  # pylint: disable=broad-except
+                raise OpenBBError(
+                    f"Failed to connect to Deribit -> {e.__class__.__name__}: {e}"
+                ) from e
+            self._reader = asyncio.create_task(self._read(self._connection))
+            self._expiry = asyncio.create_task(self._expire(self._reader))
+
+    async def close(self) -> None:
+        """Close the connection."""
+        if self._expiry is not None:
+            self._expiry.cancel()
+        if self._connection is not None:
+            await self._connection.close()
+        if self._reader is not None:
+            await asyncio.gather(self._reader, return_exceptions=True)
+
+    async def call(self, method: str, params: Optional[dict] = None) -> Any:
+        """Send a request, and return the result of its response."""
+        await self.connect()
+        request_id = next(self._ids)
+        future = asyncio.get_running_loop().create_future()
+        self._pending[request_id] = future
+        request = {
+            "jsonrpc": "2.0",
+            "id": request_id,
+            "method": method,
+            "params": params or {},
+        }
+        try:
+            await self._connection.send(json.dumps(request))
+            return await asyncio.wait_for(future, self.timeout)
+        except asyncio.TimeoutError as e:
+            raise OpenBBError(f"Timeout reached for the Deribit {method}.") from e
+        finally:
+            self._pending.pop(request_id, None)
+
+    async def subscribe(self, instruments: list[str]) -> set[str]:
+        """Subscribe to the ticker of the instruments, and return the ones subscribed."""
+        requested = dict.fromkeys(instruments)
+        self._touch([i for i in requested if i in self._subscribed])
+        new = [i for i in requested if i not in self._subscribed]
+        excess = len(self._subscribed) + len(new) - self.max_instruments
+        if excess > 0:
+            # The least recently requested instruments make room for the new ones.
+            await self.unsubscribe(
+                [i for i in self._last_used if i not in requested][:excess]
+            )
+        self._subscribed.update(new)
+        chunks = [new[i : i + MAX_CHANNELS] for i in range(0, len(new), MAX_CHANNELS)]
+        try:
+            results = await asyncio.gather(
+                *[
+                    self.call(
+                        "public/subscribe",
+                        {"channels": [_channel(i) for i in chunk]},
+                    )
+                    for chunk in chunks
+                ]
+            )
+        except BaseException:
+            self._subscribed.difference_update(new)
+            raise
+        # Deribit leaves the channels of unknown instruments out of the result.
+        channels = {c for result in results for c in result or []}
+        self._subscribed.difference_update(
+            i for i in new if _channel(i) not in channels
+        )
+        self._touch([i for i in new if i in self._subscribed])
+        return {i for i in requested if i in self._subscribed}
+
+    async def unsubscribe(self, instruments: list[str]) -> None:
+        """Unsubscribe from the ticker of the instruments, and drop them from the snapshot."""
+        old = [i for i in dict.fromkeys(instruments) if i in self._subscribed]
+        if not old:
+            return
+        self._subscribed.difference_update(old)
+        for i in old:
+            self.tickers.pop(i, None)
+            self._last_used.pop(i, None)
+        await self.call("public/unsubscribe", {"channels": [_channel(i) for i in old]})
+
+    async def get_tickers(
+        self, instruments: list[str], timeout: Optional[float] = None
+    ) -> dict[str, dict]:
+        """Get the last ticker of the instruments.
+
+        Returns as soon as every instrument subscribed has reported, or when the
+        timeout is reached. The instruments without a ticker are left out.
+        """
+        subscribed = await self.subscribe(instruments)
+        missing = subscribed - self.tickers.keys()
+        if missing:
+            future = asyncio.get_running_loop().create_future()
+            waiter = (missing, future)
+            self._waiters.append(waiter)
+            try:
+                await asyncio.wait_for(future, timeout or self.timeout)
+            except asyncio.TimeoutError:
+                pass
+            finally:
+                self._waiters.remove(waiter)
+        return {i: dict(self.tickers[i]) for i in instruments if i in self.tickers}
+
+    def _touch(self, instruments: list[str]) -> None:
+        """Mark the instruments as requested now."""
+        now = monotonic()
+        for i in instruments:
+            self._last_used.pop(i, None)
+            self._last_used[i] = now
+
+    async def _expire(self, reader: asyncio.Task) -> None:
+        """Unsubscribe the idle instruments, and close the connection once none is left."""
+        while not reader.done():
+            await asyncio.sleep(self.idle_ttl / 2)
+            expired = monotonic() - self.idle_ttl
+            idle = [
+                i
+                for i, used in self._last_used.items()
+                if used <= expired and i in self._subscribed
+            ]
+            try:
+                await self.unsubscribe(idle)
+            except OpenBBError:
+                return
+            if not self._subscribed and not self._pending and not self._waiters:
+                await self._connection.close()
+                return
+
+    async def _read(self, connection: Any) -> None:
+        """Read the messages of the connection until it closes."""
+        error: Optional[BaseException] = None
+        try:
+            async for message in connection:
+                self._dispatch(json.loads(message))
+        except Exception as e:  # pylint: disable=broad-except
+            error = e
+            await connection.close()
+        finally:
+            self._subscribed.clear()
+            self._last_used.clear()
+            self.tickers.clear()
+            exception = OpenBBError(
+                "The Deribit connection closed"
+                + (f" -> {error.__class__.__name__}: {error}" if error else ".")
+            )
+            futures = list(self._pending.values()) + [f for _, f in self._waiters]
+            for future in futures:
+                if not future.done():
+                    future.set_exception(exception)
+
+    def _dispatch(self, message: dict) -> None:
+        """Resolve the request of a response, or store the data of a subscription."""
+        if "id" in message:
+            future = self._pending.get(message["id"])
+            if future is None or future.done():
+                return
+            if message.get("error"):
+                future.set_exception(
+                    OpenBBError(f"Deribit returned an error -> {message['error']}")
+                )
+            else:
+                future.set_result(message.get("result"))
+            return
+
+        if message.get("method") != "subscription":
+            return
+
+        params = message.get("params", {})
+        data = params.get("data", {})
+        instrument = data.get("instrument_name")
+        if not params.get("channel", "").startswith("ticker.") or not instrument:
+            return
+
+        self.tickers[instrument] = data
+        for missing, future in self._waiters:
+            missing.discard(instrument)
+            if not missing and not future.done():
+                future.set_result(None)
+
+
+def _channel(instrument: str) -> str:
+    """Get the ticker channel of an instrument."""
+    return f"ticker.{instrument}.{TICKER_INTERVAL}"
+
+
+_clients: dict[tuple[asyncio.AbstractEventLoop, str], DeribitWebSocket] = {}
+_clients_lock = threading.Lock()
+
+
+def get_client(url: Optional[str] = None) -> DeribitWebSocket:
+    """Get the Deribit WebSocket client of the running event loop."""
+    loop = asyncio.get_running_loop()
+    key = (loop, url or WEBSOCKET_URL)
+    with _clients_lock:
+        for closed in [k for k in _clients if k[0].is_closed()]:
+            del _clients[closed]
+        if key not in _clients:
+            _clients[key] = DeribitWebSocket(key[1])
+        return _clients[key]
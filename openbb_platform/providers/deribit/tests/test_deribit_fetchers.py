@@ -1,5 +1,8 @@
 """Deribit Fetcher Tests."""
 
+import asyncio
+import json
+from contextlib import asynccontextmanager
 from datetime import date
 from unittest.mock import MagicMock, patch
 
@@ -14,6 +17,8 @@ from openbb_deribit.models.options_chains import (
     DeribitOptionsChainsData,
     DeribitOptionsChainsFetcher,
 )
+from openbb_deribit.utils.websocket_client import DeribitWebSocket
+from websockets.asyncio.server import serve
 
 test_credentials = UserService().default_user_settings.credentials.model_dump(
     mode="json"
@@ -104,6 +109,147 @@ async def test_deribit_options_chains_fetcher(credentials=test_credentials):
         assert isinstance(result, DeribitOptionsChainsData)
 
 
+def mock_ticker(instrument):
+    """Get a mock ticker message of an instrument."""
+    return {
+        "instrument_name": instrument,
+        "timestamp": 1733500000000,
+        "state": "open",
+        "underlying_index": "index_price",
+        "underlying_price": 100671.2825,
+        "index_price": 100671.28,
+        "estimated_delivery_price": 100671.28,
+        "best_bid_price": 0.001,
+        "best_ask_price": 0.002,
+        "mark_price": 0.0015,
+        "mark_iv": 50.0,
+        "open_interest": 10.0,
+        "stats": {"volume": 1.0, "volume_usd": 100.0, "price_change": 10.0},
+        "greeks": {"delta": 0.1, "gamma": 0.0, "vega": 1.0, "theta": -1.0},
+    }
+
+
+@asynccontextmanager
+async def mock_deribit():
+    """Serve a mock Deribit WebSocket API, with a ticker for each subscription."""
+    requests: list = []
+
+    async def handler(websocket):
+        """Answer the subscriptions, leaving out the unknown instruments."""
+        async for message in websocket:
+            request = json.loads(message)
+            requests.append(request)
+            channels = [c for c in request["params"]["channels"] if "UNKNOWN" not in c]
+            await websocket.send(
+                json.dumps({"jsonrpc": "2.0", "id": request["id"], "result": channels})
+            )
+            if request["method"] != "public/subscribe":
+                continue
+            for channel in channels:
+                notification = {
+                    "jsonrpc": "2.0",
+                    "method": "subscription",
+                    "params": {
+                        "channel": channel,
+                        "data": mock_ticker(channel.split(".")[1]),
+                    },
+                }
+                await websocket.send(json.dumps(notification))
+
+    async with serve(handler, "localhost", 0) as server:
+        port = server.sockets[0].getsockname()[1]
+        yield f"ws://localhost:{port}", requests
+
+
+@pytest.mark.asyncio
+async def test_deribit_websocket():
+    """Test the subscriptions are multiplexed over one connection."""
+    instruments = ["BTC-7DEC24-84000-C", "BTC-7DEC24-84000-P", "BTC-UNKNOWN"]
+
+    async with mock_deribit() as (url, requests):
+        client = DeribitWebSocket(url, timeout=5)
+        tickers = await client.get_tickers(instruments)
+        assert list(tickers) == instruments[:2]
+        assert [r["id"] for r in requests] == [1]
+
+        # The snapshot answers the repeated calls without subscribing again.
+        tickers = await client.get_tickers(instruments[:2])
+        assert list(tickers) == instruments[:2]
+        assert len(requests) == 1
+
+        await client.close()
+
+    assert not client.connected
+    assert not client.tickers
+
+
+@pytest.mark.asyncio
+async def test_deribit_websocket_idle():
+    """Test the idle instruments are unsubscribed, and the connection closed."""
+    instruments = ["BTC-7DEC24-84000-C", "BTC-7DEC24-84000-P"]
+
+    async with mock_deribit() as (url, requests):
+        client = DeribitWebSocket(url, timeout=5, idle_ttl=0.1)
+        await client.get_tickers(instruments)
+        assert client.connected
+
+        await asyncio.sleep(0.3)
+
+        assert not client.connected
+        assert not client.tickers
+        assert [r["method"] for r in requests] == [
+            "public/subscribe",
+            "public/unsubscribe",
+        ]
+
+
+@pytest.mark.asyncio
+async def test_deribit_websocket_max_instruments():
+    """Test the least recently requested instruments make room for the new ones."""
+    a, b, c = "BTC-7DEC24-1-C", "BTC-7DEC24-2-C", "BTC-7DEC24-3-C"
+
+    async with mock_deribit() as (url, requests):
+        client = DeribitWebSocket(url, timeout=5, max_instruments=2)
+        await client.get_tickers([a, b])
+        await client.get_tickers([a])
+        tickers = await client.get_tickers([c])
+
+        assert list(tickers) == [c]
+        assert set(client.tickers) == {a, c}
+        assert [(r["method"], r["params"]["channels"]) for r in requests[1:]] == [
+            ("public/unsubscribe", [f"ticker.{b}.100ms"]),
+            ("public/subscribe", [f"ticker.{c}.100ms"]),
+        ]
+
+        await client.close()
+
+
+@pytest.mark.asyncio
+async def test_deribit_options_chains_websocket():
+    """Test the options chains are received from the mock Deribit WebSocket API."""
+    symbols = {
+        "2024-12-07": ["BTC-7DEC24-84000-C", "BTC-7DEC24-84000-P"],
+        "2024-12-27": ["BTC-27DEC24-100000-C"],
+    }
+    query = DeribitOptionsChainsFetcher.transform_query({"symbol": "BTC"})
+
+    async with mock_deribit() as (url, requests):
+        with patch(
+            "openbb_deribit.utils.helpers.get_options_symbols", return_value=symbols
+        ), patch("openbb_deribit.utils.websocket_client.WEBSOCKET_URL", url):
+            data = await DeribitOptionsChainsFetcher.aextract_data(query, None)
+        assert len(requests) == 1
+
+    result = DeribitOptionsChainsFetcher.transform_data(query, data)
+    assert isinstance(result, DeribitOptionsChainsData)
+    assert result.contract_symbol == [
+        "BTC-7DEC24-84000-C",
+        "BTC-7DEC24-84000-P",
+        "BTC-27DEC24-100000-C",
+    ]
+    assert result.underlying_symbol == ["BTC"] * 3
+
+
 @pytest.mark.record_http
 def test_deribit_futures_curve_fetcher(credentials=test_credentials):
     """Test Deribit Futures Curve Fetcher."""
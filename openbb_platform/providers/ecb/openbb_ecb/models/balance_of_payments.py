@@ -114,4 +114,4 @@ class ECBBalanceOfPaymentsFetcher(
         query: ECBBalanceOfPaymentsQueryParams, data: List[Dict], **kwargs: Any
     ) -> List[ECBBalanceOfPaymentsData]:
         """Transform and validate data through the model."""
-        return [ECBBalanceOfPaymentsData.model_validate(d) for d in data]
+        return ECBBalanceOfPaymentsData.model_validate_list(data)
@@ -164,4 +164,4 @@ class ECBYieldCurveFetcher(
         flattened_data.rate = flattened_data.rate.astype(float).div(100)
         records = flattened_data.to_dict(orient="records")
 
-        return [ECBYieldCurveData.model_validate(d) for d in records]
+        return ECBYieldCurveData.model_validate_list(records)
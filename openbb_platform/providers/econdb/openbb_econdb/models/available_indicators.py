@@ -100,4 +100,4 @@ class EconDbAvailableIndicatorsFetcher(
         **kwargs: Any,
     ) -> List[EconDbAvailableIndicatorsData]:
         """Transform data."""
-        return [EconDbAvailableIndicatorsData.model_validate(d) for d in data]
+        return EconDbAvailableIndicatorsData.model_validate_list(data)
@@ -152,4 +152,4 @@ class EconDbExportDestinationsFetcher(
         **kwargs: Any,
     ) -> List[EconDbExportDestinationsData]:
         """Transform the data."""
-        return [EconDbExportDestinationsData.model_validate(d) for d in data]
+        return EconDbExportDestinationsData.model_validate_list(data)
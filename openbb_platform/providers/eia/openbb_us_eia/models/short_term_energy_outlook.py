@@ -281,4 +281,4 @@ class EiaShortTermEnergyOutlookFetcher(
             )
         records = df.to_dict(orient="records")
 
-        return [EiaShortTermEnergyOutlookData.model_validate(d) for d in records]
+        return EiaShortTermEnergyOutlookData.model_validate_list(records)
@@ -365,4 +365,4 @@ class FederalReserveCentralBankHoldingsFetcher(
         **kwargs: Any,
     ) -> List[FederalReserveCentralBankHoldingsData]:
         """Transform data."""
-        return [FederalReserveCentralBankHoldingsData.model_validate(d) for d in data]
+        return FederalReserveCentralBankHoldingsData.model_validate_list(data)
@@ -114,4 +114,4 @@ class FederalReserveYieldCurveFetcher(
         flattened_data.loc[:, "date"] = flattened_data["date"].dt.strftime("%Y-%m-%d")
         records = flattened_data.to_dict(orient="records")
 
-        return [FederalReserveYieldCurveData.model_validate(d) for d in records]
+        return FederalReserveYieldCurveData.model_validate_list(records)
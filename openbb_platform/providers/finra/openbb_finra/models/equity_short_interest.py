@@ -85,4 +85,4 @@ class FinraShortInterestFetcher(
         query: FinraShortInterestQueryParams, data: List[Dict], **kwargs: Any
     ) -> List[FinraShortInterestData]:
         """Transform the data."""
-        return [FinraShortInterestData.model_validate(d) for d in data]
+        return FinraShortInterestData.model_validate_list(data)
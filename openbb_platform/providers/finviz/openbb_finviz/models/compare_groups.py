@@ -270,4 +270,4 @@ class FinvizCompareGroupsFetcher(
         **kwargs: Any,
     ) -> List[FinvizCompareGroupsData]:
         """Transform the raw data."""
-        return [FinvizCompareGroupsData.model_validate(d) for d in data]
+        return FinvizCompareGroupsData.model_validate_list(data)
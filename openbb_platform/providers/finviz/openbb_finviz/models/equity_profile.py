@@ -238,4 +238,4 @@ class FinvizEquityProfileFetcher(
         **kwargs: Any,
     ) -> List[FinvizEquityProfileData]:
         """Transform and validate the raw data."""
-        return [FinvizEquityProfileData.model_validate(d) for d in data]
+        return FinvizEquityProfileData.model_validate_list(data)
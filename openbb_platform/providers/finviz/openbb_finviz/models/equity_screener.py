@@ -725,4 +725,4 @@ class FinvizEquityScreenerFetcher(
         **kwargs: Any,
     ) -> List[FinvizEquityScreenerData]:
         """Transform data."""
-        return [FinvizEquityScreenerData.model_validate(d) for d in data]
+        return FinvizEquityScreenerData.model_validate_list(data)
@@ -293,4 +293,4 @@ class FinvizKeyMetricsFetcher(
         **kwargs: Any,
     ) -> List[FinvizKeyMetricsData]:
         """Transform and validate the raw data."""
-        return [FinvizKeyMetricsData.model_validate(d) for d in data]
+        return FinvizKeyMetricsData.model_validate_list(data)
@@ -133,4 +133,4 @@ class FinvizPricePerformanceFetcher(
         **kwargs: Any,
     ) -> List[FinvizPricePerformanceData]:
         """Transform the raw data."""
-        return [FinvizPricePerformanceData.model_validate(d) for d in data]
+        return FinvizPricePerformanceData.model_validate_list(data)
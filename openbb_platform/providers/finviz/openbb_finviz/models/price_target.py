@@ -131,4 +131,4 @@ class FinvizPriceTargetFetcher(
         **kwargs: Any,
     ) -> List[FinvizPriceTargetData]:
         """Transform and validate the raw data."""
-        return [FinvizPriceTargetData.model_validate(d) for d in data]
+        return FinvizPriceTargetData.model_validate_list(data)
@@ -87,4 +87,4 @@ class FMPAnalystEstimatesFetcher(
         query: FMPAnalystEstimatesQueryParams, data: List[Dict], **kwargs: Any
     ) -> List[FMPAnalystEstimatesData]:
         """Return the transformed data."""
-        return [FMPAnalystEstimatesData.model_validate(d) for d in data]
+        return FMPAnalystEstimatesData.model_validate_list(data)
@@ -66,4 +66,4 @@ class FMPAvailableIndicesFetcher(
         query: FMPAvailableIndicesQueryParams, data: List[Dict], **kwargs: Any
     ) -> List[FMPAvailableIndicesData]:
         """Return the transformed data."""
-        return [FMPAvailableIndicesData.model_validate(d) for d in data]
+        return FMPAvailableIndicesData.model_validate_list(data)
@@ -342,4 +342,4 @@ class FMPBalanceSheetFetcher(
         for result in data:
             result.pop("symbol", None)
             result.pop("cik", None)
-        return [FMPBalanceSheetData.model_validate(d) for d in data]
+        return FMPBalanceSheetData.model_validate_list(data)
@@ -282,4 +282,4 @@ class FMPBalanceSheetGrowthFetcher(
         query: FMPBalanceSheetGrowthQueryParams, data: List[Dict], **kwargs: Any
     ) -> List[FMPBalanceSheetGrowthData]:
         """Return the transformed data."""
-        return [FMPBalanceSheetGrowthData.model_validate(d) for d in data]
+        return FMPBalanceSheetGrowthData.model_validate_list(data)
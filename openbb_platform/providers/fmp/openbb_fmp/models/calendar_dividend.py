@@ -100,4 +100,4 @@ class FMPCalendarDividendFetcher(
         query: FMPCalendarDividendQueryParams, data: List[Dict], **kwargs: Any
     ) -> List[FMPCalendarDividendData]:
         """Return the transformed data."""
-        return [FMPCalendarDividendData.model_validate(d) for d in data]
+        return FMPCalendarDividendData.model_validate_list(data)
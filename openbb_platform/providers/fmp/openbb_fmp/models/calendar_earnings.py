@@ -122,4 +122,4 @@ class FMPCalendarEarningsFetcher(
     ) -> List[FMPCalendarEarningsData]:
         """Return the transformed data."""
         data = sorted(data, key=lambda x: x["date"], reverse=True)
-        return [FMPCalendarEarningsData.model_validate(d) for d in data]
+        return FMPCalendarEarningsData.model_validate_list(data)
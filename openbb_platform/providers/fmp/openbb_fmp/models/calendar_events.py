@@ -133,4 +133,4 @@ class FMPCalendarEventsFetcher(
         query: FmpCalendarEventsQueryParams, data: list, **kwargs: Any
     ) -> list[FmpCalendarEventsData]:
         """Transform the data."""
-        return [FmpCalendarEventsData.model_validate(d) for d in data]
+        return FmpCalendarEventsData.model_validate_list(data)
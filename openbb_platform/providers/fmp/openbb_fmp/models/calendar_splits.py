@@ -66,4 +66,4 @@ class FMPCalendarSplitsFetcher(
         query: FMPCalendarSplitsQueryParams, data: List[Dict], **kwargs: Any
     ) -> List[FMPCalendarSplitsData]:
         """Return the transformed data."""
-        return [FMPCalendarSplitsData.model_validate(d) for d in data]
+        return FMPCalendarSplitsData.model_validate_list(data)
@@ -270,4 +270,4 @@ class FMPCashFlowStatementFetcher(
         for result in data:
             result.pop("symbol", None)
             result.pop("cik", None)
-        return [FMPCashFlowStatementData.model_validate(d) for d in data]
+        return FMPCashFlowStatementData.model_validate_list(data)
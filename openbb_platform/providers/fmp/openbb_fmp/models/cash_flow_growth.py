@@ -242,4 +242,4 @@ class FMPCashFlowStatementGrowthFetcher(
         query: FMPCashFlowStatementGrowthQueryParams, data: List[Dict], **kwargs: Any
     ) -> List[FMPCashFlowStatementGrowthData]:
         """Return the transformed data."""
-        return [FMPCashFlowStatementGrowthData.model_validate(d) for d in data]
+        return FMPCashFlowStatementGrowthData.model_validate_list(data)
@@ -121,4 +121,4 @@ class FMPCompanyFilingsFetcher(
         query: FMPCompanyFilingsQueryParams, data: List[Dict], **kwargs: Any
     ) -> List[FMPCompanyFilingsData]:
         """Return the transformed data."""
-        return [FMPCompanyFilingsData.model_validate(d) for d in data]
+        return FMPCompanyFilingsData.model_validate_list(data)
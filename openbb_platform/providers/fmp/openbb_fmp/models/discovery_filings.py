@@ -80,4 +80,4 @@ class FMPDiscoveryFilingsFetcher(
         query: FMPDiscoveryFilingsQueryParams, data: List[Dict], **kwargs: Any
     ) -> List[FMPDiscoveryFilingsData]:
         """Return the transformed data."""
-        return [FMPDiscoveryFilingsData.model_validate(d) for d in data]
+        return FMPDiscoveryFilingsData.model_validate_list(data)
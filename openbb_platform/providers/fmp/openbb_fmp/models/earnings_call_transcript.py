@@ -84,4 +84,4 @@ class FMPEarningsCallTranscriptFetcher(
         query: FMPEarningsCallTranscriptQueryParams, data: List[Dict], **kwargs: Any
     ) -> List[FMPEarningsCallTranscriptData]:
         """Return the transformed data."""
-        return [FMPEarningsCallTranscriptData.model_validate(d) for d in data]
+        return FMPEarningsCallTranscriptData.model_validate_list(data)
@@ -152,4 +152,4 @@ class FMPEconomicCalendarFetcher(
         **kwargs: Any,
     ) -> List[FMPEconomicCalendarData]:
         """Transform the data."""
-        return [FMPEconomicCalendarData.model_validate(d) for d in data]
+        return FMPEconomicCalendarData.model_validate_list(data)
@@ -168,20 +168,16 @@ class FMPEquityHistoricalFetcher(
 
         # Get rid of duplicate fields.
         to_pop = ["label", "changePercent"]
-        results: List[FMPEquityHistoricalData] = []
-
-        for d in sorted(
+        multiple_symbols = len(query.symbol.split(",")) > 1
+        rows = sorted(
             data,
-            key=lambda x: (
-                (x["date"], x["symbol"])
-                if len(query.symbol.split(",")) > 1
-                else x["date"]
-            ),
-            reverse=False,
-        ):
-            _ = [d.pop(pop) for pop in to_pop if pop in d]
+            key=lambda x: (x["date"], x["symbol"]) if multiple_symbols else x["date"],
+        )
+
+        for d in rows:
+            for pop in to_pop:
+                d.pop(pop, None)
             if d.get("unadjusted_volume") == d.get("volume"):
-                _ = d.pop("unadjusted_volume")
-            results.append(FMPEquityHistoricalData.model_validate(d))
+                d.pop("unadjusted_volume", None)
 
-        return results
+        return FMPEquityHistoricalData.model_validate_list(rows)
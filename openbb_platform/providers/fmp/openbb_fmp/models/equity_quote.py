@@ -149,4 +149,4 @@ class FMPEquityQuoteFetcher(
         query: FMPEquityQuoteQueryParams, data: List[Dict], **kwargs: Any
     ) -> List[FMPEquityQuoteData]:
         """Return the transformed data."""
-        return [FMPEquityQuoteData.model_validate(d) for d in data]
+        return FMPEquityQuoteData.model_validate_list(data)
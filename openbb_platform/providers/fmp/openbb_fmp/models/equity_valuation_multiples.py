@@ -149,4 +149,4 @@ class FMPEquityValuationMultiplesFetcher(
         **kwargs: Any,
     ) -> List[FMPEquityValuationMultiplesData]:
         """Return the transformed data."""
-        return [FMPEquityValuationMultiplesData.model_validate(d) for d in data]
+        return FMPEquityValuationMultiplesData.model_validate_list(data)
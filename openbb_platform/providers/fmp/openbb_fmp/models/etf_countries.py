@@ -105,4 +105,4 @@ class FMPEtfCountriesFetcher(
         query: FMPEtfCountriesQueryParams, data: List[Dict], **kwargs: Any
     ) -> List[FMPEtfCountriesData]:
         """Return the transformed data."""
-        return [FMPEtfCountriesData.model_validate(d) for d in data]
+        return FMPEtfCountriesData.model_validate_list(data)
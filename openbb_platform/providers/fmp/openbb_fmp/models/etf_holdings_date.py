@@ -67,4 +67,4 @@ class FMPEtfHoldingsDateFetcher(
         **kwargs: Any,
     ) -> List[FMPEtfHoldingsDateData]:
         """Return the transformed data."""
-        return [FMPEtfHoldingsDateData.model_validate(d) for d in data]
+        return FMPEtfHoldingsDateData.model_validate_list(data)
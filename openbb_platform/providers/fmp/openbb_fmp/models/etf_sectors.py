@@ -60,4 +60,4 @@ class FMPEtfSectorsFetcher(
                 "%"
             ):
                 d["weightPercentage"] = float(d["weightPercentage"][:-1]) / 100
-        return [FMPEtfSectorsData.model_validate(d) for d in data]
+        return FMPEtfSectorsData.model_validate_list(data)
@@ -52,4 +52,4 @@ class FMPHistoricalEmployeesFetcher(
         query: FMPHistoricalEmployeesQueryParams, data: List[Dict], **kwargs: Any
     ) -> List[FMPHistoricalEmployeesData]:
         """Return the transformed data."""
-        return [FMPHistoricalEmployeesData.model_validate(d) for d in data]
+        return FMPHistoricalEmployeesData.model_validate_list(data)
@@ -108,4 +108,4 @@ class FMPHistoricalEpsFetcher(
         query: FMPHistoricalEpsQueryParams, data: List[Dict], **kwargs: Any
     ) -> List[FMPHistoricalEpsData]:
         """Return the transformed data."""
-        return [FMPHistoricalEpsData.model_validate(d) for d in data]
+        return FMPHistoricalEpsData.model_validate_list(data)
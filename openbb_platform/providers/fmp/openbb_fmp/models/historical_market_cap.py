@@ -123,4 +123,4 @@ class FmpHistoricalMarketCapFetcher(
 
         records = df.sort_values(by=["date", "marketCap"]).to_dict(orient="records")
 
-        return [FmpHistoricalMarketCapData.model_validate(d) for d in records]
+        return FmpHistoricalMarketCapData.model_validate_list(records)
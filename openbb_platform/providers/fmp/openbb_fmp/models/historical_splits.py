@@ -62,4 +62,4 @@ class FMPHistoricalSplitsFetcher(
         query: FMPHistoricalSplitsQueryParams, data: List[Dict], **kwargs: Any
     ) -> List[FMPHistoricalSplitsData]:
         """Return the transformed data."""
-        return [FMPHistoricalSplitsData.model_validate(d) for d in data]
+        return FMPHistoricalSplitsData.model_validate_list(data)
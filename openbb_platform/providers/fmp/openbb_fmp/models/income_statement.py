@@ -266,4 +266,4 @@ class FMPIncomeStatementFetcher(
         for result in data:
             result.pop("symbol", None)
             result.pop("cik", None)
-        return [FMPIncomeStatementData.model_validate(d) for d in data]
+        return FMPIncomeStatementData.model_validate_list(data)
@@ -232,4 +232,4 @@ class FMPIncomeStatementGrowthFetcher(
         query: FMPIncomeStatementGrowthQueryParams, data: List[Dict], **kwargs: Any
     ) -> List[FMPIncomeStatementGrowthData]:
         """Return the transformed data."""
-        return [FMPIncomeStatementGrowthData.model_validate(d) for d in data]
+        return FMPIncomeStatementGrowthData.model_validate_list(data)
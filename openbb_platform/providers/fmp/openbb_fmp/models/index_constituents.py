@@ -113,4 +113,4 @@ class FMPIndexConstituentsFetcher(
         query: FMPIndexConstituentsQueryParams, data: List[Dict], **kwargs: Any
     ) -> List[FMPIndexConstituentsData]:
         """Return the raw data from the FMP endpoint."""
-        return [FMPIndexConstituentsData.model_validate(d) for d in data]
+        return FMPIndexConstituentsData.model_validate_list(data)
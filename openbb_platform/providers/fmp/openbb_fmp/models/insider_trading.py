@@ -103,4 +103,4 @@ class FMPInsiderTradingFetcher(
     ) -> List[FMPInsiderTradingData]:
         """Return the transformed data."""
         data = sorted(data, key=lambda x: x["filingDate"], reverse=True)
-        return [FMPInsiderTradingData.model_validate(d) for d in data]
+        return FMPInsiderTradingData.model_validate_list(data)
@@ -160,4 +160,4 @@ class FMPInstitutionalOwnershipFetcher(
         query: FMPInstitutionalOwnershipQueryParams, data: List[Dict], **kwargs: Any
     ) -> List[FMPInstitutionalOwnershipData]:
         """Return the transformed data."""
-        return [FMPInstitutionalOwnershipData.model_validate(d) for d in data]
+        return FMPInstitutionalOwnershipData.model_validate_list(data)
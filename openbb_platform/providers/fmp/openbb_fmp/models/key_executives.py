@@ -69,4 +69,4 @@ class FMPKeyExecutivesFetcher(
         query: FMPKeyExecutivesQueryParams, data: List[Dict], **kwargs: Any
     ) -> List[FMPKeyExecutivesData]:
         """Return the transformed data."""
-        return [FMPKeyExecutivesData.model_validate(d) for d in data]
+        return FMPKeyExecutivesData.model_validate_list(data)
@@ -331,4 +331,4 @@ class FMPKeyMetricsFetcher(
         query: FMPKeyMetricsQueryParams, data: List[Dict], **kwargs: Any
     ) -> List[FMPKeyMetricsData]:
         """Return the transformed data."""
-        return [FMPKeyMetricsData.model_validate(d) for d in data]
+        return FMPKeyMetricsData.model_validate_list(data)
@@ -191,4 +191,4 @@ class FMPMarketSnapshotsFetcher(
         query: FMPMarketSnapshotsQueryParams, data: List[Dict], **kwargs: Any
     ) -> List[FMPMarketSnapshotsData]:
         """Return the transformed data."""
-        return [FMPMarketSnapshotsData.model_validate(d) for d in data]
+        return FMPMarketSnapshotsData.model_validate_list(data)
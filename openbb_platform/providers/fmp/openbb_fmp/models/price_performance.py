@@ -106,4 +106,4 @@ class FMPPricePerformanceFetcher(
             ]
             warn(f"Missing data for symbols: {missing_symbols}")
 
-        return [FMPPricePerformanceData.model_validate(i) for i in data]
+        return FMPPricePerformanceData.model_validate_list(data)
@@ -95,4 +95,4 @@ class FMPPriceTargetConsensusFetcher(
         **kwargs: Any,
     ) -> List[FMPPriceTargetConsensusData]:
         """Return the transformed data."""
-        return [FMPPriceTargetConsensusData.model_validate(d) for d in data]
+        return FMPPriceTargetConsensusData.model_validate_list(data)
@@ -65,4 +65,4 @@ class FMPShareStatisticsFetcher(
         query: FMPShareStatisticsQueryParams, data: List[Dict], **kwargs: Any
     ) -> List[FMPShareStatisticsData]:
         """Return the transformed data."""
-        return [FMPShareStatisticsData.model_validate(d) for d in data]
+        return FMPShareStatisticsData.model_validate_list(data)
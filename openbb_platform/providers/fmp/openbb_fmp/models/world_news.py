@@ -100,4 +100,4 @@ class FMPWorldNewsFetcher(
         query: FMPWorldNewsQueryParams, data: List[Dict], **kwargs: Any
     ) -> List[FMPWorldNewsData]:
         """Return the transformed data."""
-        return [FMPWorldNewsData.model_validate(d) for d in data]
+        return FMPWorldNewsData.model_validate_list(data)
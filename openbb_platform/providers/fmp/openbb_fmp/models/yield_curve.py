@@ -128,4 +128,4 @@ class FMPYieldCurveFetcher(
         flattened_data.loc[:, "date"] = flattened_data["date"].dt.strftime("%Y-%m-%d")
         records = flattened_data.to_dict(orient="records")
 
-        return [FMPYieldCurveData.model_validate(d) for d in records]
+        return FMPYieldCurveData.model_validate_list(records)
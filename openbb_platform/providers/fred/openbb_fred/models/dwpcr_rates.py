@@ -85,4 +85,4 @@ class FREDDiscountWindowPrimaryCreditRateFetcher(
         query: FREDDiscountWindowPrimaryCreditRateParams, data: List, **kwargs: Any
     ) -> List[FREDDiscountWindowPrimaryCreditRateData]:
         """Transform data."""
-        return [FREDDiscountWindowPrimaryCreditRateData.model_validate(d) for d in data]
+        return FREDDiscountWindowPrimaryCreditRateData.model_validate_list(data)
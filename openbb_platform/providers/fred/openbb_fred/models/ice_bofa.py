@@ -113,4 +113,4 @@ class FREDICEBofAFetcher(
         query: FREDICEBofAQueryParams, data: List, **kwargs: Any
     ) -> List[FREDICEBofAData]:
         """Transform data."""
-        return [FREDICEBofAData.model_validate(d) for d in data]
+        return FREDICEBofAData.model_validate_list(data)
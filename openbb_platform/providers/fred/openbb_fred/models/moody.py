@@ -113,4 +113,4 @@ class FREDMoodyCorporateBondIndexFetcher(
         query: FREDMoodyCorporateBondIndexQueryParams, data: List, **kwargs: Any
     ) -> List[FREDMoodyCorporateBondIndexData]:
         """Transform data."""
-        return [FREDMoodyCorporateBondIndexData.model_validate(d) for d in data]
+        return FREDMoodyCorporateBondIndexData.model_validate_list(data)
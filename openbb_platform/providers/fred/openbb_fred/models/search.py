@@ -313,4 +313,4 @@ class FredSearchFetcher(
 
         records = df.to_dict(orient="records")
 
-        return [FredSearchData.model_validate(r) for r in records]
+        return FredSearchData.model_validate_list(records)
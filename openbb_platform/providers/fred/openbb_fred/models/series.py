@@ -154,98 +154,96 @@ class FredSeriesFetcher(
     ) -> List[Dict]:
         """Extract data."""
         # pylint: disable=import-outside-toplevel
+        import asyncio  # noqa
         from openbb_core.provider.utils.helpers import (
             ClientResponse,
             ClientSession,
             amake_requests,
             get_querystring,
         )
-        from pandas import DataFrame
+        from openbb_fred.utils.fred_helpers import get_series_metadata
+        from pandas import DataFrame, to_numeric
 
         api_key = credentials.get("fred_api_key") if credentials else ""
 
         base_url = "https://api.stlouisfed.org/fred/series/observations"
-        metadata_url = "https://api.stlouisfed.org/fred/series"
 
         querystring = get_querystring(query.model_dump(), ["series_id"])
-        series_ids = query.symbol.split(",") if "," in query.symbol else [query.symbol]
+        series_ids = list(dict.fromkeys(query.symbol.split(",")))
 
         urls = [
             f"{base_url}?series_id={series_id}&{querystring}&file_type=json&api_key={api_key}"
             for series_id in series_ids
         ]
 
-        async def callback(response: ClientResponse, session: ClientSession) -> Dict:
+        async def callback(response: ClientResponse, _: ClientSession) -> Dict:
             observations_response = await response.json()
             series_id = response.url.query.get("series_id")
-
-            metadata_response = await session.get_json(
-                f"{metadata_url}?series_id={series_id}&file_type=json&api_key={api_key}",
-                timeout=5,
-            )
-
-            # seriess is not a typo, it's the actual key in the response
-            _metadata = (
-                metadata_response.get("seriess", [{}])[0]
-                if isinstance(metadata_response, dict)
-                else {}
-            ) or {}
             observations = (
                 observations_response.get("observations")
                 if isinstance(observations_response, dict)
                 else []
             ) or []
             try:
-                for d in observations:
-                    d.pop("realtime_start")
-                    d.pop("realtime_end")
-
-                data = (
-                    DataFrame(observations)
-                    .replace(".", None)
-                    .set_index("date")["value"]
-                    .astype(float)
-                    .dropna()
-                    .to_dict()
-                )
-            except (KeyError, TypeError):
+                frame = DataFrame(observations, columns=["date", "value"])
+            except (KeyError, TypeError, ValueError):
                 return {}
+            # Missing values are ".", and are dropped.
+            values = to_numeric(frame["value"], errors="coerce")
+            valid = values.notna()
 
             return {
                 series_id: {
-                    "title": _metadata.get("title"),
-                    "units": _metadata.get("units"),
-                    "frequency": _metadata.get("frequency"),
-                    "seasonal_adjustment": _metadata.get("seasonal_adjustment"),
-                    "notes": _metadata.get("notes"),
-                    "data": data,
+                    "data": {
+                        "date": frame["date"][valid].tolist(),
+                        "value": values[valid].tolist(),
+                    }
                 }
             }
 
         try:
-            results = await amake_requests(urls, callback, timeout=5, **kwargs)
-            return results
+            results, metadata = await asyncio.gather(
+                amake_requests(urls, callback, timeout=5, **kwargs),
+                get_series_metadata(series_ids, api_key),  # type: ignore[arg-type]
+            )
         except Exception as e:
             raise OpenBBError(e) from e
 
+        for result in results:
+            for series_id, series in result.items():
+                series.update(metadata.get(series_id, {}))
+
+        return results
+
     @staticmethod
     def transform_data(
         query: FredSeriesQueryParams, data: List[Dict], **kwargs: Any
     ) -> AnnotatedResult[List[FredSeriesData]]:
         """Transform data."""
         # pylint: disable=import-outside-toplevel
-        from pandas import DataFrame
+        from pandas import Series, concat
 
         series = {_id: s.pop("data", {}) for d in data for _id, s in d.items()}
         metadata = {_id: m for d in data for _id, m in d.items()}
-        records = (
-            DataFrame(series)
-            .filter(items=query.symbol.split(","), axis=1)
-            .reset_index()
-            .rename(columns={"index": "date"})
-            .fillna("N/A")
-            .replace("N/A", None)
-            .to_dict("records")
+        symbols = [
+            s
+            for s in dict.fromkeys(query.symbol.split(","))
+            if series.get(s, {}).get("date")
+        ]
+        if not symbols:
+            return AnnotatedResult(result=[], metadata=metadata)
+
+        # Outer join of the series on their dates, with NaN where a series has no value.
+        frame = concat(
+            [
+                Series(series[s]["value"], index=series[s]["date"], dtype=float)
+                for s in symbols
+            ],
+            axis=1,
+            keys=symbols,
+            sort=True,
         )
-        validated = [FredSeriesData.model_validate(r) for r in records]
+        columns = {"date": frame.index.tolist()}
+        columns.update({s: frame[s] for s in symbols})
+        validated = FredSeriesData.model_validate_list(columns)
         return AnnotatedResult(result=validated, metadata=metadata)
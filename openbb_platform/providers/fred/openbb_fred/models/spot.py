@@ -105,4 +105,4 @@ class FREDSpotRateFetcher(
         query: FREDSpotRateQueryParams, data: List, **kwargs: Any
     ) -> List[FREDSpotRateData]:
         """Transform data."""
-        return [FREDSpotRateData.model_validate(d) for d in data]
+        return FREDSpotRateData.model_validate_list(data)
@@ -76,4 +76,4 @@ class FREDSelectedTreasuryBillFetcher(
         query: FREDSelectedTreasuryBillQueryParams, data: List, **kwargs: Any
     ) -> List[FREDSelectedTreasuryBillData]:
         """Transform data."""
-        return [FREDSelectedTreasuryBillData.model_validate(d) for d in data]
+        return FREDSelectedTreasuryBillData.model_validate_list(data)
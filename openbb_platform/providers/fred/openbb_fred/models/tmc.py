@@ -78,4 +78,4 @@ class FREDTreasuryConstantMaturityFetcher(
         query: FREDTreasuryConstantMaturityQueryParams, data: List, **kwargs: Any
     ) -> List[FREDTreasuryConstantMaturityData]:
         """Transform data."""
-        return [FREDTreasuryConstantMaturityData.model_validate(d) for d in data]
+        return FREDTreasuryConstantMaturityData.model_validate_list(data)
@@ -120,4 +120,4 @@ class FREDYieldCurveFetcher(
         flattened_data.loc[:, "date"] = flattened_data["date"].dt.strftime("%Y-%m-%d")
         records = flattened_data.to_dict(orient="records")
 
-        return [FREDYieldCurveData.model_validate(d) for d in records]
+        return FREDYieldCurveData.model_validate_list(records)
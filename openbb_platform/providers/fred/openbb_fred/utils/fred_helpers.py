@@ -1,12 +1,22 @@
 """FRED helpers."""
 
+import asyncio
 import csv
 import os
+import threading
 from pathlib import Path
-from typing import Dict, List, Literal
+from time import monotonic
+from typing import Dict, List, Literal, Tuple
 
 from openbb_core.app.model.abstract.error import OpenBBError
 
+# Seconds the metadata of a series is kept, since titles and units rarely change.
+SERIES_METADATA_TTL = 86400
+SERIES_METADATA_FIELDS = ["title", "units", "frequency", "seasonal_adjustment", "notes"]
+
+_series_metadata: Dict[str, Tuple[float, Dict]] = {}
+_series_metadata_lock = threading.Lock()
+
 YIELD_CURVE_NOMINAL_RATES = [round(1 / 12, 3), 0.25, 0.5, 1, 2, 3, 5, 7, 10, 20, 30]
 YIELD_CURVE_SPOT_RATES = [0.5, 1, 2, 3, 5, 7, 10, 20, 30, 50, 75, 100]
 YIELD_CURVE_REAL_RATES = [5.0, 7, 10, 20, 30]
@@ -505,3 +515,67 @@ def get_bop_series(country: str) -> dict:
         debits_total=f"{country}B6DBTT01CXCUSAQ",
         debits_total_secondary_income=f"{country}B6DBSI01CXCUSAQ",
     )
+
+
+async def get_series_metadata(series_ids: List[str], api_key: str) -> Dict[str, Dict]:
+    """Get the metadata of FRED series, from the cache when it has not expired.
+
+    The series missing from the cache are requested concurrently, and kept for
+    `SERIES_METADATA_TTL` seconds. A series whose metadata cannot be retrieved
+    gets empty metadata, and is requested again on the next call.
+
+    Parameters
+    ----------
+    series_ids : List[str]
+        The FRED series IDs.
+    api_key : str
+        The FRED API key.
+
+    Returns
+    -------
+    Dict[str, Dict]
+        The title, units, frequency, seasonal adjustment and notes of each series.
+    """
+    # pylint: disable=import-outside-toplevel
+    from openbb_core.provider.utils.helpers import amake_request
+
+    now = monotonic()
+    with _series_metadata_lock:
+        metadata = {
+            series_id: _series_metadata[series_id][1]
+            for series_id in series_ids
+            if series_id in _series_metadata and _series_metadata[series_id][0] > now
+        }
+
+    async def get_one(series_id: str) -> Dict:
+        """Get the metadata of a series."""
+        try:
+            response = await amake_request(
+                "https://api.stlouisfed.org/fred/series"
+                + f"?series_id={series_id}&file_type=json&api_key={api_key}",
+                timeout=5,
+            )
+        except Exception:  # pylint: disable=broad-except
+            return {}
+        # seriess is not a typo, it's the actual key in the response
+        series = (
+            response.get("seriess", [{}])[0] if isinstance(response, dict) else {}
+        ) or {}
+        if not series:
+            return {}
+        result = {k: series.get(k) for k in SERIES_METADATA_FIELDS}
+        with _series_metadata_lock:
+            _series_metadata[series_id] = (monotonic() + SERIES_METADATA_TTL, result)
+        return result
+
+    missing = [
+        series_id
+        for series_id in dict.fromkeys(series_ids)
+        if series_id not in metadata
+    ]
+    for series_id, result in zip(
+        missing, await asyncio.gather(*[get_one(series_id) for series_id in missing])
+    ):
+        metadata[series_id] = result or dict.fromkeys(SERIES_METADATA_FIELDS)
+
+    return metadata
@@ -0,0 +1,65 @@
+"""Test the FRED helpers."""
+
+import asyncio
+from unittest.mock import patch
+
+import pytest
+from openbb_fred.utils import fred_helpers
+from openbb_fred.utils.fred_helpers import SERIES_METADATA_TTL, get_series_metadata
+
+# pylint: disable=redefined-outer-name, protected-access
+
+
+@pytest.fixture
+def requests():
+    """Patch the requests of the series, and clear the metadata cache."""
+    urls: list = []
+
+    async def amake_request(url, **kwargs):
+        urls.append(url)
+        if "series_id=FAIL" in url:
+            raise ValueError("Failed.")
+        series_id = url.split("series_id=")[1].split("&")[0]
+        return {"seriess": [{"title": series_id, "units": "Percent"}]}
+
+    with patch.dict(fred_helpers._series_metadata, clear=True), patch(
+        "openbb_core.provider.utils.helpers.amake_request", amake_request
+    ):
+        yield urls
+
+
+def test_get_series_metadata(requests):
+    """Test the metadata is requested once, and reused until it expires."""
+    first = asyncio.run(get_series_metadata(["DGS10"], "key"))
+    second = asyncio.run(get_series_metadata(["DGS10"], "key"))
+
+    assert first == second
+    assert first["DGS10"]["title"] == "DGS10"
+    assert first["DGS10"]["units"] == "Percent"
+    assert len(requests) == 1
+
+    expired = fred_helpers.monotonic() + SERIES_METADATA_TTL + 1
+    with patch.object(fred_helpers, "monotonic", return_value=expired):
+        asyncio.run(get_series_metadata(["DGS10"], "key"))
+
+    assert len(requests) == 2
+
+
+def test_get_series_metadata_failed(requests):
+    """Test a series that fails gets empty metadata, and is not cached."""
+    metadata = asyncio.run(get_series_metadata(["FAIL", "DGS10"], "key"))
+    asyncio.run(get_series_metadata(["FAIL", "DGS10"], "key"))
+
+    assert metadata["FAIL"] == dict.fromkeys(fred_helpers.SERIES_METADATA_FIELDS)
+    assert metadata["DGS10"]["title"] == "DGS10"
+    assert "FAIL" not in fred_helpers._series_metadata
+    assert sum("series_id=FAIL" in url for url in requests) == 2
+    assert sum("series_id=DGS10" in url for url in requests) == 1
+
+
+def test_get_series_metadata_duplicates(requests):
+    """Test a series given more than once is requested once."""
+    metadata = asyncio.run(get_series_metadata(["DGS10", "DGS2", "DGS10"], "key"))
+
+    assert list(metadata) == ["DGS10", "DGS2"]
+    assert len(requests) == 2
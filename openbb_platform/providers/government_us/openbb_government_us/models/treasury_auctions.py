@@ -232,4 +232,4 @@ class GovernmentUSTreasuryAuctionsFetcher(
         **kwargs: Any,
     ) -> List[GovernementUSTreasuryAuctionsData]:
         """Transform the data."""
-        return [GovernementUSTreasuryAuctionsData.model_validate(d) for d in data]
+        return GovernementUSTreasuryAuctionsData.model_validate_list(data)
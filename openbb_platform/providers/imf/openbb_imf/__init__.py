@@ -1,6 +1,7 @@
 """OpenBB IMF Provider Module."""
 
 from openbb_core.provider.abstract.provider import Provider
+from openbb_core.provider.utils.rate_limit import RateLimit
 from openbb_imf.models.available_indicators import ImfAvailableIndicatorsFetcher
 from openbb_imf.models.direction_of_trade import ImfDirectionOfTradeFetcher
 from openbb_imf.models.economic_indicators import ImfEconomicIndicatorsFetcher
@@ -25,4 +26,5 @@ imf_provider = Provider(
         "PortVolume": ImfPortVolumeFetcher,
     },
     repr_name="International Monetary Fund (IMF) Data APIs",
+    rate_limit=RateLimit(max_concurrent=8),
 )
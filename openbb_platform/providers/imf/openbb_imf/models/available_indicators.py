@@ -123,4 +123,4 @@ class ImfAvailableIndicatorsFetcher(
         **kwargs: Any,
     ) -> list[ImfAvailableIndicatorsData]:
         """Transform the data."""
-        return [ImfAvailableIndicatorsData.model_validate(d) for d in data]
+        return ImfAvailableIndicatorsData.model_validate_list(data)
@@ -300,4 +300,4 @@ class ImfEconomicIndicatorsFetcher(
         )
         records = df.replace({nan: None}).to_dict(orient="records")
 
-        return [ImfEconomicIndicatorsData.model_validate(r) for r in records]
+        return ImfEconomicIndicatorsData.model_validate_list(records)
@@ -1,6 +1,7 @@
 """IMF Port Watch helpers."""
 
-from typing import Optional
+import asyncio
+from typing import Callable, Optional
 
 from async_lru import alru_cache
 from openbb_imf.utils.constants import (
@@ -9,6 +10,8 @@ from openbb_imf.utils.constants import (
     PORT_COUNTRIES,
 )
 
+EXCLUDED_FIELDS = ["year", "month", "day", "date", "ObjectId"]
+
 
 def map_port_country_code(country_code: str) -> str:
     """Map the 3-letter country code to the full country name.
@@ -103,6 +106,97 @@ def get_port_id_choices() -> list:
     return choices
 
 
+async def _get_page(session, url: str) -> dict:
+    """Get a page of a feature service query."""
+    # pylint: disable=import-outside-toplevel
+    from openbb_core.app.model.abstract.error import OpenBBError
+
+    async with await session.get(url) as response:
+        if response.status != 200:
+            raise OpenBBError(f"Failed to fetch data: {response.status}")
+        data = await response.json()
+
+    # ArcGIS returns the errors of a query with a 200 status.
+    if isinstance(data, dict) and "error" in data:
+        error = data["error"]
+        message = error.get("message") if isinstance(error, dict) else error
+        raise OpenBBError(f"Failed to fetch data: {message}")
+    return data
+
+
+def _parse_page(data: dict) -> dict:
+    """Parse the features of a page into columns, with the date as a string."""
+    features = data.get("features") or []
+    if not features:
+        return {}
+
+    fields = [k for k in features[0]["attributes"] if k not in EXCLUDED_FIELDS]
+    columns: dict = {"date": []}
+    columns.update({k: [] for k in fields})
+    for feature in features:
+        attributes = feature["attributes"]
+        columns["date"].append(
+            f"{attributes['year']:04d}-{attributes['month']:02d}-{attributes['day']:02d}"
+        )
+        for k in fields:
+            columns[k].append(attributes.get(k))
+
+    return columns
+
+
+async def get_feature_records(get_url: Callable[[int], str]) -> list:
+    """Get all the records of a paginated ArcGIS feature service query.
+
+    The first page gives the page size of the service. When the query has more
+    records, their count is requested, and the remaining pages are fetched
+    concurrently, within the rate limit of the provider. Each page is parsed into
+    columns as it arrives, and the records are returned in the query order.
+
+    Parameters
+    ----------
+    get_url : Callable[[int], str]
+        Function returning the URL of the query, starting at the given record offset.
+
+    Returns
+    -------
+    list
+        A list of dictionaries, each representing a record, with its date as "%Y-%m-%d".
+    """
+    # pylint: disable=import-outside-toplevel
+    from openbb_core.app.model.abstract.error import OpenBBError
+    from openbb_core.provider.utils.helpers import get_async_requests_session
+
+    async with await get_async_requests_session() as session:
+        data = await _get_page(session, get_url(0))
+        pages = [_parse_page(data)]
+        page_size = len(data.get("features") or [])
+
+        if data.get("exceededTransferLimit") is True and page_size:
+            count = await _get_page(session, get_url(0) + "&returnCountOnly=true")
+            if "count" not in count:
+                raise OpenBBError(f"Failed to count the records: {count}")
+
+            async def get_page(offset: int) -> dict:
+                """Get and parse the page at the offset."""
+                return _parse_page(await _get_page(session, get_url(offset)))
+
+            pages.extend(
+                await asyncio.gather(
+                    *[
+                        get_page(offset)
+                        for offset in range(page_size, count["count"], page_size)
+                    ]
+                )
+            )
+
+    columns: dict = {}
+    for page in pages:
+        for k, values in page.items():
+            columns.setdefault(k, []).extend(values)
+
+    return [dict(zip(columns, row)) for row in zip(*columns.values())]
+
+
 @alru_cache(maxsize=25)
 async def get_daily_chokepoint_data(
     chokepoint_id, start_date: Optional[str] = None, end_date: Optional[str] = None
@@ -116,8 +210,6 @@ async def get_daily_chokepoint_data(
     """
     # pylint: disable=import-outside-toplevel
     from datetime import datetime  # noqa
-    from openbb_core.app.model.abstract.error import OpenBBError
-    from openbb_core.provider.utils.helpers import get_async_requests_session
 
     if start_date is not None and end_date is None:
         end_date = datetime.now().strftime("%Y-%m-%d")
@@ -146,54 +238,7 @@ async def get_daily_chokepoint_data(
             )
         )
 
-    offset: int = 0
-    output: dict = {}
-    url = get_chokepoints_url(offset)
-
-    async with await get_async_requests_session() as session:
-        async with await session.get(url) as response:
-            data: dict = {}
-
-            if response.status != 200:
-                raise OpenBBError(f"Failed to fetch data: {response.status}")
-            data = await response.json()
-
-        if "features" in data:
-            output = data.copy()
-
-        while data.get("exceededTransferLimit") is True:
-            offset += len(data["features"])
-            url = get_chokepoints_url(offset)
-
-            async with await session.get(url) as response:
-                data = {}
-                if response.status != 200:
-                    raise OpenBBError(f"Failed to fetch data: {response.status}")
-                data = await response.json()
-
-            if "features" in data:
-                output["features"].extend(data["features"])
-
-        final_output: list = []
-
-        for feature in output["features"]:
-            date = datetime(
-                feature["attributes"]["year"],
-                feature["attributes"]["month"],
-                feature["attributes"]["day"],
-            ).strftime("%Y-%m-%d")
-            final_output.append(
-                {
-                    "date": date,
-                    **{
-                        k: v
-                        for k, v in feature["attributes"].items()
-                        if k not in ["year", "month", "day", "date", "ObjectId"]
-                    },
-                }
-            )
-
-    return final_output
+    return await get_feature_records(get_chokepoints_url)
 
 
 @alru_cache(maxsize=1)
@@ -307,7 +352,6 @@ async def get_daily_port_activity_data(
     # pylint: disable=import-outside-toplevel
     from datetime import datetime  # noqa
     from openbb_core.app.model.abstract.error import OpenBBError
-    from openbb_core.provider.utils.helpers import get_async_requests_session
 
     if port_id is None:
         raise OpenBBError(
@@ -341,51 +385,4 @@ async def get_daily_port_activity_data(
             )
         )
 
-    offset: int = 0
-    output: dict = {}
-    url = get_port_url(offset)
-
-    async with await get_async_requests_session() as session:
-        async with await session.get(url) as response:
-            data = {}
-
-            if response.status != 200:
-                raise OpenBBError(f"Failed to fetch data: {response.status}")
-            data = await response.json()
-
-        if "features" in data:
-            output = data.copy()
-
-        while data.get("exceededTransferLimit") is True:
-            offset += len(data["features"])
-            url = get_port_url(offset)
-
-            async with await session.get(url) as response:
-                data = {}
-                if response.status != 200:
-                    raise OpenBBError(f"Failed to fetch data: {response.status}")
-                data = await response.json()
-
-            if "features" in data:
-                output["features"].extend(data["features"])
-
-        final_output: list = []
-
-        for feature in output["features"]:
-            date = datetime(
-                feature["attributes"]["year"],
-                feature["attributes"]["month"],
-                feature["attributes"]["day"],
-            ).strftime("%Y-%m-%d")
-            final_output.append(
-                {
-                    "date": date,
-                    **{
-                        k: v
-                        for k, v in feature["attributes"].items()
-                        if k not in ["year", "month", "day", "date", "ObjectId"]
-                    },
-                }
-            )
-
-    return final_output
+    return await get_feature_records(get_port_url)
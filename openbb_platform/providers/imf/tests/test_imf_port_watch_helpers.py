@@ -0,0 +1,161 @@
+"""Test the IMF Port Watch helpers."""
+
+import asyncio
+from unittest.mock import patch
+
+import pytest
+from openbb_core.app.model.abstract.error import OpenBBError
+from openbb_imf.utils.port_watch_helpers import get_feature_records
+
+# pylint: disable=redefined-outer-name
+
+URL = "https://services9.arcgis.com/query?f=json"
+
+
+def get_url(offset: int) -> str:
+    """Get the URL of the query at the offset."""
+    return f"{URL}&resultOffset={offset}"
+
+
+def make_page(days: list, exceeded: bool = False) -> dict:
+    """Make a page of features, one per day of January 2024."""
+    return {
+        "features": [
+            {
+                "attributes": {
+                    "year": 2024,
+                    "month": 1,
+                    "day": day,
+                    "ObjectId": day,
+                    "portcalls": day * 10,
+                }
+            }
+            for day in days
+        ],
+        "exceededTransferLimit": exceeded,
+    }
+
+
+class MockResponse:
+    """Mock response of the session."""
+
+    def __init__(self, status: int, data: dict, delay: float):
+        """Initialize the response."""
+        self.status = status
+        self._data = data
+        self._delay = delay
+
+    async def __aenter__(self):
+        """Enter the response."""
+        return self
+
+    async def __aexit__(self, *args):
+        """Exit the response."""
+
+    async def json(self):
+        """Get the data, after a delay."""
+        await asyncio.sleep(self._delay)
+        return self._data
+
+
+class MockSession:
+    """Mock session, with the responses by URL."""
+
+    def __init__(self, responses: dict):
+        """Initialize the session."""
+        self.responses = responses
+        self.urls: list = []
+
+    async def __aenter__(self):
+        """Enter the session."""
+        return self
+
+    async def __aexit__(self, *args):
+        """Exit the session."""
+
+    async def get(self, url: str):
+        """Get the response of the URL. The later pages answer first."""
+        self.urls.append(url)
+        status, data = self.responses[url]
+        delay = 0.01 if url.endswith("=2") else 0
+        return MockResponse(status, data, delay)
+
+
+@pytest.fixture
+def mock_session():
+    """Patch the session of the requests, with the responses to set."""
+    session = MockSession({})
+
+    async def get_session(**kwargs):
+        return session
+
+    with patch(
+        "openbb_core.provider.utils.helpers.get_async_requests_session", get_session
+    ):
+        yield session
+
+
+def test_get_feature_records(mock_session):
+    """Test the pages are returned in the query order, after counting the records."""
+    mock_session.responses = {
+        get_url(0): (200, make_page([1, 2], exceeded=True)),
+        get_url(0) + "&returnCountOnly=true": (200, {"count": 5}),
+        get_url(2): (200, make_page([3, 4])),
+        get_url(4): (200, make_page([5])),
+    }
+
+    records = asyncio.run(get_feature_records(get_url))
+
+    assert records == [
+        {"date": f"2024-01-0{day}", "portcalls": day * 10} for day in range(1, 6)
+    ]
+    assert mock_session.urls[:2] == [
+        get_url(0),
+        get_url(0) + "&returnCountOnly=true",
+    ]
+    assert sorted(mock_session.urls[2:]) == [get_url(2), get_url(4)]
+
+
+def test_get_feature_records_single_page(mock_session):
+    """Test the records are not counted when the first page has all of them."""
+    mock_session.responses = {get_url(0): (200, make_page([1]))}
+
+    records = asyncio.run(get_feature_records(get_url))
+
+    assert records == [{"date": "2024-01-01", "portcalls": 10}]
+    assert mock_session.urls == [get_url(0)]
+
+
+def test_get_feature_records_failed_page(mock_session):
+    """Test a page that fails raises an error."""
+    mock_session.responses = {
+        get_url(0): (200, make_page([1, 2], exceeded=True)),
+        get_url(0) + "&returnCountOnly=true": (200, {"count": 4}),
+        get_url(2): (500, {}),
+    }
+
+    with pytest.raises(OpenBBError, match="Failed to fetch data: 500"):
+        asyncio.run(get_feature_records(get_url))
+
+
+def test_get_feature_records_failed_count(mock_session):
+    """Test an error returned with the count of the records raises an error."""
+    error = {"error": {"code": 400, "message": "Unable to complete operation."}}
+    mock_session.responses = {
+        get_url(0): (200, make_page([1, 2], exceeded=True)),
+        get_url(0) + "&returnCountOnly=true": (200, error),
+    }
+
+    with pytest.raises(OpenBBError, match="Unable to complete operation."):
+        asyncio.run(get_feature_records(get_url))
+
+
+def test_get_feature_records_missing_count(mock_session):
+    """Test a count response without the count raises an error."""
+    mock_session.responses = {
+        get_url(0): (200, make_page([1, 2], exceeded=True)),
+        get_url(0) + "&returnCountOnly=true": (200, {}),
+    }
+
+    with pytest.raises(OpenBBError, match="Failed to count the records"):
+        asyncio.run(get_feature_records(get_url))
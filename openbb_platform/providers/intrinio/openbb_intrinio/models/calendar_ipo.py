@@ -190,4 +190,4 @@ class IntrinioCalendarIpoFetcher(
         """Return the transformed data."""
         if not data:
             raise EmptyDataError("The request was returned empty.")
-        return [IntrinioCalendarIpoData.model_validate(d) for d in data]
+        return IntrinioCalendarIpoData.model_validate_list(data)
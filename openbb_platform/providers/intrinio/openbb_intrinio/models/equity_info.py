@@ -75,4 +75,4 @@ class IntrinioEquityInfoFetcher(
         **kwargs: Any,
     ) -> List[IntrinioEquityInfoData]:
         """Transform the data."""
-        return [IntrinioEquityInfoData.model_validate(d) for d in data]
+        return IntrinioEquityInfoData.model_validate_list(data)
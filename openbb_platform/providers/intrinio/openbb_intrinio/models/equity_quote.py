@@ -139,4 +139,4 @@ class IntrinioEquityQuoteFetcher(
         query: IntrinioEquityQuoteQueryParams, data: List[Dict], **kwargs: Any
     ) -> List[IntrinioEquityQuoteData]:
         """Return the transformed data."""
-        return [IntrinioEquityQuoteData.model_validate(d) for d in data]
+        return IntrinioEquityQuoteData.model_validate_list(data)
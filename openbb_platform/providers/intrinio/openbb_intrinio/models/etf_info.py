@@ -652,4 +652,4 @@ class IntrinioEtfInfoFetcher(
         **kwargs: Any,
     ) -> List[IntrinioEtfInfoData]:
         """Transform data."""
-        return [IntrinioEtfInfoData.model_validate(d) for d in data]
+        return IntrinioEtfInfoData.model_validate_list(data)
@@ -224,4 +224,4 @@ class IntrinioEtfPricePerformanceFetcher(
         **kwargs: Any,
     ) -> List[IntrinioEtfPricePerformanceData]:
         """Transform data."""
-        return [IntrinioEtfPricePerformanceData.model_validate(d) for d in data]
+        return IntrinioEtfPricePerformanceData.model_validate_list(data)
@@ -75,4 +75,4 @@ class IntrinioFinancialAttributesFetcher(
         **kwargs: Any,
     ) -> List[IntrinioFinancialAttributesData]:
         """Return the transformed data."""
-        return [IntrinioFinancialAttributesData.model_validate(item) for item in data]
+        return IntrinioFinancialAttributesData.model_validate_list(data)
@@ -162,4 +162,4 @@ class IntrinioForwardPeEstimatesFetcher(
                     else len(symbols)
                 )
             )
-        return [IntrinioForwardPeEstimatesData.model_validate(d) for d in data]
+        return IntrinioForwardPeEstimatesData.model_validate_list(data)
@@ -111,4 +111,4 @@ class IntrinioFredSeriesFetcher(
         query: IntrinioFredSeriesQueryParams, data: List[Dict], **kwargs: Any
     ) -> List[IntrinioFredSeriesData]:
         """Return the transformed data."""
-        return [IntrinioFredSeriesData.model_validate(d) for d in data]
+        return IntrinioFredSeriesData.model_validate_list(data)
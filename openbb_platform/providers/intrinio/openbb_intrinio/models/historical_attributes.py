@@ -141,4 +141,4 @@ class IntrinioHistoricalAttributesFetcher(
         **kwargs: Any,
     ) -> List[IntrinioHistoricalAttributesData]:
         """Return the transformed data."""
-        return [IntrinioHistoricalAttributesData.model_validate(d) for d in data]
+        return IntrinioHistoricalAttributesData.model_validate_list(data)
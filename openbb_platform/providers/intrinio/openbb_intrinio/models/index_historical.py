@@ -98,4 +98,4 @@ class IntrinioIndexHistoricalFetcher(
         **kwargs: Any,
     ) -> List[IntrinioIndexHistoricalData]:
         """Return the transformed data."""
-        return [IntrinioIndexHistoricalData.model_validate(d) for d in data]
+        return IntrinioIndexHistoricalData.model_validate_list(data)
@@ -175,4 +175,4 @@ class IntrinioInsiderTradingFetcher(
                 ]
             )
 
-        return [IntrinioInsiderTradingData.model_validate(d) for d in transformed_data]
+        return IntrinioInsiderTradingData.model_validate_list(transformed_data)
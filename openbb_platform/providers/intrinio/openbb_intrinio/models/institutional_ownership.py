@@ -128,4 +128,4 @@ class IntrinioInstitutionalOwnershipFetcher(
         **kwargs: Any,
     ) -> List[IntrinioInstitutionalOwnershipData]:
         """Return the transformed data."""
-        return [IntrinioInstitutionalOwnershipData.model_validate(d) for d in data]
+        return IntrinioInstitutionalOwnershipData.model_validate_list(data)
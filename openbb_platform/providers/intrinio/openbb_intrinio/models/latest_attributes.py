@@ -96,4 +96,4 @@ class IntrinioLatestAttributesFetcher(
         **kwargs: Any,
     ) -> List[IntrinioLatestAttributesData]:
         """Return the transformed data."""
-        return [IntrinioLatestAttributesData.model_validate(d) for d in data]
+        return IntrinioLatestAttributesData.model_validate_list(data)
@@ -260,4 +260,4 @@ class IntrinioMarketSnapshotsFetcher(
         **kwargs: Any,
     ) -> list[IntrinioMarketSnapshotsData]:
         """Return the transformed data."""
-        return [IntrinioMarketSnapshotsData.model_validate(d) for d in data]
+        return IntrinioMarketSnapshotsData.model_validate_list(data)
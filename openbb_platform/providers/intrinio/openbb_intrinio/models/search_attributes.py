@@ -70,4 +70,4 @@ class IntrinioSearchAttributesFetcher(
         **kwargs: Any,
     ) -> List[IntrinioSearchAttributesData]:
         """Return the transformed data."""
-        return [IntrinioSearchAttributesData.model_validate(item) for item in data]
+        return IntrinioSearchAttributesData.model_validate_list(data)
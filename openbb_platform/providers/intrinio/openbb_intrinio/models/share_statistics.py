@@ -90,4 +90,4 @@ class IntrinioShareStatisticsFetcher(
         query: IntrinioShareStatisticsQueryParams, data: List[Dict], **kwargs: Any
     ) -> List[IntrinioShareStatisticsData]:
         """Return the transformed data."""
-        return [IntrinioShareStatisticsData.model_validate(d) for d in data]
+        return IntrinioShareStatisticsData.model_validate_list(data)
@@ -220,4 +220,4 @@ class NasdaqCalendarIpoFetcher(
                 data, key=lambda x: datetime.strptime(x["filedDate"], "%m/%d/%Y")
             )
 
-        return [NasdaqCalendarIpoData.model_validate(d) for d in data]
+        return NasdaqCalendarIpoData.model_validate_list(data)
@@ -179,4 +179,4 @@ class NasdaqEconomicCalendarFetcher(
         **kwargs: Any,
     ) -> List[NasdaqEconomicCalendarData]:
         """Return the transformed data."""
-        return [NasdaqEconomicCalendarData.model_validate(d) for d in data]
+        return NasdaqEconomicCalendarData.model_validate_list(data)
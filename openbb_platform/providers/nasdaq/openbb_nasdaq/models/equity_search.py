@@ -152,4 +152,4 @@ class NasdaqEquitySearchFetcher(
             .to_dict(orient="records")
         )
 
-        return [NasdaqEquitySearchData.model_validate(d) for d in results]
+        return NasdaqEquitySearchData.model_validate_list(results)
@@ -233,4 +233,4 @@ class OECDCompositeLeadingIndicatorFetcher(
         **kwargs: Any,
     ) -> List[OECDCompositeLeadingIndicatorData]:
         """Transform the data from the OECD endpoint."""
-        return [OECDCompositeLeadingIndicatorData.model_validate(d) for d in data]
+        return OECDCompositeLeadingIndicatorData.model_validate_list(data)
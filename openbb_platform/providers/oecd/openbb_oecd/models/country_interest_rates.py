@@ -166,4 +166,4 @@ class OecdCountryInterestRatesFetcher(
         **kwargs: Any,
     ) -> List[OecdCountryInterestRatesData]:
         """Transform the data from the OECD endpoint."""
-        return [OecdCountryInterestRatesData.model_validate(d) for d in data]
+        return OecdCountryInterestRatesData.model_validate_list(data)
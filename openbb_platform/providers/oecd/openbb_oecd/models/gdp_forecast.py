@@ -253,4 +253,4 @@ class OECDGdpForecastFetcher(
         query: OECDGdpForecastQueryParams, data: List[Dict], **kwargs: Any
     ) -> List[OECDGdpForecastData]:
         """Transform the data from the OECD endpoint."""
-        return [OECDGdpForecastData.model_validate(d) for d in data]
+        return OECDGdpForecastData.model_validate_list(data)
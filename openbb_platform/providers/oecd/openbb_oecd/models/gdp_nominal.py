@@ -201,4 +201,4 @@ class OECDGdpNominalFetcher(
         **kwargs: Any,
     ) -> List[OECDGdpNominalData]:
         """Transform the data from the OECD endpoint."""
-        return [OECDGdpNominalData.model_validate(d) for d in data]
+        return OECDGdpNominalData.model_validate_list(data)
@@ -174,4 +174,4 @@ class OECDGdpRealFetcher(Fetcher[OECDGdpRealQueryParams, List[OECDGdpRealData]])
         **kwargs: Any,
     ) -> List[OECDGdpRealData]:
         """Transform the data from the OECD endpoint."""
-        return [OECDGdpRealData.model_validate(d) for d in data]
+        return OECDGdpRealData.model_validate_list(data)
@@ -164,4 +164,4 @@ class OECDHousePriceIndexFetcher(
         query: OECDHousePriceIndexQueryParams, data: List[Dict], **kwargs: Any
     ) -> List[OECDHousePriceIndexData]:
         """Transform the data from the OECD endpoint."""
-        return [OECDHousePriceIndexData.model_validate(d) for d in data]
+        return OECDHousePriceIndexData.model_validate_list(data)
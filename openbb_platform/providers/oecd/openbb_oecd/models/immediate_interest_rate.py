@@ -157,4 +157,4 @@ class OECDImmediateInterestRateFetcher(
         query: OECDImmediateInterestRateQueryParams, data: List[Dict], **kwargs: Any
     ) -> List[OECDImmediateInterestRateData]:
         """Transform the data from the OECD endpoint."""
-        return [OECDImmediateInterestRateData.model_validate(d) for d in data]
+        return OECDImmediateInterestRateData.model_validate_list(data)
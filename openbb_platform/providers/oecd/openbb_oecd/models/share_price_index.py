@@ -155,4 +155,4 @@ class OECDSharePriceIndexFetcher(
         query: OECDSharePriceIndexQueryParams, data: List[Dict], **kwargs: Any
     ) -> List[OECDSharePriceIndexData]:
         """Transform the data from the OECD endpoint."""
-        return [OECDSharePriceIndexData.model_validate(d) for d in data]
+        return OECDSharePriceIndexData.model_validate_list(data)
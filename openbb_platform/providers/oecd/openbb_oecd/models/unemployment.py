@@ -186,4 +186,4 @@ class OECDUnemploymentFetcher(
         query: OECDUnemploymentQueryParams, data: List[Dict], **kwargs: Any
     ) -> List[OECDUnemploymentData]:
         """Transform the data from the OECD endpoint."""
-        return [OECDUnemploymentData.model_validate(d) for d in data]
+        return OECDUnemploymentData.model_validate_list(data)
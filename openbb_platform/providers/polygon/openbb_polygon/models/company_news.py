@@ -152,4 +152,4 @@ class PolygonCompanyNewsFetcher(
         **kwargs: Any,
     ) -> List[PolygonCompanyNewsData]:
         """Transform data."""
-        return [PolygonCompanyNewsData.model_validate(d) for d in data]
+        return PolygonCompanyNewsData.model_validate_list(data)
@@ -190,21 +190,22 @@ class PolygonEquityHistoricalFetcher(
 
         if not data:
             raise EmptyDataError()
+        rows = sorted(data, key=lambda x: x["t"])
         if query.extended_hours is True or query._timespan not in [
             "second",
             "minute",
             "hour",
         ]:
-            return [
-                PolygonEquityHistoricalData.model_validate(d)
-                for d in sorted(data, key=lambda x: x["t"], reverse=False)
-            ]
-
-        return [
-            PolygonEquityHistoricalData.model_validate(d)
-            for d in sorted(data, key=lambda x: x["t"], reverse=False)
-            if to_datetime(d["t"]).time()
-            >= datetime.strptime("09:30:00", "%H:%M:%S").time()
-            and to_datetime(d["t"]).time()
-            <= datetime.strptime("16:00:00", "%H:%M:%S").time()
-        ]
+            return PolygonEquityHistoricalData.model_validate_list(rows)
+
+        # The rows of a range crossing a DST change have different offsets.
+        times = (
+            to_datetime([d["t"] for d in rows], utc=True)
+            .tz_convert("America/New_York")
+            .time
+        )
+        market_open = datetime.strptime("09:30:00", "%H:%M:%S").time()
+        market_close = datetime.strptime("16:00:00", "%H:%M:%S").time()
+        return PolygonEquityHistoricalData.model_validate_list(
+            [d for d, t in zip(rows, times) if market_open <= t <= market_close]
+        )
@@ -228,4 +228,4 @@ class PolygonEquityNBBOFetcher(
         **kwargs: Any,
     ) -> List[PolygonEquityNBBOData]:
         """Transform the data."""
-        return [PolygonEquityNBBOData.model_validate(d) for d in data]
+        return PolygonEquityNBBOData.model_validate_list(data)
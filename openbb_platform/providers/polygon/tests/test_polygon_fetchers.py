@@ -35,6 +35,29 @@ def vcr_config():
     }
 
 
+def test_polygon_equity_historical_transform_data_dst():
+    """Test the regular hours are kept in a range crossing a DST change."""
+    query = PolygonEquityHistoricalFetcher.transform_query(
+        {"symbol": "AAPL", "interval": "1h", "extended_hours": False}
+    )
+    data = [
+        {"t": t, "o": 1.0, "h": 1.0, "l": 1.0, "c": 1.0, "v": 1}
+        for t in [
+            "2024-03-08T08:00:00-0500",
+            "2024-03-08T10:00:00-0500",
+            "2024-03-11T10:00:00-0400",
+            "2024-03-11T17:00:00-0400",
+        ]
+    ]
+
+    result = PolygonEquityHistoricalFetcher.transform_data(query, data)
+
+    assert [r.date.isoformat() for r in result] == [
+        "2024-03-08T10:00:00-05:00",
+        "2024-03-11T10:00:00-04:00",
+    ]
+
+
 @pytest.mark.record_http
 def test_polygon_equity_historical_fetcher(credentials=test_credentials):
     """Test the Polygon Equity Historical fetcher."""
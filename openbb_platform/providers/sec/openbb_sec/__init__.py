@@ -20,6 +20,7 @@ from openbb_sec.models.schema_files import SecSchemaFilesFetcher
 from openbb_sec.models.sec_filing import SecFilingFetcher
 from openbb_sec.models.sic_search import SecSicSearchFetcher
 from openbb_sec.models.symbol_map import SecSymbolMapFetcher
+from openbb_sec.utils.definitions import SEC_RATE_LIMIT
 
 sec_provider = Provider(
     name="sec",
@@ -47,4 +48,5 @@ sec_provider = Provider(
         "SymbolMap": SecSymbolMapFetcher,
     },
     repr_name="Securities and Exchange Commission (SEC)",
+    rate_limit=SEC_RATE_LIMIT,
 )
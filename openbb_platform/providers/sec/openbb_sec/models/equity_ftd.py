@@ -101,4 +101,4 @@ class SecEquityFtdFetcher(
         query: SecEquityFtdQueryParams, data: List[Dict], **kwargs: Any
     ) -> List[SecEquityFtdData]:
         """Transform the data to the standard format."""
-        return [SecEquityFtdData.model_validate(d) for d in data]
+        return SecEquityFtdData.model_validate_list(data)
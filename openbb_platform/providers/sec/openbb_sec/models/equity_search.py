@@ -88,4 +88,4 @@ class SecEquitySearchFetcher(
         query: SecEquitySearchQueryParams, data: Dict, **kwargs: Any
     ) -> List[SecEquitySearchData]:
         """Transform the data to the standard format."""
-        return [SecEquitySearchData.model_validate(d) for d in data]
+        return SecEquitySearchData.model_validate_list(data)
@@ -218,4 +218,4 @@ class SecInsiderTradingFetcher(
         **kwargs: Any,
     ) -> list[SecInsiderTradingData]:
         """Transform the data."""
-        return [SecInsiderTradingData.model_validate(d) for d in data]
+        return SecInsiderTradingData.model_validate_list(data)
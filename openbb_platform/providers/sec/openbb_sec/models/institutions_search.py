@@ -72,4 +72,4 @@ class SecInstitutionsSearchFetcher(
         query: SecInstitutionsSearchQueryParams, data: List[Dict], **kwargs: Any
     ) -> List[SecInstitutionsSearchData]:
         """Transform the data to the standard format."""
-        return [SecInstitutionsSearchData.model_validate(d) for d in data]
+        return SecInstitutionsSearchData.model_validate_list(data)
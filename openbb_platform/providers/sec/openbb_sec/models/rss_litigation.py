@@ -95,4 +95,4 @@ class SecRssLitigationFetcher(
         query: SecRssLitigationQueryParams, data: List[Dict], **kwargs: Any
     ) -> List[SecRssLitigationData]:
         """Transform the data to the standard format."""
-        return [SecRssLitigationData.model_validate(d) for d in data]
+        return SecRssLitigationData.model_validate_list(data)
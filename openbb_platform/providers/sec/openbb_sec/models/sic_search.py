@@ -108,4 +108,4 @@ class SecSicSearchFetcher(
         query: SecSicSearchQueryParams, data: List[Dict], **kwargs: Any
     ) -> List[SecSicSearchData]:
         """Transform the data."""
-        return [SecSicSearchData.model_validate(d) for d in data]
+        return SecSicSearchData.model_validate_list(data)
@@ -4,6 +4,8 @@
 
 from typing import Dict, Literal
 
+from openbb_core.provider.utils.rate_limit import RateLimit
+
 QUARTERS = Literal[1, 2, 3, 4]
 
 SEC_HEADERS: Dict[str, str] = {
@@ -12,6 +14,9 @@ SEC_HEADERS: Dict[str, str] = {
     "Host": "www.sec.gov",
 }
 
+# The SEC fair access policy allows 10 requests per second.
+SEC_RATE_LIMIT = RateLimit(requests=10, period=1, max_concurrent=8)
+
 # Some endpoints don't like the Host header.
 
 HEADERS: Dict[str, str] = {
@@ -1,10 +1,12 @@
 """Module for handling Form 4 data, by company, from the SEC."""
 
 import logging
+import threading
 from datetime import date as dateType
 from typing import Optional
 
 from openbb_core.app.model.abstract.error import OpenBBError
+from openbb_sec.utils.definitions import SEC_RATE_LIMIT
 
 SEC_HEADERS: dict[str, str] = {
     "User-Agent": "Jesus Window Washing jesus@stainedglass.com",
@@ -98,6 +100,10 @@ def get_logger():
 logger = get_logger()
 
 
+_connections: dict = {}
+_connections_lock = threading.Lock()
+
+
 def setup_database(conn):
     """Create a caching database for Form 4 data."""
     create_table_query = """
@@ -138,7 +144,16 @@ def setup_database(conn):
         filing_url TEXT NOT NULL
     );
     """
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
     conn.execute(create_table_query)
+    conn.execute(
+        "CREATE INDEX IF NOT EXISTS form4_data_filing_url ON form4_data (filing_url)"
+    )
+    conn.execute(
+        "CREATE INDEX IF NOT EXISTS form4_data_symbol_filing_date"
+        " ON form4_data (symbol, filing_date)"
+    )
     conn.commit()
 
 
@@ -158,44 +173,104 @@ def add_missing_column(conn, column_name):
         )
     )
     cursor = conn.cursor()
-    cursor.execute(f"ALTER TABLE form4_data ADD COLUMN {column_name} {missing_type}")
+    cursor.execute(
+        f'ALTER TABLE form4_data ADD COLUMN "{column_name}" {missing_type}'  # noqa: S608
+    )
     conn.commit()
 
 
-def compress_db(db_path):
-    """Compress the database file."""
-    # pylint: disable=import-outside-toplevel
-    import gzip
-    import shutil
-
-    with open(db_path, "rb") as f_in, gzip.open(f"{db_path}.gz", "wb") as f_out:
-        shutil.copyfileobj(f_in, f_out)
-
-
 def decompress_db(db_path):
-    """Decompress the database file."""
+    """Decompress a database file written by previous versions, and remove the archive."""
     # pylint: disable=import-outside-toplevel
     import gzip
+    import os
     import shutil
 
     with gzip.open(f"{db_path}.gz", "rb") as f_in, open(db_path, "wb") as f_out:
         shutil.copyfileobj(f_in, f_out)
+    os.remove(f"{db_path}.gz")
 
 
-def close_db(conn, db_path):
-    """Sort the table by "date" before closing the connection and compressing the database."""
+def open_db(db_path):
+    """Get the open connection to the database, creating it on first use.
+
+    A database that cannot be read is renamed with a ".faulty" suffix and replaced
+    by an empty one. An OpenBBError is raised when the database cannot be created.
+    """
     # pylint: disable=import-outside-toplevel
     import os
+    import sqlite3
 
-    conn.execute(
-        "CREATE TABLE IF NOT EXISTS form4_data_sorted AS SELECT * FROM form4_data ORDER BY filing_date"
-    )
-    conn.execute("DROP TABLE form4_data")
-    conn.execute("ALTER TABLE form4_data_sorted RENAME TO form4_data")
-    conn.commit()
+    with _connections_lock:
+        if db_path in _connections:
+            return _connections[db_path]
+
+        os.makedirs(os.path.dirname(db_path), exist_ok=True)
+        if os.path.exists(f"{db_path}.gz") and not os.path.exists(db_path):
+            decompress_db(db_path)
+
+        conn = None
+        try:
+            conn = sqlite3.connect(db_path, check_same_thread=False)
+            setup_database(conn)
+        except sqlite3.DatabaseError as e:
+            if conn is not None:
+                conn.close()
+            if not os.path.exists(db_path):
+                raise OpenBBError(f"Error creating the database {db_path}: {e}") from e
+            faulty_db_path = f"{db_path}.faulty"
+            os.replace(db_path, faulty_db_path)
+            logger.info(
+                "Error reading the database. Renamed it to %s and created a new one.",
+                faulty_db_path,
+            )
+            conn = sqlite3.connect(db_path, check_same_thread=False)
+            setup_database(conn)
+
+        _connections[db_path] = conn
+        return conn
+
+
+def close_db(conn, db_path=None):
+    """Close the connection to the database."""
+    with _connections_lock:
+        for path in [k for k, v in _connections.items() if v is conn or k == db_path]:
+            _connections.pop(path)
     conn.close()
-    compress_db(db_path)
-    os.remove(db_path)
+
+
+def _to_sql_value(value):
+    """Convert a value to a type supported by SQLite."""
+    # pylint: disable=import-outside-toplevel
+    from datetime import date, datetime
+    from math import isnan
+
+    if isinstance(value, float) and isnan(value):
+        return None
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    if value is None or isinstance(value, (str, int, float, bytes)):
+        return value
+    return str(value)
+
+
+def insert_rows(conn, rows):
+    """Insert rows into the form4_data table, in a single transaction."""
+    if not rows:
+        return
+    existing = {r[1] for r in conn.execute("PRAGMA table_info(form4_data)")}
+    columns = list(dict.fromkeys(k for row in rows for k in row))
+    for column in columns:
+        if column not in existing:
+            add_missing_column(conn, column)
+
+    placeholders = ", ".join("?" for _ in columns)
+    names = ", ".join(f'"{c}"' for c in columns)
+    with conn:
+        conn.executemany(
+            f"INSERT INTO form4_data ({names}) VALUES ({placeholders})",  # noqa: S608
+            [tuple(_to_sql_value(row.get(c)) for c in columns) for row in rows],
+        )
 
 
 async def get_form_4_urls(
@@ -286,6 +361,7 @@ async def get_form_4_data(url) -> dict:
         headers=SEC_HEADERS,
         response_callback=response_callback,
         timeout=30,
+        rate_limit=SEC_RATE_LIMIT,
     )  # type: ignore
     response_text = response.decode("utf-8")
 
@@ -496,89 +572,47 @@ async def parse_form_4_data(  # noqa: PLR0915, PLR0912  # pylint: disable=too-ma
     return results
 
 
-async def download_data(urls, use_cache: bool = True):  # noqa: PLR0915
+async def download_data(urls, use_cache: bool = True):
     """Get the Form 4 data from a list of URLs."""
     # pylint: disable=import-outside-toplevel
     import asyncio  # noqa
-    import os
-    import sqlite3
     from numpy import nan
     from openbb_core.app.utils import get_user_cache_directory
     from pandas import DataFrame
 
     results: list = []
-    non_cached_urls: list = []
+    non_cached_urls: list = urls
+    new_rows: list = []
+    conn = None
 
     try:
         if use_cache is True:
-            db_dir = f"{get_user_cache_directory()}/sql"
-            db_path = f"{db_dir}/sec_form4.db"
-            # Decompress the database file
-            if os.path.exists(f"{db_path}.gz"):
-                decompress_db(db_path)
-
-            os.makedirs(db_dir, exist_ok=True)
-
-            try:
-                conn = sqlite3.connect(db_path)
-                setup_database(conn)
-                cached_data = get_cached_data(urls, conn)
-                cached_urls = {entry["filing_url"] for entry in cached_data}
-                for url in urls:
-                    if url not in cached_urls:
-                        non_cached_urls.append(url)
-            except sqlite3.DatabaseError as e:
-                logger.info("Error connecting to the database.")
-                retry_input = input(
-                    "Would you like to retry with a new database? (y/n): "
-                )
-                if retry_input.lower() == "y":
-                    faulty_db_path = f"{db_path}.faulty"
-                    os.rename(db_path, faulty_db_path)
-                    logger.info("Renamed faulty database to %s", faulty_db_path)
-                    db_path = f"{db_dir}/sec_form4.db"
-                    conn = sqlite3.connect(db_path)
-                    setup_database(conn)
-                    cached_data = get_cached_data(urls, conn)
-                    cached_urls = {entry["filing_url"] for entry in cached_data}
-                    for url in urls:
-                        if url not in cached_urls:
-                            non_cached_urls.append(url)
-                else:
-                    raise OpenBBError(e) from e
-
+            conn = open_db(f"{get_user_cache_directory()}/sql/sec_form4.db")
+            cached_data = get_cached_data(urls, conn)
+            cached_urls = {entry["filing_url"] for entry in cached_data}
+            non_cached_urls = [url for url in urls if url not in cached_urls]
             results.extend(cached_data)
-        elif use_cache is False:
-            non_cached_urls = urls
 
         async def get_one(url):
             """Get the data for one URL."""
             data = await get_form_4_data(url)
             result = await parse_form_4_data(data)
-            if not result and use_cache is True:
-                df = DataFrame([{"filing_url": url}])
-                df.to_sql("form4_data", conn, if_exists="append", index=False)
-
-            if result:
-                df = DataFrame(result)
-                df.loc[:, "filing_url"] = url
-                df = df.replace({nan: None}).rename(columns=field_map)
-                try:
-                    if use_cache is True:
-                        df.to_sql("form4_data", conn, if_exists="append", index=False)
-                except sqlite3.DatabaseError as e:
-                    if "no column named" in str(e):
-                        missing_column = (
-                            str(e).split("no column named ")[1].split(" ")[0]
-                        )
-                        missing_column = field_map.get(missing_column, missing_column)
-                        add_missing_column(conn, missing_column)
-                        df.to_sql("form4_data", conn, if_exists="append", index=False)
-                    else:
-                        raise OpenBBError(e) from e
-                results.extend(df.replace({nan: None}).to_dict(orient="records"))
-
-        time_estimate = (len(non_cached_urls) / 7) * 1.8
+            if not result:
+                # Store the URL alone, so filings without transactions are not downloaded again.
+                new_rows.append({"filing_url": url})
+                return
+
+            df = DataFrame(result)
+            df.loc[:, "filing_url"] = url
+            records = (
+                df.replace({nan: None})
+                .rename(columns=field_map)
+                .to_dict(orient="records")
+            )
+            new_rows.extend(records)
+            results.extend(records)
+
+        time_estimate = len(non_cached_urls) / SEC_RATE_LIMIT.requests
         logger.info(
             "Found %d total filings and %d"
             " uncached entries to download, estimated download time: %d seconds.",
@@ -594,25 +628,18 @@ async def download_data(urls, use_cache: bool = True):  # noqa: PLR0915
                 "\n\nReduce the number of requests by using a more specific date range."
             )
 
-        if len(non_cached_urls) > 0:
-            async with asyncio.Semaphore(8):
-                for url_chunk in [
-                    non_cached_urls[i : i + 8]
-                    for i in range(0, len(non_cached_urls), 8)
-                ]:
-                    await asyncio.gather(*[get_one(url) for url in url_chunk])
-                    await asyncio.sleep(1.125)
-
-        if use_cache is True:
-            close_db(conn, db_path)
+        try:
+            if len(non_cached_urls) > 0:
+                await asyncio.gather(*[get_one(url) for url in non_cached_urls])
+        finally:
+            if conn is not None:
+                insert_rows(conn, new_rows)
 
         results = [entry for entry in results if entry.get("filing_date")]
 
         return sorted(results, key=lambda x: x["filing_date"], reverse=True)
 
     except Exception as e:  # pylint: disable=broad-except
-        if use_cache is True:
-            close_db(conn, db_path)
         raise OpenBBError(
             f"Unexpected error while downloading and processing data -> {e.__class__.__name__}: {e}"
         ) from e
@@ -622,11 +649,19 @@ def get_cached_data(urls, conn):
     """Retrieve cached data for a list of URLs."""
     # pylint: disable=import-outside-toplevel
     from numpy import nan
-    from pandas import read_sql
-
-    placeholders = ", ".join("?" for _ in urls)
-    query = f"SELECT * FROM form4_data WHERE filing_url IN ({placeholders})"  # noqa
-    df = read_sql(query, conn, params=urls)
+    from pandas import concat, read_sql
+
+    # Stay below the maximum number of host parameters of older SQLite versions.
+    chunk_size = 900
+    frames = []
+    for i in range(0, len(urls), chunk_size):
+        chunk = urls[i : i + chunk_size]
+        placeholders = ", ".join("?" for _ in chunk)
+        query = f"SELECT * FROM form4_data WHERE filing_url IN ({placeholders})"  # noqa
+        frames.append(read_sql(query, conn, params=chunk))
+    if not frames:
+        return []
+    df = concat(frames) if len(frames) > 1 else frames[0]
     return df.replace({nan: None}).to_dict(orient="records") if not df.empty else []
 
 
@@ -21,7 +21,7 @@ from openbb_sec.utils.definitions import (
     TAXONOMIES,
     USD_PER_SHARE_FACTS,
 )
-from openbb_sec.utils.helpers import get_all_companies, symbol_map
+from openbb_sec.utils.helpers import resolver, symbol_map
 from pandas import DataFrame
 
 
@@ -171,9 +171,10 @@ async def get_frame(  # pylint: disable =too-many-arguments,too-many-locals, too
         "count": response.get("pts", ""),  # type: ignore
     }
     df = DataFrame(data)
-    companies = await get_all_companies(use_cache=use_cache)
-    cik_to_symbol = companies.set_index("cik")["symbol"].to_dict()
-    df["symbol"] = df["cik"].astype(str).map(cik_to_symbol)
+    ciks = df["cik"].astype(str)
+    df["symbol"] = ciks.map(
+        await resolver.get_symbols(ciks.unique().tolist(), use_cache=use_cache)
+    )
     df["unit"] = metadata.get("unit")
     df["fact"] = metadata.get("label")
     df["frame"] = metadata.get("frame")
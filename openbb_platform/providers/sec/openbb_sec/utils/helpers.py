@@ -2,7 +2,11 @@
 
 # pylint: disable =unused-argument
 
-from typing import Dict, List, Optional, Union
+import asyncio
+import threading
+from time import monotonic
+from typing import Any, Dict, Iterable, List, Optional, Set, Union
+from weakref import WeakKeyDictionary
 
 from aiohttp_client_cache import SQLiteBackend
 from aiohttp_client_cache.session import CachedSession
@@ -125,22 +129,154 @@ async def search_institutions(keyword: str, use_cache: bool = True) -> DataFrame
     return institutions[hp]
 
 
-async def symbol_map(symbol: str, use_cache: bool = True) -> str:
-    """Return the CIK number of a ticker symbol for querying the SEC API."""
-    symbol = symbol.upper().replace(".", "-")
-    symbols = await get_all_companies(use_cache=use_cache)
+class SecSymbolResolver:
+    """Process-wide index of the tickers, CIK numbers and fund series registered with the SEC.
 
-    if symbol not in symbols["symbol"].to_list():
-        symbols = await get_mf_and_etf_map(use_cache=use_cache)
-        if symbol not in symbols["symbol"].to_list():
-            return ""
-    cik = symbols[symbols["symbol"] == symbol]["cik"].iloc[0]
-    cik_: str = ""
-    temp = 10 - len(cik)
-    for i in range(temp):  # pylint: disable=W0612
-        cik_ = cik_ + "0"
+    The company tickers, and the mutual fund and ETF tickers, are each loaded on
+    first use into dictionaries, so a lookup is a dictionary access and thousands
+    of symbols resolve in one pass. The fund index is only loaded when a symbol is
+    not a company ticker, or a fund is looked up.
+
+    After `ttl` seconds, lookups keep using the loaded index while it is reloaded
+    in the background. With `use_cache=False`, the index is reloaded before the
+    lookup. Concurrent loads of an index on the same event loop share one request.
+    """
 
-    return str(cik_ + cik)
+    def __init__(self, ttl: float = 86400) -> None:
+        """Initialize the resolver."""
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._indexes: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        self._loaded: Dict[str, float] = {}
+        self._loads: WeakKeyDictionary[
+            asyncio.AbstractEventLoop, Dict[str, asyncio.Task]
+        ] = WeakKeyDictionary()
+        self._tasks: Set[asyncio.Task] = set()
+
+    @staticmethod
+    async def _load_companies(use_cache: bool) -> Dict[str, Dict[str, Any]]:
+        """Index the company tickers by symbol and by CIK, keeping the first match."""
+        companies = await get_all_companies(use_cache=use_cache)
+        by_symbol: Dict[str, str] = {}
+        by_cik: Dict[str, str] = {}
+        for cik, symbol in zip(companies["cik"].tolist(), companies["symbol"].tolist()):
+            by_symbol.setdefault(symbol, cik)
+            by_cik.setdefault(cik, symbol)
+        return {"symbol": by_symbol, "cik": by_cik}
+
+    @staticmethod
+    async def _load_funds(use_cache: bool) -> Dict[str, Dict[str, Any]]:
+        """Index the fund classes by symbol, CIK, series ID and class ID."""
+        funds = await get_mf_and_etf_map(use_cache=use_cache)
+        index: Dict[str, Dict[str, Any]] = {
+            k: {} for k in ("symbol", "cik", "seriesId", "classId")
+        }
+        for row in funds.to_dict("records"):
+            for k, values in index.items():
+                values.setdefault(row[k], []).append(row)
+        return index
+
+    async def _load(self, name: str, use_cache: bool) -> Dict[str, Dict[str, Any]]:
+        """Load an index, and replace the previous one."""
+        loader = self._load_companies if name == "companies" else self._load_funds
+        index = await loader(use_cache)
+        with self._lock:
+            self._indexes[name] = index
+            self._loaded[name] = monotonic()
+        return index
+
+    def _start_load(self, name: str, use_cache: bool) -> asyncio.Task:
+        """Start loading an index, or get the load running on this event loop."""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            loads = self._loads.setdefault(loop, {})
+            task = loads.get(name)
+            if task is None:
+                task = loads[name] = loop.create_task(self._load(name, use_cache))
+                self._tasks.add(task)
+                task.add_done_callback(lambda t: self._finish_load(loads, name, t))
+        return task
+
+    def _finish_load(
+        self, loads: Dict[str, asyncio.Task], name: str, task: asyncio.Task
+    ) -> None:
+        """Forget a finished load, retrieving its error when nothing awaited it."""
+        with self._lock:
+            if loads.get(name) is task:
+                del loads[name]
+        self._tasks.discard(task)
+        if not task.cancelled():
+            task.exception()
+
+    async def _get_index(self, name: str, use_cache: bool) -> Dict[str, Dict[str, Any]]:
+        """Get an index, loading it when missing and refreshing it when expired."""
+        with self._lock:
+            index = self._indexes.get(name)
+            expired = monotonic() - self._loaded.get(name, 0) > self.ttl
+        if index is None or not use_cache:
+            return await asyncio.shield(self._start_load(name, use_cache))
+        if expired:
+            self._start_load(name, False)
+        return index
+
+    async def get_ciks(
+        self, symbols: Iterable[str], use_cache: bool = True
+    ) -> Dict[str, str]:
+        """Get the CIK numbers of ticker symbols, padded to 10 digits.
+
+        Symbols that are not company tickers are looked up in the fund tickers.
+        The symbols without a CIK number are left out of the result.
+        """
+        keys = {symbol: symbol.upper().replace(".", "-") for symbol in symbols}
+        companies = (await self._get_index("companies", use_cache))["symbol"]
+        ciks = {
+            symbol: companies[key] for symbol, key in keys.items() if key in companies
+        }
+        if len(ciks) < len(keys):
+            funds = (await self._get_index("funds", use_cache))["symbol"]
+            ciks.update(
+                {
+                    symbol: funds[key][0]["cik"]
+                    for symbol, key in keys.items()
+                    if symbol not in ciks and key in funds
+                }
+            )
+        return {symbol: cik.zfill(10) for symbol, cik in ciks.items()}
+
+    async def get_symbols(
+        self, ciks: Iterable[Union[str, int]], use_cache: bool = True
+    ) -> Dict[Union[str, int], str]:
+        """Get the company ticker symbols of CIK numbers, leaving out the ones without a ticker."""
+        companies = (await self._get_index("companies", use_cache))["cik"]
+        symbols: Dict[Union[str, int], str] = {}
+        for cik in ciks:
+            key = str(cik) if isinstance(cik, int) else cik.lstrip("0")
+            if key in companies:
+                symbols[cik] = companies[key]
+        return symbols
+
+    async def get_funds(
+        self,
+        symbol: Optional[str] = None,
+        cik: Optional[str] = None,
+        use_cache: bool = True,
+    ) -> List[Dict[str, str]]:
+        """Get the fund classes of a ticker symbol, or of a CIK number.
+
+        Each class has its CIK number, series ID, class ID and symbol.
+        """
+        if not symbol and not cik:
+            raise OpenBBError("Either symbol or cik must be provided.")
+        funds = await self._get_index("funds", use_cache)
+        return funds["symbol"].get(symbol, []) if symbol else funds["cik"].get(cik, [])
+
+
+resolver = SecSymbolResolver()
+
+
+async def symbol_map(symbol: str, use_cache: bool = True) -> str:
+    """Return the CIK number of a ticker symbol for querying the SEC API."""
+    return (await resolver.get_ciks([symbol], use_cache=use_cache)).get(symbol, "")
 
 
 async def cik_map(cik: Union[str, int], use_cache: bool = True) -> str:
@@ -157,15 +293,12 @@ async def cik_map(cik: Union[str, int], use_cache: bool = True) -> str:
     -------
     str: The ticker symbol associated with the CIK number.
     """
-    _cik = str(cik) if isinstance(cik, int) else cik.lstrip("0")
-    symbol = ""
-    companies = await get_all_companies(use_cache=use_cache)
-    if _cik in companies["cik"].to_list():
-        symbol = companies[companies["cik"] == _cik]["symbol"].iloc[0]
-    else:
+    symbols = await resolver.get_symbols([cik], use_cache=use_cache)
+    if cik not in symbols:
+        _cik = str(cik) if isinstance(cik, int) else cik.lstrip("0")
         return f"Error: CIK, {_cik}, does not have a unique ticker."
 
-    return symbol
+    return symbols[cik]
 
 
 def get_schema_filelist(query: str = "", url: str = "", use_cache: bool = True) -> List:
@@ -285,30 +418,11 @@ async def get_series_id(
 ):
     """Map the fund to the series and class IDs for validating the correct filing.
 
-    For an exact match, use a symbol.
+    The symbol, or the CIK number when no symbol is given, must match exactly.
     """
-    symbol = symbol if symbol else ""
-    cik = cik if cik else ""
-
-    results = DataFrame()
-    if not symbol and not cik:
-        raise OpenBBError("Either symbol or cik must be provided.")
-
-    target = symbol if symbol else cik
-    choice = "cik" if not symbol else "symbol"
-    funds = await get_mf_and_etf_map(use_cache=use_cache)
-
-    results = funds[
-        funds["cik"].str.contains(target, case=False)
-        | funds["seriesId"].str.contains(target, case=False)
-        | funds["classId"].str.contains(target, case=False)
-        | funds["symbol"].str.contains(target, case=False)
-    ]
-
-    if len(results) > 0:
-        results = results[results[choice if not symbol else choice] == target]
+    funds = await resolver.get_funds(symbol=symbol, cik=cik, use_cache=use_cache)
 
-        return results
+    return DataFrame(funds) if funds else None
 
 
 async def get_nport_candidates(symbol: str, use_cache: bool = True) -> List[Dict]:
@@ -0,0 +1,322 @@
+"""Utility functions for parsing SEC Form N-PORT-P."""
+
+# pylint: disable=too-many-branches,too-many-statements
+
+from typing import Any, Dict, List, Optional
+from xml.etree.ElementTree import Element, ParseError, XMLPullParser  # noqa: S405
+
+from openbb_core.app.model.abstract.error import OpenBBError
+
+# Size of the chunks read from the response stream.
+CHUNK_SIZE = 2**16
+
+# The nested values of a holding that are flattened into columns, then dropped.
+NESTED_FIELDS = [
+    "identifiers",
+    "securityLending",
+    "issuerConditional",
+    "assetConditional",
+    "debtSec",
+    "currencyConditional",
+    "derivativeInfo",
+    "repurchaseAgrmt",
+]
+
+
+def _local_name(tag: str) -> str:
+    """Remove the namespace of a tag."""
+    return tag.rsplit("}", 1)[-1]
+
+
+def element_to_dict(element: Element) -> Any:
+    """Convert an element to a dictionary, the way `xmltodict` does.
+
+    Attributes are keys prefixed with "@", repeated children are lists, and the
+    text of an element with attributes or children is under "#text".
+    """
+    result: Dict[str, Any] = {
+        f"@{_local_name(k)}": v for k, v in element.attrib.items()
+    }
+    for child in element:
+        tag = _local_name(child.tag)
+        value = element_to_dict(child)
+        if tag not in result:
+            result[tag] = value
+        elif isinstance(result[tag], list):
+            result[tag].append(value)
+        else:
+            result[tag] = [result[tag], value]
+    text = (element.text or "").strip()
+    if not result:
+        return text or None
+    if text:
+        result["#text"] = text
+    return result
+
+
+def flatten_holding(holding: Dict[str, Any]) -> Dict[str, Any]:
+    """Flatten the nested values of a holding into a row of the holdings table."""
+    row = {k: v for k, v in holding.items() if k not in NESTED_FIELDS}
+
+    identifiers = holding.get("identifiers")
+    if isinstance(identifiers, dict):
+        if isinstance(identifiers.get("isin"), dict):
+            row["isin"] = identifiers["isin"].get("@value")
+        if isinstance(identifiers.get("other"), dict) and (
+            "@value" in identifiers["other"]
+        ):
+            row["other_id"] = identifiers["other"].get("@value")
+
+    security_lending = holding.get("securityLending")
+    if isinstance(security_lending, dict):
+        if "loanByFundCondition" in security_lending:
+            loan_by_fund_condition = security_lending["loanByFundCondition"]
+            row["isLoanByFund"] = loan_by_fund_condition.get("@isLoanByFund")
+            row["loanVal"] = loan_by_fund_condition.get("@loanVal")
+        if "isCashCollateral" in security_lending:
+            row["isCashCollateral"] = security_lending.get("isCashCollateral")
+        if "isNonCashCollateral" in security_lending:
+            row["isNonCashCollateral"] = security_lending.get("isNonCashCollateral")
+
+    debt_sec = holding.get("debtSec")
+    if isinstance(debt_sec, dict):
+        row["maturity_date"] = debt_sec.get("maturityDt")
+        row["coupon_kind"] = debt_sec.get("couponKind")
+        row["annualized_return"] = debt_sec.get("annualizedRt")
+        row["is_default"] = debt_sec.get("isDefault")
+        row["in_arrears"] = debt_sec.get("areIntrstPmntsInArrs")
+        row["is_paid_kind"] = debt_sec.get("isPaidKind")
+
+    if isinstance(holding.get("issuerConditional"), dict):
+        row["issuer_conditional"] = holding["issuerConditional"].get("@desc")
+
+    if isinstance(holding.get("assetConditional"), dict):
+        row["asset_conditional"] = holding["assetConditional"].get("@desc")
+
+    derivative_info = holding.get("derivativeInfo")
+    if isinstance(derivative_info, dict):
+        if "optionSwaptionWarrantDeriv" in derivative_info:
+            option_deriv = derivative_info["optionSwaptionWarrantDeriv"]
+            row["derivative_category"] = option_deriv.get("@derivCat")
+            row["counterparty"] = option_deriv["counterparties"].get("counterpartyName")
+            row["lei"] = option_deriv["counterparties"].get("counterpartyLei")
+            row["underlying_name"] = option_deriv["descRefInstrmnt"].get(
+                "nestedDerivInfo", {}
+            ).get("fwdDeriv", {}).get("derivAddlInfo", {}).get("title") or option_deriv[
+                "descRefInstrmnt"
+            ].get(
+                "otherRefInst", {}
+            ).get(
+                "issueTitle"
+            )
+            row["option_type"] = option_deriv.get("putOrCall")
+            row["derivative_payoff"] = option_deriv.get("writtenOrPur")
+            row["expiry_date"] = option_deriv.get("expDt")
+            row["exercise_price"] = option_deriv.get("exercisePrice")
+            row["exercise_currency"] = option_deriv.get("exercisePriceCurCd")
+            row["shares_per_contract"] = option_deriv.get("shareNo")
+            if option_deriv.get("delta") != "XXXX":
+                row["delta"] = option_deriv.get("delta")
+            row["unrealized_gain"] = float(option_deriv.get("unrealizedAppr"))
+
+        if "futrDeriv" in derivative_info:
+            futr_deriv = derivative_info["futrDeriv"]
+            row["derivative_category"] = futr_deriv.get("@derivCat")
+            if isinstance(futr_deriv.get("counterparties"), dict):
+                row["counterparty"] = futr_deriv["counterparties"].get(
+                    "counterpartyName"
+                )
+                row["lei"] = futr_deriv["counterparties"].get("counterpartyLei")
+            index_basket_info = futr_deriv["descRefInstrmnt"].get("indexBasketInfo", {})
+            row["underlying_name"] = index_basket_info.get("indexName")
+            row["other_id"] = index_basket_info.get("indexIdentifier")
+            row["derivative_payoff"] = futr_deriv.get("payOffProf")
+            row["expiry_date"] = futr_deriv.get("expDt") or futr_deriv.get("expDate")
+            row["notional_amount"] = float(futr_deriv.get("notionalAmt"))
+            row["notional_currency"] = futr_deriv.get("curCd")
+            row["unrealized_gain"] = float(futr_deriv.get("unrealizedAppr"))
+
+        if "fwdDeriv" in derivative_info:
+            fwd_deriv = derivative_info["fwdDeriv"]
+            row["derivative_category"] = fwd_deriv.get("@derivCat")
+            row["counterparty"] = fwd_deriv["counterparties"].get("counterpartyName")
+            row["currency_sold"] = fwd_deriv.get("curSold")
+            row["currency_amount_sold"] = float(fwd_deriv.get("amtCurSold"))
+            row["currency_bought"] = fwd_deriv.get("curPur")
+            row["currency_amount_bought"] = float(fwd_deriv.get("amtCurPur"))
+            row["expiry_date"] = fwd_deriv.get("settlementDt")
+            row["unrealized_gain"] = float(fwd_deriv.get("unrealizedAppr"))
+
+        if "swapDeriv" in derivative_info:
+            swap_deriv = derivative_info["swapDeriv"]
+            row["derivative_category"] = swap_deriv.get("@derivCat")
+            row["counterparty"] = swap_deriv["counterparties"].get("counterpartyName")
+            row["lei"] = swap_deriv["counterparties"].get("counterpartyLei")
+            if "otherRefInst" in swap_deriv["descRefInstrmnt"]:
+                row["underlying_name"] = swap_deriv["descRefInstrmnt"][
+                    "otherRefInst"
+                ].get("issueTitle")
+            if "indexBasketInfo" in swap_deriv["descRefInstrmnt"]:
+                index_basket_info = swap_deriv["descRefInstrmnt"]["indexBasketInfo"]
+                row["underlying_name"] = index_basket_info.get("indexName")
+                row["other_id"] = index_basket_info.get("indexIdentifier")
+            row["swap_description"] = (
+                swap_deriv["otherRecDesc"].get("#text")
+                if "otherRecDesc" in swap_deriv["descRefInstrmnt"]
+                else None
+            )
+            if "floatingRecDesc" in swap_deriv:
+                floating_rec_desc = swap_deriv["floatingRecDesc"]
+                reset_tenor = floating_rec_desc["rtResetTenors"]["rtResetTenor"]
+                row["rate_type_rec"] = floating_rec_desc.get("@fixedOrFloating")
+                row["floating_rate_index_rec"] = floating_rec_desc.get(
+                    "@floatingRtIndex"
+                )
+                row["floating_rate_spread_rec"] = float(
+                    floating_rec_desc.get("@floatingRtSpread")
+                )
+                row["payment_amount_rec"] = float(floating_rec_desc.get("@pmntAmt"))
+                row["rate_tenor_rec"] = reset_tenor.get("@rateTenor")
+                row["rate_tenor_unit_rec"] = reset_tenor.get("@rateTenorUnit")
+                row["reset_date_rec"] = reset_tenor.get("@resetDt")
+                row["reset_date_unit_rec"] = reset_tenor.get("@resetDtUnit")
+            if "floatingPmntDesc" in swap_deriv:
+                floating_pmnt_desc = swap_deriv["floatingPmntDesc"]
+                reset_tenor = floating_pmnt_desc["rtResetTenors"]["rtResetTenor"]
+                row["rate_type_pmnt"] = floating_pmnt_desc.get("@fixedOrFloating")
+                row["floating_rate_index_pmnt"] = floating_pmnt_desc.get(
+                    "@floatingRtIndex"
+                )
+                row["floating_rate_spread_pmnt"] = float(
+                    floating_pmnt_desc.get("@floatingRtSpread")
+                )
+                row["payment_amount_pmnt"] = float(floating_pmnt_desc.get("@pmntAmt"))
+                row["rate_tenor_pmnt"] = reset_tenor.get("@rateTenor")
+                row["rate_tenor_unit_pmnt"] = reset_tenor.get("@rateTenorUnit")
+                row["reset_date_pmnt"] = reset_tenor.get("@resetDt")
+                row["reset_date_unit_rec"] = reset_tenor.get("@resetDtUnit")
+            row["expiry_date"] = swap_deriv.get("terminationDt")
+            row["upfront_payment"] = float(swap_deriv.get("upfrontPmnt"))
+            row["payment_currency"] = swap_deriv.get("pmntCurCd")
+            row["upfront_receive"] = float(swap_deriv.get("upfrontRcpt"))
+            row["receive_currency"] = swap_deriv.get("rcptCurCd")
+            row["notional_amount"] = float(swap_deriv.get("notionalAmt"))
+            row["notional_currency"] = swap_deriv.get("curCd")
+            row["unrealized_gain"] = float(swap_deriv.get("unrealizedAppr"))
+
+    repurchase_agrmt = holding.get("repurchaseAgrmt")
+    if isinstance(repurchase_agrmt, dict):
+        row["repo_type"] = repurchase_agrmt.get("transCat")
+        if isinstance(repurchase_agrmt.get("clearedCentCparty"), dict):
+            cleared_cent_cparty = repurchase_agrmt["clearedCentCparty"]
+            row["is_cleared"] = cleared_cent_cparty.get("@isCleared")
+            row["counterparty"] = cleared_cent_cparty.get("@centralCounterparty")
+        row["is_tri_party"] = repurchase_agrmt.get("isTriParty")
+        row["annualized_return"] = repurchase_agrmt.get("repurchaseRt")
+        row["maturity_date"] = repurchase_agrmt.get("maturityDt")
+        if (
+            "repurchaseCollaterals" in repurchase_agrmt
+            and "repurchaseCollateral" in repurchase_agrmt["repurchaseCollaterals"]
+        ):
+            repurchase_collateral = repurchase_agrmt["repurchaseCollaterals"][
+                "repurchaseCollateral"
+            ]
+            row["principal_amount"] = float(repurchase_collateral.get("principalAmt"))
+            row["principal_currency"] = repurchase_collateral.get("@principalCd")
+            row["collateral_amount"] = float(repurchase_collateral.get("collateralVal"))
+            row["collateral_currency"] = repurchase_collateral.get("@collateralCd")
+            row["collateral_type"] = repurchase_collateral.get("@invstCat")
+
+    currency_conditional = holding.get("currencyConditional")
+    if isinstance(currency_conditional, dict):
+        row["exchange_currency"] = currency_conditional.get("@curCd")
+        row["exchange_rate"] = currency_conditional.get("@exchangeRt")
+
+    return row
+
+
+class NportParser:
+    """Incremental parser of an N-PORT-P filing.
+
+    The XML is fed in chunks as it is downloaded. Each holding is flattened into
+    the holdings columns as soon as its `invstOrSec` element is complete, and the
+    element is then discarded, so the memory used does not grow with the size of
+    the parsed tree. The fund information sections are kept as dictionaries.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the parser."""
+        self._parser = XMLPullParser(events=("start", "end"))
+        self._stack: List[Element] = []
+        self.submission_type: Optional[str] = None
+        self.gen_info: Dict[str, Any] = {}
+        self.fund_info: Dict[str, Any] = {}
+        self.holdings: Dict[str, List[Any]] = {}
+        self.count = 0
+
+    def _add_holding(self, row: Dict[str, Any]) -> None:
+        """Append a row to the holdings columns, with None for its missing fields."""
+        for k, v in row.items():
+            column = self.holdings.get(k)
+            if column is None:
+                column = self.holdings[k] = [None] * self.count
+            column.append(v)
+        self.count += 1
+        for column in self.holdings.values():
+            if len(column) < self.count:
+                column.append(None)
+
+    def _read_events(self) -> None:
+        """Handle the elements parsed so far."""
+        for event, element in self._parser.read_events():
+            if event == "start":
+                self._stack.append(element)
+                continue
+            self._stack.pop()
+            tag = _local_name(element.tag)
+            parent = _local_name(self._stack[-1].tag) if self._stack else None
+            if parent == "invstOrSecs" and tag == "invstOrSec":
+                self._add_holding(flatten_holding(element_to_dict(element)))
+            elif parent == "headerData" and tag == "submissionType":
+                self.submission_type = (element.text or "").strip()
+            elif parent == "formData" and tag == "genInfo":
+                self.gen_info = element_to_dict(element) or {}
+            elif parent == "formData" and tag == "fundInfo":
+                self.fund_info = element_to_dict(element) or {}
+            elif parent not in ("invstOrSecs", "formData", "headerData"):
+                continue
+            # The element has been read, so it is removed from the tree.
+            self._stack[-1].remove(element)
+
+    def feed(self, data: bytes) -> None:
+        """Parse a chunk of the filing."""
+        # The errors of the chunk are raised when its events are read.
+        try:
+            self._parser.feed(data)
+            self._read_events()
+        except ParseError as e:
+            raise OpenBBError(f"Failed to parse the N-PORT filing: {e}") from e
+
+    def close(self) -> Dict[str, Any]:
+        """Finish parsing, and return the submission type, fund information and holdings."""
+        try:
+            self._parser.close()
+            self._read_events()
+        except ParseError as e:
+            raise OpenBBError(f"Failed to parse the N-PORT filing: {e}") from e
+        if self.submission_type is None:
+            return {}
+        return {
+            "submission_type": self.submission_type,
+            "gen_info": self.gen_info,
+            "fund_info": self.fund_info,
+            "holdings": self.holdings,
+        }
+
+
+async def parse_nport_response(response, _) -> Dict[str, Any]:
+    """Response callback parsing an N-PORT-P filing as it is downloaded."""
+    parser = NportParser()
+    async for chunk in response.content.iter_chunked(CHUNK_SIZE):
+        parser.feed(chunk)
+    return parser.close()
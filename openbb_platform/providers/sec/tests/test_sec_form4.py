@@ -0,0 +1,95 @@
+"""Test the SEC Form 4 cache."""
+
+import os
+import sqlite3
+from datetime import date
+from unittest.mock import patch
+
+import pytest
+from openbb_core.app.model.abstract.error import OpenBBError
+from openbb_sec.utils.form4 import close_db, get_cached_data, insert_rows, open_db
+
+# pylint: disable=redefined-outer-name
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    """Get the path of a new database, and close its connection after the test."""
+    path = str(tmp_path / "cache" / "sec_form4.db")
+    yield path
+    conn = open_db(path)
+    close_db(conn, path)
+
+
+def test_open_db(db_path):
+    """Test the database is created in WAL mode, with its indexes, and stays open."""
+    conn = open_db(db_path)
+
+    assert os.path.exists(db_path)
+    assert open_db(db_path) is conn
+    assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    indexes = {r[1] for r in conn.execute("PRAGMA index_list(form4_data)")}
+    assert indexes == {"form4_data_filing_url", "form4_data_symbol_filing_date"}
+
+
+def test_close_db(db_path):
+    """Test a closed database is opened again with a new connection."""
+    conn = open_db(db_path)
+    close_db(conn, db_path)
+
+    assert open_db(db_path) is not conn
+
+
+def test_insert_rows(db_path):
+    """Test the rows are inserted, with a column missing from the table."""
+    conn = open_db(db_path)
+    insert_rows(
+        conn,
+        [
+            {"filing_url": "a", "symbol": "AAPL", "filing_date": date(2024, 1, 2)},
+            {"filing_url": "b", "symbol": "AAPL", "new_share_price": float("nan")},
+        ],
+    )
+
+    columns = {r[1] for r in conn.execute("PRAGMA table_info(form4_data)")}
+    assert "new_share_price" in columns
+    rows = conn.execute(
+        "SELECT filing_url, filing_date, new_share_price FROM form4_data"
+        " ORDER BY filing_url"
+    ).fetchall()
+    assert rows == [("a", "2024-01-02", None), ("b", None, None)]
+
+
+def test_open_db_faulty(db_path):
+    """Test a database that cannot be read is renamed, and replaced by a new one."""
+    os.makedirs(os.path.dirname(db_path))
+    with open(db_path, "wb") as f:
+        f.write(b"not a database" * 100)
+
+    conn = open_db(db_path)
+
+    with open(f"{db_path}.faulty", "rb") as f:
+        assert f.read().startswith(b"not a database")
+    assert conn.execute("SELECT COUNT(*) FROM form4_data").fetchone()[0] == 0
+
+
+def test_open_db_failed(db_path):
+    """Test a database that cannot be created raises an error."""
+    with patch("sqlite3.connect", side_effect=sqlite3.OperationalError("Failed.")):
+        with pytest.raises(OpenBBError, match="Error creating the database"):
+            open_db(db_path)
+
+    assert not os.path.exists(f"{db_path}.faulty")
+
+
+def test_get_cached_data(db_path):
+    """Test the cached rows are found for more URLs than one query can hold."""
+    conn = open_db(db_path)
+    urls = [f"https://www.sec.gov/{i}.xml" for i in range(2000)]
+    insert_rows(conn, [{"filing_url": url, "symbol": "AAPL"} for url in urls[::2]])
+
+    results = get_cached_data(urls, conn)
+
+    assert len(results) == 1000
+    assert {r["filing_url"] for r in results} == set(urls[::2])
+    assert get_cached_data([], conn) == []
@@ -0,0 +1,143 @@
+"""Test the SEC symbol resolver."""
+
+import asyncio
+from unittest.mock import patch
+
+import pytest
+from openbb_sec.utils import helpers
+from openbb_sec.utils.helpers import SecSymbolResolver
+from pandas import DataFrame
+
+# pylint: disable=redefined-outer-name, protected-access
+
+COMPANIES = DataFrame(
+    {
+        "cik": ["320193", "1067983", "1067983"],
+        "symbol": ["AAPL", "BRK-B", "BRK-A"],
+        "name": ["Apple Inc.", "Berkshire Hathaway", "Berkshire Hathaway"],
+    }
+)
+
+FUNDS = DataFrame(
+    {
+        "cik": ["36405", "36405"],
+        "seriesId": ["S000002839", "S000002839"],
+        "classId": ["C000007774", "C000007775"],
+        "symbol": ["VFINX", "VFIAX"],
+    }
+)
+
+
+class Loader:
+    """Mock loader of an index, recording its calls."""
+
+    def __init__(self, data: DataFrame):
+        """Initialize the loader."""
+        self.data = data
+        self.calls: list = []
+
+    async def __call__(self, use_cache: bool = True) -> DataFrame:
+        """Load the data, after a delay."""
+        self.calls.append(use_cache)
+        await asyncio.sleep(0.01)
+        return self.data
+
+
+@pytest.fixture
+def loaders():
+    """Patch the loaders of the company and fund tickers."""
+    companies, funds = Loader(COMPANIES), Loader(FUNDS)
+    with patch.object(helpers, "get_all_companies", companies), patch.object(
+        helpers, "get_mf_and_etf_map", funds
+    ):
+        yield companies, funds
+
+
+def test_get_ciks(loaders):
+    """Test the symbols are looked up in the company tickers, then in the fund tickers."""
+    companies, funds = loaders
+    resolver = SecSymbolResolver()
+
+    ciks = asyncio.run(resolver.get_ciks(["AAPL", "brk.b", "VFIAX", "UNKNOWN"]))
+
+    assert ciks == {"AAPL": "0000320193", "brk.b": "0001067983", "VFIAX": "0000036405"}
+    assert companies.calls == [True]
+    assert funds.calls == [True]
+
+
+def test_get_ciks_companies(loaders):
+    """Test the fund tickers are not loaded when every symbol is a company ticker."""
+    _, funds = loaders
+    resolver = SecSymbolResolver()
+
+    assert asyncio.run(resolver.get_ciks(["AAPL"])) == {"AAPL": "0000320193"}
+    assert not funds.calls
+
+
+def test_get_symbols(loaders):
+    """Test the CIK numbers are matched with or without their leading zeros."""
+    resolver = SecSymbolResolver()
+
+    symbols = asyncio.run(resolver.get_symbols(["0000320193", 320193, 1067983, "1"]))
+
+    assert symbols == {"0000320193": "AAPL", 320193: "AAPL", 1067983: "BRK-B"}
+
+
+def test_get_ciks_expired(loaders):
+    """Test an expired index is used while it is reloaded in the background."""
+    companies, _ = loaders
+    resolver = SecSymbolResolver(ttl=60)
+
+    async def main():
+        await resolver.get_ciks(["AAPL"])
+        companies.data = DataFrame(
+            {"cik": ["1"], "symbol": ["AAPL"], "name": ["Apple Inc."]}
+        )
+        expired = helpers.monotonic() + 61
+        with patch.object(helpers, "monotonic", return_value=expired):
+            stale = await resolver.get_ciks(["AAPL"])
+            await asyncio.gather(*resolver._tasks)
+        return stale, await resolver.get_ciks(["AAPL"])
+
+    stale, refreshed = asyncio.run(main())
+
+    assert stale == {"AAPL": "0000320193"}
+    assert refreshed == {"AAPL": "0000000001"}
+    assert companies.calls == [True, False]
+
+
+def test_get_ciks_no_cache(loaders):
+    """Test the index is reloaded before the lookup without the cache."""
+    companies, _ = loaders
+    resolver = SecSymbolResolver()
+
+    async def main():
+        await resolver.get_ciks(["AAPL"])
+        companies.data = DataFrame(
+            {"cik": ["1"], "symbol": ["AAPL"], "name": ["Apple Inc."]}
+        )
+        return await resolver.get_ciks(["AAPL"], use_cache=False)
+
+    assert asyncio.run(main()) == {"AAPL": "0000000001"}
+    assert companies.calls == [True, False]
+
+
+def test_get_ciks_concurrent(loaders):
+    """Test concurrent lookups share one load of the index."""
+    companies, funds = loaders
+    resolver = SecSymbolResolver()
+
+    async def main():
+        return await asyncio.gather(
+            resolver.get_ciks(["AAPL"]),
+            resolver.get_ciks(["VFIAX"]),
+            resolver.get_funds(symbol="VFINX"),
+        )
+
+    aapl, vfiax, vfinx = asyncio.run(main())
+
+    assert aapl == {"AAPL": "0000320193"}
+    assert vfiax == {"VFIAX": "0000036405"}
+    assert vfinx[0]["classId"] == "C000007774"
+    assert companies.calls == [True]
+    assert funds.calls == [True]
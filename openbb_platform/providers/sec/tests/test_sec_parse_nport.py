@@ -0,0 +1,180 @@
+"""Test the SEC N-PORT-P parser."""
+
+import pytest
+from openbb_core.app.model.abstract.error import OpenBBError
+from openbb_sec.utils.parse_nport import NportParser, flatten_holding
+
+# pylint: disable=protected-access
+
+HOLDING = """
+      <invstOrSec>
+        <name>{name}</name>
+        <title>{name} Inc</title>
+        <identifiers>
+          <isin value="{isin}"/>
+        </identifiers>
+        <balance>{balance}</balance>
+        <pctVal>{pct}</pctVal>
+        <securityLending>
+          <isCashCollateral>N</isCashCollateral>
+          <loanByFundCondition isLoanByFund="Y" loanVal="100"/>
+        </securityLending>
+      </invstOrSec>"""
+
+HOLDINGS = HOLDING.format(
+    name="Apple", isin="US0378331005", balance="10", pct="60"
+) + HOLDING.format(name="Microsoft", isin="US5949181045", balance="5", pct="40")
+
+
+def make_filing(holdings: str = HOLDINGS, submission_type: str = "NPORT-P") -> bytes:
+    """Make a filing, with the namespaces of the EDGAR schema."""
+    return f"""<?xml version="1.0" encoding="UTF-8"?>
+<edgarSubmission xmlns="http://www.sec.gov/edgar/nport"
+  xmlns:com="http://www.sec.gov/edgar/common"
+  xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance">
+  <headerData>
+    <submissionType>{submission_type}</submissionType>
+  </headerData>
+  <formData>
+    <genInfo>
+      <regName>Index Fund</regName>
+      <repPdDate>2024-03-31</repPdDate>
+    </genInfo>
+    <fundInfo>
+      <totAssets>1000</totAssets>
+      <returnInfo>
+        <monthlyTotReturns>
+          <monthlyTotReturn classId="C000001" rtn1="1.5"/>
+        </monthlyTotReturns>
+      </returnInfo>
+    </fundInfo>
+    <invstOrSecs>{holdings}
+    </invstOrSecs>
+  </formData>
+</edgarSubmission>
+""".encode()
+
+
+def parse(data: bytes, chunk_size: int = 7) -> dict:
+    """Parse a filing fed in chunks."""
+    parser = NportParser()
+    for start in range(0, len(data), chunk_size):
+        parser.feed(data[start : start + chunk_size])
+    return parser.close()
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 64, 100000])
+def test_nport_parser(chunk_size):
+    """Test the filing is parsed the same, whatever the chunks split."""
+    result = parse(make_filing(), chunk_size)
+
+    assert result["submission_type"] == "NPORT-P"
+    assert result["gen_info"] == {"regName": "Index Fund", "repPdDate": "2024-03-31"}
+    assert result["fund_info"]["totAssets"] == "1000"
+    assert result["fund_info"]["returnInfo"]["monthlyTotReturns"][
+        "monthlyTotReturn"
+    ] == {"@classId": "C000001", "@rtn1": "1.5"}
+    assert result["holdings"]["name"] == ["Apple", "Microsoft"]
+    assert result["holdings"]["isin"] == ["US0378331005", "US5949181045"]
+    assert result["holdings"]["pctVal"] == ["60", "40"]
+    assert result["holdings"]["isLoanByFund"] == ["Y", "Y"]
+    assert "identifiers" not in result["holdings"]
+
+
+def test_nport_parser_single_holding():
+    """Test a single holding is a row, like several holdings."""
+    holding = HOLDING.format(name="Apple", isin="US0378331005", balance="1", pct="1")
+
+    holdings = parse(make_filing(holding))["holdings"]
+
+    assert holdings["name"] == ["Apple"]
+    assert holdings["balance"] == ["1"]
+
+
+def test_nport_parser_missing_fields():
+    """Test a field missing from a holding is None in its row."""
+    holding = "<invstOrSec><name>Cash</name></invstOrSec>"
+
+    holdings = parse(make_filing(HOLDINGS + holding))["holdings"]
+
+    assert holdings["name"] == ["Apple", "Microsoft", "Cash"]
+    assert holdings["isin"] == ["US0378331005", "US5949181045", None]
+
+
+def test_nport_parser_other_submission():
+    """Test a submission other than N-PORT-P keeps its type, to be filtered out."""
+    result = parse(make_filing(submission_type="NPORT-EX"))
+
+    assert result["submission_type"] == "NPORT-EX"
+
+
+def test_nport_parser_not_nport():
+    """Test a document without a submission type is empty."""
+    assert parse(b"<html><body>Not found</body></html>") == {}
+
+
+def test_nport_parser_invalid():
+    """Test a filing that is not XML raises an error."""
+    with pytest.raises(OpenBBError, match="Failed to parse the N-PORT filing"):
+        parse(b"<edgarSubmission><headerData></edgarSubmission>")
+
+
+def test_nport_parser_removes_holdings():
+    """Test the holdings are removed from the tree once they are parsed."""
+    data = make_filing()
+    end = data.index(b"</invstOrSecs>")
+    parser = NportParser()
+
+    for start in range(0, end, 7):
+        parser.feed(data[start : min(start + 7, end)])
+
+    invst_or_secs = parser._stack[-1]
+    assert invst_or_secs.tag == "{http://www.sec.gov/edgar/nport}invstOrSecs"
+    assert len(invst_or_secs) == 0
+    assert parser.count == 2
+    assert parser._stack[-2].find("{http://www.sec.gov/edgar/nport}genInfo") is None
+
+
+def test_flatten_holding():
+    """Test the nested values of a holding are flattened into columns."""
+    holding = {
+        "name": "EUR/USD Forward",
+        "identifiers": {"other": {"@otherDesc": "Internal", "@value": "FX1"}},
+        "debtSec": {"maturityDt": "2030-01-01", "couponKind": "Fixed"},
+        "derivativeInfo": {
+            "fwdDeriv": {
+                "@derivCat": "FWD",
+                "counterparties": {"counterpartyName": "Bank"},
+                "curSold": "EUR",
+                "amtCurSold": "100",
+                "curPur": "USD",
+                "amtCurPur": "110",
+                "settlementDt": "2024-06-30",
+                "unrealizedAppr": "-1.5",
+            }
+        },
+        "currencyConditional": {"@curCd": "EUR", "@exchangeRt": "1.1"},
+    }
+
+    row = flatten_holding(holding)
+
+    assert row == {
+        "name": "EUR/USD Forward",
+        "other_id": "FX1",
+        "maturity_date": "2030-01-01",
+        "coupon_kind": "Fixed",
+        "annualized_return": None,
+        "is_default": None,
+        "in_arrears": None,
+        "is_paid_kind": None,
+        "derivative_category": "FWD",
+        "counterparty": "Bank",
+        "currency_sold": "EUR",
+        "currency_amount_sold": 100.0,
+        "currency_bought": "USD",
+        "currency_amount_bought": 110.0,
+        "expiry_date": "2024-06-30",
+        "unrealized_gain": -1.5,
+        "exchange_currency": "EUR",
+        "exchange_rate": "1.1",
+    }
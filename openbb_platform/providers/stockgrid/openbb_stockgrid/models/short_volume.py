@@ -70,4 +70,4 @@ class StockgridShortVolumeFetcher(
         **kwargs: Any,
     ) -> List[StockgridShortVolumeData]:
         """Transform data."""
-        return [StockgridShortVolumeData.model_validate(d) for d in data]
+        return StockgridShortVolumeData.model_validate_list(data)
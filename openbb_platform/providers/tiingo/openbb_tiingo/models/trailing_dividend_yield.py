@@ -64,4 +64,4 @@ class TiingoTrailingDivYieldFetcher(
     ) -> List[TiingoTrailingDivYieldData]:
         """Return the transformed data."""
         data = data[-query.limit :] if query.limit else data
-        return [TiingoTrailingDivYieldData.model_validate(d) for d in data]
+        return TiingoTrailingDivYieldData.model_validate_list(data)
@@ -131,4 +131,4 @@ class TmxAvailableIndicesFetcher(
                 }
             )
 
-        return [TmxAvailableIndicesData.model_validate(d) for d in new_data]
+        return TmxAvailableIndicesData.model_validate_list(new_data)
@@ -144,4 +144,4 @@ class TmxCalendarEarningsFetcher(
     ) -> List[TmxCalendarEarningsData]:
         """Return the transformed data."""
         results = [{k: (None if v == "N/A" else v) for k, v in d.items()} for d in data]
-        return [TmxCalendarEarningsData.model_validate(d) for d in results]
+        return TmxCalendarEarningsData.model_validate_list(results)
@@ -181,4 +181,4 @@ class TmxCompanyFilingsFetcher(
         **kwargs: Any,
     ) -> List[TmxCompanyFilingsData]:
         """Return the transformed data."""
-        return [TmxCompanyFilingsData.model_validate(d) for d in data]
+        return TmxCompanyFilingsData.model_validate_list(data)
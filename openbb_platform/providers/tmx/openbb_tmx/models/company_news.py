@@ -133,4 +133,4 @@ class TmxCompanyNewsFetcher(
         query: TmxCompanyNewsQueryParams, data: List[Dict], **kwargs: Any
     ) -> List[TmxCompanyNewsData]:
         """Return the transformed data."""
-        return [TmxCompanyNewsData.model_validate(d) for d in data]
+        return TmxCompanyNewsData.model_validate_list(data)
@@ -164,4 +164,4 @@ class TmxEquityProfileFetcher(
         symbol_to_index = {symbol: index for index, symbol in enumerate(symbols)}
         data = sorted(data, key=lambda d: symbol_to_index[d["symbol"]])
 
-        return [TmxEquityProfileData.model_validate(d) for d in data]
+        return TmxEquityProfileData.model_validate_list(data)
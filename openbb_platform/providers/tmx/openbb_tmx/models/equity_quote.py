@@ -379,4 +379,4 @@ class TmxEquityQuoteFetcher(
         symbol_to_index = {symbol: index for index, symbol in enumerate(symbols)}
         data = sorted(data, key=lambda d: symbol_to_index[d["symbol"]])
 
-        return [TmxEquityQuoteData.model_validate(d) for d in data]
+        return TmxEquityQuoteData.model_validate_list(data)
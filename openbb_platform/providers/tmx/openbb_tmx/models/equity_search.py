@@ -69,4 +69,4 @@ class TmxEquitySearchFetcher(
         query: TmxEquitySearchQueryParams, data: List[Dict], **kwargs: Any
     ) -> List[TmxEquitySearchData]:
         """Transform the data to the standard format."""
-        return [TmxEquitySearchData.model_validate(d) for d in data]
+        return TmxEquitySearchData.model_validate_list(data)
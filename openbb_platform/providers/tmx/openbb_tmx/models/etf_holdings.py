@@ -147,4 +147,4 @@ class TmxEtfHoldingsFetcher(
         **kwargs: Any,
     ) -> List[TmxEtfHoldingsData]:
         """Transform the data to the standard format."""
-        return [TmxEtfHoldingsData.model_validate(d) for d in data]
+        return TmxEtfHoldingsData.model_validate_list(data)
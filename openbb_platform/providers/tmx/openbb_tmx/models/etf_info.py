@@ -236,4 +236,4 @@ class TmxEtfInfoFetcher(
         **kwargs: Any,
     ) -> List[TmxEtfInfoData]:
         """Return the transformed data."""
-        return [TmxEtfInfoData.model_validate(d) for d in data]
+        return TmxEtfInfoData.model_validate_list(data)
@@ -267,4 +267,4 @@ class TmxEtfSearchFetcher(
         **kwargs: Any,
     ) -> List[TmxEtfSearchData]:
         """Transform the data to the standard format."""
-        return [TmxEtfSearchData.model_validate(d) for d in data]
+        return TmxEtfSearchData.model_validate_list(data)
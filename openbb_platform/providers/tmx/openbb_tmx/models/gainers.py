@@ -171,4 +171,4 @@ class TmxGainersFetcher(
         **kwargs: Any,
     ) -> List[TmxGainersData]:
         """Transform the data to the model."""
-        return [TmxGainersData.model_validate(d) for d in data]
+        return TmxGainersData.model_validate_list(data)
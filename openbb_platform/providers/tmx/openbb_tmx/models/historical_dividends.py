@@ -108,4 +108,4 @@ class TmxHistoricalDividendsFetcher(
         **kwargs: Any,
     ) -> List[TmxHistoricalDividendsData]:
         """Return the transformed data."""
-        return [TmxHistoricalDividendsData.model_validate(d) for d in data]
+        return TmxHistoricalDividendsData.model_validate_list(data)
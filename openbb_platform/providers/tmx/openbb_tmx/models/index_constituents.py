@@ -95,4 +95,4 @@ class TmxIndexConstituentsFetcher(
         ):
             raise OpenBBError(f"No constituents found for index, {query.symbol}")
         results = index_data["constituents"]
-        return [TmxIndexConstituentsData.model_validate(d) for d in results]
+        return TmxIndexConstituentsData.model_validate_list(results)
@@ -89,4 +89,4 @@ class TmxIndexSectorsFetcher(
                 if temp is not None
             ]
 
-        return [TmxIndexSectorsData.model_validate(d) for d in results]
+        return TmxIndexSectorsData.model_validate_list(results)
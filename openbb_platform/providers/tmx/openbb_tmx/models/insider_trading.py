@@ -170,4 +170,4 @@ class TmxInsiderTradingFetcher(
         elif query.summary is True and len(flattened_summary) > 0:
             results = flattened_summary
 
-        return [TmxInsiderTradingData.model_validate(d) for d in results]
+        return TmxInsiderTradingData.model_validate_list(results)
@@ -169,4 +169,4 @@ class TmxPriceTargetConsensusFetcher(
         **kwargs: Any,
     ) -> List[TmxPriceTargetConsensusData]:
         """Return the transformed data."""
-        return [TmxPriceTargetConsensusData.model_validate(d) for d in data]
+        return TmxPriceTargetConsensusData.model_validate_list(data)
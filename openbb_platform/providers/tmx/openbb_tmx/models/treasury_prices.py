@@ -158,4 +158,4 @@ class TmxTreasuryPricesFetcher(
             data = data.fillna("N/A").replace("N/A", None)
             results = data.to_dict("records")
 
-        return [TmxTreasuryPricesData.model_validate(d) for d in results]
+        return TmxTreasuryPricesData.model_validate_list(results)
@@ -267,4 +267,4 @@ class TEEconomicCalendarFetcher(
         query: TEEconomicCalendarQueryParams, data: list[dict], **kwargs: Any
     ) -> list[TEEconomicCalendarData]:
         """Return the transformed data."""
-        return [TEEconomicCalendarData.model_validate(d) for d in data]
+        return TEEconomicCalendarData.model_validate_list(data)
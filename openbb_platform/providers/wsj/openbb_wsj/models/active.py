@@ -101,4 +101,4 @@ class WSJActiveFetcher(Fetcher[WSJActiveQueryParams, List[WSJActiveData]]):
             data,
             key=lambda x: x["volume"] if query.sort == "asc" else -x["volume"],
         )
-        return [WSJActiveData.model_validate(d) for d in data]
+        return WSJActiveData.model_validate_list(data)
@@ -107,4 +107,4 @@ class WSJGainersFetcher(Fetcher[WSJGainersQueryParams, List[WSJGainersData]]):
                 x["percentChange"] if query.sort == "asc" else -x["percentChange"]
             ),
         )
-        return [WSJGainersData.model_validate(d) for d in data]
+        return WSJGainersData.model_validate_list(data)
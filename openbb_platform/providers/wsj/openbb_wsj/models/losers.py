@@ -106,4 +106,4 @@ class WSJLosersFetcher(Fetcher[WSJLosersQueryParams, List[WSJLosersData]]):
                 x["percentChange"] if query.sort == "desc" else -x["percentChange"]
             ),
         )
-        return [WSJLosersData.model_validate(d) for d in data]
+        return WSJLosersData.model_validate_list(data)
@@ -65,4 +65,4 @@ class YFinanceAvailableIndicesFetcher(
         query: YFinanceAvailableIndicesQueryParams, data: List[Dict], **kwargs: Any
     ) -> List[YFinanceAvailableIndicesData]:
         """Return the transformed data."""
-        return [YFinanceAvailableIndicesData.model_validate(d) for d in data]
+        return YFinanceAvailableIndicesData.model_validate_list(data)
@@ -121,4 +121,4 @@ class YFinanceBalanceSheetFetcher(
         **kwargs: Any,
     ) -> list[YFinanceBalanceSheetData]:
         """Transform the data."""
-        return [YFinanceBalanceSheetData.model_validate(d) for d in data]
+        return YFinanceBalanceSheetData.model_validate_list(data)
@@ -120,4 +120,4 @@ class YFinanceCashFlowStatementFetcher(
         **kwargs: Any,
     ) -> list[YFinanceCashFlowStatementData]:
         """Transform the data."""
-        return [YFinanceCashFlowStatementData.model_validate(d) for d in data]
+        return YFinanceCashFlowStatementData.model_validate_list(data)
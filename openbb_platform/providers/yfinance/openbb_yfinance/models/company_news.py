@@ -116,4 +116,4 @@ class YFinanceCompanyNewsFetcher(
         **kwargs: Any,
     ) -> list[YFinanceCompanyNewsData]:
         """Transform data."""
-        return [YFinanceCompanyNewsData.model_validate(d) for d in data]
+        return YFinanceCompanyNewsData.model_validate_list(data)
@@ -134,4 +134,4 @@ class YFinanceCryptoHistoricalFetcher(
         **kwargs: Any,
     ) -> List[YFinanceCryptoHistoricalData]:
         """Transform the data to the standard format."""
-        return [YFinanceCryptoHistoricalData.model_validate(d) for d in data]
+        return YFinanceCryptoHistoricalData.model_validate_list(data)
@@ -132,4 +132,4 @@ class YFinanceCurrencyHistoricalFetcher(
         **kwargs: Any,
     ) -> List[YFinanceCurrencyHistoricalData]:
         """Transform the data to the standard format."""
-        return [YFinanceCurrencyHistoricalData.model_validate(d) for d in data]
+        return YFinanceCurrencyHistoricalData.model_validate_list(data)
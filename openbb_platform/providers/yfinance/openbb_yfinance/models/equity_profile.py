@@ -208,4 +208,4 @@ class YFinanceEquityProfileFetcher(
         **kwargs: Any,
     ) -> List[YFinanceEquityProfileData]:
         """Transform the data."""
-        return [YFinanceEquityProfileData.model_validate(d) for d in data]
+        return YFinanceEquityProfileData.model_validate_list(data)
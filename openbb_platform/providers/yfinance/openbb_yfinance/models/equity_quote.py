@@ -143,4 +143,4 @@ class YFinanceEquityQuoteFetcher(
         **kwargs: Any,
     ) -> List[YFinanceEquityQuoteData]:
         """Transform the data."""
-        return [YFinanceEquityQuoteData.model_validate(d) for d in data]
+        return YFinanceEquityQuoteData.model_validate_list(data)
@@ -329,4 +329,4 @@ class YFinanceEtfInfoFetcher(
         **kwargs: Any,
     ) -> List[YFinanceEtfInfoData]:
         """Transform the data."""
-        return [YFinanceEtfInfoData.model_validate(d) for d in data]
+        return YFinanceEtfInfoData.model_validate_list(data)
@@ -66,4 +66,4 @@ class YFinanceFuturesCurveFetcher(
         **kwargs: Any,
     ) -> List[YFinanceFuturesCurveData]:
         """Transform the data to the standard format."""
-        return [YFinanceFuturesCurveData.model_validate(d) for d in data]
+        return YFinanceFuturesCurveData.model_validate_list(data)
@@ -148,4 +148,4 @@ class YFinanceFuturesHistoricalFetcher(
         **kwargs: Any,
     ) -> List[YFinanceFuturesHistoricalData]:
         """Transform the data to the standard format."""
-        return [YFinanceFuturesHistoricalData.model_validate(d) for d in data]
+        return YFinanceFuturesHistoricalData.model_validate_list(data)
@@ -75,4 +75,4 @@ class YFinanceHistoricalDividendsFetcher(
         **kwargs: Any,
     ) -> List[YFinanceHistoricalDividendsData]:
         """Transform the data."""
-        return [YFinanceHistoricalDividendsData.model_validate(d) for d in data]
+        return YFinanceHistoricalDividendsData.model_validate_list(data)
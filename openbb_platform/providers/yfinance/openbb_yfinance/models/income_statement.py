@@ -122,4 +122,4 @@ class YFinanceIncomeStatementFetcher(
         **kwargs: Any,
     ) -> list[YFinanceIncomeStatementData]:
         """Transform the data."""
-        return [YFinanceIncomeStatementData.model_validate(d) for d in data]
+        return YFinanceIncomeStatementData.model_validate_list(data)
@@ -151,4 +151,4 @@ class YFinanceIndexHistoricalFetcher(
         **kwargs: Any,
     ) -> List[YFinanceIndexHistoricalData]:
         """Transform the data to the standard format."""
-        return [YFinanceIndexHistoricalData.model_validate(d) for d in data]
+        return YFinanceIndexHistoricalData.model_validate_list(data)
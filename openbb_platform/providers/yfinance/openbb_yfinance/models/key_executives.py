@@ -92,4 +92,4 @@ class YFinanceKeyExecutivesFetcher(
         **kwargs: Any,
     ) -> List[YFinanceKeyExecutivesData]:
         """Transform the data."""
-        return [YFinanceKeyExecutivesData.model_validate(d) for d in data]
+        return YFinanceKeyExecutivesData.model_validate_list(data)
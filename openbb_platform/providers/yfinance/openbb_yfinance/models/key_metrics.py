@@ -336,4 +336,4 @@ class YFinanceKeyMetricsFetcher(
         **kwargs: Any,
     ) -> List[YFinanceKeyMetricsData]:
         """Transform the data."""
-        return [YFinanceKeyMetricsData.model_validate(d) for d in data]
+        return YFinanceKeyMetricsData.model_validate_list(data)
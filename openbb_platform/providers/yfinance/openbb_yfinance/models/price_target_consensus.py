@@ -153,4 +153,4 @@ class YFinancePriceTargetConsensusFetcher(
         **kwargs: Any,
     ) -> List[YFinancePriceTargetConsensusData]:
         """Transform the data."""
-        return [YFinancePriceTargetConsensusData.model_validate(d) for d in data]
+        return YFinancePriceTargetConsensusData.model_validate_list(data)
@@ -193,4 +193,4 @@ class YFinanceShareStatisticsFetcher(
         **kwargs: Any,
     ) -> List[YFinanceShareStatisticsData]:
         """Transform the data."""
-        return [YFinanceShareStatisticsData.model_validate(d) for d in data]
+        return YFinanceShareStatisticsData.model_validate_list(data)